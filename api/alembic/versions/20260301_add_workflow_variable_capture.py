@@ -0,0 +1,27 @@
+"""add_workflow_variable_capture
+
+Revision ID: 20260301_wf_variable_capture
+Revises: 20260218_oauth_audience
+Create Date: 2026-03-01
+
+Per-workflow variable capture mode: 'off', 'summary' or 'full'.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260301_wf_variable_capture"
+down_revision = "20260218_oauth_audience"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workflows",
+        sa.Column("variable_capture", sa.String(20), nullable=False, server_default="full"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workflows", "variable_capture")
@@ -0,0 +1,35 @@
+"""add_metrics_rollup_checkpoints
+
+Revision ID: 20260310_metrics_checkpoints
+Revises: 20260301_wf_variable_capture
+Create Date: 2026-03-10
+
+Progress markers for metrics rollup jobs (e.g. folding Redis execution
+counters into execution_metrics_daily / workflow_roi_daily).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260310_metrics_checkpoints"
+down_revision = "20260301_wf_variable_capture"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metrics_rollup_checkpoints",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("position", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("metrics_rollup_checkpoints")
@@ -0,0 +1,57 @@
+"""add_execution_rollups
+
+Revision ID: 20260312_execution_rollups
+Revises: 20260310_metrics_checkpoints
+Create Date: 2026-03-12
+
+Hourly and daily execution rollups maintained incrementally from a
+created_at high-water mark, plus a partial index to find the oldest
+unfinished execution cheaply.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260312_execution_rollups"
+down_revision = "20260310_metrics_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def _counter_columns() -> list[sa.Column]:
+    return [
+        sa.Column("execution_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("success_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("failed_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("timeout_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cancelled_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("success_duration_ms", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("success_duration_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_memory_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_cpu_seconds", sa.Float(), nullable=False, server_default="0"),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "execution_rollups_hourly",
+        sa.Column("hour", sa.DateTime(timezone=True), primary_key=True),
+        *_counter_columns(),
+    )
+    op.create_table(
+        "execution_rollups_daily",
+        sa.Column("date", sa.Date(), primary_key=True),
+        *_counter_columns(),
+    )
+    op.create_index(
+        "ix_executions_active_created",
+        "executions",
+        ["created_at"],
+        postgresql_where=sa.text("status IN ('Pending', 'Running', 'Cancelling')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_executions_active_created", table_name="executions")
+    op.drop_table("execution_rollups_daily")
+    op.drop_table("execution_rollups_hourly")
@@ -0,0 +1,53 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 20260314_keyset_indexes
+Revises: 20260312_execution_rollups
+Create Date: 2026-03-14
+
+Composite indexes ending in the (started_at, id) / (timestamp, id) sort
+keys used by the execution and log list cursors. The single-column
+executed_by, workflow_name and workflow_id indexes are prefixes of the
+new ones and are dropped.
+"""
+
+from alembic import op
+
+revision = "20260314_keyset_indexes"
+down_revision = "20260312_execution_rollups"
+branch_labels = None
+depends_on = None
+
+EXECUTION_INDEXES = {
+    "ix_executions_started_id": ["started_at", "id"],
+    "ix_executions_org_started_id": ["organization_id", "started_at", "id"],
+    "ix_executions_user_started_id": ["executed_by", "started_at", "id"],
+    "ix_executions_workflow_started_id": ["workflow_name", "started_at", "id"],
+    "ix_executions_workflow_id_started_id": ["workflow_id", "started_at", "id"],
+    "ix_executions_status_started_id": ["status", "started_at", "id"],
+}
+
+REPLACED_INDEXES = {
+    "ix_executions_user": ["executed_by"],
+    "ix_executions_workflow": ["workflow_name"],
+    "ix_executions_workflow_id": ["workflow_id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in EXECUTION_INDEXES.items():
+        op.create_index(name, "executions", columns)
+    for name in REPLACED_INDEXES:
+        op.drop_index(name, table_name="executions")
+
+    op.create_index(
+        "ix_execution_logs_timestamp_id", "execution_logs", ["timestamp", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_execution_logs_timestamp_id", table_name="execution_logs")
+
+    for name, columns in REPLACED_INDEXES.items():
+        op.create_index(name, "executions", columns)
+    for name in EXECUTION_INDEXES:
+        op.drop_index(name, table_name="executions")
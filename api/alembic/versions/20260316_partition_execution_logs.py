@@ -0,0 +1,146 @@
+"""partition_execution_logs
+
+Revision ID: 20260316_partition_exec_logs
+Revises: 20260314_keyset_indexes
+Create Date: 2026-03-16
+
+Rebuilds execution_logs as a table range-partitioned by month on
+timestamp, so old months can be dropped as a whole and date-bounded
+searches only touch the partitions in range. Adds trigram indexes for
+the substring message and workflow name searches of the log view.
+
+Existing rows are copied into monthly partitions covering their range;
+partitions up to three months ahead are created here and then kept
+ahead by the execution log retention job. A default partition catches
+rows outside every monthly partition.
+"""
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260316_partition_exec_logs"
+down_revision = "20260314_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+PARTITIONS_AHEAD = 3
+
+COLUMNS = "id, execution_id, level, message, log_metadata, timestamp, sequence"
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Move the old table aside; its index names are schema-wide
+    op.execute("ALTER TABLE execution_logs RENAME TO execution_logs_unpartitioned")
+    op.execute("ALTER INDEX execution_logs_pkey RENAME TO execution_logs_unpartitioned_pkey")
+    op.drop_index("ix_execution_logs_exec_seq", table_name="execution_logs_unpartitioned")
+    op.drop_index("ix_execution_logs_timestamp_id", table_name="execution_logs_unpartitioned")
+
+    op.execute(
+        """
+        CREATE TABLE execution_logs (
+            id BIGINT NOT NULL DEFAULT nextval('execution_logs_id_seq'),
+            execution_id UUID NOT NULL REFERENCES executions (id) ON DELETE CASCADE,
+            level VARCHAR(20) NOT NULL,
+            message TEXT NOT NULL,
+            log_metadata JSONB,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            sequence INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+
+    oldest = op.get_bind().execute(
+        sa.text("SELECT min(timestamp) FROM execution_logs_unpartitioned")
+    ).scalar()
+    now = datetime.now(timezone.utc)
+    first = (oldest or now).astimezone(timezone.utc).date().replace(day=1)
+    last = _add_months(now.date().replace(day=1), PARTITIONS_AHEAD)
+    month = first
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE execution_logs_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF execution_logs FOR VALUES "
+            f"FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        month = upper
+    op.execute("CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT")
+
+    op.execute(
+        f"INSERT INTO execution_logs ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM execution_logs_unpartitioned"
+    )
+    op.execute("ALTER SEQUENCE execution_logs_id_seq AS BIGINT OWNED BY execution_logs.id")
+    op.drop_table("execution_logs_unpartitioned")
+
+    op.create_index(
+        "ix_execution_logs_exec_seq", "execution_logs", ["execution_id", "sequence"]
+    )
+    op.create_index(
+        "ix_execution_logs_timestamp_id", "execution_logs", ["timestamp", "id"]
+    )
+    op.create_index(
+        "ix_execution_logs_message_trgm",
+        "execution_logs",
+        ["message"],
+        postgresql_using="gin",
+        postgresql_ops={"message": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_executions_workflow_name_trgm",
+        "executions",
+        ["workflow_name"],
+        postgresql_using="gin",
+        postgresql_ops={"workflow_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_executions_workflow_name_trgm", table_name="executions")
+
+    op.execute("ALTER TABLE execution_logs RENAME TO execution_logs_partitioned")
+    op.execute(
+        "ALTER INDEX execution_logs_pkey RENAME TO execution_logs_partitioned_pkey"
+    )
+    op.drop_index("ix_execution_logs_exec_seq", table_name="execution_logs_partitioned")
+    op.drop_index("ix_execution_logs_timestamp_id", table_name="execution_logs_partitioned")
+    op.drop_index("ix_execution_logs_message_trgm", table_name="execution_logs_partitioned")
+
+    op.execute(
+        """
+        CREATE TABLE execution_logs (
+            id INTEGER NOT NULL DEFAULT nextval('execution_logs_id_seq'),
+            execution_id UUID NOT NULL REFERENCES executions (id) ON DELETE CASCADE,
+            level VARCHAR(20) NOT NULL,
+            message TEXT NOT NULL,
+            log_metadata JSONB,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            sequence INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(
+        f"INSERT INTO execution_logs ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM execution_logs_partitioned"
+    )
+    op.execute("ALTER SEQUENCE execution_logs_id_seq AS INTEGER OWNED BY execution_logs.id")
+    # Dropping the parent drops every partition
+    op.drop_table("execution_logs_partitioned")
+
+    op.create_index(
+        "ix_execution_logs_exec_seq", "execution_logs", ["execution_id", "sequence"]
+    )
+    op.create_index(
+        "ix_execution_logs_timestamp_id", "execution_logs", ["timestamp", "id"]
+    )
@@ -0,0 +1,39 @@
+"""add_execution_archive
+
+Revision ID: 20260318_execution_archive
+Revises: 20260316_partition_exec_logs
+Create Date: 2026-03-18
+
+Pointer from an execution to its archived logs, result and variables in
+object storage, plus a partial index to find executions still to archive.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260318_execution_archive"
+down_revision = "20260316_partition_exec_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "executions", sa.Column("archive_key", sa.String(255), nullable=True)
+    )
+    op.add_column(
+        "executions",
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_executions_unarchived_completed",
+        "executions",
+        ["completed_at"],
+        postgresql_where=sa.text("archive_key IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_executions_unarchived_completed", table_name="executions")
+    op.drop_column("executions", "archived_at")
+    op.drop_column("executions", "archive_key")
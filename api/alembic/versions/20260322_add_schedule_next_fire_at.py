@@ -0,0 +1,36 @@
+"""add_schedule_next_fire_at
+
+Revision ID: 20260322_schedule_next_fire
+Revises: 20260318_execution_archive
+Create Date: 2026-03-22
+
+Persisted next fire time of schedule sources, with a partial index so the
+scheduler finds due schedules without scanning every source. Existing rows
+start NULL and are scheduled by the scheduler on its first pass.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260322_schedule_next_fire"
+down_revision = "20260318_execution_archive"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "schedule_sources",
+        sa.Column("next_fire_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_schedule_sources_next_fire_at",
+        "schedule_sources",
+        ["next_fire_at"],
+        postgresql_where=sa.text("enabled"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_schedule_sources_next_fire_at", table_name="schedule_sources")
+    op.drop_column("schedule_sources", "next_fire_at")
@@ -0,0 +1,31 @@
+"""add_file_index_content_trgm
+
+Revision ID: 20260324_file_index_trgm
+Revises: 20260322_schedule_next_fire
+Create Date: 2026-03-24
+
+Trigram index on file_index.content so code search can narrow the files
+it reads with LIKE/ILIKE predicates instead of scanning every row.
+"""
+
+from alembic import op
+
+revision = "20260324_file_index_trgm"
+down_revision = "20260322_schedule_next_fire"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_file_index_content_trgm",
+        "file_index",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_index_content_trgm", table_name="file_index")
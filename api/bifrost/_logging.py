@@ -4,7 +4,10 @@ Unified log streaming for Bifrost SDK.
 Writes execution logs to Redis Stream as the single source of truth.
 Two consumers read from this stream:
 1. PubSub forwarder - Publishes to WebSocket for real-time delivery
-2. Log persistence worker - Batch inserts to Postgres
+2. Log persister - Tails active streams through the LOG_PERSISTER_GROUP
+   consumer group and COPYs batches to Postgres while the execution runs
+   (src.services.execution.log_persister); entries are deleted once
+   committed, and load_stream_logs() picks up the remainder on completion
 
 This replaces the previous dual-write pattern (sync Postgres + Redis PubSub)
 which caused duplicate logs and event loop affinity issues.
@@ -12,9 +15,14 @@ which caused duplicate logs and event loop affinity issues.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -25,7 +33,12 @@ from uuid import UUID
 
 import redis as redis_sync
 
-from src.core.cache.keys import execution_logs_stream_key
+from src.core.cache.keys import (
+    TTL_LOG_SEQUENCE,
+    active_log_streams_key,
+    execution_logs_sequence_key,
+    execution_logs_stream_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +46,63 @@ logger = logging.getLogger(__name__)
 _local = threading.local()
 
 
+# Consumer group through which log entries are persisted to Postgres
+LOG_PERSISTER_GROUP = "log-persister"
+
+# Consumer that reads the remaining entries when an execution completes
+LOG_FINALIZER_CONSUMER = "finalizer"
+
+# Safety bound on a stream's length. Persisted entries are deleted, so this
+# is only reached if persistence stalls for a very chatty execution.
+LOG_STREAM_MAXLEN = 100000
+
+# Entries delivered but not acknowledged for this long belong to a persister
+# that stopped; they may be claimed by another consumer
+LOG_PENDING_IDLE_MS = 30000
+
+# How long the finalizer waits for a persister's in-flight batch to commit
+# before claiming its entries
+LOG_FINALIZE_WAIT_SECONDS = 5.0
+
+# Appends one entry to an execution's log stream.
+# KEYS: stream, sequence counter, active streams set
+# ARGV: maxlen, group, execution id, sequence TTL, field/value pairs...
+#
+# Entries are numbered at append time (the "seq" field) so their order
+# survives being persisted in several batches. The first entry creates the
+# persister group at the start of the stream, so nothing is skipped.
+_APPEND_LOG_SCRIPT = """
+local seq = redis.call('INCR', KEYS[2]) - 1
+if seq == 0 then
+    redis.call('EXPIRE', KEYS[2], ARGV[4])
+    redis.pcall('XGROUP', 'CREATE', KEYS[1], ARGV[2], '0', 'MKSTREAM')
+end
+redis.call('SADD', KEYS[3], ARGV[3])
+local fields = {}
+for i = 5, #ARGV do
+    fields[#fields + 1] = ARGV[i]
+end
+fields[#fields + 1] = 'seq'
+fields[#fields + 1] = tostring(seq)
+return redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', unpack(fields))
+"""
+
+
+def _append_script_args(
+    exec_id: str, entry: dict[str, str]
+) -> tuple[list[str], list[Any]]:
+    """KEYS and ARGV for _APPEND_LOG_SCRIPT."""
+    keys = [
+        execution_logs_stream_key(exec_id),
+        execution_logs_sequence_key(exec_id),
+        active_log_streams_key(),
+    ]
+    args: list[Any] = [LOG_STREAM_MAXLEN, LOG_PERSISTER_GROUP, exec_id, TTL_LOG_SEQUENCE]
+    for field, value in entry.items():
+        args.extend((field, value))
+    return keys, args
+
+
 def _serialize_metadata(metadata: dict[str, Any] | None) -> dict[str, Any] | None:
     """
     Ensure metadata is JSON-serializable by converting datetime to ISO strings.
@@ -55,16 +125,72 @@ def _serialize_metadata(metadata: dict[str, Any] | None) -> dict[str, Any] | Non
     return convert(metadata)
 
 
+def _build_stream_entry(
+    exec_id: str,
+    level: str,
+    message: str,
+    metadata: dict[str, Any] | None,
+    ts: datetime,
+) -> dict[str, str]:
+    """Build the Redis Stream entry for a log record."""
+    safe_metadata = _serialize_metadata(metadata)
+    return {
+        "execution_id": exec_id,
+        "level": level.upper(),
+        "message": message,
+        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
+        "timestamp": ts.isoformat(),
+    }
+
+
+def _build_pubsub_message(
+    exec_id: str,
+    level: str,
+    message: str,
+    metadata: dict[str, Any] | None,
+    ts: datetime,
+) -> str:
+    """Build the PubSub payload for a log record (WebSocket format)."""
+    return json.dumps({
+        "type": "execution_log",
+        "executionId": exec_id,
+        "level": level.upper(),
+        "message": message,
+        "metadata": _serialize_metadata(metadata),
+        "timestamp": ts.isoformat(),
+    })
+
+
+def _publish(r: Any, exec_id: str, message: str) -> Any:
+    """
+    Publish to an execution's WebSocket channel on a client or pipeline.
+
+    Uses SPUBLISH when sharded pub/sub is enabled, so the API instances
+    subscribed with SSUBSCRIBE receive it (awaitable on async clients).
+    """
+    from src.config import get_settings
+
+    channel = f"bifrost:execution:{exec_id}"
+    if get_settings().pubsub_sharded:
+        return r.spublish(channel, message)
+    return r.publish(channel, message)
+
+
+def _new_sync_redis() -> redis_sync.Redis:
+    """Create a sync Redis connection from settings."""
+    from src.config import get_settings
+
+    settings = get_settings()
+    return redis_sync.from_url(
+        settings.redis_url,
+        decode_responses=True,
+    )
+
+
 def _get_sync_redis() -> redis_sync.Redis:
     """Get thread-local sync Redis connection."""
     if not hasattr(_local, "redis") or _local.redis is None:
-        from src.config import get_settings
-
-        settings = get_settings()
-        _local.redis = redis_sync.from_url(
-            settings.redis_url,
-            decode_responses=True,
-        )
+        _local.redis = _new_sync_redis()
     return _local.redis
 
 
@@ -93,22 +219,12 @@ def append_log_to_stream(
     """
     exec_id = str(execution_id)
     ts = timestamp or datetime.now(timezone.utc)
-    stream_key = execution_logs_stream_key(exec_id)
-
-    safe_metadata = _serialize_metadata(metadata)
-    entry = {
-        "execution_id": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
-        "timestamp": ts.isoformat(),
-    }
+    entry = _build_stream_entry(exec_id, level, message, metadata, ts)
 
     try:
         r = _get_sync_redis()
-        # XADD with automatic ID generation (*)
-        # MAXLEN ~ 10000 keeps stream bounded (approximate trimming)
-        entry_id: str = r.xadd(stream_key, entry, maxlen=10000)  # type: ignore[misc]
+        keys, args = _append_script_args(exec_id, entry)
+        entry_id: str = r.register_script(_APPEND_LOG_SCRIPT)(keys=keys, args=args)  # type: ignore[assignment]
         return entry_id
     except Exception as e:
         logger.warning(f"Failed to append log to stream: {e}")
@@ -140,19 +256,9 @@ def publish_log_to_pubsub(
     exec_id = str(execution_id)
     ts = timestamp or datetime.now(timezone.utc)
 
-    safe_metadata = _serialize_metadata(metadata)
-    log_entry = {
-        "type": "execution_log",
-        "executionId": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": safe_metadata,
-        "timestamp": ts.isoformat(),
-    }
-
     try:
         r = _get_sync_redis()
-        r.publish(f"bifrost:execution:{exec_id}", json.dumps(log_entry))
+        _publish(r, exec_id, _build_pubsub_message(exec_id, level, message, metadata, ts))
     except Exception as e:
         logger.warning(f"Failed to publish log to PubSub: {e}")
         _local.redis = None
@@ -204,6 +310,254 @@ def log_and_broadcast(
     return entry_id
 
 
+# =============================================================================
+# Buffered log shipping (workflow executions)
+# =============================================================================
+
+# Max log records buffered in-process before new records are dropped
+LOG_SHIPPER_MAX_BUFFERED = 10000
+
+# Max log records written per Redis pipeline
+LOG_SHIPPER_BATCH_SIZE = 200
+
+# How long the flusher waits for more records before writing a partial batch
+LOG_SHIPPER_FLUSH_INTERVAL_SECONDS = 0.005
+
+# How long a full buffer blocks the logging thread before the record is dropped
+LOG_SHIPPER_BACKPRESSURE_SECONDS = 0.05
+
+
+@dataclass
+class LogShipperStats:
+    """Counters for a LogShipper (cumulative for the process)."""
+
+    enqueued: int = 0
+    shipped: int = 0
+    batches: int = 0
+    dropped: int = 0
+    backpressure_waits: int = 0
+    failed: int = 0
+
+
+class LogShipper:
+    """
+    Ships execution logs to Redis without blocking the caller.
+
+    log_and_broadcast() does a synchronous XADD and PUBLISH per record, so a
+    workflow's event loop waits on two network round trips for every
+    logging.info(). The shipper instead appends records to a bounded
+    in-process buffer and a background thread writes them in pipelined
+    batches (XADD + PUBLISH per record, one round trip per batch).
+
+    A batch is written when it reaches LOG_SHIPPER_BATCH_SIZE records, after
+    LOG_SHIPPER_FLUSH_INTERVAL_SECONDS, or when flush() is called at the end
+    of an execution. Records are written in submission order by a single
+    thread, so stream order matches log order.
+
+    When the buffer is full, submit() waits up to
+    LOG_SHIPPER_BACKPRESSURE_SECONDS for the flusher to make room and then
+    drops the record; both cases are counted in stats.
+    """
+
+    def __init__(
+        self,
+        max_buffered: int = LOG_SHIPPER_MAX_BUFFERED,
+        batch_size: int = LOG_SHIPPER_BATCH_SIZE,
+        flush_interval: float = LOG_SHIPPER_FLUSH_INTERVAL_SECONDS,
+        backpressure_timeout: float = LOG_SHIPPER_BACKPRESSURE_SECONDS,
+    ):
+        self.max_buffered = max_buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure_timeout = backpressure_timeout
+        self.stats = LogShipperStats()
+
+        self._buffer: deque[tuple[str, dict[str, str], str]] = deque()
+        self._in_flight = 0
+        self._dropped_reported = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._redis: redis_sync.Redis | None = None
+
+    def submit(
+        self,
+        execution_id: str | UUID,
+        level: str,
+        message: str,
+        metadata: dict[str, Any] | None = None,
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """
+        Queue a log record for shipping.
+
+        Returns:
+            True if queued, False if dropped because the buffer is full
+        """
+        exec_id = str(execution_id)
+        ts = timestamp or datetime.now(timezone.utc)
+        item = (
+            exec_id,
+            _build_stream_entry(exec_id, level, message, metadata, ts),
+            _build_pubsub_message(exec_id, level, message, metadata, ts),
+        )
+
+        self._ensure_thread()
+        with self._cond:
+            if len(self._buffer) >= self.max_buffered:
+                self.stats.backpressure_waits += 1
+                self._cond.notify_all()
+                self._cond.wait_for(
+                    lambda: len(self._buffer) < self.max_buffered,
+                    timeout=self.backpressure_timeout,
+                )
+                if len(self._buffer) >= self.max_buffered:
+                    self.stats.dropped += 1
+                    return False
+
+            self._buffer.append(item)
+            self.stats.enqueued += 1
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Block until every queued record has been written (or failed).
+
+        Call at the end of an execution, before the result is reported, so
+        the stream is complete when the consumer persists it.
+
+        Returns:
+            True if the buffer drained within the timeout
+        """
+        with self._cond:
+            self._cond.notify_all()
+            drained = self._cond.wait_for(
+                lambda: not self._buffer and not self._in_flight,
+                timeout=timeout,
+            )
+            dropped = self.stats.dropped - self._dropped_reported
+            self._dropped_reported = self.stats.dropped
+
+        if dropped:
+            logger.warning(f"Log buffer full: dropped {dropped} log records")
+        return drained
+
+    def _ensure_thread(self) -> None:
+        """Start the flusher thread (again, if this process was forked)."""
+        pid = os.getpid()
+        if self._thread is not None and self._thread.is_alive() and self._pid == pid:
+            return
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive() and self._pid == pid:
+                return
+            if self._pid != pid:
+                # Forked child: the parent's buffer and connection aren't ours
+                self._buffer.clear()
+                self._in_flight = 0
+                self._redis = None
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name="bifrost-log-shipper", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Flusher loop: wait for a full batch or the flush interval, then write."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._buffer))
+                if len(self._buffer) < self.batch_size:
+                    # Give the caller a moment to fill the batch
+                    self._cond.wait_for(
+                        lambda: len(self._buffer) >= self.batch_size,
+                        timeout=self.flush_interval,
+                    )
+                count = min(len(self._buffer), self.batch_size)
+                batch = [self._buffer.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Wake submitters waiting for room
+                self._cond.notify_all()
+
+            self._write_batch(batch)
+
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _write_batch(self, batch: list[tuple[str, dict[str, str], str]]) -> None:
+        """Write one batch with a single pipelined round trip."""
+        try:
+            if self._redis is None:
+                self._redis = _new_sync_redis()
+            append = self._redis.register_script(_APPEND_LOG_SCRIPT)
+            pipe = self._redis.pipeline(transaction=False)
+            for exec_id, entry, pubsub_message in batch:
+                keys, args = _append_script_args(exec_id, entry)
+                append(keys=keys, args=args, client=pipe)
+                _publish(pipe, exec_id, pubsub_message)
+            pipe.execute()
+            self.stats.shipped += len(batch)
+            self.stats.batches += 1
+        except Exception as e:
+            logger.warning(f"Failed to ship {len(batch)} logs: {e}")
+            self.stats.failed += len(batch)
+            self._redis = None
+
+
+_log_shipper: LogShipper | None = None
+_log_shipper_lock = threading.Lock()
+
+
+def get_log_shipper() -> LogShipper:
+    """Get the process-wide LogShipper."""
+    global _log_shipper
+    if _log_shipper is None:
+        with _log_shipper_lock:
+            if _log_shipper is None:
+                _log_shipper = LogShipper()
+    return _log_shipper
+
+
+def ship_log(
+    execution_id: str | UUID,
+    level: str,
+    message: str,
+    metadata: dict[str, Any] | None = None,
+    timestamp: datetime | None = None,
+) -> bool:
+    """
+    Non-blocking alternative to log_and_broadcast.
+
+    Queues the record for the background shipper, which writes it to the
+    execution's stream and publishes it to PubSub. Call flush_shipped_logs()
+    before reporting the execution's result.
+
+    Returns:
+        True if queued, False if dropped because the buffer is full
+    """
+    return get_log_shipper().submit(
+        execution_id=execution_id,
+        level=level,
+        message=message,
+        metadata=metadata,
+        timestamp=timestamp,
+    )
+
+
+def flush_shipped_logs(timeout: float = 5.0) -> bool:
+    """
+    Wait for logs queued by ship_log() to reach Redis.
+
+    Returns:
+        True if everything was written within the timeout
+    """
+    if _log_shipper is None:
+        return True
+    return _log_shipper.flush(timeout=timeout)
+
+
 # =============================================================================
 # Async versions for use in async contexts (API routes, consumers)
 # =============================================================================
@@ -225,20 +579,12 @@ async def append_log_to_stream_async(
 
     exec_id = str(execution_id)
     ts = timestamp or datetime.now(timezone.utc)
-    stream_key = execution_logs_stream_key(exec_id)
-
-    safe_metadata = _serialize_metadata(metadata)
-    entry = {
-        "execution_id": exec_id,
-        "level": level.upper(),
-        "message": message,
-        "metadata": json.dumps(safe_metadata) if safe_metadata else "{}",
-        "timestamp": ts.isoformat(),
-    }
+    entry = _build_stream_entry(exec_id, level, message, metadata, ts)
 
     try:
         async with get_redis() as r:
-            entry_id = await r.xadd(stream_key, entry, maxlen=10000)  # type: ignore[misc]
+            keys, args = _append_script_args(exec_id, entry)
+            entry_id = await r.register_script(_APPEND_LOG_SCRIPT)(keys=keys, args=args)
             return entry_id
     except Exception as e:
         logger.warning(f"Failed to append log to stream (async): {e}")
@@ -251,40 +597,72 @@ async def read_logs_from_stream(
     count: int = 100,
 ) -> "list[ExecutionLog]":
     """
-    Read log entries from an execution's Redis Stream.
+    Read an execution's log entries so far, in order.
+
+    The log persister moves entries from the stream to execution_logs while
+    the execution runs, so the persisted rows are read from Postgres and the
+    stream supplies the entries not persisted yet. The stream is read first:
+    an entry missing from it by then has already been committed.
 
     Args:
         execution_id: Execution UUID
-        start: Stream ID to start from (default: beginning)
+        start: Sequence number to start from (default: beginning); pass the
+            last entry's id + 1 to continue
         count: Maximum entries to read
 
     Returns:
-        List of ExecutionLog entries
+        List of ExecutionLog entries (id is the entry's sequence number)
     """
     from src.core.cache import get_redis
+    from src.core.database import get_session_factory
+    from src.repositories.execution_logs import ExecutionLogRepository
     from .models import ExecutionLog
 
     exec_id = str(execution_id)
+    exec_uuid = UUID(exec_id)
     stream_key = execution_logs_stream_key(exec_id)
+    first = int(start)
 
     try:
+        # Entries not persisted yet (persisted ones may linger until deleted)
+        rows: dict[int, dict[str, Any]] = {}
         async with get_redis() as r:
-            # XRANGE returns [(id, {field: value}), ...]
-            entries = await r.xrange(stream_key, min=start, count=count)  # type: ignore[misc]
-
-            logs = []
-            for entry_id, data in entries:
-                logs.append(ExecutionLog(
-                    id=entry_id,
-                    execution_id=data.get("execution_id", exec_id),
-                    level=data.get("level", "INFO"),
-                    message=data.get("message", ""),
-                    metadata=json.loads(data.get("metadata", "{}")),
-                    timestamp=data.get("timestamp", ""),
-                ))
-            return logs
+            entries = await r.xrange(stream_key, min="-", max="+")  # type: ignore[misc]
+        for index, (entry_id, data) in enumerate(entries):
+            try:
+                row = parse_stream_entry(exec_uuid, entry_id, data, index)
+            except Exception as e:
+                logger.warning(f"Failed to parse log entry {entry_id}: {e}")
+                continue
+            if row["sequence"] >= first:
+                rows[row["sequence"]] = row
+
+        async with get_session_factory()() as db:
+            persisted = await ExecutionLogRepository(db).get_logs_by_sequence(
+                exec_uuid, first, count
+            )
+        for log in persisted:
+            rows.setdefault(log.sequence, {
+                "level": log.level,
+                "message": log.message,
+                "log_metadata": log.log_metadata,
+                "timestamp": log.timestamp,
+                "sequence": log.sequence,
+            })
+
+        return [
+            ExecutionLog(
+                id=str(sequence),
+                execution_id=exec_id,
+                level=row["level"],
+                message=row["message"],
+                metadata=row["log_metadata"] or {},
+                timestamp=row["timestamp"].isoformat(),
+            )
+            for sequence, row in sorted(rows.items())[:count]
+        ]
     except Exception as e:
-        logger.warning(f"Failed to read logs from stream: {e}")
+        logger.warning(f"Failed to read logs: {e}")
         return []
 
 
@@ -325,7 +703,7 @@ async def publish_log_to_pubsub_async(
 
     try:
         async with get_redis() as r:
-            await r.publish(f"bifrost:execution:{exec_id}", json.dumps(log_entry))
+            await _publish(r, exec_id, json.dumps(log_entry))
     except Exception as e:
         logger.warning(f"Failed to publish log to PubSub (async): {e}")
 
@@ -396,10 +774,10 @@ async def flush_logs_to_postgres(
     session: "AsyncSession | None" = None,
 ) -> int:
     """
-    Flush all logs from Redis Stream to Postgres.
+    Flush the logs not yet persisted from Redis Stream to Postgres.
 
-    Called at the end of execution to persist logs from the stream
-    to the database. Uses batch inserts for efficiency.
+    Called at the end of execution to persist what the log persister has
+    not written yet. Uses COPY for efficiency.
 
     Args:
         execution_id: Execution UUID
@@ -409,67 +787,171 @@ async def flush_logs_to_postgres(
     Returns:
         Number of logs persisted
     """
-    from src.models.orm import ExecutionLog
+    from src.repositories.execution_logs import ExecutionLogRepository
 
     exec_id = str(execution_id)
-    exec_uuid = UUID(exec_id)
-    stream_key = execution_logs_stream_key(exec_id)
 
     try:
-        from src.core.cache import get_redis
-
-        async with get_redis() as r:
-            # Read all entries from stream
-            entries = await r.xrange(stream_key, min="-", max="+")  # type: ignore[misc]
+        rows = await load_stream_logs(exec_id)
+        if not rows:
+            return 0
 
-            if not entries:
-                return 0
-
-            # Parse entries - enumerate to preserve insertion order
-            logs_to_insert = []
-            for seq, (entry_id, data) in enumerate(entries):
-                try:
-                    # Parse timestamp and strip timezone (DB uses TIMESTAMP WITHOUT TIME ZONE)
-                    ts_str = data.get("timestamp", datetime.now(timezone.utc).isoformat())
-                    ts = datetime.fromisoformat(ts_str)
-                    if ts.tzinfo is not None:
-                        ts = ts.replace(tzinfo=None)
-
-                    log_entry = ExecutionLog(
-                        execution_id=exec_uuid,
-                        level=data.get("level", "INFO"),
-                        message=data.get("message", ""),
-                        log_metadata=json.loads(data.get("metadata", "{}")),
-                        timestamp=ts,
-                        sequence=seq,
-                    )
-                    logs_to_insert.append(log_entry)
-                except Exception as e:
-                    logger.warning(f"Failed to parse log entry {entry_id}: {e}")
-                    continue
-
-            if not logs_to_insert:
-                return 0
-
-            # Batch insert to Postgres
-            if session is not None:
-                # Use provided session (caller manages commit)
-                session.add_all(logs_to_insert)
-            else:
-                # Create own session
-                from src.core.database import get_session_factory
+        if session is not None:
+            # Use provided session (caller manages commit)
+            await ExecutionLogRepository(session).copy_logs(rows)
+        else:
+            # Create own session
+            from src.core.database import get_session_factory
 
-                session_factory = get_session_factory()
-                async with session_factory() as db:
-                    db.add_all(logs_to_insert)
-                    await db.commit()
+            session_factory = get_session_factory()
+            async with session_factory() as db:
+                await ExecutionLogRepository(db).copy_logs(rows)
+                await db.commit()
 
-            # Clear the stream after successful persistence
-            await r.delete(stream_key)
+        # Clear the stream after successful persistence
+        await clear_stream_logs(exec_id)
 
-            logger.debug(f"Flushed {len(logs_to_insert)} logs to Postgres for {exec_id}")
-            return len(logs_to_insert)
+        logger.debug(f"Flushed {len(rows)} logs to Postgres for {exec_id}")
+        return len(rows)
 
     except Exception as e:
         logger.error(f"Failed to flush logs to Postgres: {e}")
         return 0
+
+
+def parse_stream_entry(
+    execution_id: UUID,
+    entry_id: str,
+    data: dict[str, str],
+    fallback_sequence: int = 0,
+) -> dict[str, Any]:
+    """
+    Convert a log stream entry to ExecutionLog column values.
+
+    Raises:
+        ValueError: If the entry's timestamp or metadata is malformed
+    """
+    ts_str = data.get("timestamp") or datetime.now(timezone.utc).isoformat()
+    ts = datetime.fromisoformat(ts_str)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    seq = data.get("seq")
+    return {
+        "execution_id": execution_id,
+        "level": data.get("level", "INFO"),
+        "message": data.get("message", ""),
+        "log_metadata": json.loads(data.get("metadata") or "{}"),
+        "timestamp": ts,
+        "sequence": int(seq) if seq is not None else fallback_sequence,
+    }
+
+
+def stream_entries(response: Any) -> list[tuple[str, dict[str, str]]]:
+    """Flatten an XREADGROUP response into (entry id, fields) pairs."""
+    return [
+        (entry_id, data)
+        for _, entries in response or []
+        for entry_id, data in entries
+        # Entries trimmed while pending are returned without fields
+        if data
+    ]
+
+
+async def _wait_for_persisters(r: Any, stream_key: str) -> None:
+    """Wait until no persister holds unacknowledged entries of a stream, or time out."""
+    deadline = time.monotonic() + LOG_FINALIZE_WAIT_SECONDS
+    while True:
+        summary = await r.xpending(stream_key, LOG_PERSISTER_GROUP)
+        in_flight = sum(
+            int(consumer["pending"])
+            for consumer in summary.get("consumers") or []
+            if consumer["name"] not in (LOG_FINALIZER_CONSUMER, LOG_FINALIZER_CONSUMER.encode())
+        )
+        if not in_flight or time.monotonic() >= deadline:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def load_stream_logs(execution_id: str | UUID) -> list[dict[str, Any]]:
+    """
+    Read the log entries of an execution the persister has not written yet.
+
+    Waits (up to LOG_FINALIZE_WAIT_SECONDS) for batches a persister is
+    writing to be acknowledged, then claims every entry still pending (its
+    COPY failed, or its persister stopped) and reads every entry not yet
+    delivered to the persister group, so nothing is lost when the stream is
+    cleared. A batch whose COPY is still running after the wait may be
+    persisted twice. Streams written before the group existed are read in
+    full.
+
+    Args:
+        execution_id: Execution UUID
+
+    Returns:
+        Keyword arguments for ExecutionLog, in sequence order (empty if none)
+    """
+    from redis.exceptions import ResponseError
+
+    from src.core.cache import get_redis
+
+    exec_id = str(execution_id)
+    exec_uuid = UUID(exec_id)
+    stream_key = execution_logs_stream_key(exec_id)
+
+    entries: list[tuple[str, dict[str, str]]] = []
+    async with get_redis() as r:
+        try:
+            await _wait_for_persisters(r, stream_key)
+            start = "0-0"
+            while True:
+                claimed = await r.xautoclaim(
+                    stream_key,
+                    LOG_PERSISTER_GROUP,
+                    LOG_FINALIZER_CONSUMER,
+                    min_idle_time=0,
+                    start_id=start,
+                    count=1000,
+                )
+                start, batch = claimed[0], claimed[1]
+                entries.extend((entry_id, data) for entry_id, data in batch if data)
+                if start in ("0-0", b"0-0"):
+                    break
+            while True:
+                response = await r.xreadgroup(
+                    LOG_PERSISTER_GROUP,
+                    LOG_FINALIZER_CONSUMER,
+                    {stream_key: ">"},
+                    count=1000,
+                )
+                batch = stream_entries(response)
+                if not batch:
+                    break
+                entries.extend(batch)
+        except ResponseError as e:
+            if "NOGROUP" not in str(e):
+                raise
+            # No group: the stream is missing or predates the persister
+            entries = await r.xrange(stream_key, min="-", max="+")  # type: ignore[misc]
+
+    logs: list[dict[str, Any]] = []
+    for index, (entry_id, data) in enumerate(entries or []):
+        try:
+            logs.append(parse_stream_entry(exec_uuid, entry_id, data, index))
+        except Exception as e:
+            logger.warning(f"Failed to parse log entry {entry_id}: {e}")
+            continue
+    logs.sort(key=lambda row: row["sequence"])
+    return logs
+
+
+async def clear_stream_logs(execution_id: str | UUID) -> None:
+    """Delete an execution's log stream once its logs are committed."""
+    from src.core.cache import get_redis
+
+    exec_id = str(execution_id)
+    async with get_redis() as r:
+        await r.delete(
+            execution_logs_stream_key(exec_id),
+            execution_logs_sequence_key(exec_id),
+        )
+        await r.srem(active_log_streams_key(), exec_id)  # type: ignore[misc]
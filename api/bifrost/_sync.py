@@ -45,41 +45,25 @@ async def flush_pending_changes(
     Raises:
         SyncError: If flush fails after retries
     """
-    r = await get_shared_redis()
-    redis_key = pending_changes_key(execution_id)
-
-    pending = await r.hgetall(redis_key)  # type: ignore[misc]
-    if not pending:
+    changes = await load_pending_changes(execution_id)
+    if not changes:
         return 0
 
-    changes: list[dict[str, Any]] = []
-    for value in pending.values():
-        try:
-            changes.append(json.loads(value))
-        except json.JSONDecodeError:
-            continue
-
-    changes.sort(key=lambda c: c.get("sequence", 0))
-
-    async def _apply_all(db: "AsyncSession") -> None:
-        for change in changes:
-            await _apply_change(db, change)
-
     for attempt in range(3):
         try:
             if session is not None:
                 # Use provided session (caller manages commit)
-                await _apply_all(session)
+                await apply_pending_changes(session, changes)
             else:
                 # Create own session
                 from src.core.database import get_session_factory
 
                 session_factory = get_session_factory()
                 async with session_factory() as db:
-                    await _apply_all(db)
+                    await apply_pending_changes(db, changes)
                     await db.commit()
 
-            await r.delete(redis_key)
+            await clear_pending_changes(execution_id)
             logger.info(f"Flushed {len(changes)} changes for {execution_id}")
             return len(changes)
         except Exception as e:
@@ -89,6 +73,44 @@ async def flush_pending_changes(
     return 0
 
 
+async def load_pending_changes(execution_id: str) -> list[dict[str, Any]]:
+    """
+    Read an execution's buffered changes from Redis, in write order.
+
+    Args:
+        execution_id: Execution ID
+
+    Returns:
+        Changes to pass to apply_pending_changes (empty if none)
+    """
+    r = await get_shared_redis()
+    pending = await r.hgetall(pending_changes_key(execution_id))  # type: ignore[misc]
+    if not pending:
+        return []
+
+    changes: list[dict[str, Any]] = []
+    for value in pending.values():
+        try:
+            changes.append(json.loads(value))
+        except json.JSONDecodeError:
+            continue
+
+    changes.sort(key=lambda c: c.get("sequence", 0))
+    return changes
+
+
+async def apply_pending_changes(db: "AsyncSession", changes: list[dict[str, Any]]) -> None:
+    """Apply changes read by load_pending_changes (caller commits)."""
+    for change in changes:
+        await _apply_change(db, change)
+
+
+async def clear_pending_changes(execution_id: str) -> None:
+    """Drop an execution's buffered changes once they are committed."""
+    r = await get_shared_redis()
+    await r.delete(pending_changes_key(execution_id))
+
+
 async def _apply_change(db: "AsyncSession", change: dict[str, Any]) -> None:
     """Apply a single change to Postgres."""
     entity_type = change.get("entity_type")
@@ -133,19 +133,20 @@ class executions:
         """
         Get logs accumulated so far for the current (or specified) execution.
 
-        This reads logs directly from Redis Stream, allowing workflows to
+        This reads the logs already persisted to the database plus the ones
+        still in the execution's Redis Stream, allowing workflows to
         retrieve their own logs accumulated during execution. Useful for
         debugging, progress tracking, or passing execution context to sub-workflows.
 
         Args:
             execution_id: Execution ID to get logs for. If not provided,
                 uses the current execution context.
-            start: Stream ID to start from (default: "0" = beginning)
+            start: Sequence number to start from (default: "0" = beginning)
             count: Maximum entries to read (default: 100)
 
         Returns:
             list[ExecutionLog]: List of log entries with attributes:
-                - id: Stream entry ID
+                - id: Sequence number of the entry (pass id + 1 as start to continue)
                 - execution_id: Execution UUID
                 - level: Log level (INFO, WARNING, ERROR, DEBUG, CRITICAL)
                 - message: Log message text
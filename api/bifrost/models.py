@@ -97,7 +97,7 @@ class WorkflowMetadata(BaseModel):
 class ExecutionLog(BaseModel):
     """Single log entry from workflow execution."""
 
-    id: str  # Redis stream entry ID
+    id: str  # Sequence number of the entry within its execution
     execution_id: str
     level: str  # DEBUG, INFO, WARNING, ERROR, CRITICAL
     message: str
@@ -80,6 +80,14 @@ class Settings(BaseSettings):
         default=10,
         description="Max concurrent workflow executions (controls RabbitMQ prefetch)"
     )
+    execution_write_batch_ms: int = Field(
+        default=5,
+        description="Window in ms during which execution lifecycle writes (records, status, metrics) from concurrent executions are collected into one transaction (0 = commit queued writes immediately)"
+    )
+    execution_write_batch_max: int = Field(
+        default=100,
+        description="Maximum execution lifecycle writes per group transaction"
+    )
 
     # Process Pool Configuration
     min_workers: int = Field(
@@ -102,6 +110,14 @@ class Settings(BaseSettings):
         default=0,
         description="Recycle process after N executions (0 = never)"
     )
+    worker_spawn_mode: str = Field(
+        default="spawn",
+        description="How worker processes start: 'spawn' (fresh interpreter each) or, opt-in, 'forkserver' (forked from a template with heavy modules preloaded)"
+    )
+    worker_async_slots: int = Field(
+        default=1,
+        description="Executions each worker process runs concurrently on one event loop (1 = one at a time). Suited to I/O-bound workflows"
+    )
     worker_heartbeat_interval_seconds: int = Field(
         default=10,
         description="Interval in seconds between worker heartbeat publications"
@@ -110,6 +126,46 @@ class Settings(BaseSettings):
         default=30,
         description="TTL in seconds for worker registration in Redis (refreshed by heartbeat)"
     )
+    worker_reuse_workspace_modules: bool = Field(
+        default=True,
+        description="Keep imported workspace modules between executions unless their content hash changed"
+    )
+    worker_workspace_snapshot: bool = Field(
+        default=True,
+        description="Resolve workspace imports from a per-execution manifest snapshot instead of per-import Redis lookups"
+    )
+
+    # ==========================================================================
+    # Metrics
+    # ==========================================================================
+    metrics_rollup_verify: bool = Field(
+        default=False,
+        description="Compare the incremental execution rollups against a full scan of executions on each metrics refresh (expensive; for checking correctness)"
+    )
+
+    # ==========================================================================
+    # Execution Logs
+    # ==========================================================================
+    execution_log_retention_days: int = Field(
+        default=0,
+        description="Drop monthly execution log partitions once every log in them is older than this many days; this permanently deletes those logs (0 keeps logs forever, the default)"
+    )
+    execution_archive_after_days: int = Field(
+        default=0,
+        description="Move logs, result and variables of executions finished more than this many days ago to compressed objects in the S3 bucket (0 disables archival)"
+    )
+
+    # ==========================================================================
+    # Events
+    # ==========================================================================
+    webhook_fast_ack: bool = Field(
+        default=False,
+        description="Acknowledge validated webhooks once they are appended to the Redis intake stream; workers insert the events and deliveries in batches"
+    )
+    webhook_idempotency_window_seconds: int = Field(
+        default=600,
+        description="How long a webhook's delivery ID header suppresses duplicate deliveries in fast-ack mode"
+    )
 
     # ==========================================================================
     # Redis
@@ -118,6 +174,14 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection URL"
     )
+    pubsub_sharded: bool = Field(
+        default=False,
+        description="Deliver WebSocket channels with sharded pub/sub (SPUBLISH/SSUBSCRIBE, Redis 7+); must match on every API, worker and scheduler"
+    )
+    websocket_send_queue_size: int = Field(
+        default=256,
+        description="Messages queued per WebSocket before the connection is dropped as too slow"
+    )
 
     # ==========================================================================
     # Security
@@ -213,6 +277,10 @@ class Settings(BaseSettings):
         default="/tmp/bifrost",
         description="Path to temporary storage directory"
     )
+    git_worktree_cache_dir: str = Field(
+        default="/tmp/bifrost/git-worktree",
+        description="Node-local copy of the S3 _repo/ git working tree kept between git operations and synced incrementally by S3 ETag (empty syncs the whole tree into a fresh temp dir per operation)"
+    )
 
     # ==========================================================================
     # Default User (for automated deployments and development)
@@ -33,6 +33,8 @@ from .keys import (
     TTL_ORGS,
     TTL_PENDING,
     TTL_ROLES,
+    cache_version_key,
+    cache_warm_key,
     config_hash_key,
     config_key,
     execution_logs_stream_key,
@@ -60,6 +62,7 @@ from .redis_client import (
 
 # Invalidation and upsert functions
 from .invalidation import (
+    bump_cache_versions,
     cleanup_execution_cache,
     invalidate_all_config,
     invalidate_all_orgs,
@@ -87,6 +90,9 @@ from .data_provider_cache import (
     invalidate_data_provider,
     acquire_compute_lock,
     release_compute_lock,
+    wait_for_result as wait_for_data_provider_result,
+    record_cache_outcome as record_data_provider_cache_outcome,
+    get_data_provider_stats,
 )
 
 __all__ = [
@@ -102,6 +108,8 @@ __all__ = [
     "role_forms_key",
     "org_key",
     "orgs_list_key",
+    "cache_version_key",
+    "cache_warm_key",
     "pending_changes_key",
     "execution_logs_stream_key",
     # TTLs
@@ -128,6 +136,7 @@ __all__ = [
     "invalidate_org",
     "invalidate_all_orgs",
     "cleanup_execution_cache",
+    "bump_cache_versions",
     "upsert_config",
     "upsert_org",
     # Pre-warming
@@ -141,4 +150,7 @@ __all__ = [
     "invalidate_data_provider",
     "acquire_compute_lock",
     "release_compute_lock",
+    "wait_for_data_provider_result",
+    "record_data_provider_cache_outcome",
+    "get_data_provider_stats",
 ]
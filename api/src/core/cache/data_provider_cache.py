@@ -6,15 +6,27 @@ Replaces the in-memory cache with Redis for:
 - Durability across restarts
 - TTL-based expiration
 - Stampede protection via SETNX locks
+- Stale-while-revalidate
+
+Entries stay in Redis for a stale window after they expire. While one
+execution holds the compute lock and refreshes an entry, concurrent
+requests are served the stale value. On a cold miss, requests that lose
+the lock wait for the holder to release it (announced on a pub/sub
+channel) and read its result instead of computing it again.
+
+Per-provider hit/miss/stale/coalesced counters are kept in a Redis hash
+(see record_cache_outcome / get_data_provider_stats).
 
 Follows the same patterns as other cache modules in shared/cache/.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -28,6 +40,16 @@ TTL_DATA_PROVIDER = 300
 # Lock TTL for stampede protection (10 seconds)
 TTL_LOCK = 10
 
+# How long an expired entry may still be served while it is refreshed
+TTL_STALE = 300
+
+# How long a request waits for another execution computing the same result
+# before computing it itself
+TTL_WAIT = TTL_LOCK
+
+# Outcomes counted per data provider
+CACHE_OUTCOMES = ("hit", "miss", "stale", "coalesced")
+
 
 def _get_scope(org_id: str | None) -> str:
     """Get the scope prefix for a key."""
@@ -64,6 +86,26 @@ def data_provider_lock_key(org_id: str | None, name: str, param_hash: str) -> st
     return f"bifrost:{scope}:dp:{name}:{param_hash}:lock"
 
 
+def data_provider_ready_channel(org_id: str | None, name: str, param_hash: str) -> str:
+    """
+    Pub/sub channel announcing that a compute lock was released.
+
+    Pattern: bifrost:{scope}:dp:{name}:{param_hash}:ready
+    """
+    scope = _get_scope(org_id)
+    return f"bifrost:{scope}:dp:{name}:{param_hash}:ready"
+
+
+def data_provider_stats_key(org_id: str | None, name: str) -> str:
+    """
+    Key for per-provider cache outcome counters (hash).
+
+    Pattern: bifrost:{scope}:dp_stats:{name}
+    """
+    scope = _get_scope(org_id)
+    return f"bifrost:{scope}:dp_stats:{name}"
+
+
 def compute_param_hash(parameters: dict[str, Any] | None) -> str:
     """
     Compute deterministic hash of parameters.
@@ -82,10 +124,16 @@ def compute_param_hash(parameters: dict[str, Any] | None) -> str:
     return hashlib.sha256(param_str.encode()).hexdigest()[:16]
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp stored in a cache entry."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 async def get_cached_result(
     org_id: str | None,
     name: str,
-    parameters: dict[str, Any] | None
+    parameters: dict[str, Any] | None,
+    allow_stale: bool = False
 ) -> dict[str, Any] | None:
     """
     Get cached data provider result from Redis.
@@ -94,6 +142,8 @@ async def get_cached_result(
         org_id: Organization ID
         name: Data provider function name
         parameters: Input parameters
+        allow_stale: Also return entries that expired but are still
+            within their stale window (marked with 'stale': True)
 
     Returns:
         Cached entry with 'data' and 'expires_at' keys, or None if not cached
@@ -114,8 +164,17 @@ async def get_cached_result(
             # Parse expires_at and check if still valid
             expires_at_str = cached_entry.get("expires_at")
             if expires_at_str:
-                expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
-                if datetime.now(timezone.utc) >= expires_at:
+                now = datetime.now(timezone.utc)
+                if now >= _parse_timestamp(expires_at_str):
+                    stale_until_str = cached_entry.get("stale_until")
+                    if stale_until_str and now < _parse_timestamp(stale_until_str):
+                        # Within the stale window - keep it for revalidation
+                        if not allow_stale:
+                            return None
+                        logger.debug(f"Serving stale cache for data provider: {name}")
+                        cached_entry["stale"] = True
+                        return cached_entry
+
                     # Expired - Redis TTL should have handled this, but be safe
                     logger.debug(f"Cache expired for data provider: {name}")
                     await r.delete(cache_key)
@@ -138,17 +197,22 @@ async def cache_result(
     name: str,
     parameters: dict[str, Any] | None,
     result: Any,
-    ttl_seconds: int = TTL_DATA_PROVIDER
+    ttl_seconds: int = TTL_DATA_PROVIDER,
+    stale_seconds: int = TTL_STALE
 ) -> datetime:
     """
     Cache a data provider result in Redis.
 
+    The entry is fresh for ttl_seconds and kept for another stale_seconds
+    so it can be served while it is being refreshed.
+
     Args:
         org_id: Organization ID
         name: Data provider function name
         parameters: Input parameters
         result: Result to cache
         ttl_seconds: Time to live in seconds
+        stale_seconds: Stale window after expiry in seconds
 
     Returns:
         Expiration datetime
@@ -156,18 +220,20 @@ async def cache_result(
     param_hash = compute_param_hash(parameters)
     cache_key = data_provider_cache_key(org_id, name, param_hash)
     expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+    stale_until = expires_at + timedelta(seconds=stale_seconds)
 
     cache_entry = {
         "data": result,
-        "expires_at": expires_at.isoformat()
+        "expires_at": expires_at.isoformat(),
+        "stale_until": stale_until.isoformat(),
     }
 
     try:
         async with get_redis() as r:
-            # Use SETEX for atomic set with TTL
+            # Use SETEX for atomic set with TTL (covering the stale window)
             await r.setex(
                 cache_key,
-                ttl_seconds,
+                ttl_seconds + stale_seconds,
                 json.dumps(cache_entry, default=str)
             )
             logger.info(f"Cached data provider result: {name} (TTL: {ttl_seconds}s)")
@@ -273,6 +339,9 @@ async def release_compute_lock(
     """
     Release the compute lock after caching result.
 
+    Also wakes requests waiting in wait_for_result(), whether or not a
+    result was cached.
+
     Args:
         org_id: Organization ID
         name: Data provider function name
@@ -284,7 +353,98 @@ async def release_compute_lock(
     try:
         async with get_redis() as r:
             await r.delete(lock_key)
+            await r.publish(data_provider_ready_channel(org_id, name, param_hash), "1")
 
     except CacheError as e:
         # Lock will expire on its own - log and continue
         logger.warning(f"Lock release failed for {name}: {e}")
+
+
+async def wait_for_result(
+    org_id: str | None,
+    name: str,
+    parameters: dict[str, Any] | None,
+    timeout: float = TTL_WAIT
+) -> dict[str, Any] | None:
+    """
+    Wait for another execution holding the compute lock to cache a result.
+
+    Subscribes to the ready channel before checking the cache, so a
+    release between the check and the subscription isn't missed.
+
+    Args:
+        org_id: Organization ID
+        name: Data provider function name
+        parameters: Input parameters
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Cached entry, or None if the holder failed or didn't finish in time
+        (the caller should then compute the result itself)
+    """
+    param_hash = compute_param_hash(parameters)
+    lock_key = data_provider_lock_key(org_id, name, param_hash)
+    channel = data_provider_ready_channel(org_id, name, param_hash)
+    deadline = time.monotonic() + timeout
+
+    try:
+        async with get_redis() as r:
+            pubsub = r.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                while True:
+                    entry = await get_cached_result(org_id, name, parameters)
+                    if entry is not None:
+                        return entry
+                    if not await r.exists(lock_key):
+                        # Holder finished (or gave up) without caching
+                        return None
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.info(f"Timed out waiting for data provider: {name}")
+                        return None
+                    await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=remaining,
+                    )
+            finally:
+                await pubsub.aclose()
+
+    except CacheError as e:
+        logger.warning(f"Waiting for cached result failed for {name}: {e}")
+        return None
+    except asyncio.TimeoutError:
+        return None
+
+
+async def record_cache_outcome(org_id: str | None, name: str, outcome: str) -> None:
+    """
+    Increment a provider's cache outcome counter (best effort).
+
+    Args:
+        org_id: Organization ID
+        name: Data provider function name
+        outcome: One of CACHE_OUTCOMES
+    """
+    try:
+        async with get_redis() as r:
+            await r.hincrby(data_provider_stats_key(org_id, name), outcome, 1)
+    except CacheError as e:
+        logger.debug(f"Cache stats update failed for {name}: {e}")
+
+
+async def get_data_provider_stats(org_id: str | None, name: str) -> dict[str, int]:
+    """
+    Get a provider's cache outcome counters.
+
+    Returns:
+        Dict with a count for each of CACHE_OUTCOMES
+    """
+    try:
+        async with get_redis() as r:
+            raw = await r.hgetall(data_provider_stats_key(org_id, name))
+    except CacheError as e:
+        logger.warning(f"Cache stats read failed for {name}: {e}")
+        raw = {}
+    return {outcome: int(raw.get(outcome, 0)) for outcome in CACHE_OUTCOMES}
@@ -12,17 +12,22 @@ Pattern (Dual-Write):
 Pattern (Invalidation):
     1. API route deletes from Postgres
     2. API route calls invalidate_* to clear Redis cache
+
+Both patterns bump the scope's cache version for the affected kind of
+data (see cache_version_key), which makes the next prewarm_sdk_cache()
+for that scope refresh it.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .keys import (
     TTL_CONFIG,
     TTL_ORGS,
+    cache_version_key,
     config_hash_key,
     config_key,
     form_key,
@@ -42,6 +47,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def _bump_cache_version(r: Any, org_id: str | None, kind: str) -> None:
+    """Mark a kind of cached SDK data as changed in a scope."""
+    await r.incr(cache_version_key(org_id, kind))
+
+
+async def bump_cache_versions(org_id: str | None, *kinds: str) -> None:
+    """
+    Mark kinds of cached SDK data as changed after a bulk write.
+
+    For writers that change rows without the upsert/invalidate functions
+    below (e.g. git sync imports). Org-scoped data also depends on the
+    global scope, so bumping it (org_id=None) makes the next pre-warm of
+    every organization refresh those kinds.
+
+    Args:
+        org_id: Organization ID or None for global
+        kinds: Kinds of data that changed ("config", "forms", "roles", "org")
+    """
+    try:
+        r = await get_shared_redis()
+        for kind in kinds:
+            await _bump_cache_version(r, org_id, kind)
+
+        logger.debug(f"Bumped cache versions: org={org_id}, kinds={kinds}")
+    except Exception as e:
+        logger.warning(f"Failed to bump cache versions: {e}")
+
+
 # =============================================================================
 # Config Cache (Dual-Write)
 # =============================================================================
@@ -79,6 +112,9 @@ async def upsert_config(
         if ttl < 0:  # -1 = no TTL, -2 = key doesn't exist
             await r.expire(hash_key, TTL_CONFIG)
 
+        # Org hashes also hold merged copies of global configs
+        await _bump_cache_version(r, org_id, "config")
+
         logger.debug(f"Upserted config to cache: org={org_id}, key={key}")
     except Exception as e:
         # Log but don't fail - cache is best-effort
@@ -103,6 +139,8 @@ async def invalidate_config(org_id: str | None, key: str | None = None) -> None:
         if key:
             await r.delete(config_key(org_id, key))
 
+        await _bump_cache_version(r, org_id, "config")
+
         logger.debug(f"Invalidated config cache: org={org_id}, key={key}")
     except Exception as e:
         # Log but don't fail - cache invalidation is best-effort
@@ -144,6 +182,8 @@ async def invalidate_form(org_id: str | None, form_id: str | None = None) -> Non
         async for key in r.scan_iter(pattern):
             await r.delete(key)
 
+        await _bump_cache_version(r, org_id, "forms")
+
         logger.debug(f"Invalidated form cache: org={org_id}, form_id={form_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate form cache: {e}")
@@ -186,6 +226,9 @@ async def invalidate_role(org_id: str | None, role_id: str | None = None) -> Non
             await r.delete(role_users_key(org_id, role_id))
             await r.delete(role_forms_key(org_id, role_id))
 
+        # Also makes accessible forms refresh (they depend on roles)
+        await _bump_cache_version(r, org_id, "roles")
+
         logger.debug(f"Invalidated role cache: org={org_id}, role_id={role_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate role cache: {e}")
@@ -200,6 +243,7 @@ async def invalidate_role_users(org_id: str | None, role_id: str) -> None:
         pattern = f"bifrost:{_get_scope(org_id)}:user_forms:*"
         async for key in r.scan_iter(pattern):
             await r.delete(key)
+        await _bump_cache_version(r, org_id, "roles")
         logger.debug(f"Invalidated role users cache: org={org_id}, role_id={role_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate role users cache: {e}")
@@ -214,6 +258,7 @@ async def invalidate_role_forms(org_id: str | None, role_id: str) -> None:
         pattern = f"bifrost:{_get_scope(org_id)}:user_forms:*"
         async for key in r.scan_iter(pattern):
             await r.delete(key)
+        await _bump_cache_version(r, org_id, "roles")
         logger.debug(f"Invalidated role forms cache: org={org_id}, role_id={role_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate role forms cache: {e}")
@@ -272,6 +317,7 @@ async def invalidate_org(org_id: str) -> None:
         r = await get_shared_redis()
         await r.delete(org_key(org_id))
         await r.delete(orgs_list_key())
+        await _bump_cache_version(r, org_id, "org")
         logger.debug(f"Invalidated org cache: org_id={org_id}")
     except Exception as e:
         logger.warning(f"Failed to invalidate org cache: {e}")
@@ -286,6 +332,7 @@ async def invalidate_all_orgs() -> None:
         pattern = "bifrost:global:orgs:*"
         async for key in r.scan_iter(pattern):
             await r.delete(key)
+        await _bump_cache_version(r, None, "org")
         logger.debug("Invalidated all org cache")
     except Exception as e:
         logger.warning(f"Failed to invalidate all org cache: {e}")
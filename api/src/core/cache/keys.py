@@ -131,6 +131,35 @@ def orgs_list_key() -> str:
     return "bifrost:global:orgs:_list"
 
 
+# =============================================================================
+# Cache Version Keys (pre-warm skipping)
+# =============================================================================
+
+
+def cache_version_key(org_id: str | None, kind: str) -> str:
+    """
+    Key for the change version of one kind of cached SDK data in a scope.
+
+    Structure: STRING integer, INCR'd by the invalidation functions
+    kind: "config", "forms", "roles" or "org"
+    """
+    scope = _get_scope(org_id)
+    return f"bifrost:{scope}:cache_version:{kind}"
+
+
+def cache_warm_key(org_id: str | None, kind: str, user_id: str | None = None) -> str:
+    """
+    Key recording the versions a kind of cached SDK data was last warmed at.
+
+    Structure: STRING version token, expires with the warmed data
+    user_id: Set for user-specific data (accessible forms)
+    """
+    scope = _get_scope(org_id)
+    if user_id:
+        return f"bifrost:{scope}:cache_warm:{kind}:{user_id}"
+    return f"bifrost:{scope}:cache_warm:{kind}"
+
+
 # =============================================================================
 # Embed Execution Scoping Keys
 # =============================================================================
@@ -210,6 +239,95 @@ def execution_logs_stream_key(execution_id: str) -> str:
     return f"bifrost:logs:{execution_id}"
 
 
+def execution_logs_sequence_key(execution_id: str) -> str:
+    """
+    Key for the counter numbering an execution's log entries.
+
+    Structure: STRING integer, incremented per appended entry
+    TTL: 24 hours
+    """
+    return f"bifrost:logs:{execution_id}:seq"
+
+
+def active_log_streams_key() -> str:
+    """
+    Key for the set of executions whose log streams hold unpersisted entries.
+
+    Structure: SET of execution IDs, tailed by the log persister
+    """
+    return "bifrost:logs:active"
+
+
+# =============================================================================
+# Event Intake Keys (Fast-Ack Webhooks)
+# =============================================================================
+
+
+def event_intake_stream_key() -> str:
+    """
+    Key for the Redis Stream buffering accepted webhook events.
+
+    Structure: STREAM with one entry per event, consumed by the event materializer
+    """
+    return "bifrost:events:intake"
+
+
+def event_idempotency_key(source_id: str, idempotency_key: str) -> str:
+    """
+    Key marking a webhook delivery as already accepted for an event source.
+
+    Structure: STRING event ID of the first delivery
+    TTL: settings.webhook_idempotency_window_seconds
+    """
+    return f"bifrost:events:idem:{source_id}:{idempotency_key}"
+
+
+def event_intake_lag_key() -> str:
+    """
+    Key for the latest intake lag of each event source.
+
+    Structure: HASH where field = event source ID, value = JSON lag record
+    """
+    return "bifrost:events:lag"
+
+
+# =============================================================================
+# Metrics Counter Keys (Execution Metrics Aggregation)
+# =============================================================================
+
+# Counter hashes live at f"{METRIC_COUNTERS_PREFIX}{bucket}:{suffix}". They are
+# written by a Lua script that picks the bucket itself, so the prefix is
+# shared with the script rather than built per hash here.
+METRIC_COUNTERS_PREFIX = "bifrost:metrics:counters:"
+
+
+def metric_counters_bucket_keys_key(bucket: int) -> str:
+    """
+    Key for the set of counter hashes written in a minute bucket.
+
+    Structure: SET of counter hash keys
+    """
+    return f"{METRIC_COUNTERS_PREFIX}{bucket}:keys"
+
+
+def metric_counters_buckets_key() -> str:
+    """
+    Key for the index of minute buckets holding unflushed counters.
+
+    Structure: ZSET where member = score = bucket (minutes since epoch)
+    """
+    return f"{METRIC_COUNTERS_PREFIX}buckets"
+
+
+def metric_counters_sealed_key() -> str:
+    """
+    Key for the newest bucket closed for flushing.
+
+    Structure: STRING bucket number; writers move to a later bucket
+    """
+    return f"{METRIC_COUNTERS_PREFIX}sealed"
+
+
 # =============================================================================
 # Authentication Keys (Refresh Token JTI, OAuth State, Rate Limiting)
 # =============================================================================
@@ -286,6 +404,8 @@ TTL_ROLES = 600  # 10 minutes
 TTL_ORGS = 3600  # 1 hour
 TTL_PENDING = 3600  # 1 hour (safety for orphaned changes)
 TTL_PENDING_EXECUTION = 3600  # 1 hour (safety for orphaned pending executions)
+TTL_METRIC_COUNTERS = 604800  # 7 days (safety if the flush job is down)
+TTL_LOG_SEQUENCE = 86400  # 24 hours (outlives any execution)
 
 # Embed TTLs
 TTL_EMBED_EXECUTION = 86400  # 24 hours (embed session → execution link)
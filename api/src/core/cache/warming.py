@@ -8,13 +8,23 @@ Pattern:
     1. Consumer receives execution request
     2. Consumer calls prewarm_sdk_cache() (async, in main event loop)
     3. Worker thread spawns and SDK reads from Redis (fast, non-blocking)
+
+Version skipping:
+    Each scope keeps a change version per kind of data (config, forms,
+    roles, org), bumped by the invalidation/upsert functions. After
+    warming a kind, a marker storing the versions it was built from is
+    written with the same TTL as the data. Pre-warm reads all versions and
+    markers with one MGET and refreshes only the kinds whose marker is
+    missing or outdated, concurrently and each with its own DB session.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 from uuid import UUID
 
 from sqlalchemy import or_, select
@@ -24,6 +34,8 @@ from .keys import (
     TTL_FORMS,
     TTL_ORGS,
     TTL_ROLES,
+    cache_version_key,
+    cache_warm_key,
     config_hash_key,
     forms_hash_key,
     org_key,
@@ -39,6 +51,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Version kinds each warmed kind depends on (accessible forms depend on
+# role assignments too)
+_WARM_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "config": ("config",),
+    "forms": ("forms", "roles"),
+    "roles": ("roles",),
+    "org": ("org",),
+}
+
+# Marker TTLs match the TTL of the data they describe
+_WARM_TTLS = {
+    "config": TTL_CONFIG,
+    "forms": TTL_FORMS,
+    "roles": TTL_ROLES,
+    "org": TTL_ORGS,
+}
+
 
 async def prewarm_sdk_cache(
     execution_id: str,
@@ -50,7 +79,9 @@ async def prewarm_sdk_cache(
     Pre-warm Redis cache with data needed for SDK operations.
 
     Called from async context BEFORE workflow execution starts.
-    Queries Postgres once and populates Redis with all data the SDK might need.
+    When nothing changed since the last pre-warm for this org/user this is
+    a single Redis round trip; otherwise the stale kinds are re-queried
+    from Postgres in parallel.
 
     Args:
         execution_id: Execution UUID for logging
@@ -58,10 +89,6 @@ async def prewarm_sdk_cache(
         user_id: User ID executing the workflow
         is_admin: Whether the user is an admin (affects form visibility)
     """
-    from src.core.database import get_session_factory
-
-    session_factory = get_session_factory()
-
     org_uuid = None
     if org_id and org_id != "GLOBAL":
         try:
@@ -70,25 +97,107 @@ async def prewarm_sdk_cache(
             pass
 
     try:
-        async with session_factory() as db:
-            r = await get_shared_redis()
+        r = await get_shared_redis()
 
-            # Pre-warm in parallel for efficiency
-            await _prewarm_configs(db, r, org_uuid)
-            await _prewarm_forms(db, r, org_uuid, user_id, is_admin)
-            await _prewarm_roles(db, r, org_uuid)
+        stale = await _get_stale_kinds(r, org_uuid, user_id, is_admin)
+        if not stale:
+            logger.debug(
+                f"SDK cache current for execution {execution_id}, org={org_id}"
+            )
+            return
 
-            if org_uuid:
-                await _prewarm_organization(db, r, org_uuid)
+        refreshers: dict[str, Callable[..., Awaitable[None]]] = {
+            "config": lambda db: _prewarm_configs(db, r, org_uuid),
+            "forms": lambda db: _prewarm_forms(db, r, org_uuid, user_id, is_admin),
+            "roles": lambda db: _prewarm_roles(db, r, org_uuid),
+            "org": lambda db: _prewarm_organization(db, r, org_uuid),
+        }
+        results = await asyncio.gather(
+            *(
+                _refresh_kind(r, refreshers[kind], marker_key, token, _WARM_TTLS[kind])
+                for kind, (marker_key, token) in stale.items()
+            ),
+            return_exceptions=True,
+        )
+        for kind, result in zip(stale, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to pre-warm SDK {kind} cache: {result}")
 
         logger.debug(
-            f"Pre-warmed SDK cache for execution {execution_id}, org={org_id}"
+            f"Pre-warmed SDK cache for execution {execution_id}, org={org_id}: "
+            f"{', '.join(stale)}"
         )
     except Exception as e:
         # Log but don't fail execution - SDK will fall back to DB queries
         logger.warning(f"Failed to pre-warm SDK cache: {e}")
 
 
+async def _get_stale_kinds(
+    r: Any,
+    org_uuid: UUID | None,
+    user_id: str,
+    is_admin: bool,
+) -> dict[str, tuple[str, str]]:
+    """
+    Find the kinds of SDK data that need to be (re)warmed.
+
+    Reads every relevant version and warm marker with a single MGET.
+
+    Returns:
+        Dict of kind -> (warm marker key, version token to store after warming)
+    """
+    org_id = str(org_uuid) if org_uuid else None
+    # Org-scoped data also includes global rows, so depends on both scopes
+    scopes: list[str | None] = [org_id, None] if org_id else [None]
+
+    kinds = ["config", "forms", "roles"] + (["org"] if org_id else [])
+    version_kinds = sorted({dep for kind in kinds for dep in _WARM_DEPENDENCIES[kind]})
+    version_keys = [
+        cache_version_key(scope, dep) for dep in version_kinds for scope in scopes
+    ]
+
+    # Accessible forms differ per user (and for admins)
+    forms_user = f"{user_id}:{'admin' if is_admin else 'member'}"
+    marker_keys = {
+        kind: cache_warm_key(org_id, kind, forms_user if kind == "forms" else None)
+        for kind in kinds
+    }
+
+    values = await r.mget(version_keys + list(marker_keys.values()))
+    versions = dict(zip(version_keys, values[: len(version_keys)]))
+    markers = dict(zip(marker_keys, values[len(version_keys):]))
+
+    stale: dict[str, tuple[str, str]] = {}
+    for kind in kinds:
+        token = ".".join(
+            str(versions[cache_version_key(scope, dep)] or 0)
+            for dep in _WARM_DEPENDENCIES[kind]
+            for scope in scopes
+        )
+        if markers[kind] != token:
+            stale[kind] = (marker_keys[kind], token)
+    return stale
+
+
+async def _refresh_kind(
+    r: Any,
+    refresh: Callable[["AsyncSession"], Awaitable[None]],
+    marker_key: str,
+    token: str,
+    ttl: int,
+) -> None:
+    """Re-warm one kind of data in its own DB session, then record its versions."""
+    from src.core.database import get_session_factory
+
+    session_factory = get_session_factory()
+    async with session_factory() as db:
+        await refresh(db)
+
+    # A version bumped while refreshing no longer matches this token, so
+    # the next pre-warm refreshes again
+    await r.set(marker_key, token, ex=ttl)
+
+
 # =============================================================================
 # Pre-warming Functions
 # =============================================================================
@@ -117,9 +226,6 @@ async def _prewarm_configs(
     result = await db.execute(query)
     configs = result.scalars().all()
 
-    if not configs:
-        return
-
     # Build hash data
     config_data: dict[str, str] = {}
     for config in configs:
@@ -142,9 +248,13 @@ async def _prewarm_configs(
     # Write to Redis hash
     org_id = str(org_uuid) if org_uuid else None
     hash_key = config_hash_key(org_id)
+    # Replace the hash so configs deleted since it was written do not linger
+    pipe = r.pipeline(transaction=True)
+    pipe.delete(hash_key)
     if config_data:
-        await r.hset(hash_key, mapping=config_data)
-        await r.expire(hash_key, TTL_CONFIG)
+        pipe.hset(hash_key, mapping=config_data)
+        pipe.expire(hash_key, TTL_CONFIG)
+    await pipe.execute()
 
 
 async def _prewarm_forms(
@@ -211,16 +321,18 @@ async def _prewarm_forms(
     # Write to Redis hash
     org_id = str(org_uuid) if org_uuid else None
     hash_key = forms_hash_key(org_id)
+    pipe = r.pipeline(transaction=False)
     if forms_data:
-        await r.hset(hash_key, mapping=forms_data)
-        await r.expire(hash_key, TTL_FORMS)
+        pipe.hset(hash_key, mapping=forms_data)
+        pipe.expire(hash_key, TTL_FORMS)
 
     # Also cache user's accessible form IDs
     user_forms_redis_key = user_forms_key(org_id, user_id)
     if form_ids:
-        await r.delete(user_forms_redis_key)  # Clear existing
-        await r.sadd(user_forms_redis_key, *form_ids)
-        await r.expire(user_forms_redis_key, TTL_FORMS)
+        pipe.delete(user_forms_redis_key)  # Clear existing
+        pipe.sadd(user_forms_redis_key, *form_ids)
+        pipe.expire(user_forms_redis_key, TTL_FORMS)
+    await pipe.execute()
 
 
 async def _prewarm_roles(
@@ -240,55 +352,71 @@ async def _prewarm_roles(
     if not roles:
         return
 
+    # Role user and form assignments for all roles (two queries, not two per role)
+    role_ids = [role.id for role in roles]
+    users_by_role: dict[str, list[str]] = defaultdict(list)
+    user_result = await db.execute(
+        select(UserRole.role_id, UserRole.user_id).where(UserRole.role_id.in_(role_ids))
+    )
+    for role_id, user_id in user_result.all():
+        users_by_role[str(role_id)].append(str(user_id))
+
+    forms_by_role: dict[str, list[str]] = defaultdict(list)
+    form_result = await db.execute(
+        select(FormRole.role_id, FormRole.form_id).where(FormRole.role_id.in_(role_ids))
+    )
+    for role_id, form_id in form_result.all():
+        forms_by_role[str(role_id)].append(str(form_id))
+
     roles_data: dict[str, str] = {}
     # Use org_id for cache key partitioning (even though roles are global)
     org_id = str(org_uuid) if org_uuid else None
 
+    pipe = r.pipeline(transaction=False)
     for role in roles:
+        role_id = str(role.id)
         cache_value = {
-            "id": str(role.id),
+            "id": role_id,
             "name": role.name,
             "description": role.description,
             "is_active": role.is_active,
         }
-        roles_data[str(role.id)] = json.dumps(cache_value)
+        roles_data[role_id] = json.dumps(cache_value)
 
         # Also cache role's user and form assignments
-        # User assignments
-        user_query = select(UserRole.user_id).where(UserRole.role_id == role.id)
-        user_result = await db.execute(user_query)
-        user_ids = [str(uid) for uid in user_result.scalars().all()]
+        user_ids = users_by_role.get(role_id)
         if user_ids:
-            users_key = role_users_key(org_id, str(role.id))
-            await r.delete(users_key)
-            await r.sadd(users_key, *user_ids)
-            await r.expire(users_key, TTL_ROLES)
-
-        # Form assignments
-        form_query = select(FormRole.form_id).where(FormRole.role_id == role.id)
-        form_result = await db.execute(form_query)
-        form_ids = [str(fid) for fid in form_result.scalars().all()]
+            users_key = role_users_key(org_id, role_id)
+            pipe.delete(users_key)
+            pipe.sadd(users_key, *user_ids)
+            pipe.expire(users_key, TTL_ROLES)
+
+        form_ids = forms_by_role.get(role_id)
         if form_ids:
-            forms_key = role_forms_key(org_id, str(role.id))
-            await r.delete(forms_key)
-            await r.sadd(forms_key, *form_ids)
-            await r.expire(forms_key, TTL_ROLES)
+            forms_key = role_forms_key(org_id, role_id)
+            pipe.delete(forms_key)
+            pipe.sadd(forms_key, *form_ids)
+            pipe.expire(forms_key, TTL_ROLES)
 
     # Write to Redis hash
     hash_key = roles_hash_key(org_id)
     if roles_data:
-        await r.hset(hash_key, mapping=roles_data)
-        await r.expire(hash_key, TTL_ROLES)
+        pipe.hset(hash_key, mapping=roles_data)
+        pipe.expire(hash_key, TTL_ROLES)
+    await pipe.execute()
 
 
 async def _prewarm_organization(
     db: "AsyncSession",
     r: Any,
-    org_uuid: UUID,
+    org_uuid: UUID | None,
 ) -> None:
     """Pre-warm organization data."""
     from src.models import Organization
 
+    if org_uuid is None:
+        return
+
     query = select(Organization).where(Organization.id == org_uuid)
     result = await db.execute(query)
     org = result.scalars().first()
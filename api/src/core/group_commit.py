@@ -0,0 +1,171 @@
+"""
+Group commit for small, independent database writes.
+
+Callers from many concurrent tasks submit write operations (coroutine
+functions taking an AsyncSession). A single flusher collects everything
+submitted within a short window and runs it in one session and one
+transaction, so N tiny single-row transactions become one commit.
+
+If the shared transaction fails, each operation of the batch is retried
+in its own transaction so one bad write only fails its own caller.
+Operations must therefore only touch the database (no Redis or other
+side effects that must not repeat) and must not commit.
+
+Usage:
+    committer = GroupCommitter(get_session_factory(), window_seconds=0.005)
+    await committer.start()
+
+    await committer.submit(lambda session: update_execution(..., session=session))
+
+    await committer.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WriteOp = Callable[["AsyncSession"], Awaitable[Any]]
+
+
+class GroupCommitter:
+    """
+    Batches write operations from concurrent tasks into shared transactions.
+
+    Attributes:
+        batches: Number of transactions committed (or attempted)
+        writes: Number of operations run
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        window_seconds: float = 0.005,
+        max_batch: int = 100,
+        name: str = "group-commit",
+    ):
+        """
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+            window_seconds: How long to collect writes after the first one
+                arrives (0 = commit whatever is queued right away)
+            max_batch: Maximum operations per transaction
+            name: Name of the flusher task (for logs)
+        """
+        self._session_factory = session_factory
+        self.window_seconds = window_seconds
+        self.max_batch = max(1, max_batch)
+        self.name = name
+
+        self._pending: list[tuple[WriteOp, asyncio.Future[Any]]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+        self.batches = 0
+        self.writes = 0
+
+    async def start(self) -> None:
+        """Start the flusher task."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Commit everything still queued and stop the flusher task."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def submit(self, op: Callable[["AsyncSession"], Awaitable[T]]) -> T:
+        """
+        Run a write operation in the next group transaction.
+
+        Args:
+            op: Coroutine function applying the write to the given session
+                (must not commit)
+
+        Returns:
+            The operation's return value, once its transaction committed
+
+        Raises:
+            Exception: Whatever the operation (or its commit) raised when
+                retried on its own
+        """
+        if self._closing or self._task is None or self._task.done():
+            # Not running (startup/shutdown): commit on its own
+            return await self._run_alone(op)
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._pending.append((op, future))
+        self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        """Flusher loop: wait for writes, collect for a window, commit."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            if self.window_seconds > 0 and not self._closing:
+                # Let other in-flight executions join this transaction
+                await asyncio.sleep(self.window_seconds)
+
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                await self._commit(batch)
+
+            if self._closing:
+                return
+
+    async def _commit(self, batch: list[tuple[WriteOp, asyncio.Future[Any]]]) -> None:
+        """Run a batch in one transaction, falling back to one per write."""
+        batch = [(op, future) for op, future in batch if not future.done()]
+        if not batch:
+            return
+
+        self.batches += 1
+        self.writes += len(batch)
+        results: list[Any] = []
+        try:
+            async with self._session_factory() as session:
+                for op, _ in batch:
+                    results.append(await op(session))
+                await session.commit()
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            logger.warning(
+                f"Group commit of {len(batch)} writes failed "
+                f"({type(e).__name__}: {e}), retrying individually"
+            )
+            for item in batch:
+                await self._commit([item])
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        logger.debug(f"Committed {len(batch)} writes in one transaction")
+
+    async def _run_alone(self, op: Callable[["AsyncSession"], Awaitable[T]]) -> T:
+        """Run a write operation in its own transaction."""
+        async with self._session_factory() as session:
+            result = await op(session)
+            await session.commit()
+            return result
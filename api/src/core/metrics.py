@@ -3,9 +3,14 @@ Metrics Helper Functions
 
 Functions for updating execution metrics on completion.
 Called by the workflow execution consumer.
+
+The consumer records completions as Redis counters
+(record_execution_metrics) that the scheduler folds into the daily
+tables; the direct upserts remain as the fallback when Redis is down.
 """
 
 import logging
+import time
 from datetime import datetime, date, timezone
 from uuid import UUID
 
@@ -14,8 +19,15 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import get_redis
+from src.core.cache.keys import (
+    METRIC_COUNTERS_PREFIX,
+    TTL_METRIC_COUNTERS,
+    metric_counters_buckets_key,
+    metric_counters_sealed_key,
+)
 from src.core.database import get_session_factory
-from src.models import ExecutionMetricsDaily, WorkflowROIDaily, Workflow
+from src.models import ExecutionMetricsDaily, MetricsRollupCheckpoint, WorkflowROIDaily, Workflow
 from src.models.enums import ExecutionStatus
 
 logger = logging.getLogger(__name__)
@@ -475,3 +487,243 @@ async def _upsert_workflow_roi(
         )
 
     await db.execute(stmt)
+
+
+async def lock_metrics_checkpoint(db: AsyncSession, name: str) -> int:
+    """
+    Lock a metrics rollup checkpoint row for this transaction.
+
+    Creates the row (position -1, nothing applied yet) on first use. The
+    caller updates the position in the same transaction as the rows it
+    applies, so concurrent or repeated runs never apply the same work twice.
+
+    Args:
+        db: Database session (caller manages commit)
+        name: Checkpoint name
+
+    Returns:
+        The checkpoint position
+    """
+    await db.execute(
+        insert(MetricsRollupCheckpoint)
+        .values(name=name, position=-1)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    result = await db.execute(
+        select(MetricsRollupCheckpoint.position)
+        .where(MetricsRollupCheckpoint.name == name)
+        .with_for_update()
+    )
+    return result.scalar_one()
+
+
+# =============================================================================
+# Counter aggregation
+#
+# Upserting execution_metrics_daily per execution makes today's global row a
+# lock every consumer contends on. Instead, completions increment Redis hash
+# counters in per-minute buckets and the scheduler folds closed buckets into
+# PostgreSQL (src/jobs/schedulers/metrics_flush.py).
+# =============================================================================
+
+# Applies counter ops to the hashes of the current bucket. If the flush job
+# already sealed that bucket, the ops go to the next one instead, so nothing
+# is written to a bucket after it was read.
+#
+# KEYS[1] = sealed bucket, KEYS[2] = bucket index
+# ARGV[1] = bucket, ARGV[2] = key prefix, ARGV[3] = TTL, then per hash:
+#   suffix, op count, then (op, field, value) triples where op is
+#   "i" (HINCRBY), "f" (HINCRBYFLOAT) or "m" (keep maximum)
+_RECORD_COUNTERS_SCRIPT = """
+local bucket = tonumber(ARGV[1])
+local sealed = tonumber(redis.call('GET', KEYS[1]) or '-1')
+if bucket <= sealed then
+    bucket = sealed + 1
+end
+local prefix = ARGV[2] .. bucket .. ':'
+local members = prefix .. 'keys'
+local ttl = ARGV[3]
+local i = 4
+while i <= #ARGV do
+    local key = prefix .. ARGV[i]
+    local count = tonumber(ARGV[i + 1])
+    i = i + 2
+    for _ = 1, count do
+        local op, field, value = ARGV[i], ARGV[i + 1], ARGV[i + 2]
+        i = i + 3
+        if op == 'i' then
+            redis.call('HINCRBY', key, field, value)
+        elseif op == 'f' then
+            redis.call('HINCRBYFLOAT', key, field, value)
+        else
+            local current = tonumber(redis.call('HGET', key, field) or '0')
+            if tonumber(value) > current then
+                redis.call('HSET', key, field, value)
+            end
+        end
+    end
+    redis.call('EXPIRE', key, ttl)
+    redis.call('SADD', members, key)
+end
+redis.call('EXPIRE', members, ttl)
+redis.call('ZADD', KEYS[2], bucket, bucket)
+return bucket
+"""
+
+# Hash fields holding floats (everything else is an integer)
+FLOAT_COUNTER_FIELDS = frozenset(
+    {"total_cpu_seconds", "peak_cpu_seconds", "total_value"}
+)
+
+
+def current_metrics_bucket(now: float | None = None) -> int:
+    """Minute bucket (minutes since the epoch) for a timestamp."""
+    return int((time.time() if now is None else now) // 60)
+
+
+def _counter_scope(org_uuid: UUID | None) -> str:
+    return str(org_uuid) if org_uuid is not None else "global"
+
+
+def _daily_counter_ops(
+    status: str,
+    duration_ms: int | None,
+    peak_memory_bytes: int | None,
+    cpu_total_seconds: float | None,
+    time_saved: int,
+    value: float,
+) -> list[tuple[str, str, int | float]]:
+    """Counter ops for one execution's execution_metrics_daily row."""
+    is_success = status == ExecutionStatus.SUCCESS.value
+    status_field = {
+        ExecutionStatus.SUCCESS.value: "success_count",
+        ExecutionStatus.FAILED.value: "failed_count",
+        ExecutionStatus.TIMEOUT.value: "timeout_count",
+        ExecutionStatus.CANCELLED.value: "cancelled_count",
+    }.get(status)
+
+    ops: list[tuple[str, str, int | float]] = [("i", "execution_count", 1)]
+    if status_field:
+        ops.append(("i", status_field, 1))
+    if duration_ms:
+        ops.append(("i", "total_duration_ms", duration_ms))
+        ops.append(("m", "max_duration_ms", duration_ms))
+    if peak_memory_bytes:
+        ops.append(("i", "total_memory_bytes", peak_memory_bytes))
+        ops.append(("m", "peak_memory_bytes", peak_memory_bytes))
+    if cpu_total_seconds:
+        ops.append(("f", "total_cpu_seconds", cpu_total_seconds))
+        ops.append(("m", "peak_cpu_seconds", cpu_total_seconds))
+    # Only count ROI for successful executions
+    if is_success and time_saved:
+        ops.append(("i", "total_time_saved", time_saved))
+    if is_success and value:
+        ops.append(("f", "total_value", value))
+    return ops
+
+
+def _roi_counter_ops(
+    status: str, time_saved: int, value: float
+) -> list[tuple[str, str, int | float]]:
+    """Counter ops for one execution's workflow_roi_daily row."""
+    is_success = status == ExecutionStatus.SUCCESS.value
+    ops: list[tuple[str, str, int | float]] = [("i", "execution_count", 1)]
+    if is_success:
+        ops.append(("i", "success_count", 1))
+        if time_saved:
+            ops.append(("i", "total_time_saved", time_saved))
+        if value:
+            ops.append(("f", "total_value", value))
+    return ops
+
+
+async def record_execution_metrics(
+    org_id: str | None,
+    status: str,
+    duration_ms: int | None = None,
+    peak_memory_bytes: int | None = None,
+    cpu_total_seconds: float | None = None,
+    time_saved: int = 0,
+    value: float = 0.0,
+    workflow_id: str | None = None,
+) -> None:
+    """
+    Record an execution completion in the Redis metric counters.
+
+    Increments the org and global daily counters and, with a workflow,
+    the workflow ROI counters in one atomic script call. The scheduler
+    folds them into execution_metrics_daily / workflow_roi_daily about
+    once a minute.
+
+    If Redis is unavailable, falls back to upserting the rows directly.
+
+    Args:
+        org_id: Organization ID (None for global/platform executions)
+        status: Final execution status
+        duration_ms: Execution duration in milliseconds
+        peak_memory_bytes: Peak memory usage
+        cpu_total_seconds: Total CPU time
+        time_saved: Minutes saved (only counted for SUCCESS)
+        value: Value generated (only counted for SUCCESS)
+        workflow_id: Workflow ID for per-workflow ROI tracking
+    """
+    today = date.today().isoformat()
+    org_uuid = (
+        UUID(org_id.replace("ORG:", ""))
+        if org_id and org_id.startswith("ORG:")
+        else None
+    )
+
+    daily_ops = _daily_counter_ops(
+        status, duration_ms, peak_memory_bytes, cpu_total_seconds, time_saved, value
+    )
+    hashes = [(f"daily:{today}:{_counter_scope(None)}", daily_ops)]
+    if org_uuid is not None:
+        hashes.append((f"daily:{today}:{_counter_scope(org_uuid)}", daily_ops))
+    if workflow_id:
+        hashes.append((
+            f"roi:{today}:{UUID(workflow_id)}:{_counter_scope(org_uuid)}",
+            _roi_counter_ops(status, time_saved, value),
+        ))
+
+    args: list[str | int | float] = [
+        current_metrics_bucket(),
+        METRIC_COUNTERS_PREFIX,
+        TTL_METRIC_COUNTERS,
+    ]
+    for suffix, ops in hashes:
+        args.extend([suffix, len(ops)])
+        for op in ops:
+            args.extend(op)
+
+    try:
+        async with get_redis() as r:
+            await r.eval(
+                _RECORD_COUNTERS_SCRIPT,
+                2,
+                metric_counters_sealed_key(),
+                metric_counters_buckets_key(),
+                *args,
+            )
+    except Exception as e:
+        logger.warning(
+            f"Recording metric counters failed ({e}), updating metrics directly"
+        )
+        await update_daily_metrics(
+            org_id=org_id,
+            status=status,
+            duration_ms=duration_ms,
+            peak_memory_bytes=peak_memory_bytes,
+            cpu_total_seconds=cpu_total_seconds,
+            time_saved=time_saved,
+            value=value,
+            workflow_id=workflow_id,
+        )
+        if workflow_id:
+            await update_workflow_roi_daily(
+                workflow_id=workflow_id,
+                org_id=org_id,
+                status=status,
+                time_saved=time_saved,
+                value=value,
+            )
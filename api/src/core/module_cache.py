@@ -7,6 +7,8 @@ Workers read modules from this cache during virtual imports.
 Key patterns:
 - bifrost:module:{path} - JSON: {content, path, hash}
 - bifrost:module:index - SET of all module paths
+- bifrost:module:hashes - HASH of module path -> content hash (manifest
+  used by workers to snapshot the workspace in one round trip)
 """
 
 import hashlib
@@ -21,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 MODULE_KEY_PREFIX = "bifrost:module:"
 MODULE_INDEX_KEY = "bifrost:module:index"
+MODULE_HASHES_KEY = "bifrost:module:hashes"
 
 
 class CachedModule(TypedDict):
@@ -78,6 +81,7 @@ async def get_module(path: str) -> CachedModule | None:
         await redis.setex(key, 86400, json.dumps(module))
         redis_conn = await redis._get_redis()
         await cast(Awaitable[int], redis_conn.sadd(MODULE_INDEX_KEY, path))
+        await cast(Awaitable[int], redis_conn.hset(MODULE_HASHES_KEY, path, content_hash))
     except Exception as e:
         logger.warning(f"Failed to re-cache S3 module to Redis: {e}")
 
@@ -101,9 +105,10 @@ async def set_module(path: str, content: str, content_hash: str) -> None:
     cached = CachedModule(content=content, path=path, hash=content_hash)
     await redis.setex(key, 86400, json.dumps(cached))  # 24hr TTL
 
-    # Add to index set
+    # Add to index set and hash manifest
     redis_conn = await redis._get_redis()
     await cast(Awaitable[int], redis_conn.sadd(MODULE_INDEX_KEY, path))
+    await cast(Awaitable[int], redis_conn.hset(MODULE_HASHES_KEY, path, content_hash))
 
     logger.debug(f"Cached module: {path}")
 
@@ -122,9 +127,10 @@ async def invalidate_module(path: str) -> None:
 
     await redis.delete(key)
 
-    # Remove from index set
+    # Remove from index set and hash manifest
     redis_conn = await redis._get_redis()
     await cast(Awaitable[int], redis_conn.srem(MODULE_INDEX_KEY, path))
+    await cast(Awaitable[int], redis_conn.hdel(MODULE_HASHES_KEY, path))
 
     logger.debug(f"Invalidated module cache: {path}")
 
@@ -165,8 +171,8 @@ async def clear_module_cache() -> int:
         keys = [f"{MODULE_KEY_PREFIX}{p if isinstance(p, str) else p.decode()}" for p in paths]
         await cast(Awaitable[int], redis_conn.delete(*keys))
 
-    # Clear the index
-    await cast(Awaitable[int], redis_conn.delete(MODULE_INDEX_KEY))
+    # Clear the index and hash manifest
+    await cast(Awaitable[int], redis_conn.delete(MODULE_INDEX_KEY, MODULE_HASHES_KEY))
 
     logger.info(f"Cleared {count} modules from cache")
     return count
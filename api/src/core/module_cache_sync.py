@@ -23,13 +23,22 @@ from typing import Any
 
 import redis
 
-from src.core.module_cache import MODULE_INDEX_KEY, MODULE_KEY_PREFIX, CachedModule
+from src.core.module_cache import (
+    MODULE_HASHES_KEY,
+    MODULE_INDEX_KEY,
+    MODULE_KEY_PREFIX,
+    CachedModule,
+)
 
 logger = logging.getLogger(__name__)
 
 # TTL for cached modules (24 hours)
 MODULE_CACHE_TTL = 86400
 
+# Compiled bytecode shared between workers.
+# Keys are content-addressed, so entries never need explicit invalidation.
+BYTECODE_KEY_PREFIX = "bifrost:module:bytecode:"
+
 REPO_PREFIX = "_repo/"
 
 # Cached S3 client — reused across calls to avoid repeated setup
@@ -50,6 +59,20 @@ def _get_sync_redis() -> Any:
     )
 
 
+@lru_cache(maxsize=1)
+def _get_sync_redis_binary() -> Any:
+    """
+    Get synchronous Redis client that returns raw bytes.
+
+    Marshalled bytecode is not valid UTF-8, so it needs a client
+    without decode_responses.
+    """
+    return redis.Redis.from_url(
+        os.environ.get("BIFROST_REDIS_URL", "redis://localhost:6379/0"),
+        decode_responses=False,
+    )
+
+
 def _get_s3_client() -> Any:
     """
     Get or create a sync S3 client using botocore (always available via aiobotocore).
@@ -161,8 +184,9 @@ def get_module_sync(path: str) -> CachedModule | None:
             # Cache back to Redis
             try:
                 client.setex(key, MODULE_CACHE_TTL, json.dumps(module))
-                # Also add to module index
+                # Also add to module index and hash manifest
                 client.sadd(MODULE_INDEX_KEY, path)
+                client.hset(MODULE_HASHES_KEY, path, content_hash)
             except redis.RedisError as e:
                 logger.warning(f"Failed to cache S3 module to Redis: {e}")
 
@@ -176,6 +200,116 @@ def get_module_sync(path: str) -> CachedModule | None:
         return None
 
 
+def get_module_hashes_sync(paths: list[str]) -> dict[str, str | None]:
+    """
+    Fetch the current content hash for several modules in one round trip.
+
+    Used by workers to decide which already-imported workspace modules
+    are stale. Modules missing from Redis map to None; no S3 fallback
+    is attempted since a miss only means the module must be re-imported.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable (callers treat this as
+            "everything is stale").
+    """
+    if not paths:
+        return {}
+
+    client = _get_sync_redis()
+    values = client.mget([f"{MODULE_KEY_PREFIX}{path}" for path in paths])
+
+    hashes: dict[str, str | None] = {}
+    for path, data in zip(paths, values):
+        if not data:
+            hashes[path] = None
+            continue
+        try:
+            hashes[path] = json.loads(data).get("hash") or None
+        except (ValueError, AttributeError):
+            hashes[path] = None
+    return hashes
+
+
+def get_module_manifest_sync() -> tuple[dict[str, str], int]:
+    """
+    Fetch the module hash manifest in one round trip.
+
+    Returns:
+        Tuple of (path -> content hash, size of the module index). Callers
+        compare the two to tell whether the manifest covers every module.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable
+    """
+    client = _get_sync_redis()
+    pipe = client.pipeline(transaction=False)
+    pipe.hgetall(MODULE_HASHES_KEY)
+    pipe.scard(MODULE_INDEX_KEY)
+    hashes, index_size = pipe.execute()
+    return dict(hashes or {}), int(index_size or 0)
+
+
+def get_modules_sync(paths: list[str]) -> dict[str, CachedModule]:
+    """
+    Fetch several modules from Redis in one MGET (no S3 fallback).
+
+    Args:
+        paths: Module paths relative to workspace
+
+    Returns:
+        Dict of path -> CachedModule for the paths present in Redis
+    """
+    if not paths:
+        return {}
+
+    try:
+        client = _get_sync_redis()
+        values = client.mget([f"{MODULE_KEY_PREFIX}{path}" for path in paths])
+    except redis.RedisError as e:
+        logger.warning(f"Redis error fetching {len(paths)} modules: {e}")
+        return {}
+
+    modules: dict[str, CachedModule] = {}
+    for path, data in zip(paths, values):
+        if data:
+            try:
+                modules[path] = json.loads(data)
+            except ValueError:
+                logger.warning(f"Invalid cached module JSON: {path}")
+    return modules
+
+
+def get_bytecode_sync(key: str) -> bytes | None:
+    """
+    Fetch marshalled bytecode shared by other workers.
+
+    Args:
+        key: Cache key suffix (see bytecode_cache.bytecode_key)
+
+    Returns:
+        Marshalled code object bytes, or None on miss or Redis error
+    """
+    try:
+        return _get_sync_redis_binary().get(f"{BYTECODE_KEY_PREFIX}{key}")
+    except redis.RedisError as e:
+        logger.debug(f"Redis error fetching bytecode {key}: {e}")
+        return None
+
+
+def set_bytecode_sync(key: str, data: bytes) -> None:
+    """
+    Share marshalled bytecode with other workers (best effort).
+
+    Args:
+        key: Cache key suffix (see bytecode_cache.bytecode_key)
+        data: Marshalled code object
+    """
+    try:
+        _get_sync_redis_binary().setex(f"{BYTECODE_KEY_PREFIX}{key}", MODULE_CACHE_TTL, data)
+    except redis.RedisError as e:
+        logger.debug(f"Redis error caching bytecode {key}: {e}")
+
+
 def _list_s3_modules() -> set[str]:
     """
     List all Python module paths in S3 _repo/ (synchronous).
@@ -239,8 +373,9 @@ def get_module_index_sync() -> set[str]:
 
 
 def reset_sync_redis() -> None:
-    """Reset the sync Redis client."""
+    """Reset the sync Redis clients."""
     _get_sync_redis.cache_clear()
+    _get_sync_redis_binary.cache_clear()
 
 
 def reset_s3_client() -> None:
@@ -0,0 +1,130 @@
+"""
+Keyset Pagination
+
+Continuation tokens for newest-first listings ordered by (timestamp, id).
+
+A token is the base64url-encoded sort key of the last row on a page. The
+next page seeks past that key instead of skipping an OFFSET, so with an
+index ending in (timestamp, id) every page is a short range scan no matter
+how deep it is, and rows inserted in the meantime do not shift later pages.
+
+Plain integer tokens handed out before keyset pagination are still accepted
+and treated as offsets, so clients paging across a deploy keep working.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Sort key of the last row returned on the previous page."""
+
+    timestamp: datetime | None
+    id: Any
+
+
+def encode_cursor(timestamp: datetime | None, row_id: Any) -> str:
+    """Build the continuation token that continues after this row."""
+    payload = [
+        timestamp.isoformat() if timestamp is not None else None,
+        row_id if isinstance(row_id, int) else str(row_id),
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is not a valid cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        timestamp, row_id = json.loads(raw)
+        return Cursor(
+            timestamp=datetime.fromisoformat(timestamp) if timestamp is not None else None,
+            id=row_id,
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid continuation token: {token!r}") from e
+
+
+def _coerce_id(row_id: Any, id_type: type) -> Any:
+    """
+    Convert a cursor id to the id column's Python type.
+
+    Raises:
+        ValueError: If the id is not a valid value of that type
+    """
+    if isinstance(row_id, id_type) and not isinstance(row_id, bool):
+        return row_id
+    try:
+        return id_type(str(row_id))
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid continuation token id: {row_id!r}") from e
+
+
+def parse_continuation_token(
+    token: str | None, id_type: type | None = None
+) -> tuple[Cursor | None, int]:
+    """
+    Parse a continuation token from a request.
+
+    Args:
+        token: Token from the request, if any
+        id_type: Python type of the id column the listing seeks on (UUID,
+            int). The cursor's id is converted to it here, so a crafted or
+            corrupt id is caught before it reaches a query.
+
+    Returns:
+        (cursor, offset). Legacy integer tokens give an offset and no
+        cursor; missing or unreadable tokens start from the first page.
+    """
+    if not token:
+        return None, 0
+    if token.isdigit():
+        return None, int(token)
+    try:
+        cursor = decode_cursor(token)
+        if id_type is not None:
+            cursor = Cursor(cursor.timestamp, _coerce_id(cursor.id, id_type))
+        return cursor, 0
+    except ValueError:
+        return None, 0
+
+
+def seek_before(
+    cursor: Cursor,
+    timestamp_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+) -> ColumnElement[bool]:
+    """
+    Filter for the rows after `cursor` in (timestamp DESC, id DESC) order.
+
+    Postgres sorts NULL timestamps first in descending order, so a cursor
+    on a non-NULL timestamp never returns them again, and a cursor on a
+    NULL timestamp continues through the remaining NULLs before the rest.
+
+    The redundant upper bound on the timestamp alone lets the planner prune
+    partitions of tables partitioned by it, which a row comparison does not.
+    """
+    row_id = _coerce_id(cursor.id, id_column.type.python_type)
+    if cursor.timestamp is None:
+        return or_(
+            and_(timestamp_column.is_(None), id_column < row_id),
+            timestamp_column.is_not(None),
+        )
+    return and_(
+        tuple_(timestamp_column, id_column) < tuple_(cursor.timestamp, row_id),
+        timestamp_column <= cursor.timestamp,
+    )
@@ -9,6 +9,7 @@ Provides real-time updates for:
 Uses Redis pub/sub for scalability across multiple API instances.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -34,6 +35,14 @@ class ConnectionManager:
     - execution:{execution_id} - Execution status updates and logs
     - user:{user_id} - User-specific notifications
     - system - System-wide broadcasts
+
+    Each instance only subscribes to the Redis channels its own sockets
+    listen on: a channel is subscribed when its first local socket joins and
+    unsubscribed when its last one leaves (the keys of `connections`).
+
+    Messages are handed to each socket through a bounded queue drained by a
+    sender task, so one slow client never delays the others; a client that
+    falls websocket_send_queue_size messages behind is disconnected.
     """
 
     # Active WebSocket connections per channel
@@ -42,6 +51,11 @@ class ConnectionManager:
     _redis: redis.Redis | None = None
     # Resilient pub/sub listener for receiving messages
     _pubsub_listener: ResilientPubSubListener | None = None
+    # Outgoing message queue and sender task per socket
+    _queues: dict[WebSocket, asyncio.Queue[str]] = field(default_factory=dict)
+    _senders: dict[WebSocket, asyncio.Task[None]] = field(default_factory=dict)
+    # Pending subscription updates (kept referenced until done)
+    _sync_tasks: set[asyncio.Task[None]] = field(default_factory=set)
 
     async def connect(self, websocket: WebSocket, channels: list[str]) -> None:
         """
@@ -60,19 +74,73 @@ class ConnectionManager:
             await self._init_redis()
 
         for channel in channels:
-            if channel not in self.connections:
-                self.connections[channel] = set()
-            self.connections[channel].add(websocket)
+            self._add(websocket, channel)
             logger.debug(f"WebSocket connected to channel: {channel}")
+        await self._sync_subscriptions()
+
+    async def subscribe(self, websocket: WebSocket, channel: str) -> None:
+        """Add a connected WebSocket to a channel."""
+        self._add(websocket, channel)
+        await self._sync_subscriptions()
+
+    def unsubscribe(self, websocket: WebSocket, channel: str) -> bool:
+        """
+        Remove a WebSocket from a channel.
+
+        Returns:
+            True if the socket was subscribed to the channel
+        """
+        sockets = self.connections.get(channel)
+        if not sockets or websocket not in sockets:
+            return False
+        sockets.discard(websocket)
+        if not sockets:
+            del self.connections[channel]
+            self._schedule_sync()
+        return True
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove WebSocket from all channels."""
+        emptied = False
         for channel, sockets in list(self.connections.items()):
             sockets.discard(websocket)
             if not sockets:
                 del self.connections[channel]
+                emptied = True
+
+        self._queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
+        if emptied:
+            self._schedule_sync()
         logger.debug("WebSocket disconnected")
 
+    def _add(self, websocket: WebSocket, channel: str) -> None:
+        if channel not in self.connections:
+            self.connections[channel] = set()
+        self.connections[channel].add(websocket)
+
+    async def _sync_subscriptions(self) -> None:
+        """Make the Redis subscriptions match the locally watched channels."""
+        if self._pubsub_listener is not None:
+            # Generator: read when the listener applies it, not now
+            await self._pubsub_listener.set_channels(
+                f"bifrost:{channel}" for channel in self.connections
+            )
+
+    def _schedule_sync(self) -> None:
+        """Update subscriptions from sync code (e.g. disconnect handlers)."""
+        if self._pubsub_listener is None:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._sync_subscriptions())
+        except RuntimeError:
+            return
+        self._sync_tasks.add(task)
+        task.add_done_callback(self._sync_tasks.discard)
+
     async def broadcast(self, channel: str, message: dict[str, Any]) -> None:
         """
         Broadcast message to all connections on a channel.
@@ -91,22 +159,58 @@ class ConnectionManager:
             await self._send_local(channel, message)
 
     async def _send_local(self, channel: str, message: dict[str, Any]) -> None:
-        """Send message to local WebSocket connections."""
+        """Queue message for every local WebSocket connection on the channel."""
         if channel not in self.connections:
             return
 
-        dead_connections = set()
+        slow_connections = []
         message_json = json.dumps(message)
 
-        for websocket in self.connections[channel]:
+        for websocket in list(self.connections[channel]):
             try:
+                self._queue_for(websocket).put_nowait(message_json)
+            except asyncio.QueueFull:
+                slow_connections.append(websocket)
+
+        # Drop clients that stopped reading
+        for ws in slow_connections:
+            logger.warning(f"Dropping slow WebSocket client on {channel}")
+            self.disconnect(ws)
+            self._schedule_close(ws)
+
+    def _queue_for(self, websocket: WebSocket) -> asyncio.Queue[str]:
+        """The socket's send queue, starting its sender task on first use."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=get_settings().websocket_send_queue_size)
+            self._queues[websocket] = queue
+            self._senders[websocket] = asyncio.create_task(
+                self._send_loop(websocket, queue)
+            )
+        return queue
+
+    async def _send_loop(self, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        """Write queued messages to one socket until it fails."""
+        try:
+            while True:
+                message_json = await queue.get()
                 await websocket.send_text(message_json)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Clean up dead connection
+            self.disconnect(websocket)
+
+    def _schedule_close(self, websocket: WebSocket) -> None:
+        async def close() -> None:
+            try:
+                await websocket.close(code=1013, reason="Too slow")
             except Exception:
-                dead_connections.add(websocket)
+                pass
 
-        # Clean up dead connections
-        for ws in dead_connections:
-            self.disconnect(ws)
+        task = asyncio.create_task(close())
+        self._sync_tasks.add(task)
+        task.add_done_callback(self._sync_tasks.discard)
 
     async def _publish_to_redis(self, channel: str, message: dict[str, Any]) -> bool:
         """
@@ -120,10 +224,10 @@ class ConnectionManager:
 
         if self._redis:
             try:
-                await self._redis.publish(
-                    f"bifrost:{channel}",
-                    json.dumps(message)
-                )
+                if get_settings().pubsub_sharded:
+                    await self._redis.spublish(f"bifrost:{channel}", json.dumps(message))
+                else:
+                    await self._redis.publish(f"bifrost:{channel}", json.dumps(message))
                 return True
             except Exception as e:
                 logger.warning(f"Failed to publish to Redis: {e}")
@@ -140,12 +244,13 @@ class ConnectionManager:
             # Create resilient listener for receiving messages
             async def on_message(channel: str, data: dict) -> None:
                 # Strip "bifrost:" prefix from channel
-                local_channel = channel.replace("bifrost:", "")
+                local_channel = channel.replace("bifrost:", "", 1)
                 await self._send_local(local_channel, data)
 
             self._pubsub_listener = ResilientPubSubListener(
                 redis_url=settings.redis_url,
-                patterns=["bifrost:*"],
+                channels=[f"bifrost:{channel}" for channel in self.connections],
+                sharded=settings.pubsub_sharded,
                 on_message=on_message,
             )
             await self._pubsub_listener.start()
@@ -156,6 +261,11 @@ class ConnectionManager:
 
     async def close(self) -> None:
         """Clean up connections."""
+        for sender in self._senders.values():
+            sender.cancel()
+        self._senders.clear()
+        self._queues.clear()
+
         if self._pubsub_listener:
             await self._pubsub_listener.stop()
 
@@ -721,6 +831,17 @@ async def publish_reimport_request(job_id: str) -> None:
     await manager._publish_to_redis("scheduler:reimport", {"action": "reimport", "job_id": job_id})
 
 
+async def publish_schedules_changed(next_fire_at: datetime | None) -> None:
+    """Tell the scheduler when a created or edited schedule source fires next."""
+    await manager._publish_to_redis(
+        "scheduler:schedules",
+        {
+            "action": "reschedule",
+            "next_fire_at": next_fire_at.isoformat() if next_fire_at else None,
+        },
+    )
+
+
 async def publish_pool_progress(
     worker_id: str,
     action: str,
@@ -3,7 +3,7 @@ Redis Client for Execution Management
 
 Provides:
 1. Pending execution storage (API writes, Worker reads)
-2. Sync execution results via BLPOP/RPUSH pattern
+2. Sync execution results via RPUSH + ready notification
 3. Cancellation flag management
 
 Execution Flow:
@@ -11,9 +11,11 @@ Execution Flow:
 2. API publishes to RabbitMQ
 3. Worker reads pending execution from Redis
 4. Worker writes to PostgreSQL and executes
-5. For sync: Worker pushes result, API's BLPOP returns
+5. For sync: Worker pushes result and publishes a ready notification;
+   the API's SyncResultWaiter pops the result and wakes the caller
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
@@ -22,6 +24,7 @@ from typing import Any, Awaitable, TypedDict, cast
 import redis.asyncio as redis
 
 from src.config import get_settings
+from src.core.redis_reconnect import ResilientPubSubListener
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,13 @@ RESULT_TTL_SECONDS = 60
 # Pending execution TTL (1 hour safety for orphaned entries)
 PENDING_EXECUTION_TTL_SECONDS = 3600
 
+# Pub/sub channel announcing that a sync result was pushed
+RESULT_READY_CHANNEL = "bifrost:results:ready"
+
+# How often waiting results are polled in case a notification was missed
+# (e.g. while the pub/sub connection was reconnecting)
+RESULT_RECONCILE_INTERVAL_SECONDS = 5.0
+
 
 class PendingExecution(TypedDict):
     """Schema for pending execution data stored in Redis."""
@@ -64,18 +74,145 @@ class PendingExecution(TypedDict):
     cancelled: bool
 
 
+class SyncResultWaiter:
+    """
+    Per-process dispatcher for sync execution results.
+
+    Waiting with BLPOP held a pooled Redis connection for the whole wait,
+    one per in-flight sync call. Instead, waiters register a future keyed
+    by execution_id, and a single pub/sub connection listens for
+    RESULT_READY_CHANNEL notifications. When one arrives for a local
+    waiter, the result is popped from its list with a plain LPOP and the
+    future is resolved.
+
+    Connection usage is one pub/sub connection plus short, non-blocking
+    commands on the shared client, regardless of how many callers wait.
+
+    Results pushed before the waiter registered, or whose notification
+    was lost, are picked up by an LPOP right after registering and by a
+    pipelined poll of all waiting keys every RESULT_RECONCILE_INTERVAL_SECONDS.
+    """
+
+    def __init__(self, client: "RedisClient"):
+        self._client = client
+        self._futures: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._waiter_counts: dict[str, int] = {}
+        self._listener: ResilientPubSubListener | None = None
+        self._reconcile_task: asyncio.Task | None = None
+
+    @property
+    def waiting(self) -> int:
+        """Number of executions with at least one waiter."""
+        return len(self._futures)
+
+    async def wait(
+        self,
+        execution_id: str,
+        timeout_seconds: float,
+    ) -> dict[str, Any] | None:
+        """
+        Wait for an execution's result.
+
+        Cancelling the calling task removes the waiter.
+
+        Returns:
+            Result dict or None if timeout
+        """
+        await self._ensure_started()
+
+        future = self._futures.get(execution_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[execution_id] = future
+        self._waiter_counts[execution_id] = self._waiter_counts.get(execution_id, 0) + 1
+
+        try:
+            # The result may already be there (fast execution or retry)
+            await self._collect([execution_id])
+            return await asyncio.wait_for(asyncio.shield(future), timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout waiting for result: {execution_id}")
+            return None
+        finally:
+            remaining = self._waiter_counts[execution_id] - 1
+            if remaining:
+                self._waiter_counts[execution_id] = remaining
+            else:
+                del self._waiter_counts[execution_id]
+                del self._futures[execution_id]
+
+    async def stop(self) -> None:
+        """Stop the listener and reconcile loop (waiters run into their timeouts)."""
+        if self._reconcile_task:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
+        if self._listener:
+            await self._listener.stop()
+            self._listener = None
+
+    async def _ensure_started(self) -> None:
+        """Start the pub/sub listener and reconcile loop on first use."""
+        if self._listener is not None:
+            return
+        settings = get_settings()
+        self._listener = ResilientPubSubListener(
+            redis_url=settings.redis_url,
+            channels=[RESULT_READY_CHANNEL],
+            on_message=self._on_message,
+        )
+        await self._listener.start()
+        self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def _on_message(self, channel: str, data: dict) -> None:
+        """Handle a result-ready notification (ignored unless waited on here)."""
+        execution_id = data.get("execution_id")
+        if execution_id in self._futures:
+            await self._collect([execution_id])
+
+    async def _reconcile_loop(self) -> None:
+        """Periodically poll all waiting keys in one round trip."""
+        while True:
+            await asyncio.sleep(RESULT_RECONCILE_INTERVAL_SECONDS)
+            if not self._futures:
+                continue
+            try:
+                await self._collect(list(self._futures))
+            except Exception as e:
+                logger.warning(f"Failed to poll sync results: {e}")
+
+    async def _collect(self, execution_ids: list[str]) -> None:
+        """Pop any available results and resolve their futures."""
+        redis_client = await self._client._get_redis()
+        pipe = redis_client.pipeline(transaction=False)
+        for execution_id in execution_ids:
+            pipe.lpop(f"{RESULT_KEY_PREFIX}{execution_id}")
+        values = await pipe.execute()
+
+        for execution_id, value in zip(execution_ids, values):
+            if value is None:
+                continue
+            future = self._futures.get(execution_id)
+            if future is not None and not future.done():
+                future.set_result(json.loads(value))
+
+
 class RedisClient:
     """
     Redis client wrapper for execution management.
 
     Provides:
     - Pending execution: set/get/delete/cancel pending executions
-    - Sync results: push_result/wait_for_result via BLPOP
+    - Sync results: push_result/wait_for_result via SyncResultWaiter
     - Cancellation: set_cancel_flag for running executions
     """
 
     def __init__(self):
         self._redis: redis.Redis | None = None
+        self._result_waiter: SyncResultWaiter | None = None
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create Redis connection."""
@@ -305,7 +442,7 @@ class RedisClient:
             raise
 
     # =========================================================================
-    # Sync Execution Results (BLPOP/RPUSH pattern)
+    # Sync Execution Results (RPUSH + notification, see SyncResultWaiter)
     # =========================================================================
 
     async def push_result(
@@ -353,6 +490,15 @@ class RedisClient:
             logger.error(f"Failed to push result to Redis: {e}")
             raise
 
+        try:
+            # Wake the waiting API instance
+            await redis_client.publish(
+                RESULT_READY_CHANNEL, json.dumps({"execution_id": execution_id})
+            )
+        except Exception as e:
+            # Don't raise - the waiter's periodic poll picks the result up
+            logger.warning(f"Failed to publish result notification: {e}")
+
     async def wait_for_result(
         self,
         execution_id: str,
@@ -361,7 +507,8 @@ class RedisClient:
         """
         Wait for execution result from Redis.
 
-        Called by API for sync execution requests.
+        Called by API for sync execution requests. Waits on the process's
+        SyncResultWaiter rather than holding a connection in BLPOP.
 
         Args:
             execution_id: Execution ID
@@ -370,25 +517,11 @@ class RedisClient:
         Returns:
             Result dict or None if timeout
         """
-        redis_client = await self._get_redis()
-        key = f"{RESULT_KEY_PREFIX}{execution_id}"
+        if self._result_waiter is None:
+            self._result_waiter = SyncResultWaiter(self)
 
         try:
-            # BLPOP blocks until value available or timeout
-            # Cast needed: redis-py returns Union[Awaitable[list], list] but we're async
-            result = await cast(
-                Awaitable[list[str] | None],
-                redis_client.blpop([key], timeout=timeout_seconds)
-            )
-
-            if result is None:
-                logger.warning(f"Timeout waiting for result: {execution_id}")
-                return None
-
-            # result is tuple (key, value)
-            _, value = result
-            return json.loads(value)
-
+            return await self._result_waiter.wait(execution_id, timeout_seconds)
         except Exception as e:
             logger.error(f"Error waiting for result: {e}")
             raise
@@ -436,6 +569,9 @@ class RedisClient:
 
     async def close(self) -> None:
         """Close Redis connection."""
+        if self._result_waiter:
+            await self._result_waiter.stop()
+            self._result_waiter = None
         if self._redis:
             await self._redis.close()
             self._redis = None
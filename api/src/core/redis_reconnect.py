@@ -9,7 +9,7 @@ restarts or network issues occur.
 import asyncio
 import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 
 from redis.asyncio import Redis
@@ -43,12 +43,17 @@ class ResilientPubSubListener:
             patterns=["bifrost:*"],
             on_message=handle_message,
         )
+
+    Channels can be changed while running with set_channels(); they are
+    resubscribed after every reconnect. With sharded=True channels use
+    SSUBSCRIBE (Redis 7+) and only receive messages sent with SPUBLISH.
     """
 
     redis_url: str
     on_message: Callable[[str, dict], Awaitable[None]]
     channels: list[str] = field(default_factory=list)
     patterns: list[str] = field(default_factory=list)
+    sharded: bool = False  # Subscribe to channels with SSUBSCRIBE
 
     # Backoff configuration
     initial_backoff: float = 1.0  # Initial retry delay in seconds
@@ -62,6 +67,8 @@ class ResilientPubSubListener:
     _listener_task: asyncio.Task | None = field(default=None, init=False)
     _running: bool = field(default=False, init=False)
     _consecutive_failures: int = field(default=0, init=False)
+    _subscription_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _channels_changed: asyncio.Event = field(default_factory=asyncio.Event, init=False)
 
     async def start(self) -> asyncio.Task:
         """
@@ -115,20 +122,22 @@ class ResilientPubSubListener:
             True if connection was successful, False otherwise.
         """
         try:
-            # Clean up any existing connections first
-            await self._cleanup()
+            # Hold off set_channels() until the new connection is subscribed
+            async with self._subscription_lock:
+                # Clean up any existing connections first
+                await self._cleanup()
 
-            # Create new connection
-            self._redis = Redis.from_url(self.redis_url)
-            self._pubsub = self._redis.pubsub()
+                # Create new connection
+                self._redis = Redis.from_url(self.redis_url)
+                self._pubsub = self._redis.pubsub()
 
-            # Subscribe to channels
-            for channel in self.channels:
-                await self._pubsub.subscribe(channel)
+                # Subscribe to channels
+                for channel in self.channels:
+                    await self._subscribe(channel)
 
-            # Subscribe to patterns
-            for pattern in self.patterns:
-                await self._pubsub.psubscribe(pattern)
+                # Subscribe to patterns
+                for pattern in self.patterns:
+                    await self._pubsub.psubscribe(pattern)
 
             return True
 
@@ -136,6 +145,50 @@ class ResilientPubSubListener:
             logger.warning(f"Failed to connect to Redis: {e}")
             return False
 
+    async def _subscribe(self, *channels: str) -> None:
+        """SUBSCRIBE (or SSUBSCRIBE) on the current connection."""
+        assert self._pubsub is not None
+        if self.sharded:
+            await self._pubsub.ssubscribe(*channels)
+        else:
+            await self._pubsub.subscribe(*channels)
+
+    async def _unsubscribe(self, *channels: str) -> None:
+        """UNSUBSCRIBE (or SUNSUBSCRIBE) on the current connection."""
+        assert self._pubsub is not None
+        if self.sharded:
+            await self._pubsub.sunsubscribe(*channels)
+        else:
+            await self._pubsub.unsubscribe(*channels)
+
+    async def set_channels(self, channels: Iterable[str]) -> None:
+        """
+        Subscribe to exactly these channels (patterns are left alone).
+
+        `channels` is read once the previous change has been applied, so
+        callers may pass a live view of their state and concurrent calls
+        converge on the latest one. If the connection is down the change
+        is applied by the next reconnect.
+        """
+        async with self._subscription_lock:
+            wanted = set(channels)
+            current = set(self.channels)
+            added = sorted(wanted - current)
+            removed = sorted(current - wanted)
+            self.channels = sorted(wanted)
+            if not (added or removed):
+                return
+            self._channels_changed.set()
+            if self._pubsub is None:
+                return
+            try:
+                if added:
+                    await self._subscribe(*added)
+                if removed:
+                    await self._unsubscribe(*removed)
+            except Exception as e:
+                logger.warning(f"Failed to update pub/sub subscriptions: {e}")
+
     async def _listener_loop(self) -> None:
         """
         Main listener loop with reconnection logic.
@@ -213,6 +266,18 @@ class ResilientPubSubListener:
             return
 
         while self._running:
+            if self._pubsub.connection is None:
+                if (self.channels or self.patterns) and not self._subscription_lock.locked():
+                    # A subscription failed before the connection was made
+                    raise ConnectionError("Pub/sub connection not established")
+                # Nothing subscribed yet: wait for set_channels()
+                self._channels_changed.clear()
+                try:
+                    await asyncio.wait_for(self._channels_changed.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
             message = await self._pubsub.get_message(
                 ignore_subscribe_messages=True,
                 timeout=0.5,  # Check for cancellation every 500ms
@@ -229,8 +294,8 @@ class ResilientPubSubListener:
             message: Raw message from Redis pub/sub.
         """
         try:
-            # Handle regular channel messages
-            if message["type"] == "message":
+            # Handle regular (and sharded) channel messages
+            if message["type"] in ("message", "smessage"):
                 channel = message["channel"]
                 if isinstance(channel, bytes):
                     channel = channel.decode()
@@ -13,12 +13,23 @@ Architecture (Redis-first):
 
 For sync execution requests (sync=True in message):
 - Pushes result to Redis after completion
-- API waits on Redis BLPOP for the result
+- API waits on the Redis sync result waiter for the result
 
 Execution Model:
 - All executions use ProcessPoolManager (process isolation)
 - Worker processes are pooled and reused for efficiency
 - Timeouts and crashes are handled by the pool manager
+
+Database writes:
+- Lifecycle writes (execution records, status transitions, logs, SDK
+  writes) are submitted to a GroupCommitter, which commits the
+  writes of all in-flight executions arriving within a few milliseconds
+  in one transaction (see src/core/group_commit.py)
+- Redis reads happen before a write is submitted, and Redis cleanup and
+  pubsub updates after it committed
+- Reads (workflow metadata, config) use a short-lived session per message
+- Daily metrics/ROI are recorded as Redis counters after the commit and
+  folded into PostgreSQL by the scheduler (src/core/metrics.py)
 """
 
 import asyncio
@@ -27,12 +38,16 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_session_factory
+from src.core.group_commit import GroupCommitter
 from src.core.pubsub import publish_execution_update, publish_history_update
 from src.core.redis_client import get_redis_client
 from src.jobs.rabbitmq import BaseConsumer
+from src.services.execution.log_persister import LogPersister
 
 logger = logging.getLogger(__name__)
 
@@ -74,18 +89,24 @@ class WorkflowExecutionConsumer(BaseConsumer):
         self._pool.on_result = self._handle_result
         self._pool_started = False
 
-        # Persistent DB session for read operations
+        # Sessions for reads; lifecycle writes are group-committed
         self._session_factory = get_session_factory()
-        self._db_session: "AsyncSession | None" = None
+        self._writes = GroupCommitter(
+            self._session_factory,
+            window_seconds=settings.execution_write_batch_ms / 1000,
+            max_batch=settings.execution_write_batch_max,
+            name="execution-writes",
+        )
+        # Writes logs to Postgres while executions run
+        self._log_persister = LogPersister(self._session_factory)
 
     async def start(self) -> None:
         """Start the consumer and process pool."""
         # Call parent start to set up RabbitMQ connection
         await super().start()
 
-        # Create persistent DB session for read operations
-        self._db_session = self._session_factory()
-        logger.info("Persistent DB session created")
+        await self._writes.start()
+        await self._log_persister.start()
 
         # Start process pool
         await self._pool.start()
@@ -100,45 +121,26 @@ class WorkflowExecutionConsumer(BaseConsumer):
             self._pool_started = False
             logger.info("Process pool stopped")
 
-        # Close persistent DB session
-        if self._db_session:
-            await self._db_session.close()
-            self._db_session = None
-            logger.info("Persistent DB session closed")
+        # Persist logs still in flight, then commit writes still queued
+        # (results reported during pool shutdown)
+        await self._log_persister.stop()
+        await self._writes.stop()
 
         # Call parent stop
         await super().stop()
 
-    async def _get_db_session(self) -> "AsyncSession":
+    async def _write(self, func: "Callable[..., Awaitable[Any]]", **kwargs: Any) -> Any:
         """
-        Get the persistent DB session, reconnecting if needed.
+        Run a session-accepting write function in the next group transaction.
 
-        Performs a health check and reconnects if the connection is stale.
-        This is important for long-running consumers where connections may drop.
+        Args:
+            func: Write function taking a `session` keyword argument
+            **kwargs: Arguments for func
 
         Returns:
-            Healthy AsyncSession instance
+            func's return value once committed
         """
-        from sqlalchemy import text
-
-        # Create session if None
-        if self._db_session is None:
-            self._db_session = self._session_factory()
-            logger.debug("Created new persistent DB session")
-
-        # Health check - try a simple query
-        try:
-            await self._db_session.execute(text("SELECT 1"))
-        except Exception as e:
-            logger.warning(f"DB session stale ({type(e).__name__}), reconnecting...")
-            try:
-                await self._db_session.close()
-            except Exception:
-                pass  # Ignore close errors on stale session
-            self._db_session = self._session_factory()
-            logger.info("Reconnected persistent DB session")
-
-        return self._db_session
+        return await self._writes.submit(lambda session: func(**kwargs, session=session))
 
     async def _handle_result(self, result: dict[str, Any]) -> None:
         """
@@ -147,37 +149,111 @@ class WorkflowExecutionConsumer(BaseConsumer):
         This callback is invoked by the pool when a worker reports
         a result (success or failure, including timeouts and crashes).
 
-        All DB operations are batched into a single transaction.
+        All DB writes for the result run in one group-committed operation.
         """
-        from src.core.database import get_session_factory
-
         execution_id = result.get("execution_id", "")
 
-        # Single session for all DB operations
-        session_factory = get_session_factory()
-        async with session_factory() as session:
-            try:
-                if result.get("success"):
-                    await self._process_success(execution_id, result, session)
-                else:
-                    await self._process_failure(execution_id, result, session)
+        try:
+            if result.get("success"):
+                await self._process_success(execution_id, result)
+            else:
+                await self._process_failure(execution_id, result)
+        except Exception as e:
+            logger.error(f"Failed to process result for {execution_id}: {e}")
+            raise
 
-                await session.commit()
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Failed to process result for {execution_id}: {e}")
-                raise
+    async def _load_execution_output(
+        self,
+        execution_id: str,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Read an execution's buffered SDK writes and unpersisted logs from Redis.
+
+        Done before the write is submitted so the group transaction only
+        waits on Postgres.
+
+        Returns:
+            Tuple of (pending changes, log rows); empty on read failure
+        """
+        from bifrost._logging import load_stream_logs
+        from bifrost._sync import load_pending_changes
+
+        changes, logs = await asyncio.gather(
+            load_pending_changes(execution_id),
+            load_stream_logs(execution_id),
+            return_exceptions=True,
+        )
+        if isinstance(changes, BaseException):
+            logger.warning(f"Failed to read pending changes for {execution_id[:8]}...: {changes}")
+            changes = []
+        if isinstance(logs, BaseException):
+            logger.error(f"Failed to read logs for {execution_id[:8]}...: {logs}")
+            logs = []
+        return changes, logs
+
+    @staticmethod
+    async def _persist_execution_output(
+        session: "AsyncSession",
+        changes: list[dict[str, Any]],
+        logs: list[dict[str, Any]],
+    ) -> None:
+        """Apply buffered SDK writes and COPY the remaining logs (caller commits)."""
+        from bifrost._sync import apply_pending_changes
+        from src.repositories.execution_logs import ExecutionLogRepository
+
+        if changes:
+            await apply_pending_changes(session, changes)
+        if logs:
+            await ExecutionLogRepository(session).copy_logs(logs)
+
+    async def _clear_execution_output(
+        self,
+        execution_id: str,
+        changes: list[dict[str, Any]],
+        logs: list[dict[str, Any]],
+    ) -> None:
+        """Drop the Redis copies of SDK writes and logs once committed."""
+        from bifrost._logging import clear_stream_logs
+        from bifrost._sync import clear_pending_changes
+
+        try:
+            if changes:
+                await clear_pending_changes(execution_id)
+                logger.info(f"Flushed {len(changes)} pending changes for {execution_id[:8]}...")
+            # The persister may have written every log already
+            await clear_stream_logs(execution_id)
+            if logs:
+                logger.debug(f"Flushed {len(logs)} logs for {execution_id[:8]}...")
+        except Exception as e:
+            logger.warning(f"Failed to clear flushed output for {execution_id[:8]}...: {e}")
+
+    @staticmethod
+    async def _update_event_delivery(
+        session: "AsyncSession",
+        execution_id: str,
+        status: str,
+        error_message: str | None = None,
+    ) -> None:
+        """Update event delivery status if this execution was triggered by an event."""
+        try:
+            from src.services.events.processor import update_delivery_from_execution
+            await update_delivery_from_execution(
+                execution_id, status, error_message=error_message, session=session
+            )
+        except Exception as e:
+            # Don't fail the execution result if delivery update fails
+            logger.warning(f"Failed to update event delivery for {execution_id[:8]}...: {e}")
 
     async def _process_success(
         self,
         execution_id: str,
         result: dict[str, Any],
-        session: "AsyncSession",
     ) -> None:
         """
         Process a successful execution result.
 
-        Updates the database, flushes logs, and publishes status updates.
+        Updates the database (status, logs and SDK writes in one
+        group-committed write), records metrics, then publishes status updates.
 
         The result dict from simple_worker contains:
         - result["result"]: The workflow's return value (e.g., {"message": "Hello"})
@@ -191,9 +267,8 @@ class WorkflowExecutionConsumer(BaseConsumer):
         Args:
             execution_id: The execution ID
             result: Result dict from worker process
-            session: Database session (caller manages commit)
         """
-        from src.core.metrics import update_daily_metrics, update_workflow_roi_daily
+        from src.core.metrics import record_execution_metrics
         from src.models.enums import ExecutionStatus
         from src.repositories.executions import update_execution
 
@@ -227,52 +302,43 @@ class WorkflowExecutionConsumer(BaseConsumer):
         roi_time_saved = roi_data.get("time_saved", 0)
         roi_value = roi_data.get("value", 0.0)
 
-        # Update database
-        await update_execution(
-            execution_id=execution_id,
-            status=status,
-            result=workflow_result,
-            error_message=result.get("error"),
-            error_type=result.get("error_type"),
+        metrics = result.get("metrics") or {}
+        changes, logs = await self._load_execution_output(execution_id)
+
+        async def write(session: "AsyncSession") -> None:
+            await update_execution(
+                execution_id=execution_id,
+                status=status,
+                result=workflow_result,
+                error_message=result.get("error"),
+                error_type=result.get("error_type"),
+                duration_ms=duration_ms,
+                variables=result.get("variables"),
+                metrics=result.get("metrics"),
+                time_saved=roi_time_saved,
+                value=roi_value,
+                session=session,
+            )
+            await self._update_event_delivery(session, execution_id, status.value)
+            # SDK writes and logs land with the status, so a client
+            # refetching after the update below sees complete data
+            await self._persist_execution_output(session, changes, logs)
+
+        await self._writes.submit(write)
+        await self._clear_execution_output(execution_id, changes, logs)
+        await record_execution_metrics(
+            org_id=org_id,
+            status=status.value,
             duration_ms=duration_ms,
-            variables=result.get("variables"),
-            metrics=result.get("metrics"),
+            peak_memory_bytes=metrics.get("peak_memory_bytes"),
+            cpu_total_seconds=metrics.get("cpu_total_seconds"),
             time_saved=roi_time_saved,
             value=roi_value,
-            session=session,
+            workflow_id=workflow_id,
         )
 
-        # Update event delivery status if this execution was triggered by an event
-        try:
-            from src.services.events.processor import update_delivery_from_execution
-            await update_delivery_from_execution(execution_id, status.value, session=session)
-        except Exception as e:
-            # Don't fail the execution result if delivery update fails
-            logger.warning(f"Failed to update event delivery for {execution_id[:8]}...: {e}")
-
-        # Flush pending changes (SDK writes) from Redis to Postgres BEFORE publishing
-        # This ensures data is in PostgreSQL when client refetches after receiving update
-        try:
-            from bifrost._sync import flush_pending_changes
-            changes_count = await flush_pending_changes(execution_id, session=session)
-            if changes_count > 0:
-                logger.info(f"Flushed {changes_count} pending changes for {execution_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"Failed to flush pending changes for {execution_id[:8]}...: {e}")
-
-        # Flush logs from Redis Stream to Postgres BEFORE publishing
-        # This ensures logs are in PostgreSQL when client refetches after receiving update
-        try:
-            from bifrost._logging import flush_logs_to_postgres
-            logs_count = await flush_logs_to_postgres(execution_id, session=session)
-            if logs_count > 0:
-                logger.debug(f"Flushed {logs_count} logs for {execution_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"Failed to flush logs for {execution_id[:8]}...: {e}")
-
-        # Publish updates AFTER flushing data to PostgreSQL
+        # Publish updates AFTER the data is committed to PostgreSQL
         # Client will refetch and get the complete data including logs
-        # (pubsub operations don't need the session)
         await publish_execution_update(
             execution_id,
             status.value,
@@ -312,30 +378,6 @@ class WorkflowExecutionConsumer(BaseConsumer):
                 duration_ms=duration_ms,
             )
 
-        # Update metrics
-        metrics = result.get("metrics") or {}
-        await update_daily_metrics(
-            org_id=org_id,
-            status=status.value,
-            duration_ms=duration_ms,
-            peak_memory_bytes=metrics.get("peak_memory_bytes"),
-            cpu_total_seconds=metrics.get("cpu_total_seconds"),
-            time_saved=roi_time_saved,
-            value=roi_value,
-            workflow_id=workflow_id,
-            db=session,
-        )
-
-        if workflow_id:
-            await update_workflow_roi_daily(
-                workflow_id=workflow_id,
-                org_id=org_id,
-                status=status.value,
-                time_saved=roi_time_saved,
-                value=roi_value,
-                db=session,
-            )
-
         logger.info(
             f"Execution result processed: {execution_id[:8]}... status={status.value}",
             extra={
@@ -351,7 +393,6 @@ class WorkflowExecutionConsumer(BaseConsumer):
         self,
         execution_id: str,
         result: dict[str, Any],
-        session: "AsyncSession",
     ) -> None:
         """
         Process a failed execution result.
@@ -361,9 +402,8 @@ class WorkflowExecutionConsumer(BaseConsumer):
         Args:
             execution_id: The execution ID
             result: Result dict from worker process
-            session: Database session (caller manages commit)
         """
-        from src.core.metrics import update_daily_metrics
+        from src.core.metrics import record_execution_metrics
         from src.models.enums import ExecutionStatus
         from src.repositories.executions import update_execution
 
@@ -392,50 +432,34 @@ class WorkflowExecutionConsumer(BaseConsumer):
         else:
             status = ExecutionStatus.FAILED
 
-        # Update database
-        await update_execution(
-            execution_id=execution_id,
-            status=status,
-            error_message=error,
-            error_type=error_type,
-            duration_ms=duration_ms,
-            session=session,
-        )
+        # Even failed executions may have buffered SDK writes and logs
+        changes, logs = await self._load_execution_output(execution_id)
 
-        # Update event delivery status if this execution was triggered by an event
-        try:
-            from src.services.events.processor import update_delivery_from_execution
-            await update_delivery_from_execution(
-                execution_id, status.value, error_message=error, session=session
+        async def write(session: "AsyncSession") -> None:
+            await update_execution(
+                execution_id=execution_id,
+                status=status,
+                error_message=error,
+                error_type=error_type,
+                duration_ms=duration_ms,
+                session=session,
             )
-        except Exception as e:
-            # Don't fail the execution result if delivery update fails
-            logger.warning(f"Failed to update event delivery for {execution_id[:8]}...: {e}")
-
-        # Flush pending changes (SDK writes) from Redis to Postgres BEFORE publishing
-        # Even failed executions may have buffered writes
-        # This ensures data is in PostgreSQL when client refetches after receiving update
-        try:
-            from bifrost._sync import flush_pending_changes
-            changes_count = await flush_pending_changes(execution_id, session=session)
-            if changes_count > 0:
-                logger.info(f"Flushed {changes_count} pending changes for failed {execution_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"Failed to flush pending changes for {execution_id[:8]}...: {e}")
+            await self._update_event_delivery(
+                session, execution_id, status.value, error_message=error
+            )
+            await self._persist_execution_output(session, changes, logs)
 
-        # Flush logs from Redis Stream to Postgres BEFORE publishing
-        # This ensures logs are in PostgreSQL when client refetches after receiving update
-        try:
-            from bifrost._logging import flush_logs_to_postgres
-            logs_count = await flush_logs_to_postgres(execution_id, session=session)
-            if logs_count > 0:
-                logger.debug(f"Flushed {logs_count} logs for failed {execution_id[:8]}...")
-        except Exception as e:
-            logger.warning(f"Failed to flush logs for {execution_id[:8]}...: {e}")
+        await self._writes.submit(write)
+        await self._clear_execution_output(execution_id, changes, logs)
+        await record_execution_metrics(
+            org_id=org_id,
+            status=status.value,
+            duration_ms=duration_ms,
+            workflow_id=workflow_id,
+        )
 
-        # Publish updates AFTER flushing data to PostgreSQL
+        # Publish updates AFTER the data is committed to PostgreSQL
         # Client will refetch and get the complete data including logs
-        # (pubsub operations don't need the session)
         await publish_execution_update(
             execution_id,
             status.value,
@@ -474,15 +498,6 @@ class WorkflowExecutionConsumer(BaseConsumer):
                 duration_ms=duration_ms,
             )
 
-        # Update metrics
-        await update_daily_metrics(
-            org_id=org_id,
-            status=status.value,
-            duration_ms=duration_ms,
-            workflow_id=workflow_id,
-            db=session,
-        )
-
         logger.warning(
             f"Execution failed: {execution_id[:8]}... status={status.value} error={error_type}",
             extra={
@@ -499,9 +514,6 @@ class WorkflowExecutionConsumer(BaseConsumer):
         """Process a workflow execution message."""
         from src.services.execution.queue_tracker import remove_from_queue
 
-        # Get persistent session for read operations
-        db = await self._get_db_session()
-
         execution_id = message_data.get("execution_id", "")
         workflow_id = message_data.get("workflow_id")
         code_base64 = message_data.get("code")
@@ -541,6 +553,9 @@ class WorkflowExecutionConsumer(BaseConsumer):
         # Determine if this is a code or workflow execution
         is_script = bool(code_base64)
 
+        # Session for this message's reads (writes are group-committed)
+        db = self._session_factory()
+
         try:
             logger.info(
                 f"Processing {'code' if is_script else 'workflow'} execution",
@@ -562,25 +577,31 @@ class WorkflowExecutionConsumer(BaseConsumer):
             # Check if execution was cancelled in Redis before we started
             if pending.get("cancelled", False):
                 logger.info(f"Execution {execution_id} was cancelled before starting")
-                await create_execution(
-                    execution_id=execution_id,
-                    workflow_name=script_name or "workflow",
-                    parameters=parameters,
-                    org_id=org_id,
-                    user_id=user_id,
-                    user_name=user_name,
-                    form_id=form_id,
-                    api_key_id=api_key_id,
-                    status=ExecutionStatus.CANCELLED,
-                    execution_model="process",
-                    workflow_id=workflow_id,
-                )
-                await update_execution(
-                    execution_id=execution_id,
-                    status=ExecutionStatus.CANCELLED,
-                    error_message="Execution was cancelled before it could start",
-                    duration_ms=0,
-                )
+
+                async def write_cancelled(session: "AsyncSession") -> None:
+                    await create_execution(
+                        execution_id=execution_id,
+                        workflow_name=script_name or "workflow",
+                        parameters=parameters,
+                        org_id=org_id,
+                        user_id=user_id,
+                        user_name=user_name,
+                        form_id=form_id,
+                        api_key_id=api_key_id,
+                        status=ExecutionStatus.CANCELLED,
+                        execution_model="process",
+                        workflow_id=workflow_id,
+                        session=session,
+                    )
+                    await update_execution(
+                        execution_id=execution_id,
+                        status=ExecutionStatus.CANCELLED,
+                        error_message="Execution was cancelled before it could start",
+                        duration_ms=0,
+                        session=session,
+                    )
+
+                await self._writes.submit(write_cancelled)
                 await publish_execution_update(execution_id, "Cancelled")
                 await publish_history_update(
                     execution_id=execution_id,
@@ -603,6 +624,7 @@ class WorkflowExecutionConsumer(BaseConsumer):
             # Get workflow metadata from database if this is a workflow execution
             workflow_name = script_name or "inline_script"
             timeout_seconds = 1800  # Default 30 minutes
+            variable_capture = "full"  # Variable capture mode (off/summary/full)
             roi_time_saved = 0
             roi_value = 0.0
             workflow_function_name: str | None = None  # Function name for exec_from_db()
@@ -619,6 +641,7 @@ class WorkflowExecutionConsumer(BaseConsumer):
                     file_path = workflow_data["path"]  # Used for __file__ injection and Redis/S3 loading
 
                     timeout_seconds = workflow_data["timeout_seconds"]
+                    variable_capture = workflow_data["variable_capture"]
                     # Initialize ROI from workflow defaults
                     roi_time_saved = workflow_data["time_saved"]
                     roi_value = workflow_data["value"]
@@ -637,25 +660,31 @@ class WorkflowExecutionConsumer(BaseConsumer):
                     logger.error(f"Workflow not found: {workflow_id}")
                     duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
                     error_msg = f"Workflow with ID '{workflow_id}' not found"
-                    await create_execution(
-                        execution_id=execution_id,
-                        workflow_name="unknown",
-                        parameters=parameters,
-                        org_id=org_id,
-                        user_id=user_id,
-                        user_name=user_name,
-                        form_id=form_id,
-                        api_key_id=api_key_id,
-                        status=ExecutionStatus.FAILED,
-                        execution_model="process",
-                        workflow_id=workflow_id,
-                    )
-                    await update_execution(
-                        execution_id=execution_id,
-                        status=ExecutionStatus.FAILED,
-                        result={"error": "WorkflowNotFound", "message": error_msg},
-                        duration_ms=duration_ms,
-                    )
+
+                    async def write_not_found(session: "AsyncSession") -> None:
+                        await create_execution(
+                            execution_id=execution_id,
+                            workflow_name="unknown",
+                            parameters=parameters,
+                            org_id=org_id,
+                            user_id=user_id,
+                            user_name=user_name,
+                            form_id=form_id,
+                            api_key_id=api_key_id,
+                            status=ExecutionStatus.FAILED,
+                            execution_model="process",
+                            workflow_id=workflow_id,
+                            session=session,
+                        )
+                        await update_execution(
+                            execution_id=execution_id,
+                            status=ExecutionStatus.FAILED,
+                            result={"error": "WorkflowNotFound", "message": error_msg},
+                            duration_ms=duration_ms,
+                            session=session,
+                        )
+
+                    await self._writes.submit(write_not_found)
                     await publish_execution_update(execution_id, "Failed", {"error": error_msg})
                     await publish_history_update(
                         execution_id=execution_id,
@@ -689,7 +718,8 @@ class WorkflowExecutionConsumer(BaseConsumer):
             )
 
             # Create PostgreSQL record with RUNNING status
-            await create_execution(
+            await self._write(
+                create_execution,
                 execution_id=execution_id,
                 workflow_name=workflow_name,
                 parameters=parameters,
@@ -736,6 +766,9 @@ class WorkflowExecutionConsumer(BaseConsumer):
                 resolver = ConfigResolver()
                 config = await resolver.load_config_for_scope("GLOBAL", db=db)
 
+            # Reads are done; don't hold a connection while waiting for a slot
+            await db.close()
+
             # Build context for worker process
             context_data = {
                 "execution_id": execution_id,
@@ -753,6 +786,7 @@ class WorkflowExecutionConsumer(BaseConsumer):
                 "config": config,
                 "tags": ["workflow"] if not is_script else [],
                 "timeout_seconds": timeout_seconds,
+                "variable_capture": variable_capture,
                 "transient": False,
                 "is_platform_admin": False,
                 "startup": startup,  # Launch workflow results (available via context.startup)
@@ -807,7 +841,8 @@ class WorkflowExecutionConsumer(BaseConsumer):
             from src.models.enums import ExecutionStatus
             from src.repositories.executions import update_execution
 
-            await update_execution(
+            await self._write(
+                update_execution,
                 execution_id=execution_id,
                 status=ExecutionStatus.FAILED,
                 error_message=error_msg,
@@ -855,3 +890,5 @@ class WorkflowExecutionConsumer(BaseConsumer):
                 exc_info=True,
             )
             raise
+        finally:
+            await db.close()
@@ -2,14 +2,18 @@
 RabbitMQ Consumer Infrastructure
 
 Provides the base consumer class and connection management for processing
-background jobs from RabbitMQ queues.
+background jobs from RabbitMQ queues, and the publisher used to enqueue them.
 """
 
 import asyncio
+import bisect
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator
 
 import aio_pika
 from aio_pika import IncomingMessage
@@ -76,6 +80,7 @@ class RabbitMQConnection:
 
     async def close(self) -> None:
         """Close all connections."""
+        await publisher.close()
         if self._channel_pool:
             await self._channel_pool.close()
         if self._connection_pool:
@@ -87,6 +92,284 @@ class RabbitMQConnection:
 rabbitmq = RabbitMQConnection()
 
 
+async def declare_work_queue(
+    channel: AbstractRobustChannel,
+    queue_name: str,
+    dead_letter_exchange: str | None = None,
+) -> aio_pika.abc.AbstractRobustQueue:
+    """
+    Declare a durable work queue with its dead letter exchange and poison queue.
+
+    Used by both consumers and the publisher so the queue arguments match.
+
+    Args:
+        channel: Channel to declare on
+        queue_name: Name of the work queue
+        dead_letter_exchange: Exchange for failed messages (default: {queue_name}-dlx)
+
+    Returns:
+        The declared main queue
+    """
+    dead_letter_exchange = dead_letter_exchange or f"{queue_name}-dlx"
+
+    # Declare dead letter exchange
+    dlx = await channel.declare_exchange(
+        dead_letter_exchange,
+        aio_pika.ExchangeType.DIRECT,
+        durable=True,
+    )
+
+    # Declare dead letter queue
+    dlq = await channel.declare_queue(
+        f"{queue_name}-poison",
+        durable=True,
+    )
+    await dlq.bind(dlx, routing_key=queue_name)
+
+    # Declare main queue with dead letter routing
+    return await channel.declare_queue(
+        queue_name,
+        durable=True,
+        arguments={
+            "x-dead-letter-exchange": dead_letter_exchange,
+            "x-dead-letter-routing-key": queue_name,
+        },
+    )
+
+
+# Publish latency histogram bucket upper bounds (milliseconds)
+PUBLISH_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (cumulative for the process)."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = PUBLISH_LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        # One count per bucket, plus one for values above the last bound
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        """Record one latency."""
+        self.counts[bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return count, sum and per-bucket counts (not cumulative)."""
+        buckets = {f"le_{bound}ms": n for bound, n in zip(self.buckets_ms, self.counts)}
+        buckets[f"gt_{self.buckets_ms[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class PublishError(Exception):
+    """
+    Some messages of a batch were not confirmed by the broker.
+
+    Attributes:
+        failed: The messages that were not confirmed (the others were)
+        errors: Their publish errors, in the same order
+    """
+
+    def __init__(self, failed: list[dict[str, Any]], errors: list[BaseException]):
+        super().__init__(f"{len(failed)} message(s) not confirmed: {errors[0]}")
+        self.failed = failed
+        self.errors = errors
+
+
+class RabbitMQPublisher:
+    """
+    Publishes messages to work queues over a long-lived channel.
+
+    publish_message() used to open a channel and re-declare the dead letter
+    exchange, poison queue and main queue for every message. The publisher
+    keeps one confirm-mode channel on a dedicated connection and declares
+    each queue's topology once per channel (robust channels restore their
+    declarations after a reconnect).
+
+    publish_many() sends a batch concurrently on the channel, so the
+    publisher confirms for the whole batch arrive in about one round trip.
+
+    Latency (publish until broker confirm) is recorded per message in
+    `latency` and per publish_many() call in `batch_latency`.
+    """
+
+    def __init__(self) -> None:
+        self._connection_ctx: Any = None
+        self._channel: AbstractRobustChannel | None = None
+        self._declared: set[str] = set()
+        self._lock = asyncio.Lock()
+        self.latency = LatencyHistogram()
+        self.batch_latency = LatencyHistogram()
+
+    async def publish(
+        self,
+        queue_name: str,
+        message: dict[str, Any],
+        priority: int = 0,
+    ) -> None:
+        """Publish one message and wait for the broker confirm."""
+        await self.publish_many(queue_name, [message], priority=priority)
+
+    async def publish_many(
+        self,
+        queue_name: str,
+        messages: list[dict[str, Any]],
+        priority: int = 0,
+    ) -> None:
+        """
+        Publish a batch of messages and wait for all broker confirms.
+
+        Raises:
+            PublishError: Listing the messages not confirmed, after every
+                message has been attempted (all of them if the channel could
+                not be opened)
+        """
+        if not messages:
+            return
+
+        try:
+            channel = await self._get_channel()
+            await self._ensure_queue(channel, queue_name)
+        except Exception as e:
+            raise PublishError(list(messages), [e]) from e
+
+        async def _publish_one(message: dict[str, Any]) -> None:
+            started = time.perf_counter()
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=json.dumps(message).encode(),
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    priority=priority,
+                ),
+                routing_key=queue_name,
+            )
+            self.latency.observe((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(_publish_one(message) for message in messages),
+            return_exceptions=True,
+        )
+        self.batch_latency.observe((time.perf_counter() - started) * 1000)
+
+        failed = [
+            (message, result)
+            for message, result in zip(messages, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            logger.error(f"Failed to publish {len(failed)}/{len(messages)} messages to {queue_name}")
+            errors = [error for _, error in failed]
+            raise PublishError([message for message, _ in failed], errors) from errors[0]
+
+        logger.debug(f"Published {len(messages)} message(s) to {queue_name}")
+
+    def stats(self) -> dict[str, Any]:
+        """Publish latency histograms for diagnostics."""
+        return {
+            "latency": self.latency.snapshot(),
+            "batch_latency": self.batch_latency.snapshot(),
+        }
+
+    async def close(self) -> None:
+        """Close the publisher channel and release its connection."""
+        async with self._lock:
+            await self._release()
+
+    async def _get_channel(self) -> AbstractRobustChannel:
+        """Get the publisher channel, opening it on first use or after it closed."""
+        channel = self._channel
+        if channel is not None and not channel.is_closed:
+            return channel
+
+        async with self._lock:
+            if self._channel is not None and not self._channel.is_closed:
+                return self._channel
+
+            await self._release()
+            await rabbitmq.init_pools()
+            self._connection_ctx = rabbitmq.get_connection()
+            connection = await self._connection_ctx.__aenter__()
+            self._channel = await connection.channel(publisher_confirms=True)
+            return self._channel
+
+    async def _ensure_queue(self, channel: AbstractRobustChannel, queue_name: str) -> None:
+        """Declare a work queue's topology once per channel."""
+        if queue_name in self._declared:
+            return
+        async with self._lock:
+            if queue_name in self._declared:
+                return
+            await declare_work_queue(channel, queue_name)
+            self._declared.add(queue_name)
+
+    async def _release(self) -> None:
+        """Close the channel and return the connection to the pool (lock held)."""
+        channel, self._channel = self._channel, None
+        connection_ctx, self._connection_ctx = self._connection_ctx, None
+        self._declared.clear()
+        try:
+            if channel is not None and not channel.is_closed:
+                await channel.close()
+        except Exception as e:
+            logger.debug(f"Error closing publisher channel: {e}")
+        if connection_ctx is not None:
+            await connection_ctx.__aexit__(None, None, None)
+
+
+# Global publisher
+publisher = RabbitMQPublisher()
+
+# Messages deferred by batch_publishes() in the current context
+_publish_batch: ContextVar[list[tuple[str, dict[str, Any], int]] | None] = ContextVar(
+    "rabbitmq_publish_batch", default=None
+)
+
+
+@asynccontextmanager
+async def batch_publishes() -> AsyncIterator[None]:
+    """
+    Defer publish_message() calls in this context and send them as batches.
+
+    On exit, deferred messages are sent with publish_many() per queue (and
+    priority). Nothing is sent if the body raises. Every batch is attempted;
+    a PublishError listing all the messages not confirmed is raised from
+    the exit of the context.
+
+    Usage:
+        async with batch_publishes():
+            for delivery in deliveries:
+                await enqueue_system_workflow_execution(...)
+    """
+    pending: list[tuple[str, dict[str, Any], int]] = []
+    token = _publish_batch.set(pending)
+    try:
+        yield
+    finally:
+        _publish_batch.reset(token)
+
+    batches: dict[tuple[str, int], list[dict[str, Any]]] = {}
+    for queue_name, message, priority in pending:
+        batches.setdefault((queue_name, priority), []).append(message)
+    failed: list[dict[str, Any]] = []
+    errors: list[BaseException] = []
+    for (queue_name, priority), messages in batches.items():
+        try:
+            await publisher.publish_many(queue_name, messages, priority=priority)
+        except PublishError as e:
+            failed.extend(e.failed)
+            errors.extend(e.errors)
+    if failed:
+        raise PublishError(failed, errors) from errors[0]
+
+
 class BaseConsumer(ABC):
     """
     Base class for RabbitMQ consumers.
@@ -133,28 +416,9 @@ class BaseConsumer(ABC):
         self._channel = channel
         await channel.set_qos(prefetch_count=self.prefetch_count)
 
-        # Declare dead letter exchange
-        dlx = await channel.declare_exchange(
-            self.dead_letter_exchange,
-            aio_pika.ExchangeType.DIRECT,
-            durable=True,
-        )
-
-        # Declare dead letter queue
-        dlq = await channel.declare_queue(
-            f"{self.queue_name}-poison",
-            durable=True,
-        )
-        await dlq.bind(dlx, routing_key=self.queue_name)
-
-        # Declare main queue with dead letter routing
-        queue = await channel.declare_queue(
-            self.queue_name,
-            durable=True,
-            arguments={
-                "x-dead-letter-exchange": self.dead_letter_exchange,
-                "x-dead-letter-routing-key": self.queue_name,
-            },
+        # Declare main queue with dead letter exchange and poison queue
+        queue = await declare_work_queue(
+            channel, self.queue_name, self.dead_letter_exchange
         )
         self._queue = queue
 
@@ -516,53 +780,17 @@ async def publish_message(
     """
     Publish a message to a queue.
 
+    Uses the shared publisher channel; inside batch_publishes() the message
+    is deferred and sent with the rest of the batch.
+
     Args:
         queue_name: Target queue name
         message: Message body (will be JSON encoded)
         priority: Message priority (0-9, higher = more important)
     """
-    await rabbitmq.init_pools()
-    async with rabbitmq.get_connection() as connection:
-        channel = await connection.channel()
+    pending = _publish_batch.get()
+    if pending is not None:
+        pending.append((queue_name, message, priority))
+        return
 
-        try:
-            dead_letter_exchange = f"{queue_name}-dlx"
-
-            # Declare dead letter exchange
-            await channel.declare_exchange(
-                dead_letter_exchange,
-                aio_pika.ExchangeType.DIRECT,
-                durable=True,
-            )
-
-            # Declare dead letter queue
-            dlq = await channel.declare_queue(
-                f"{queue_name}-poison",
-                durable=True,
-            )
-            await dlq.bind(dead_letter_exchange, routing_key=queue_name)
-
-            # Declare main queue with dead letter routing (matches consumer)
-            await channel.declare_queue(
-                queue_name,
-                durable=True,
-                arguments={
-                    "x-dead-letter-exchange": dead_letter_exchange,
-                    "x-dead-letter-routing-key": queue_name,
-                },
-            )
-
-            # Publish message
-            await channel.default_exchange.publish(
-                aio_pika.Message(
-                    body=json.dumps(message).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                    priority=priority,
-                ),
-                routing_key=queue_name,
-            )
-
-            logger.debug(f"Published message to {queue_name}")
-
-        finally:
-            await channel.close()
+    await publisher.publish(queue_name, message, priority=priority)
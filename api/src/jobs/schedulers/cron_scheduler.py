@@ -2,211 +2,403 @@
 CRON Scheduler
 
 Processes schedule event sources based on their CRON expressions.
-Replaces the Azure Timer trigger version with APScheduler cron job.
 
-Checks each ScheduleSource and fires events for matching schedules,
-creating Event records and queuing deliveries for subscribed workflows.
+Every schedule source persists its next fire time (ScheduleSource.next_fire_at,
+UTC), set when it is created or edited and recomputed each time it fires.
+ScheduleTimer sleeps until the earliest next_fire_at of the enabled schedules
+(or until woken because a schedule changed), then fires the due ones through
+the partial index on next_fire_at instead of scanning every source.
+
+Each due schedule is fired in its own transaction, creating an Event record
+and queuing deliveries for subscribed workflows, so one failing source does
+not hold back the others. Schedules whose fire time passed more than
+MISFIRE_GRACE_SECONDS ago (scheduler down) are moved to their next fire time
+without firing. Schedules with an invalid expression are parked at
+UNSCHEDULABLE_FIRE_AT, logged once, and stay out of the due set until an
+edit reschedules them.
 """
 
+import asyncio
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from croniter import croniter
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import joinedload
 
 from src.core.database import get_db_context
 from src.models.enums import EventDeliveryStatus, EventSourceType, EventStatus
-from src.models.orm.events import Event, EventDelivery, EventSource
+from src.models.orm.events import Event, EventDelivery, EventSource, ScheduleSource
 from src.repositories.events import EventSubscriptionRepository
+from src.services.cron_parser import next_fire_time
 
 logger = logging.getLogger(__name__)
 
+# Due schedules loaded per query
+DUE_BATCH_SIZE = 500
 
-async def process_schedule_sources() -> dict[str, Any]:
+# Schedules fired concurrently (each uses its own session)
+FIRE_CONCURRENCY = 8
+
+# Fire times missed by more than this are skipped rather than fired late
+MISFIRE_GRACE_SECONDS = 600
+
+# Longest sleep between passes, bounding the delay for changes nobody announced
+MAX_SLEEP_SECONDS = 60.0
+
+# Pause before retrying schedules that are still due after a pass (they failed)
+RETRY_SLEEP_SECONDS = 1.0
+
+# Schedules firing more often than this get a warning when first scheduled
+MIN_INTERVAL_SECONDS = 300
+
+# next_fire_at of schedules whose expression has no fire time, far enough
+# ahead that they are never due (editing the schedule reschedules it)
+UNSCHEDULABLE_FIRE_AT = datetime(9999, 12, 31, tzinfo=timezone.utc)
+
+
+def _active_schedules():
+    """Enabled schedules of active schedule event sources."""
+    return (
+        select(ScheduleSource.id)
+        .join(EventSource, EventSource.id == ScheduleSource.event_source_id)
+        .where(
+            ScheduleSource.enabled.is_(True),
+            EventSource.is_active.is_(True),
+            EventSource.source_type == EventSourceType.SCHEDULE,
+        )
+    )
+
+
+async def reschedule(ss: ScheduleSource, now: datetime | None = None) -> None:
     """
-    Process schedule event sources.
+    Recompute the next fire time of a created or edited schedule source.
 
-    Checks each ScheduleSource and fires events for matching schedules.
-    Creates Event records and queues deliveries for subscribed workflows.
+    Also tells the scheduler when it fires next, so a schedule due before
+    the scheduler's next pass is not fired late.
+    """
+    ss.next_fire_at = next_fire_time(ss.cron_expression, now or datetime.now(timezone.utc))
+    if ss.next_fire_at is None or not ss.enabled:
+        return
+    try:
+        from src.core.pubsub import publish_schedules_changed
+
+        await publish_schedules_changed(ss.next_fire_at)
+    except Exception as e:
+        logger.warning(f"Failed to notify scheduler of schedule change: {e}")
+
+
+async def next_due_time() -> datetime | None:
+    """Earliest next fire time of the enabled schedules, if any."""
+    async with get_db_context() as db:
+        result = await db.execute(
+            _active_schedules()
+            .with_only_columns(func.min(ScheduleSource.next_fire_at))
+        )
+        return result.scalar_one_or_none()
+
+
+async def _due_schedule_ids(now: datetime) -> list[uuid.UUID]:
+    """Schedules due at `now` or never scheduled, earliest first."""
+    async with get_db_context() as db:
+        result = await db.execute(
+            _active_schedules()
+            .where(
+                or_(
+                    ScheduleSource.next_fire_at.is_(None),
+                    ScheduleSource.next_fire_at <= now,
+                )
+            )
+            .order_by(ScheduleSource.next_fire_at.asc().nulls_last())
+            .limit(DUE_BATCH_SIZE)
+        )
+        return list(result.scalars().all())
+
+
+def _warn_if_frequent(source: EventSource, cron_expression: str, first: datetime) -> None:
+    """Warn about schedules firing more often than MIN_INTERVAL_SECONDS."""
+    second = next_fire_time(cron_expression, first)
+    if second is None:
+        return
+    interval_seconds = (second - first).total_seconds()
+    if interval_seconds < MIN_INTERVAL_SECONDS:
+        logger.warning(
+            f"Schedule interval for source {source.name} is "
+            f"{interval_seconds}s (< 5 minutes)"
+        )
+
+
+async def fire_schedule_source(schedule_source_id: uuid.UUID, now: datetime) -> dict[str, Any]:
+    """
+    Fire one due schedule source and move it to its next fire time.
+
+    Runs in its own transaction. A schedule seen for the first time (no
+    next_fire_at yet) is only scheduled, not fired.
 
     Returns:
-        Summary of processing results
+        {"fired": bool, "rescheduled": bool, "deliveries_queued": int, "error": str | None}
     """
-    from src.services.cron_parser import is_cron_expression_valid
+    outcome: dict[str, Any] = {
+        "fired": False,
+        "rescheduled": False,
+        "deliveries_queued": 0,
+        "error": None,
+    }
 
-    logger.info("Schedule sources processor started")
+    async with get_db_context() as db:
+        result = await db.execute(
+            select(ScheduleSource)
+            .options(joinedload(ScheduleSource.event_source))
+            .where(ScheduleSource.id == schedule_source_id)
+            .with_for_update(skip_locked=True, of=ScheduleSource)
+        )
+        ss = result.scalar_one_or_none()
+        if ss is None or (ss.next_fire_at is not None and ss.next_fire_at > now):
+            # Fired by someone else, or rescheduled by an edit meanwhile
+            return outcome
+
+        source = ss.event_source
+        cron_expression = ss.cron_expression
+        due_at = ss.next_fire_at
+
+        next_at = next_fire_time(cron_expression, now)
+
+        # Keep updated_at for edits; firing is not one
+        await db.execute(
+            update(ScheduleSource)
+            .where(ScheduleSource.id == ss.id)
+            .values(
+                next_fire_at=next_at or UNSCHEDULABLE_FIRE_AT,
+                updated_at=ScheduleSource.updated_at,
+            )
+        )
+        if next_at is None:
+            # Parked until an edit fixes the expression, so this is logged once
+            logger.warning(
+                f"Invalid cron for schedule source {source.name} ({source.id}): "
+                f"{cron_expression}; not scheduled until it is edited"
+            )
+            outcome["error"] = f"Invalid CRON expression: {cron_expression}"
+            await db.commit()
+            return outcome
+        outcome["rescheduled"] = True
 
+        if due_at is None:
+            _warn_if_frequent(source, cron_expression, next_at)
+            await db.commit()
+            return outcome
+
+        if (now - due_at).total_seconds() > MISFIRE_GRACE_SECONDS:
+            logger.warning(
+                f"Skipping missed fire of schedule source {source.name} ({source.id}) "
+                f"due at {due_at.isoformat()}"
+            )
+            await db.commit()
+            return outcome
+
+        logger.info(f"Firing schedule source: {source.name} ({source.id})")
+
+        # Create event record
+        event = Event(
+            id=uuid.uuid4(),
+            event_source_id=source.id,
+            event_type="schedule.fired",
+            received_at=now,
+            data={
+                "cron_expression": cron_expression,
+                "timezone": ss.timezone,
+                "scheduled_time": due_at.isoformat(),
+            },
+            status=EventStatus.PROCESSING,
+        )
+        db.add(event)
+        outcome["fired"] = True
+
+        # Get active subscriptions for this source
+        sub_repo = EventSubscriptionRepository(db)
+        subscriptions = await sub_repo.get_active_for_event(
+            source_id=source.id,
+            event_type=None,  # Match all subscriptions for schedule events
+        )
+
+        deliveries_for_event = 0
+        for sub in subscriptions:
+            if not sub.workflow_id:
+                logger.warning(f"Subscription {sub.id} has no workflow, skipping")
+                continue
+
+            db.add(EventDelivery(
+                id=uuid.uuid4(),
+                event_id=event.id,
+                event_subscription_id=sub.id,
+                workflow_id=sub.workflow_id,
+                status=EventDeliveryStatus.PENDING,
+            ))
+            deliveries_for_event += 1
+
+        if not deliveries_for_event:
+            # No subscriptions - mark event as completed (nothing to deliver)
+            event.status = EventStatus.COMPLETED
+            await db.commit()
+            logger.info(f"No subscriptions for schedule source: {source.id}")
+            return outcome
+
+        # Commit the event and its deliveries before queueing them
+        await db.commit()
+        logger.info(
+            f"Created {deliveries_for_event} deliveries for schedule event: {event.id}"
+        )
+
+        # Queue the deliveries using the event processor
+        from src.services.events.processor import EventProcessor
+
+        processor = EventProcessor(db)
+        outcome["deliveries_queued"] = await processor.queue_event_deliveries(event.id)
+        event.status = EventStatus.COMPLETED
+        await db.commit()
+
+    return outcome
+
+
+async def process_schedule_sources() -> dict[str, Any]:
+    """
+    Fire every schedule source that is due now.
+
+    Returns:
+        Summary of processing results
+    """
     results: dict[str, Any] = {
         "total_sources": 0,
         "events_created": 0,
         "deliveries_queued": 0,
         "errors": [],
     }
-
-    try:
-        async with get_db_context() as db:
-            # Query active schedule sources
-            query = (
-                select(EventSource)
-                .options(
-                    joinedload(EventSource.schedule_source),
-                    joinedload(EventSource.subscriptions),
-                )
-                .where(
-                    EventSource.source_type == EventSourceType.SCHEDULE,
-                    EventSource.is_active.is_(True),
+    semaphore = asyncio.Semaphore(FIRE_CONCURRENCY)
+
+    async def fire(schedule_source_id: uuid.UUID, now: datetime) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                return await fire_schedule_source(schedule_source_id, now)
+            except Exception as e:
+                logger.error(
+                    f"Error processing schedule source {schedule_source_id}: {e}",
+                    exc_info=True,
                 )
-            )
-            result = await db.execute(query)
-            sources = result.unique().scalars().all()
+                return {"fired": False, "rescheduled": False, "deliveries_queued": 0, "error": str(e)}
 
-            results["total_sources"] = len(sources)
+    try:
+        while True:
             now = datetime.now(timezone.utc)
-
-            for source in sources:
-                try:
-                    if not source.schedule_source or not source.schedule_source.enabled:
-                        continue
-
-                    ss = source.schedule_source
-                    cron_expression = ss.cron_expression
-
-                    # Validate CRON expression
-                    if not is_cron_expression_valid(cron_expression):
-                        logger.warning(
-                            f"Invalid cron for schedule source {source.id}: {cron_expression}"
-                        )
-                        results["errors"].append({
-                            "source_id": str(source.id),
-                            "source_name": source.name,
-                            "error": f"Invalid CRON expression: {cron_expression}",
-                        })
-                        continue
-
-                    # Check if schedule interval is too frequent
-                    try:
-                        cron = croniter(cron_expression, now)
-                        first_run = cron.get_next(datetime)
-                        second_run = cron.get_next(datetime)
-                        interval_seconds = (second_run - first_run).total_seconds()
-
-                        if interval_seconds < 300:  # Less than 5 minutes
-                            logger.warning(
-                                f"Schedule interval for source {source.name} is "
-                                f"{interval_seconds}s (< 5 minutes)"
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to validate schedule interval for source {source.id}: {e}"
-                        )
-
-                    # Check if the most recent cron match is within our polling window.
-                    # We poll every 1 minute, so check if the last match was < 60s ago.
-                    cron_iter = croniter(cron_expression, now)
-                    prev_run = cron_iter.get_prev(datetime)
-                    seconds_since_last = (now - prev_run).total_seconds()
-                    if seconds_since_last >= 60:
-                        continue  # Last match was outside our polling window
-
-                    logger.info(f"Firing schedule source: {source.name} ({source.id})")
-
-                    # Create event record
-                    event = Event(
-                        id=uuid.uuid4(),
-                        event_source_id=source.id,
-                        event_type="schedule.fired",
-                        received_at=now,
-                        data={
-                            "cron_expression": cron_expression,
-                            "timezone": ss.timezone,
-                            "scheduled_time": now.isoformat(),
-                        },
-                        status=EventStatus.PROCESSING,
-                    )
-                    db.add(event)
-                    await db.flush()
-                    results["events_created"] += 1
-
-                    # Get active subscriptions for this source
-                    sub_repo = EventSubscriptionRepository(db)
-                    subscriptions = await sub_repo.get_active_for_event(
-                        source_id=source.id,
-                        event_type=None,  # Match all subscriptions for schedule events
-                    )
-
-                    if not subscriptions:
-                        # No subscriptions - mark event as completed (nothing to deliver)
-                        event.status = EventStatus.COMPLETED
-                        await db.flush()
-                        logger.info(f"No subscriptions for schedule source: {source.id}")
-                        continue
-
-                    # Create deliveries for each subscription
-                    deliveries_for_event = 0
-                    for sub in subscriptions:
-                        if not sub.workflow_id:
-                            logger.warning(
-                                f"Subscription {sub.id} has no workflow, skipping"
-                            )
-                            continue
-
-                        delivery = EventDelivery(
-                            id=uuid.uuid4(),
-                            event_id=event.id,
-                            event_subscription_id=sub.id,
-                            workflow_id=sub.workflow_id,
-                            status=EventDeliveryStatus.PENDING,
-                        )
-                        db.add(delivery)
-                        deliveries_for_event += 1
-
-                    await db.flush()
-
-                    logger.info(
-                        f"Created {deliveries_for_event} deliveries for schedule event: {event.id}"
-                    )
-
-                    # Queue the deliveries using the event processor
-                    from src.services.events.processor import EventProcessor
-
-                    processor = EventProcessor(db)
-                    queued = await processor.queue_event_deliveries(event.id)
-                    results["deliveries_queued"] += queued
-
-                    # Update event status based on delivery outcomes
-                    if queued > 0:
-                        event.status = EventStatus.COMPLETED
-                    else:
-                        event.status = EventStatus.COMPLETED
-
-                except Exception as source_error:
-                    error_info = {
-                        "source_id": str(source.id),
-                        "source_name": source.name,
-                        "error": str(source_error),
-                    }
-                    results["errors"].append(error_info)
-                    logger.error(
-                        "Error processing schedule source",
-                        extra=error_info,
-                        exc_info=True,
-                    )
-
-            await db.commit()
+            due = await _due_schedule_ids(now)
+            outcomes = await asyncio.gather(*(fire(schedule_id, now) for schedule_id in due))
+
+            results["total_sources"] += len(due)
+            for schedule_id, outcome in zip(due, outcomes):
+                results["events_created"] += int(outcome["fired"])
+                results["deliveries_queued"] += outcome["deliveries_queued"]
+                if outcome["error"]:
+                    results["errors"].append({
+                        "schedule_source_id": str(schedule_id),
+                        "error": outcome["error"],
+                    })
+
+            # A full batch may leave more due schedules behind; stop when the
+            # batch moved nothing forward (e.g. only invalid expressions left)
+            if len(due) < DUE_BATCH_SIZE or not any(o["rescheduled"] for o in outcomes):
+                break
 
     except Exception as e:
         logger.error(f"Schedule sources processor failed: {e}", exc_info=True)
         results["errors"].append({"error": str(e)})
 
-    logger.info(
-        f"Schedule sources processor completed: "
-        f"Sources={results['total_sources']}, "
-        f"Events={results['events_created']}, "
-        f"Deliveries={results['deliveries_queued']}, "
-        f"Errors={len(results['errors'])}"
-    )
+    if results["total_sources"]:
+        logger.info(
+            f"Schedule sources processor completed: "
+            f"Sources={results['total_sources']}, "
+            f"Events={results['events_created']}, "
+            f"Deliveries={results['deliveries_queued']}, "
+            f"Errors={len(results['errors'])}"
+        )
 
     return results
+
+
+class ScheduleTimer:
+    """
+    Background task firing schedule sources at their next fire time.
+
+    Sleeps until the earliest next_fire_at (at most MAX_SLEEP_SECONDS), so
+    schedules fire within a second of their time instead of on the next
+    minute tick. wake() moves the next pass earlier, e.g. when a schedule
+    was created or edited.
+    """
+
+    def __init__(self, max_sleep: float = MAX_SLEEP_SECONDS):
+        self.max_sleep = max_sleep
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._wake_at: datetime | None = None
+
+    async def start(self) -> None:
+        """Start the timer task."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="schedule-timer")
+
+    async def stop(self) -> None:
+        """Stop the timer task after the current pass."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def wake(self, at: datetime | None = None) -> None:
+        """
+        Run a pass at `at` (or right away) unless one is due sooner.
+
+        Editors announce a schedule's new fire time before their transaction
+        commits, so waking at that time (rather than immediately) finds the
+        committed row.
+        """
+        at = at or datetime.now(timezone.utc)
+        if self._wake_at is None or at < self._wake_at:
+            self._wake_at = at
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            next_due = None
+            try:
+                await process_schedule_sources()
+                next_due = await next_due_time()
+            except Exception as e:
+                logger.error(f"Schedule timer pass failed: {e}", exc_info=True)
+            await self._sleep(next_due)
+
+    async def _sleep(self, next_due: datetime | None) -> None:
+        """Wait until `next_due` (bounded by max_sleep) or an earlier wake()."""
+        deadline = datetime.now(timezone.utc) + timedelta(seconds=self._sleep_seconds(next_due))
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            if self._wake_at is not None:
+                deadline = min(deadline, self._wake_at)
+                self._wake_at = None
+            timeout = (deadline - datetime.now(timezone.utc)) / timedelta(seconds=1)
+            if timeout <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return
+
+    def _sleep_seconds(self, next_due: datetime | None) -> float:
+        """Seconds until `next_due`, bounded by max_sleep."""
+        if next_due is None:
+            return self.max_sleep
+        delay = (next_due - datetime.now(timezone.utc)) / timedelta(seconds=1)
+        if delay <= 0:
+            return min(RETRY_SLEEP_SECONDS, self.max_sleep)
+        return min(delay, self.max_sleep)
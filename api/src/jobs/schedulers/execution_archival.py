@@ -0,0 +1,163 @@
+"""
+Execution Archival Scheduler
+
+Moves the logs, result and variables of executions that finished more than
+settings.execution_archive_after_days ago into the S3 bucket (hourly), and
+leaves only Execution.archive_key in Postgres. Reads hydrate archived data
+transparently; see src.services.execution_archive for the object format.
+
+Executions are archived in batches, one transaction each: the objects are
+uploaded first, then the pointers are set and the rows cleared. A batch
+that fails to commit leaves its (content-addressed) objects behind to be
+overwritten by the next attempt.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, null, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.core.database import get_db_context
+from src.models import Execution, ExecutionLog
+from src.models.enums import ExecutionStatus
+from src.services.execution_archive import ExecutionArchive, log_record, upload_archive
+
+logger = logging.getLogger(__name__)
+
+# Executions archived per transaction
+BATCH_SIZE = 100
+
+# Upper bound per run so a large backlog is worked off over several runs
+MAX_BATCHES_PER_RUN = 50
+
+# Concurrent S3 uploads within a batch
+UPLOAD_CONCURRENCY = 8
+
+ACTIVE_STATUSES = (
+    ExecutionStatus.PENDING.value,
+    ExecutionStatus.RUNNING.value,
+    ExecutionStatus.CANCELLING.value,
+)
+
+
+async def _load_batch(db: AsyncSession, cutoff: datetime) -> list[ExecutionArchive]:
+    """Lock the next batch of archivable executions and read their data."""
+    result = await db.execute(
+        select(Execution.id, Execution.result, Execution.variables)
+        .where(
+            Execution.archive_key.is_(None),
+            Execution.completed_at < cutoff,
+            Execution.status.notin_(ACTIVE_STATUSES),
+        )
+        .order_by(Execution.completed_at)
+        .limit(BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    archives = {
+        row.id: ExecutionArchive(
+            execution_id=str(row.id), result=row.result, variables=row.variables
+        )
+        for row in result.all()
+    }
+    if not archives:
+        return []
+
+    logs = await db.execute(
+        select(
+            ExecutionLog.execution_id,
+            ExecutionLog.id,
+            ExecutionLog.level,
+            ExecutionLog.message,
+            ExecutionLog.log_metadata,
+            ExecutionLog.timestamp,
+            ExecutionLog.sequence,
+        )
+        .where(ExecutionLog.execution_id.in_(archives))
+        .order_by(ExecutionLog.execution_id, ExecutionLog.sequence)
+    )
+    for log in logs.all():
+        archives[log.execution_id].logs.append(log_record(
+            log.id, log.level, log.message, log.log_metadata, log.timestamp, log.sequence
+        ))
+    return list(archives.values())
+
+
+async def _archive_batch(db: AsyncSession, s3: Any, cutoff: datetime) -> int:
+    """
+    Archive one batch of executions in the current transaction.
+
+    Returns:
+        Number of executions archived (0 when nothing is left)
+    """
+    archives = await _load_batch(db, cutoff)
+    if not archives:
+        return 0
+
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+    async def upload(archive: ExecutionArchive) -> str:
+        async with semaphore:
+            return await upload_archive(s3, archive)
+
+    keys = await asyncio.gather(*(upload(archive) for archive in archives))
+
+    now = datetime.now(timezone.utc)
+    ids = [UUID(archive.execution_id) for archive in archives]
+    await db.execute(
+        update(Execution),
+        [{"id": execution_id, "archive_key": key} for execution_id, key in zip(ids, keys)],
+    )
+    await db.execute(
+        update(Execution)
+        .where(Execution.id.in_(ids))
+        .values(result=null(), variables=null(), archived_at=now)
+    )
+    await db.execute(delete(ExecutionLog).where(ExecutionLog.execution_id.in_(ids)))
+    return len(archives)
+
+
+async def archive_old_executions() -> dict[str, Any]:
+    """
+    Archive executions older than the configured window.
+
+    Returns:
+        Summary of archived executions
+    """
+    settings = get_settings()
+    results: dict[str, Any] = {
+        "archive_after_days": settings.execution_archive_after_days,
+        "archived": 0,
+        "errors": [],
+    }
+    if settings.execution_archive_after_days <= 0 or not settings.s3_configured:
+        return results
+
+    from src.services.file_storage.s3_client import S3StorageClient
+
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        days=settings.execution_archive_after_days
+    )
+
+    try:
+        async with S3StorageClient(settings).get_client() as s3:
+            for _ in range(MAX_BATCHES_PER_RUN):
+                async with get_db_context() as db:
+                    archived = await _archive_batch(db, s3, cutoff)
+                    await db.commit()
+                if not archived:
+                    break
+                results["archived"] += archived
+
+        if results["archived"]:
+            logger.info(f"Archived {results['archived']} executions to object storage")
+
+    except Exception as e:
+        logger.error(f"Execution archival failed: {e}", exc_info=True)
+        results["errors"].append({"error": str(e)})
+
+    return results
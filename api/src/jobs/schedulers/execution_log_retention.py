@@ -0,0 +1,228 @@
+"""
+Execution Log Retention Scheduler
+
+Maintains the monthly partitions of execution_logs (daily):
+- Creates partitions for the current month and the next few months, moving
+  any rows of that month out of the default partition
+- Drops partitions whose whole month is older than the retention window
+  (settings.execution_log_retention_days), and deletes expired rows that
+  landed in the default partition. Retention is opt-in: the default of 0
+  keeps logs forever and nothing is deleted. With archival enabled,
+  partitions still holding logs of executions awaiting archival are kept.
+
+Dropping a partition is a metadata change, so retention costs nothing
+compared with deleting millions of rows. Creating and dropping run in
+separate transactions, so a failure in one does not undo the other.
+"""
+
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import get_settings
+from src.core.database import get_db_context
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "execution_logs"
+DEFAULT_PARTITION = "execution_logs_default"
+
+# Months of partitions kept ready beyond the current one
+PARTITIONS_AHEAD = 3
+
+_PARTITION_NAME = re.compile(r"^execution_logs_y(\d{4})m(\d{2})$")
+
+
+def _add_months(month: date, months: int) -> date:
+    """First day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding logs from `month`."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """Month covered by a partition, or None for the default partition."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def list_partitions(db: AsyncSession) -> list[str]:
+    """Names of the partitions currently attached to execution_logs."""
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return sorted(result.scalars().all())
+
+
+async def ensure_partitions(
+    db: AsyncSession, now: datetime, existing: list[str]
+) -> list[str]:
+    """
+    Create the partitions for this month and the next PARTITIONS_AHEAD.
+
+    Postgres refuses to create a partition while the default partition
+    holds rows in its range. If it does, the default partition is detached,
+    the partition created, the rows moved into it and the default
+    partition attached again, all within the caller's transaction.
+
+    Returns:
+        Names of the partitions created
+    """
+    created = []
+    this_month = now.astimezone(timezone.utc).date().replace(day=1)
+    for offset in range(PARTITIONS_AHEAD + 1):
+        month = _add_months(this_month, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        lower = f"{month.isoformat()} 00:00:00+00"
+        upper = f"{_add_months(month, 1).isoformat()} 00:00:00+00"
+        in_range = f"timestamp >= '{lower}' AND timestamp < '{upper}'"
+
+        stranded = False
+        if DEFAULT_PARTITION in existing:
+            result = await db.execute(text(
+                f"SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range} LIMIT 1"
+            ))
+            stranded = result.first() is not None
+
+        if stranded:
+            await db.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"
+            ))
+        await db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        if stranded:
+            result = await db.execute(text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ))
+            moved = result.rowcount or 0  # type: ignore[attr-defined]
+            await db.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+            ))
+            logger.info(f"Moved {moved} rows from {DEFAULT_PARTITION} into {name}")
+        created.append(name)
+    return created
+
+
+# Logs of finished executions the archival job has not moved to object storage yet
+_AWAITING_ARCHIVAL = (
+    "EXISTS (SELECT 1 FROM executions e WHERE e.id = l.execution_id "
+    "AND e.archive_key IS NULL AND e.completed_at IS NOT NULL)"
+)
+
+
+async def drop_expired_partitions(
+    db: AsyncSession,
+    cutoff: datetime,
+    existing: list[str],
+    keep_unarchived: bool = False,
+) -> tuple[list[str], int]:
+    """
+    Drop partitions that only hold logs from before `cutoff`.
+
+    Args:
+        keep_unarchived: Keep partitions (and default partition rows) with logs
+            of finished executions that are still waiting to be archived
+
+    Returns:
+        (names of the dropped partitions, rows deleted from the default partition)
+    """
+    cutoff_day = cutoff.astimezone(timezone.utc).date()
+    dropped = []
+    for name in existing:
+        month = partition_month(name)
+        if month is None or _add_months(month, 1) > cutoff_day:
+            continue
+        if keep_unarchived:
+            pending = await db.execute(text(
+                f"SELECT 1 FROM {name} l WHERE {_AWAITING_ARCHIVAL} LIMIT 1"
+            ))
+            if pending.first() is not None:
+                logger.info(f"Keeping {name} until its executions are archived")
+                continue
+        await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        dropped.append(name)
+
+    deleted = 0
+    if DEFAULT_PARTITION in existing:
+        condition = "timestamp < :cutoff"
+        if keep_unarchived:
+            condition += f" AND NOT {_AWAITING_ARCHIVAL}"
+        result = await db.execute(
+            text(f"DELETE FROM {DEFAULT_PARTITION} l WHERE {condition}"),
+            {"cutoff": cutoff},
+        )
+        deleted = result.rowcount or 0  # type: ignore[attr-defined]
+    return dropped, deleted
+
+
+async def maintain_execution_log_partitions() -> dict[str, Any]:
+    """
+    Create upcoming execution log partitions and apply the retention window.
+
+    Returns:
+        Summary of created and dropped partitions
+    """
+    now = datetime.now(timezone.utc)
+    settings = get_settings()
+    retention_days = settings.execution_log_retention_days
+    results: dict[str, Any] = {
+        "retention_days": retention_days,
+        "created": [],
+        "dropped": [],
+        "default_rows_deleted": 0,
+        "errors": [],
+    }
+
+    try:
+        async with get_db_context() as db:
+            existing = await list_partitions(db)
+            results["created"] = await ensure_partitions(db, now, existing)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Creating execution log partitions failed: {e}", exc_info=True)
+        results["errors"].append({"error": str(e)})
+
+    if retention_days > 0:
+        try:
+            async with get_db_context() as db:
+                dropped, deleted = await drop_expired_partitions(
+                    db,
+                    now - timedelta(days=retention_days),
+                    await list_partitions(db),
+                    keep_unarchived=settings.execution_archive_after_days > 0,
+                )
+                await db.commit()
+            results["dropped"] = dropped
+            results["default_rows_deleted"] = deleted
+        except Exception as e:
+            logger.error(f"Dropping expired execution log partitions failed: {e}", exc_info=True)
+            results["errors"].append({"error": str(e)})
+
+    if results["created"] or results["dropped"] or results["default_rows_deleted"]:
+        logger.info(
+            f"Execution log partitions: created {results['created']}, "
+            f"dropped {results['dropped']}, "
+            f"{results['default_rows_deleted']} expired rows deleted from default"
+        )
+
+    return results
@@ -0,0 +1,321 @@
+"""
+Metrics Counter Flush Scheduler
+
+Folds the Redis execution metric counters (written by
+src.core.metrics.record_execution_metrics) into execution_metrics_daily
+and workflow_roi_daily. Runs every minute.
+
+Each run seals the buckets of past minutes (writers move on to a later
+bucket), then applies every sealed bucket, oldest first, as one batched
+upsert per table. The bucket number is stored as a checkpoint in the same
+transaction, so a bucket whose Redis keys survive a crash after the commit
+is only deleted on the next run, never applied twice.
+"""
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import get_redis
+from src.core.cache.keys import (
+    METRIC_COUNTERS_PREFIX,
+    metric_counters_bucket_keys_key,
+    metric_counters_buckets_key,
+    metric_counters_sealed_key,
+)
+from src.core.database import get_session_factory
+from src.core.metrics import (
+    FLOAT_COUNTER_FIELDS,
+    current_metrics_bucket,
+    lock_metrics_checkpoint,
+)
+from src.models import (
+    ExecutionMetricsDaily,
+    MetricsRollupCheckpoint,
+    Workflow,
+    WorkflowROIDaily,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "execution_metric_counters"
+
+# Raises the sealed bucket, never lowers it. Returns the sealed bucket.
+_SEAL_SCRIPT = """
+local sealed = tonumber(redis.call('GET', KEYS[1]) or '-1')
+local target = tonumber(ARGV[1])
+if target > sealed then
+    redis.call('SET', KEYS[1], target)
+    sealed = target
+end
+return sealed
+"""
+
+DAILY_COUNTER_FIELDS = (
+    "execution_count",
+    "success_count",
+    "failed_count",
+    "timeout_count",
+    "cancelled_count",
+    "total_duration_ms",
+    "total_memory_bytes",
+    "total_cpu_seconds",
+    "total_time_saved",
+    "total_value",
+)
+DAILY_MAX_FIELDS = ("max_duration_ms", "peak_memory_bytes", "peak_cpu_seconds")
+ROI_COUNTER_FIELDS = (
+    "execution_count",
+    "success_count",
+    "total_time_saved",
+    "total_value",
+)
+
+
+def _parse_counters(raw: dict[Any, Any]) -> dict[str, int | float]:
+    """Decode a counter hash into typed field values."""
+    counters: dict[str, int | float] = {}
+    for field, value in raw.items():
+        name = field.decode() if isinstance(field, bytes) else field
+        text_value = value.decode() if isinstance(value, bytes) else value
+        if name in FLOAT_COUNTER_FIELDS:
+            counters[name] = float(text_value)
+        else:
+            counters[name] = int(float(text_value))
+    return counters
+
+
+def _parse_bucket(
+    bucket: int, hashes: dict[str, dict[Any, Any]]
+) -> tuple[dict[tuple[date, UUID | None], dict], dict[tuple[date, UUID, UUID | None], dict]]:
+    """
+    Group a bucket's counter hashes into daily and ROI rows.
+
+    Returns:
+        (daily rows by (date, org_id), ROI rows by (date, workflow_id, org_id))
+    """
+    prefix = f"{METRIC_COUNTERS_PREFIX}{bucket}:"
+    daily: dict[tuple[date, UUID | None], dict] = {}
+    roi: dict[tuple[date, UUID, UUID | None], dict] = {}
+
+    for key, raw in hashes.items():
+        if not raw or not key.startswith(prefix):
+            continue
+        parts = key[len(prefix):].split(":")
+        try:
+            day = date.fromisoformat(parts[1])
+            scope = None if parts[-1] == "global" else UUID(parts[-1])
+            if parts[0] == "daily" and len(parts) == 3:
+                daily[(day, scope)] = _parse_counters(raw)
+            elif parts[0] == "roi" and len(parts) == 4:
+                roi[(day, UUID(parts[2]), scope)] = _parse_counters(raw)
+            else:
+                raise ValueError("unknown counter kind")
+        except (ValueError, IndexError):
+            logger.warning(f"Ignoring malformed metric counter key: {key}")
+
+    return daily, roi
+
+
+async def _apply_daily(
+    db: AsyncSession, rows: dict[tuple[date, UUID | None], dict]
+) -> None:
+    """Add daily counter rows to execution_metrics_daily (one upsert per scope)."""
+    now = datetime.now(timezone.utc)
+    org_values: list[dict[str, Any]] = []
+    global_values: list[dict[str, Any]] = []
+
+    for (day, org_id), counters in rows.items():
+        values: dict[str, Any] = {"date": day, "organization_id": org_id}
+        for field in DAILY_COUNTER_FIELDS + DAILY_MAX_FIELDS:
+            values[field] = counters.get(field, 0)
+        values["avg_duration_ms"] = (
+            values["total_duration_ms"] // values["execution_count"]
+            if values["execution_count"]
+            else 0
+        )
+        (org_values if org_id is not None else global_values).append(values)
+
+    for values, conflict in (
+        (org_values, {"constraint": "uq_metrics_daily_date_org"}),
+        (
+            global_values,
+            {
+                "index_elements": ["date"],
+                "index_where": text("organization_id IS NULL"),
+            },
+        ),
+    ):
+        if not values:
+            continue
+        stmt = insert(ExecutionMetricsDaily).values(values)
+        excluded = stmt.excluded
+        set_: dict[str, Any] = {
+            field: getattr(ExecutionMetricsDaily, field) + getattr(excluded, field)
+            for field in DAILY_COUNTER_FIELDS
+        }
+        set_.update({
+            field: func.greatest(
+                getattr(ExecutionMetricsDaily, field), getattr(excluded, field)
+            )
+            for field in DAILY_MAX_FIELDS
+        })
+        set_["avg_duration_ms"] = (
+            ExecutionMetricsDaily.total_duration_ms + excluded.total_duration_ms
+        ) // (ExecutionMetricsDaily.execution_count + excluded.execution_count)
+        set_["updated_at"] = now
+        await db.execute(stmt.on_conflict_do_update(set_=set_, **conflict))
+
+
+async def _apply_roi(
+    db: AsyncSession, rows: dict[tuple[date, UUID, UUID | None], dict]
+) -> None:
+    """Add ROI counter rows to workflow_roi_daily (one upsert per scope)."""
+    if not rows:
+        return
+
+    # Workflows may have been deleted since the executions completed
+    workflow_ids = {workflow_id for _, workflow_id, _ in rows}
+    result = await db.execute(
+        select(Workflow.id).where(Workflow.id.in_(workflow_ids))
+    )
+    existing = set(result.scalars().all())
+    skipped = workflow_ids - existing
+    if skipped:
+        logger.debug(f"Skipping ROI counters for deleted workflows: {skipped}")
+
+    now = datetime.now(timezone.utc)
+    org_values: list[dict[str, Any]] = []
+    global_values: list[dict[str, Any]] = []
+    for (day, workflow_id, org_id), counters in rows.items():
+        if workflow_id not in existing:
+            continue
+        values: dict[str, Any] = {
+            "date": day,
+            "workflow_id": workflow_id,
+            "organization_id": org_id,
+        }
+        for field in ROI_COUNTER_FIELDS:
+            values[field] = counters.get(field, 0)
+        (org_values if org_id is not None else global_values).append(values)
+
+    for values, conflict in (
+        (org_values, {"constraint": "uq_workflow_roi_daily"}),
+        (
+            global_values,
+            {
+                "index_elements": ["date", "workflow_id"],
+                "index_where": text("organization_id IS NULL"),
+            },
+        ),
+    ):
+        if not values:
+            continue
+        stmt = insert(WorkflowROIDaily).values(values)
+        set_: dict[str, Any] = {
+            field: getattr(WorkflowROIDaily, field) + getattr(stmt.excluded, field)
+            for field in ROI_COUNTER_FIELDS
+        }
+        set_["updated_at"] = now
+        await db.execute(stmt.on_conflict_do_update(set_=set_, **conflict))
+
+
+async def flush_metric_counters() -> dict[str, Any]:
+    """
+    Fold sealed Redis metric counter buckets into the daily metrics tables.
+
+    Stops at the first bucket that fails to apply; it and later buckets
+    are retried on the next run.
+
+    Returns:
+        Summary of flushed buckets and rows
+    """
+    summary: dict[str, Any] = {
+        "buckets": 0,
+        "daily_rows": 0,
+        "roi_rows": 0,
+        "skipped_buckets": 0,
+        "errors": 0,
+    }
+
+    try:
+        async with get_redis() as r:
+            # Close every bucket before the current minute for writing
+            sealed = int(await r.eval(
+                _SEAL_SCRIPT,
+                1,
+                metric_counters_sealed_key(),
+                current_metrics_bucket() - 1,
+            ))
+            buckets = sorted(
+                int(float(b))
+                for b in await r.zrangebyscore(
+                    metric_counters_buckets_key(), "-inf", sealed
+                )
+            )
+            if not buckets:
+                return summary
+
+            session_factory = get_session_factory()
+            for bucket in buckets:
+                members_key = metric_counters_bucket_keys_key(bucket)
+                keys = sorted(
+                    k.decode() if isinstance(k, bytes) else k
+                    for k in await r.smembers(members_key)
+                )
+                hashes: dict[str, dict[Any, Any]] = {}
+                if keys:
+                    pipe = r.pipeline(transaction=False)
+                    for key in keys:
+                        pipe.hgetall(key)
+                    hashes = dict(zip(keys, await pipe.execute()))
+                daily, roi = _parse_bucket(bucket, hashes)
+
+                try:
+                    async with session_factory() as db:
+                        checkpoint = await lock_metrics_checkpoint(db, CHECKPOINT_NAME)
+                        if bucket <= checkpoint:
+                            # Applied before, but its keys were not deleted
+                            summary["skipped_buckets"] += 1
+                        else:
+                            await _apply_daily(db, daily)
+                            await _apply_roi(db, roi)
+                            await db.execute(
+                                update(MetricsRollupCheckpoint)
+                                .where(MetricsRollupCheckpoint.name == CHECKPOINT_NAME)
+                                .values(position=bucket)
+                            )
+                            summary["daily_rows"] += len(daily)
+                            summary["roi_rows"] += len(roi)
+                        await db.commit()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to flush metric counters for bucket {bucket}: {e}",
+                        exc_info=True,
+                    )
+                    summary["errors"] += 1
+                    break
+
+                pipe = r.pipeline(transaction=False)
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(members_key)
+                pipe.zrem(metric_counters_buckets_key(), bucket)
+                await pipe.execute()
+                summary["buckets"] += 1
+
+    except Exception as e:
+        logger.error(f"Metric counter flush failed: {e}", exc_info=True)
+        summary["errors"] += 1
+
+    if summary["buckets"]:
+        logger.debug(
+            f"Flushed {summary['buckets']} metric counter buckets "
+            f"({summary['daily_rows']} daily rows, {summary['roi_rows']} ROI rows)"
+        )
+    return summary
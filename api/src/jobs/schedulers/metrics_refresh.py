@@ -2,18 +2,20 @@
 Metrics Refresh Scheduler
 
 Refreshes the platform_metrics_snapshot table with current metrics.
-Runs hourly to keep dashboard data fresh without expensive queries.
+Runs every few minutes to keep dashboard data fresh without expensive
+queries: execution stats come from incremental rollups
+(src/services/execution_rollups.py), not scans of the executions table.
 """
 
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import select, func, case, update
+from sqlalchemy import select, func, update
 
+from src.config import get_settings
 from src.core.database import get_session_factory
 from src.models import (
-    Execution as ExecutionModel,
     Workflow,
     Form,
     Organization,
@@ -21,8 +23,13 @@ from src.models import (
     PlatformMetricsSnapshot,
     ExecutionMetricsDaily,
 )
-from src.models.enums import ExecutionStatus
 from src.models.orm.ai_usage import AIUsage
+from src.services.execution_rollups import (
+    advance_execution_rollups,
+    get_execution_totals,
+    get_live_execution_counts,
+    verify_execution_rollups,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -80,34 +87,13 @@ async def refresh_metrics_snapshot() -> dict[str, Any]:
             counts_result = await db.execute(counts_query)
             counts = counts_result.one()
 
-            # All-time execution stats
-            all_time_query = select(
-                func.count(ExecutionModel.id).label("total"),
-                func.sum(case((ExecutionModel.status == ExecutionStatus.SUCCESS.value, 1), else_=0)).label("success"),
-                func.sum(case((ExecutionModel.status == ExecutionStatus.FAILED.value, 1), else_=0)).label("failed"),
-            )
-            all_time_result = await db.execute(all_time_query)
-            all_time = all_time_result.one()
-
-            # Last 24 hours execution stats
-            last_24h_query = select(
-                func.count(ExecutionModel.id).label("total"),
-                func.sum(case((ExecutionModel.status == ExecutionStatus.SUCCESS.value, 1), else_=0)).label("success"),
-                func.sum(case((ExecutionModel.status == ExecutionStatus.FAILED.value, 1), else_=0)).label("failed"),
-                func.avg(case((ExecutionModel.status == ExecutionStatus.SUCCESS.value, ExecutionModel.duration_ms), else_=None)).label("avg_duration"),
-                func.sum(case((ExecutionModel.peak_memory_bytes.isnot(None), ExecutionModel.peak_memory_bytes), else_=0)).label("total_memory"),
-                func.sum(case((ExecutionModel.cpu_total_seconds.isnot(None), ExecutionModel.cpu_total_seconds), else_=0)).label("total_cpu"),
-            ).where(ExecutionModel.created_at >= yesterday)
-            last_24h_result = await db.execute(last_24h_query)
-            last_24h = last_24h_result.one()
-
-            # Current running/pending counts
-            current_query = select(
-                func.sum(case((ExecutionModel.status == ExecutionStatus.RUNNING.value, 1), else_=0)).label("running"),
-                func.sum(case((ExecutionModel.status == ExecutionStatus.PENDING.value, 1), else_=0)).label("pending"),
-            )
-            current_result = await db.execute(current_query)
-            current = current_result.one()
+            # Execution stats from the incremental rollups (no full scans)
+            rollups = await advance_execution_rollups(now)
+            all_time = await get_execution_totals(db)
+            last_24h = await get_execution_totals(db, since=yesterday)
+
+            # Current running/pending counts from the pool heartbeats
+            running_count, pending_count = await get_live_execution_counts(db)
 
             # ROI (last 24 hours) - from execution_metrics_daily table
             roi_24h_query = select(
@@ -139,13 +125,13 @@ async def refresh_metrics_snapshot() -> dict[str, Any]:
             ai_24h = ai_24h_result.one()
 
             # Calculate success rates
-            total_all_time = all_time.total or 0
-            success_all_time = all_time.success or 0
-            success_rate_all_time = (success_all_time / total_all_time * 100) if total_all_time > 0 else 0.0
+            total_all_time = all_time.execution_count
+            success_all_time = all_time.success_count
+            success_rate_all_time = all_time.success_rate
 
-            total_24h = last_24h.total or 0
-            success_24h = last_24h.success or 0
-            success_rate_24h = (success_24h / total_24h * 100) if total_24h > 0 else 0.0
+            total_24h = last_24h.execution_count
+            success_24h = last_24h.success_count
+            success_rate_24h = last_24h.success_rate
 
             # Update snapshot
             await db.execute(
@@ -161,18 +147,18 @@ async def refresh_metrics_snapshot() -> dict[str, Any]:
                     # All time
                     total_executions=total_all_time,
                     total_success=success_all_time,
-                    total_failed=all_time.failed or 0,
+                    total_failed=all_time.failed_count,
                     # Last 24 hours
                     executions_24h=total_24h,
                     success_24h=success_24h,
-                    failed_24h=last_24h.failed or 0,
+                    failed_24h=last_24h.failed_count,
                     # Current state
-                    running_count=current.running or 0,
-                    pending_count=current.pending or 0,
+                    running_count=running_count,
+                    pending_count=pending_count,
                     # Performance
-                    avg_duration_ms_24h=int(last_24h.avg_duration or 0),
-                    total_memory_bytes_24h=int(last_24h.total_memory or 0),
-                    total_cpu_seconds_24h=float(last_24h.total_cpu or 0),
+                    avg_duration_ms_24h=int(last_24h.avg_success_duration_ms),
+                    total_memory_bytes_24h=last_24h.total_memory_bytes,
+                    total_cpu_seconds_24h=last_24h.total_cpu_seconds,
                     # Success rates
                     success_rate_all_time=round(success_rate_all_time, 2),
                     success_rate_24h=round(success_rate_24h, 2),
@@ -191,6 +177,16 @@ async def refresh_metrics_snapshot() -> dict[str, Any]:
             )
             await db.commit()
 
+            if get_settings().metrics_rollup_verify:
+                check = await verify_execution_rollups(db)
+                if check["ok"]:
+                    logger.info(f"Execution rollups match a full scan (up to {check['watermark']})")
+                else:
+                    logger.warning(
+                        f"Execution rollups differ from a full scan on "
+                        f"{len(check['mismatches'])} days: {check['mismatches'][:5]}"
+                    )
+
             result = {
                 "workflow_count": counts.workflow_count or 0,
                 "form_count": counts.form_count or 0,
@@ -201,6 +197,7 @@ async def refresh_metrics_snapshot() -> dict[str, Any]:
                 "ai_cost_24h": float(ai_24h.total_cost) if ai_24h.total_cost else 0.0,
                 "ai_calls_24h": ai_24h.total_calls or 0,
                 "refreshed_at": now.isoformat(),
+                "rollup_watermark": rollups["watermark"],
             }
 
             duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
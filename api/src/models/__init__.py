@@ -51,6 +51,9 @@ from src.models.orm import (
     SystemConfig,
     GlobalBranding,
     ExecutionMetricsDaily,
+    ExecutionRollupDaily,
+    ExecutionRollupHourly,
+    MetricsRollupCheckpoint,
     PlatformMetricsSnapshot,
     WorkflowROIDaily,
     FileIndex,
@@ -114,6 +117,9 @@ __all__ = [
     "SystemConfig",
     "GlobalBranding",
     "ExecutionMetricsDaily",
+    "ExecutionRollupDaily",
+    "ExecutionRollupHourly",
+    "MetricsRollupCheckpoint",
     "PlatformMetricsSnapshot",
     "WorkflowROIDaily",
     "FileIndex",
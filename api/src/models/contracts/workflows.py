@@ -76,6 +76,7 @@ class WorkflowMetadata(BaseModel):
     # Execution configuration
     execution_mode: Literal["sync", "async"] = Field(default="sync", description="Execution mode")
     timeout_seconds: int = Field(default=1800, ge=1, le=7200, description="Max execution time in seconds (default 30 min, max 2 hours)")
+    variable_capture: Literal["off", "summary", "full"] = Field(default="full", description="Variable capture mode for execution details")
 
     # Retry policy (for future use)
     retry_policy: RetryPolicy | None = Field(default=None, description="Retry configuration")
@@ -290,6 +291,10 @@ class WorkflowUpdateRequest(BaseModel):
         default=None,
         description="Execution mode: 'sync' for immediate response, 'async' for background execution"
     )
+    variable_capture: Literal["off", "summary", "full"] | None = Field(
+        default=None,
+        description="Variable capture mode: 'off', 'summary' (shallow, truncated values) or 'full'"
+    )
 
     # Economics - value metrics for reporting
     time_saved: int | None = Field(
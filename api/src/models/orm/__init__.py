@@ -25,7 +25,7 @@ from src.models.orm.forms import Form, FormField, FormRole
 from src.models.orm.integrations import Integration, IntegrationConfigSchema, IntegrationMapping
 from src.models.orm.knowledge import KnowledgeStore
 from src.models.orm.knowledge_sources import KnowledgeNamespaceRole
-from src.models.orm.metrics import ExecutionMetricsDaily, KnowledgeStorageDaily, PlatformMetricsSnapshot, WorkflowROIDaily
+from src.models.orm.metrics import ExecutionMetricsDaily, ExecutionRollupDaily, ExecutionRollupHourly, KnowledgeStorageDaily, MetricsRollupCheckpoint, PlatformMetricsSnapshot, WorkflowROIDaily
 from src.models.orm.mfa import MFARecoveryCode, TrustedDevice, UserMFAMethod, UserOAuthAccount
 from src.models.orm.oauth import OAuthProvider, OAuthToken
 from src.models.orm.organizations import Organization
@@ -96,7 +96,10 @@ __all__ = [
     "GlobalBranding",
     # Metrics
     "ExecutionMetricsDaily",
+    "ExecutionRollupDaily",
+    "ExecutionRollupHourly",
     "KnowledgeStorageDaily",
+    "MetricsRollupCheckpoint",
     "PlatformMetricsSnapshot",
     "WorkflowROIDaily",
     # Workspace
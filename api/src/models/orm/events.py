@@ -123,6 +123,12 @@ class ScheduleSource(Base):
     timezone: Mapped[str] = mapped_column(String(50), default="UTC", nullable=False)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
+    # When the schedule fires next (UTC); recomputed when it fires or is edited.
+    # NULL until first computed by the scheduler.
+    next_fire_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+
     # Audit
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
@@ -140,6 +146,12 @@ class ScheduleSource(Base):
     __table_args__ = (
         Index("ix_schedule_sources_event_source_id", "event_source_id"),
         Index("ix_schedule_sources_enabled", "enabled"),
+        # For the scheduler: enabled schedules by next fire time
+        Index(
+            "ix_schedule_sources_next_fire_at",
+            "next_fire_at",
+            postgresql_where=text("enabled"),
+        ),
     )
 
 
@@ -82,6 +82,10 @@ class Execution(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
     )
+    # Object key of the archived logs/result/variables (see src.services.execution_archive);
+    # once set, those are no longer stored in Postgres
+    archive_key: Mapped[str | None] = mapped_column(String(255), default=None)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
 
     # Relationships
     executed_by_user: Mapped["User"] = relationship(back_populates="executions")
@@ -102,30 +106,76 @@ class Execution(Base):
     __table_args__ = (
         Index("ix_executions_org_status", "organization_id", "status"),
         Index("ix_executions_created", "created_at"),
-        Index("ix_executions_user", "executed_by"),
-        Index("ix_executions_workflow", "workflow_name"),
         Index("ix_executions_is_local_execution", "is_local_execution"),
         Index("ix_executions_session_id", "session_id"),
-        Index("ix_executions_workflow_id", "workflow_id"),
+        # Keyset pagination: each common filter followed by the (started_at, id) sort key
+        Index("ix_executions_started_id", "started_at", "id"),
+        Index("ix_executions_org_started_id", "organization_id", "started_at", "id"),
+        Index("ix_executions_user_started_id", "executed_by", "started_at", "id"),
+        Index("ix_executions_workflow_started_id", "workflow_name", "started_at", "id"),
+        Index("ix_executions_workflow_id_started_id", "workflow_id", "started_at", "id"),
+        Index("ix_executions_status_started_id", "status", "started_at", "id"),
+        # Finished executions still waiting to be archived
+        Index(
+            "ix_executions_unarchived_completed",
+            "completed_at",
+            postgresql_where=text("archive_key IS NULL"),
+        ),
+        # Partial workflow name match in the global log view
+        Index(
+            "ix_executions_workflow_name_trgm",
+            "workflow_name",
+            postgresql_using="gin",
+            postgresql_ops={"workflow_name": "gin_trgm_ops"},
+        ),
+        # Oldest unfinished execution bounds the metrics rollup high-water mark
+        Index(
+            "ix_executions_active_created",
+            "created_at",
+            postgresql_where=text("status IN ('Pending', 'Running', 'Cancelling')"),
+        ),
     )
 
 
 class ExecutionLog(Base):
-    """Execution log entries."""
+    """
+    Execution log entries.
+
+    Range-partitioned by month on timestamp (execution_logs_yYYYYmMM plus a
+    default partition); partitions are created ahead of time and, when
+    execution_log_retention_days is set, dropped after the retention window
+    by src.jobs.schedulers.execution_log_retention.
+    The partition key has to be part of the primary key.
+    """
 
     __tablename__ = "execution_logs"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     execution_id: Mapped[UUID] = mapped_column(ForeignKey("executions.id"))
     level: Mapped[str] = mapped_column(String(20))
     message: Mapped[str] = mapped_column(Text)
     log_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=text("NOW()")
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("NOW()"),
     )
     sequence: Mapped[int] = mapped_column(Integer, default=0)
 
     # Relationships
     execution: Mapped["Execution"] = relationship(back_populates="logs")
 
-    __table_args__ = (Index("ix_execution_logs_exec_seq", "execution_id", "sequence"),)
+    __table_args__ = (
+        Index("ix_execution_logs_exec_seq", "execution_id", "sequence"),
+        # Keyset pagination of the global log view
+        Index("ix_execution_logs_timestamp_id", "timestamp", "id"),
+        # Substring (ILIKE '%...%') message search
+        Index(
+            "ix_execution_logs_message_trgm",
+            "message",
+            postgresql_using="gin",
+            postgresql_ops={"message": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
@@ -8,7 +8,7 @@ whenever files are written to S3. Only indexes text-searchable files
 
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String, Text, text
+from sqlalchemy import DateTime, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.orm.base import Base
@@ -28,3 +28,13 @@ class FileIndex(Base):
         server_default=text("NOW()"),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+
+    __table_args__ = (
+        # Substring/regex pre-filter for code search (src/services/file_index_search.py)
+        Index(
+            "ix_file_index_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
@@ -192,6 +192,83 @@ class WorkflowROIDaily(Base):
     )
 
 
+class ExecutionRollupHourly(Base):
+    """
+    Execution counts per hour of creation (UTC).
+
+    Maintained incrementally by the metrics refresh job from a created_at
+    high-water mark (see src/services/execution_rollups.py). Used for the
+    24 hour dashboard figures.
+    """
+
+    __tablename__ = "execution_rollups_hourly"
+
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    # Execution counts
+    execution_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    success_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    failed_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    timeout_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    cancelled_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    # Successful executions with a duration (for average duration)
+    success_duration_ms: Mapped[int] = mapped_column(BigInteger, default=0)
+    success_duration_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    # Resource metrics
+    total_memory_bytes: Mapped[int] = mapped_column(BigInteger, default=0)
+    total_cpu_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+
+
+class ExecutionRollupDaily(Base):
+    """
+    Execution counts per day of creation (UTC).
+
+    Maintained alongside ExecutionRollupHourly. All-time totals are the
+    sum of these rows.
+    """
+
+    __tablename__ = "execution_rollups_daily"
+
+    date: Mapped[date_type] = mapped_column(Date, primary_key=True)
+
+    # Execution counts
+    execution_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    success_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    failed_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    timeout_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    cancelled_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    # Successful executions with a duration (for average duration)
+    success_duration_ms: Mapped[int] = mapped_column(BigInteger, default=0)
+    success_duration_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    # Resource metrics
+    total_memory_bytes: Mapped[int] = mapped_column(BigInteger, default=0)
+    total_cpu_seconds: Mapped[float] = mapped_column(Float, default=0.0)
+
+
+class MetricsRollupCheckpoint(Base):
+    """
+    Progress marker for a metrics rollup job.
+
+    Written in the same transaction as the rows a rollup folds in, so a
+    rerun after a crash can tell which work was already applied.
+    """
+
+    __tablename__ = "metrics_rollup_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("NOW()"),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
 class KnowledgeStorageDaily(Base):
     """
     Daily snapshot of knowledge storage usage per organization and namespace.
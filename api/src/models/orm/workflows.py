@@ -73,6 +73,9 @@ class Workflow(Base):
     disable_global_key: Mapped[bool] = mapped_column(Boolean, default=False)
     execution_mode: Mapped[str] = mapped_column(String(20), default="async")
     timeout_seconds: Mapped[int] = mapped_column(Integer, default=1800)  # 30 min default
+    variable_capture: Mapped[str] = mapped_column(
+        String(20), default="full", server_default="full"
+    )  # off, summary or full
 
     # Tool configuration (for AI agent tool calling when type='tool')
     tool_description: Mapped[str | None] = mapped_column(Text, default=None)
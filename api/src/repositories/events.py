@@ -12,7 +12,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.enums import EventDeliveryStatus, EventSourceType, EventStatus
@@ -229,6 +229,26 @@ class EventSubscriptionRepository(BaseRepository[EventSubscription]):
         result = await self.session.execute(stmt)
         return result.unique().scalars().all()
 
+    async def get_active_for_sources(
+        self,
+        source_ids: Sequence[UUID],
+    ) -> Sequence[EventSubscription]:
+        """
+        Get the active subscriptions of several event sources in one query.
+
+        Callers match event types themselves (see get_active_for_event).
+        """
+        if not source_ids:
+            return []
+        stmt = (
+            select(EventSubscription)
+            .options(joinedload(EventSubscription.workflow))
+            .where(EventSubscription.event_source_id.in_(source_ids))
+            .where(EventSubscription.is_active.is_(True))
+        )
+        result = await self.session.execute(stmt)
+        return result.unique().scalars().all()
+
     async def count_by_source(self, source_id: UUID, active_only: bool = True) -> int:
         """Count subscriptions for an event source."""
         stmt = select(func.count(EventSubscription.id)).where(
@@ -357,6 +377,28 @@ class EventDeliveryRepository(BaseRepository[EventDelivery]):
         )
         return result.unique().scalars().all()
 
+    async def claim_pending(self, event_id: UUID) -> set[UUID]:
+        """
+        Move an event's pending deliveries to QUEUED.
+
+        The conditional UPDATE locks the rows, so when two callers queue the
+        same event concurrently each delivery is claimed by only one of them
+        (the other waits for its commit and then finds nothing pending).
+
+        Returns:
+            IDs of the deliveries claimed by this call
+        """
+        result = await self.session.execute(
+            update(EventDelivery)
+            .where(
+                EventDelivery.event_id == event_id,
+                EventDelivery.status == EventDeliveryStatus.PENDING,
+            )
+            .values(status=EventDeliveryStatus.QUEUED)
+            .returning(EventDelivery.id)
+        )
+        return set(result.scalars().all())
+
     async def get_by_subscription(
         self,
         subscription_id: UUID,
@@ -5,6 +5,7 @@ PostgreSQL-based repository for execution log entries.
 Replaces the Azure Table Storage implementation.
 """
 
+import json
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
@@ -13,10 +14,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from src.core.pagination import Cursor, encode_cursor, seek_before
 from src.models import ExecutionLog
 from src.models.orm.executions import Execution
 from src.models.orm.organizations import Organization
 
+# Columns written by copy_logs (id is assigned by the table's sequence)
+COPY_COLUMNS = ["execution_id", "level", "message", "log_metadata", "timestamp", "sequence"]
+
 
 class ExecutionLogRepository:
     """
@@ -96,6 +101,44 @@ class ExecutionLogRepository:
         await self.session.flush()
         return log_entries
 
+    async def copy_logs(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Bulk insert log rows with COPY in the session's transaction.
+
+        Much cheaper than ORM inserts for the thousands of rows a chatty
+        execution produces: no per-row statements and no identity map.
+
+        Args:
+            rows: ExecutionLog column values (execution_id, level, message,
+                log_metadata, timestamp, sequence)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        # Pending ORM writes (e.g. the execution row) must land first
+        await self.session.flush()
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        records = [
+            (
+                row["execution_id"],
+                row.get("level", "INFO"),
+                row.get("message", ""),
+                json.dumps(row["log_metadata"], default=str)
+                if row.get("log_metadata") is not None else None,
+                row.get("timestamp") or datetime.now(timezone.utc),
+                row.get("sequence", 0),
+            )
+            for row in rows
+        ]
+        await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            ExecutionLog.__tablename__, records=records, columns=COPY_COLUMNS
+        )
+        return len(records)
+
     async def get_logs(
         self,
         execution_id: UUID,
@@ -131,6 +174,34 @@ class ExecutionLogRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_logs_by_sequence(
+        self,
+        execution_id: UUID,
+        start_sequence: int = 0,
+        limit: int = 100,
+    ) -> list[ExecutionLog]:
+        """
+        Get an execution's logs in append order.
+
+        Args:
+            execution_id: Execution UUID
+            start_sequence: First sequence number to return
+            limit: Maximum number of logs to return
+
+        Returns:
+            List of log entries (sorted by sequence ascending)
+        """
+        result = await self.session.execute(
+            select(ExecutionLog)
+            .where(
+                ExecutionLog.execution_id == execution_id,
+                ExecutionLog.sequence >= start_sequence,
+            )
+            .order_by(ExecutionLog.sequence)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def get_logs_as_dicts(
         self,
         execution_id: UUID,
@@ -227,6 +298,7 @@ class ExecutionLogRepository:
         end_date: datetime | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
         """
         List logs across all executions with filtering and pagination.
@@ -239,11 +311,12 @@ class ExecutionLogRepository:
             start_date: Filter logs from this date
             end_date: Filter logs until this date
             limit: Maximum number of logs to return
-            offset: Number of logs to skip
+            offset: Number of logs to skip (legacy integer tokens only)
+            cursor: Continue after this (timestamp, id) of the previous page
 
         Returns:
             Tuple of (logs_list, next_continuation_token).
-            Token is the next offset as string, or None if no more results.
+            Token is an opaque cursor, or None if no more results.
         """
         # Build query with joins
         query = (
@@ -253,7 +326,7 @@ class ExecutionLogRepository:
             .options(
                 joinedload(ExecutionLog.execution).joinedload(Execution.organization)
             )
-            .order_by(ExecutionLog.timestamp.desc())
+            .order_by(ExecutionLog.timestamp.desc(), ExecutionLog.id.desc())
         )
 
         # Apply filters
@@ -275,8 +348,15 @@ class ExecutionLogRepository:
         if end_date:
             query = query.where(ExecutionLog.timestamp <= end_date)
 
+        if cursor:
+            query = query.where(
+                seek_before(cursor, ExecutionLog.timestamp, ExecutionLog.id)
+            )
+        elif offset:
+            query = query.offset(offset)
+
         # Fetch limit+1 to check if there are more results
-        query = query.offset(offset).limit(limit + 1)
+        query = query.limit(limit + 1)
 
         result = await self.session.execute(query)
         logs = result.scalars().unique().all()
@@ -287,7 +367,9 @@ class ExecutionLogRepository:
             logs = list(logs)[:limit]
 
         # Calculate next token
-        next_token = str(offset + limit) if has_more else None
+        next_token = (
+            encode_cursor(logs[-1].timestamp, logs[-1].id) if has_more else None
+        )
 
         # Convert to dicts with joined data
         return [
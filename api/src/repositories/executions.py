@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.auth import UserPrincipal
+from src.core.pagination import Cursor, encode_cursor, seek_before
 from src.models import (
     AIUsage,
     AIUsagePublicSimple,
@@ -29,6 +30,7 @@ from src.models import (
 )
 from src.models.enums import ExecutionStatus
 from src.repositories.base import BaseRepository
+from src.services.execution_archive import load_archive
 
 logger = logging.getLogger(__name__)
 
@@ -258,8 +260,14 @@ class ExecutionRepository(BaseRepository[Execution]):
         end_date: str | None = None,
         limit: int = 25,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> tuple[list[WorkflowExecution], str | None]:
-        """List executions with filtering."""
+        """
+        List executions with filtering, newest first.
+
+        Pages continue from `cursor` (the last row of the previous page);
+        `offset` only serves legacy integer continuation tokens.
+        """
         query = select(Execution)
 
         # Organization scoping
@@ -291,11 +299,15 @@ class ExecutionRepository(BaseRepository[Execution]):
             except ValueError:
                 pass
 
-        # Order by newest first
-        query = query.order_by(desc(Execution.started_at))
+        # Order by newest first, id breaks ties so the cursor is unique
+        query = query.order_by(desc(Execution.started_at), desc(Execution.id))
 
         # Pagination
-        query = query.offset(offset).limit(limit + 1)  # +1 to check for more
+        if cursor:
+            query = query.where(seek_before(cursor, Execution.started_at, Execution.id))
+        elif offset:
+            query = query.offset(offset)
+        query = query.limit(limit + 1)  # +1 to check for more
 
         result = await self.session.execute(query)
         executions = list(result.scalars().all())
@@ -308,7 +320,8 @@ class ExecutionRepository(BaseRepository[Execution]):
         # Generate continuation token
         next_token = None
         if has_more:
-            next_token = str(offset + limit)
+            last = executions[-1]
+            next_token = encode_cursor(last.started_at, last.id)
 
         return [self._to_pydantic(e, user) for e in executions], next_token
 
@@ -339,30 +352,37 @@ class ExecutionRepository(BaseRepository[Execution]):
         if not user.is_superuser and execution.executed_by != user.user_id:
             return None, "Forbidden"
 
-        # 2. Fetch logs (DEBUG/TRACEBACK filtered for non-admins)
-        logs_query = (
-            select(ExecutionLog)
-            .where(ExecutionLog.execution_id == execution_id)
-            .order_by(ExecutionLog.sequence)
+        # 2. Fetch logs (DEBUG/TRACEBACK filtered for non-admins), from the
+        # archive once the execution has been archived
+        archive = (
+            await load_archive(execution.archive_key) if execution.archive_key else None
         )
-        if not user.is_superuser:
-            logs_query = logs_query.where(
-                ExecutionLog.level.notin_(["DEBUG", "TRACEBACK"])
-            )
-        logs_result = await self.session.execute(logs_query)
-        log_entries = logs_result.scalars().all()
-
-        logs = [
-            ExecutionLogPublic(
-                id=log.id,
-                timestamp=log.timestamp.isoformat() if log.timestamp else "",
-                level=log.level or "info",
-                message=log.message or "",
-                data=log.log_metadata,
-                sequence=log.sequence or 0,
+        if archive:
+            logs = archive.log_entries(include_admin_levels=user.is_superuser)
+        else:
+            logs_query = (
+                select(ExecutionLog)
+                .where(ExecutionLog.execution_id == execution_id)
+                .order_by(ExecutionLog.sequence)
             )
-            for log in log_entries
-        ]
+            if not user.is_superuser:
+                logs_query = logs_query.where(
+                    ExecutionLog.level.notin_(["DEBUG", "TRACEBACK"])
+                )
+            logs_result = await self.session.execute(logs_query)
+            log_entries = logs_result.scalars().all()
+
+            logs = [
+                ExecutionLogPublic(
+                    id=log.id,
+                    timestamp=log.timestamp.isoformat() if log.timestamp else "",
+                    level=log.level or "info",
+                    message=log.message or "",
+                    data=log.log_metadata,
+                    sequence=log.sequence or 0,
+                )
+                for log in log_entries
+            ]
 
         # 3. Fetch AI usage data
         ai_usage_query = (
@@ -420,7 +440,7 @@ class ExecutionRepository(BaseRepository[Execution]):
             executed_by_name=execution.executed_by_name or str(execution.executed_by),
             status=ExecutionStatus(execution.status),
             input_data=execution.parameters or {},
-            result=execution.result,
+            result=archive.result if archive else execution.result,
             result_type=execution.result_type,
             error_message=execution.error_message,
             duration_ms=execution.duration_ms,
@@ -429,7 +449,11 @@ class ExecutionRepository(BaseRepository[Execution]):
             logs=[log.model_dump() for log in logs],
             session_id=str(execution.session_id) if execution.session_id else None,
             # Admin-only fields (null for non-admins)
-            variables=execution.variables if user.is_superuser else None,
+            variables=(
+                (archive.variables if archive else execution.variables)
+                if user.is_superuser
+                else None
+            ),
             peak_memory_bytes=execution.peak_memory_bytes if user.is_superuser else None,
             cpu_total_seconds=execution.cpu_total_seconds if user.is_superuser else None,
             # AI usage tracking
@@ -448,6 +472,7 @@ class ExecutionRepository(BaseRepository[Execution]):
                 Execution.result,
                 Execution.result_type,
                 Execution.executed_by,
+                Execution.archive_key,
             ).where(Execution.id == execution_id)
         )
         row = result.one_or_none()
@@ -458,7 +483,10 @@ class ExecutionRepository(BaseRepository[Execution]):
         if not user.is_superuser and row.executed_by != user.user_id:
             return None, "Forbidden"
 
-        return {"result": row.result, "result_type": row.result_type}, None
+        value = row.result
+        if row.archive_key:
+            value = (await load_archive(row.archive_key)).result
+        return {"result": value, "result_type": row.result_type}, None
 
     async def get_execution_logs(
         self,
@@ -468,7 +496,7 @@ class ExecutionRepository(BaseRepository[Execution]):
         """Get execution logs from the execution_logs table."""
         # First check if execution exists and user has access
         result = await self.session.execute(
-            select(Execution.executed_by).where(Execution.id == execution_id)
+            select(Execution.executed_by, Execution.archive_key).where(Execution.id == execution_id)
         )
         row = result.one_or_none()
 
@@ -478,6 +506,10 @@ class ExecutionRepository(BaseRepository[Execution]):
         if not user.is_superuser and row.executed_by != user.user_id:
             return None, "Forbidden"
 
+        if row.archive_key:
+            archive = await load_archive(row.archive_key)
+            return archive.log_entries(include_admin_levels=user.is_superuser), None
+
         # Query logs from execution_logs table (order by sequence for guaranteed ordering)
         logs_query = (
             select(ExecutionLog)
@@ -518,7 +550,7 @@ class ExecutionRepository(BaseRepository[Execution]):
 
         # Select id and variables to distinguish "not found" from "null variables"
         result = await self.session.execute(
-            select(Execution.id, Execution.variables)
+            select(Execution.id, Execution.variables, Execution.archive_key)
             .where(Execution.id == execution_id)
         )
         row = result.one_or_none()
@@ -526,7 +558,9 @@ class ExecutionRepository(BaseRepository[Execution]):
         if row is None:
             return None, "NotFound"
 
-        # row is a tuple of (id, variables)
+        # row is a tuple of (id, variables, archive_key)
+        if row[2]:
+            return (await load_archive(row[2])).variables or {}, None
         return row[1] or {}, None
 
     async def cancel_execution(
@@ -475,6 +475,10 @@ class IntegrationsRepository(BaseRepository[Integration]):
                     )
                     self.session.add(new_config)
 
+        # Clear the cached configs and mark them changed for SDK pre-warm
+        from src.core.cache import invalidate_config
+        await invalidate_config(str(organization_id) if organization_id else None)
+
     async def update_mapping(
         self, id: UUID, data: IntegrationMappingUpdate, updated_by: str = "system"
     ) -> IntegrationMapping | None:
@@ -12,7 +12,7 @@ Authentication:
 
 Architecture:
     - API never executes workflow code directly
-    - Sync execution: Queue to RabbitMQ, wait on Redis BLPOP for result
+    - Sync execution: Queue to RabbitMQ, wait on SyncResultWaiter for result
     - Async execution: Queue to RabbitMQ, return immediately
 """
 
@@ -278,7 +278,7 @@ async def _execute_sync(
     filesystem access), we:
     1. Store pending execution in Redis
     2. Queue to RabbitMQ with sync=True
-    3. Wait for result via Redis BLPOP
+    3. Wait for result via SyncResultWaiter (Redis pub/sub notification)
     4. Return result to caller
 
     This allows the API to stay lightweight without filesystem access.
@@ -15,6 +15,7 @@ from sqlalchemy.orm import joinedload
 
 from src.core.auth import Context, CurrentSuperuser
 from src.core.database import DbSession
+from src.jobs.schedulers.cron_scheduler import reschedule
 from src.models.contracts.events import (
     CreateDeliveryRequest,
     DynamicValuesRequest,
@@ -422,6 +423,7 @@ async def create_source(
             created_at=now,
             updated_at=now,
         )
+        await reschedule(schedule_source, now)
         db.add(schedule_source)
         await db.flush()
 
@@ -519,6 +521,10 @@ async def update_source(
             ss.enabled = request.schedule.enabled
         ss.updated_at = datetime.now(timezone.utc)
 
+    # Recompute the next fire time, so re-enabling does not fire a missed run
+    if source.schedule_source:
+        await reschedule(source.schedule_source)
+
     await db.flush()
 
     # Reload with relationships
@@ -34,11 +34,13 @@ from src.models.orm.ai_usage import AIUsage
 
 from src.core.auth import Context, UserPrincipal
 from src.core.org_filter import resolve_org_filter, OrgFilterType
+from src.core.pagination import Cursor, encode_cursor, parse_continuation_token, seek_before
 from src.core.pubsub import publish_execution_update, publish_history_update
 from src.core.redis_client import get_redis_client
 from src.models import Execution as ExecutionModel
 from src.models import ExecutionLog as ExecutionLogORM
 from src.repositories.execution_logs import ExecutionLogRepository
+from src.services.execution_archive import load_archive
 
 logger = logging.getLogger(__name__)
 
@@ -68,8 +70,14 @@ class ExecutionRepository:
         exclude_local: bool = True,
         limit: int = 25,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> tuple[list[WorkflowExecution], str | None]:
-        """List executions with filtering."""
+        """
+        List executions with filtering, newest first.
+
+        Pages continue from `cursor` (the last row of the previous page);
+        `offset` only serves legacy integer continuation tokens.
+        """
         query = select(ExecutionModel).options(selectinload(ExecutionModel.organization))
 
         # Organization scoping
@@ -113,11 +121,17 @@ class ExecutionRepository:
         if exclude_local:
             query = query.where(ExecutionModel.is_local_execution == False)  # noqa: E712
 
-        # Order by newest first
-        query = query.order_by(desc(ExecutionModel.started_at))
+        # Order by newest first, id breaks ties so the cursor is unique
+        query = query.order_by(desc(ExecutionModel.started_at), desc(ExecutionModel.id))
 
         # Pagination
-        query = query.offset(offset).limit(limit + 1)  # +1 to check for more
+        if cursor:
+            query = query.where(
+                seek_before(cursor, ExecutionModel.started_at, ExecutionModel.id)
+            )
+        elif offset:
+            query = query.offset(offset)
+        query = query.limit(limit + 1)  # +1 to check for more
 
         result = await self.db.execute(query)
         executions = list(result.scalars().all())
@@ -130,7 +144,8 @@ class ExecutionRepository:
         # Generate continuation token
         next_token = None
         if has_more:
-            next_token = str(offset + limit)
+            last = executions[-1]
+            next_token = encode_cursor(last.started_at, last.id)
 
         return [self._to_pydantic(e, user) for e in executions], next_token
 
@@ -163,30 +178,37 @@ class ExecutionRepository:
         if not user.is_superuser and execution.executed_by != user.user_id:
             return None, "Forbidden"
 
-        # 2. Fetch logs (DEBUG/TRACEBACK filtered for non-admins)
-        logs_query = (
-            select(ExecutionLogORM)
-            .where(ExecutionLogORM.execution_id == execution_id)
-            .order_by(ExecutionLogORM.sequence)
+        # 2. Fetch logs (DEBUG/TRACEBACK filtered for non-admins), from the
+        # archive once the execution has been archived
+        archive = (
+            await load_archive(execution.archive_key) if execution.archive_key else None
         )
-        if not user.is_superuser:
-            logs_query = logs_query.where(
-                ExecutionLogORM.level.notin_(["DEBUG", "TRACEBACK"])
-            )
-        logs_result = await self.db.execute(logs_query)
-        log_entries = logs_result.scalars().all()
-
-        logs = [
-            ExecutionLogPublic(
-                id=log.id,
-                timestamp=log.timestamp.isoformat() if log.timestamp else "",
-                level=log.level or "info",
-                message=log.message or "",
-                data=log.log_metadata,
-                sequence=log.sequence,
+        if archive:
+            logs = archive.log_entries(include_admin_levels=user.is_superuser)
+        else:
+            logs_query = (
+                select(ExecutionLogORM)
+                .where(ExecutionLogORM.execution_id == execution_id)
+                .order_by(ExecutionLogORM.sequence)
             )
-            for log in log_entries
-        ]
+            if not user.is_superuser:
+                logs_query = logs_query.where(
+                    ExecutionLogORM.level.notin_(["DEBUG", "TRACEBACK"])
+                )
+            logs_result = await self.db.execute(logs_query)
+            log_entries = logs_result.scalars().all()
+
+            logs = [
+                ExecutionLogPublic(
+                    id=log.id,
+                    timestamp=log.timestamp.isoformat() if log.timestamp else "",
+                    level=log.level or "info",
+                    message=log.message or "",
+                    data=log.log_metadata,
+                    sequence=log.sequence,
+                )
+                for log in log_entries
+            ]
 
         # 3. Fetch AI usage data
         ai_usage_query = (
@@ -251,7 +273,7 @@ class ExecutionRepository:
             executed_by_name=execution.executed_by_name or str(execution.executed_by),
             status=ExecutionStatus(execution.status),
             input_data=execution.parameters or {},
-            result=execution.result,
+            result=archive.result if archive else execution.result,
             result_type=execution.result_type,
             error_message=execution.error_message,
             duration_ms=execution.duration_ms,
@@ -259,7 +281,11 @@ class ExecutionRepository:
             completed_at=execution.completed_at,
             logs=[log.model_dump() for log in logs],
             # Admin-only fields (null for non-admins)
-            variables=execution.variables if user.is_superuser else None,
+            variables=(
+                (archive.variables if archive else execution.variables)
+                if user.is_superuser
+                else None
+            ),
             peak_memory_bytes=execution.peak_memory_bytes if user.is_superuser else None,
             cpu_total_seconds=execution.cpu_total_seconds if user.is_superuser else None,
             # AI usage tracking (available to all users)
@@ -278,6 +304,7 @@ class ExecutionRepository:
                 ExecutionModel.result,
                 ExecutionModel.result_type,
                 ExecutionModel.executed_by,
+                ExecutionModel.archive_key,
             ).where(ExecutionModel.id == execution_id)
         )
         row = result.one_or_none()
@@ -288,7 +315,10 @@ class ExecutionRepository:
         if not user.is_superuser and row.executed_by != user.user_id:
             return None, "Forbidden"
 
-        return {"result": row.result, "result_type": row.result_type}, None
+        value = row.result
+        if row.archive_key:
+            value = (await load_archive(row.archive_key)).result
+        return {"result": value, "result_type": row.result_type}, None
 
     async def get_execution_logs(
         self,
@@ -298,7 +328,7 @@ class ExecutionRepository:
         """Get execution logs from the execution_logs table."""
         # First check if execution exists and user has access
         result = await self.db.execute(
-            select(ExecutionModel.executed_by).where(ExecutionModel.id == execution_id)
+            select(ExecutionModel.executed_by, ExecutionModel.archive_key).where(ExecutionModel.id == execution_id)
         )
         row = result.one_or_none()
 
@@ -308,6 +338,10 @@ class ExecutionRepository:
         if not user.is_superuser and row.executed_by != user.user_id:
             return None, "Forbidden"
 
+        if row.archive_key:
+            archive = await load_archive(row.archive_key)
+            return archive.log_entries(include_admin_levels=user.is_superuser), None
+
         # Query logs from execution_logs table (order by sequence for guaranteed ordering)
         logs_query = (
             select(ExecutionLogORM)
@@ -348,7 +382,7 @@ class ExecutionRepository:
 
         # Select id and variables to distinguish "not found" from "null variables"
         result = await self.db.execute(
-            select(ExecutionModel.id, ExecutionModel.variables)
+            select(ExecutionModel.id, ExecutionModel.variables, ExecutionModel.archive_key)
             .where(ExecutionModel.id == execution_id)
         )
         row = result.one_or_none()
@@ -356,7 +390,9 @@ class ExecutionRepository:
         if row is None:
             return None, "NotFound"
 
-        # row is a tuple of (id, variables)
+        # row is a tuple of (id, variables, archive_key)
+        if row[2]:
+            return (await load_archive(row[2])).variables or {}, None
         return row[1] or {}, None
 
     async def cancel_execution(
@@ -515,13 +551,7 @@ async def list_executions(
 
     repo = ExecutionRepository(ctx.db)
 
-    # Parse continuation token as offset
-    offset = 0
-    if continuationToken:
-        try:
-            offset = int(continuationToken)
-        except ValueError:
-            pass
+    cursor, offset = parse_continuation_token(continuationToken, UUID)
 
     # Parse workflowId to UUID if provided
     parsed_workflow_id = UUID(workflowId) if workflowId else None
@@ -537,6 +567,7 @@ async def list_executions(
         exclude_local=excludeLocal,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     return ExecutionsListResponse(
@@ -567,13 +598,7 @@ async def list_logs(
     if not ctx.user.is_superuser:
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    # Parse continuation token as offset
-    offset = 0
-    if continuation_token:
-        try:
-            offset = int(continuation_token)
-        except ValueError:
-            pass
+    cursor, offset = parse_continuation_token(continuation_token, int)
 
     # Parse levels
     level_list = None
@@ -599,6 +624,7 @@ async def list_logs(
         end_date=parsed_end,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     return LogsListResponse(
@@ -14,6 +14,7 @@ import logging
 from fastapi import APIRouter, Request, Response, status
 from fastapi.responses import PlainTextResponse
 
+from src.config import get_settings
 from src.core.database import DbSession
 from src.services.events.processor import EventProcessor
 from src.services.webhooks.protocol import (
@@ -86,6 +87,9 @@ async def receive_webhook(
     4. Create event record and queue deliveries
     5. Return 202 Accepted (or adapter-specific response)
 
+    With settings.webhook_fast_ack, step 4 only appends the event to the
+    Redis intake stream; workers create the records and queue deliveries.
+
     No authentication required - security through:
     - UUID-based paths (unguessable)
     - Adapter-specific validation (HMAC, client state, etc.)
@@ -123,8 +127,13 @@ async def receive_webhook(
         client_ip=source_ip,
     )
 
+    fast_ack = get_settings().webhook_fast_ack
+
     try:
-        result = await processor.process_webhook(source_id, webhook_request)
+        if fast_ack:
+            result = await processor.accept_webhook(source_id, webhook_request)
+        else:
+            result = await processor.process_webhook(source_id, webhook_request)
     except Exception as e:
         logger.error(f"Error processing webhook: {e}", exc_info=True)
         # Return 500 but don't expose internal error details
@@ -160,6 +169,14 @@ async def receive_webhook(
             media_type="text/plain",
         )
 
+    if isinstance(result, Deliver) and fast_ack:
+        # Event buffered in the intake stream - the materializer records it
+        return Response(
+            content="Accepted",
+            status_code=status.HTTP_202_ACCEPTED,
+            media_type="text/plain",
+        )
+
     if isinstance(result, Deliver):
         # Event accepted - commit transaction and queue deliveries
         await db.commit()
@@ -1414,7 +1414,7 @@ async def test_integration_connection(
     2. Makes a GET request to the specified endpoint
     3. Returns success/failure with status code
 
-    Uses sync execution pattern (queue + Redis BLPOP) to wait for result.
+    Uses sync execution pattern (queue + SyncResultWaiter) to wait for result.
     """
     import base64
     import time
@@ -1490,7 +1490,7 @@ async def test_integration_connection(
             sync=True,
         )
 
-        # Wait for result from worker via Redis BLPOP
+        # Wait for result from worker via the sync result waiter
         worker_result = await redis_client.wait_for_result(execution_id, timeout_seconds=60)
 
         duration_ms = int((time.time() - start_time) * 1000)
@@ -574,8 +574,11 @@ async def _compute_metrics_directly(ctx: Context) -> DashboardMetricsResponse:
 
     Fallback when snapshot is not available.
     """
-    from sqlalchemy import case, literal_column
     from src.models import Workflow, Form
+    from src.services.execution_rollups import (
+        get_execution_totals,
+        get_live_execution_counts,
+    )
 
     # Single query for all entity counts using subqueries
     # Note: Data providers are now in the workflows table with type='data_provider'
@@ -604,52 +607,15 @@ async def _compute_metrics_directly(ctx: Context) -> DashboardMetricsResponse:
     form_count = counts_row.form_count or 0
     provider_count = counts_row.provider_count or 0
 
-    # Single query for all execution stats using conditional aggregation
-    exec_stats_query = select(
-        func.count(ExecutionModel.id).label("total"),
-        func.sum(
-            case(
-                (ExecutionModel.status == ExecutionStatus.SUCCESS.value, 1),
-                else_=0,
-            )
-        ).label("success_count"),
-        func.sum(
-            case(
-                (ExecutionModel.status == ExecutionStatus.FAILED.value, 1),
-                else_=0,
-            )
-        ).label("failed_count"),
-        func.sum(
-            case(
-                (ExecutionModel.status == ExecutionStatus.RUNNING.value, 1),
-                else_=0,
-            )
-        ).label("running_count"),
-        func.sum(
-            case(
-                (ExecutionModel.status == ExecutionStatus.PENDING.value, 1),
-                else_=0,
-            )
-        ).label("pending_count"),
-        func.avg(
-            case(
-                (ExecutionModel.status == ExecutionStatus.SUCCESS.value, ExecutionModel.duration_ms),
-                else_=literal_column("NULL"),
-            )
-        ).label("avg_duration_ms"),
-    )
-    exec_result = await ctx.db.execute(exec_stats_query)
-    exec_row = exec_result.one()
-
-    total_executions = exec_row.total or 0
-    success_count = exec_row.success_count or 0
-    failed_count = exec_row.failed_count or 0
-    running_count = exec_row.running_count or 0
-    pending_count = exec_row.pending_count or 0
-    avg_duration_ms = exec_row.avg_duration_ms or 0
-
-    success_rate = (success_count / total_executions * 100) if total_executions > 0 else 0.0
-    avg_duration_seconds = float(avg_duration_ms) / 1000.0 if avg_duration_ms else 0.0
+    # Execution stats from the incremental rollups (no full table scan)
+    totals = await get_execution_totals(ctx.db)
+    running_count, pending_count = await get_live_execution_counts(ctx.db)
+
+    total_executions = totals.execution_count
+    success_count = totals.success_count
+    failed_count = totals.failed_count
+    success_rate = totals.success_rate
+    avg_duration_seconds = totals.avg_success_duration_ms / 1000.0
 
     # Get recent failures
     recent_failures = await _get_recent_failures(ctx)
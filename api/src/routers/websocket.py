@@ -150,6 +150,34 @@ async def can_access_app(user: UserPrincipal, app_id: str) -> bool:
         return org_id == user.organization_id
 
 
+async def send_queue_position(websocket: WebSocket, execution_id: str) -> None:
+    """
+    Send a queued execution's exact position to a newly subscribed socket.
+
+    Queue updates are published as epoch changes on the "queue" channel, so
+    a client that subscribes after enqueue needs a starting position.
+    """
+    from src.services.execution.queue_tracker import get_queue_ticket
+
+    try:
+        ticket = await get_queue_ticket(execution_id)
+    except Exception as e:
+        logger.debug(f"Could not read queue position for {execution_id}: {e}")
+        return
+    if ticket is None:
+        return
+
+    position, epoch = ticket
+    await websocket.send_json({
+        "type": "execution_update",
+        "executionId": execution_id,
+        "status": "Pending",
+        "queuePosition": position,
+        "queueEpoch": epoch,
+        "waitReason": "queued",
+    })
+
+
 router = APIRouter(prefix="/ws", tags=["WebSocket"])
 
 
@@ -164,6 +192,7 @@ async def websocket_connect(
     Connect and subscribe to channels:
     - execution:{execution_id} - Execution updates and logs
     - user:{user_id} - User notifications
+    - queue - Queue epoch updates (clients derive queue positions)
     - system - System broadcasts
 
     Query params:
@@ -265,7 +294,7 @@ async def websocket_connect(
             app_id = channel.split(":", 2)[2]
             if await can_access_app(user, app_id):
                 allowed_channels.append(channel)
-        elif channel == "system":
+        elif channel == "system" or channel == "queue":
             allowed_channels.append(channel)
         elif channel == "platform_workers":
             # Platform workers channel - diagnostics, platform admins only
@@ -288,6 +317,11 @@ async def websocket_connect(
             "userId": str(user.user_id)
         })
 
+        # Seed queue positions for executions that are still queued
+        for channel in allowed_channels:
+            if channel.startswith("execution:"):
+                await send_queue_position(websocket, channel.split(":", 1)[1])
+
         # Keep connection alive and handle incoming messages
         while True:
             data = await websocket.receive_json()
@@ -307,26 +341,28 @@ async def websocket_connect(
                                 "message": "Access denied"
                             })
                             continue
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
+                        await websocket.send_json({
+                            "type": "subscribed",
+                            "channel": channel
+                        })
+                        await send_queue_position(websocket, execution_id)
+                    elif channel == "queue":
+                        # Queue epoch updates - no per-user data, any user
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
                         })
                     elif channel.startswith("cli-session:"):
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
                         })
                     elif channel.startswith("event-source:"):
                         # Event source channels for real-time event updates
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
@@ -336,9 +372,7 @@ async def websocket_connect(
                         # history:user:{user_id} - Allow only for the user's own channel
                         # history:GLOBAL - Allow only for platform admins
                         if channel == f"history:user:{user.user_id}" or (channel == "history:GLOBAL" and user.is_superuser):
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -353,9 +387,7 @@ async def websocket_connect(
                         # App Builder channels - validate user has access to the app
                         app_id = channel.split(":", 2)[2]
                         if await can_access_app(user, app_id):
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -369,9 +401,7 @@ async def websocket_connect(
                     elif channel.startswith("git:"):
                         # Git sync job channels - ephemeral, job-specific UUIDs
                         # Any authenticated user can subscribe (job ID is a secret token)
-                        if channel not in manager.connections:
-                            manager.connections[channel] = set()
-                        manager.connections[channel].add(websocket)
+                        await manager.subscribe(websocket, channel)
                         await websocket.send_json({
                             "type": "subscribed",
                             "channel": channel
@@ -379,9 +409,7 @@ async def websocket_connect(
                     elif channel == "platform_workers":
                         # Platform workers channel - diagnostics, platform admins only
                         if user.is_superuser:
-                            if channel not in manager.connections:
-                                manager.connections[channel] = set()
-                            manager.connections[channel].add(websocket)
+                            await manager.subscribe(websocket, channel)
                             await websocket.send_json({
                                 "type": "subscribed",
                                 "channel": channel
@@ -395,8 +423,7 @@ async def websocket_connect(
 
             elif data.get("type") == "unsubscribe":
                 channel = data.get("channel")
-                if channel and channel in manager.connections:
-                    manager.connections[channel].discard(websocket)
+                if channel and manager.unsubscribe(websocket, channel):
                     await websocket.send_json({
                         "type": "unsubscribed",
                         "channel": channel
@@ -58,6 +58,7 @@ from src.models.orm.agents import Agent, AgentTool
 from src.models.orm.developer import DeveloperContext
 from src.models.orm.users import Role
 from src.services.workflow_validation import _extract_relative_path
+from src.services.execution.variable_capture import CAPTURE_MODES, normalize_capture_mode
 
 from src.core.auth import Context, CurrentActiveUser, CurrentSuperuser
 from src.core.database import DbSession
@@ -88,6 +89,9 @@ def _convert_workflow_orm_to_schema(workflow: WorkflowORM, used_by_count: int =
     raw_mode = workflow.execution_mode or "sync"
     execution_mode: Literal["sync", "async"] = "async" if raw_mode == "async" else "sync"
 
+    # Validate variable_capture - default to "full" if invalid
+    variable_capture = normalize_capture_mode(workflow.variable_capture)
+
     # Convert string type to ExecutableType enum
     workflow_type = ExecutableType(workflow.type or "workflow")
 
@@ -105,6 +109,7 @@ def _convert_workflow_orm_to_schema(workflow: WorkflowORM, used_by_count: int =
         parameters=parameters,
         execution_mode=execution_mode,
         timeout_seconds=workflow.timeout_seconds or 1800,
+        variable_capture=variable_capture,
         retry_policy=None,
         endpoint_enabled=workflow.endpoint_enabled or False,
         allowed_methods=workflow.allowed_methods or ["POST"],
@@ -1024,6 +1029,7 @@ async def update_workflow(
     - display_name: User-facing display name (can be set to null to use code name)
     - timeout_seconds: Max execution time (1-7200 seconds)
     - execution_mode: 'sync' or 'async'
+    - variable_capture: 'off', 'summary' or 'full'
     - time_saved: Minutes saved per execution (for ROI reporting)
     - value: Flexible value unit per execution
     - tool_description: Description for AI tool selection (can be set to null)
@@ -1105,6 +1111,15 @@ async def update_workflow(
                 )
             workflow.execution_mode = request.execution_mode
 
+        # Update variable_capture if provided
+        if request.variable_capture is not None:
+            if request.variable_capture not in CAPTURE_MODES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="variable_capture must be 'off', 'summary' or 'full'",
+                )
+            workflow.variable_capture = request.variable_capture
+
         # Update time_saved if provided
         if request.time_saved is not None:
             if request.time_saved < 0:
@@ -27,7 +27,7 @@ from src.config import get_settings
 from src.core.database import init_db, close_db, get_db_context
 from src.core.pubsub import publish_git_op_completed
 from src.core.redis_reconnect import ResilientPubSubListener
-from src.jobs.schedulers.cron_scheduler import process_schedule_sources
+from src.jobs.schedulers.cron_scheduler import ScheduleTimer
 from src.jobs.schedulers.execution_cleanup import cleanup_stuck_executions
 
 
@@ -53,8 +53,11 @@ class Scheduler:
     - Stuck execution cleanup
     - OAuth token refresh
 
+    Schedule event sources fire from a ScheduleTimer at their next fire time.
+
     Also listens for on-demand requests via Redis pub/sub:
     - Git sync requests (bifrost:scheduler:git-op)
+    - Schedule changes (bifrost:scheduler:schedules)
     """
 
     def __init__(self):
@@ -63,6 +66,7 @@ class Scheduler:
         self._shutdown_event = asyncio.Event()
         self._scheduler: AsyncIOScheduler | None = None
         self._pubsub_listener: ResilientPubSubListener | None = None
+        self._schedule_timer = ScheduleTimer()
 
     async def start(self) -> None:
         """Start the scheduler."""
@@ -79,6 +83,10 @@ class Scheduler:
         logger.info("Starting APScheduler...")
         await self._start_scheduler()
 
+        # Start the schedule source timer
+        logger.info("Starting schedule timer...")
+        await self._schedule_timer.start()
+
         # Start Redis pub/sub listener for on-demand requests
         logger.info("Starting Redis pub/sub listener...")
         await self._start_pubsub_listener()
@@ -99,16 +107,6 @@ class Scheduler:
             "coalesce": True,  # Combine missed runs into one
         }
 
-        # Schedule processor - every 1 minute
-        scheduler.add_job(
-            process_schedule_sources,
-            CronTrigger(minute="*/1"),  # Every 1 minute
-            id="schedule_processor",
-            name="Process schedule sources",
-            replace_existing=True,
-            **misfire_options,
-        )
-
         # Execution cleanup - every 5 minutes (run immediately at startup)
         scheduler.add_job(
             cleanup_stuck_executions,
@@ -136,22 +134,38 @@ class Scheduler:
         except ImportError:
             logger.warning("OAuth token refresh job not available")
 
-        # Metrics snapshot refresh - every 60 minutes (run immediately at startup)
+        # Metrics snapshot refresh - every 5 minutes (run immediately at startup)
+        # Execution stats come from incremental rollups, so this is cheap
         try:
             from src.jobs.schedulers.metrics_refresh import refresh_metrics_snapshot
             scheduler.add_job(
                 refresh_metrics_snapshot,
-                IntervalTrigger(minutes=60),
+                IntervalTrigger(minutes=5),
                 id="metrics_refresh",
                 name="Refresh platform metrics snapshot",
                 replace_existing=True,
                 next_run_time=datetime.now(timezone.utc),  # Run immediately at startup
                 **misfire_options,
             )
-            logger.info("Metrics snapshot refresh job scheduled (every 60 min)")
+            logger.info("Metrics snapshot refresh job scheduled (every 5 min)")
         except ImportError:
             logger.warning("Metrics snapshot refresh job not available")
 
+        # Metric counter flush - every 1 minute
+        try:
+            from src.jobs.schedulers.metrics_flush import flush_metric_counters
+            scheduler.add_job(
+                flush_metric_counters,
+                CronTrigger(minute="*/1"),  # Every 1 minute
+                id="metrics_counter_flush",
+                name="Flush execution metric counters",
+                replace_existing=True,
+                **misfire_options,
+            )
+            logger.info("Metric counter flush job scheduled (every 1 min)")
+        except ImportError:
+            logger.warning("Metric counter flush job not available")
+
         # Knowledge storage refresh - daily at 2:00 AM UTC (run immediately at startup)
         try:
             from src.jobs.schedulers.knowledge_storage_refresh import (
@@ -201,6 +215,39 @@ class Scheduler:
         except ImportError:
             logger.warning("Event cleanup job not available")
 
+        # Execution log partitions - daily at 3:30 AM UTC (run immediately at startup)
+        try:
+            from src.jobs.schedulers.execution_log_retention import (
+                maintain_execution_log_partitions,
+            )
+            scheduler.add_job(
+                maintain_execution_log_partitions,
+                CronTrigger(hour=3, minute=30),  # Daily at 3:30 AM UTC
+                id="execution_log_retention",
+                name="Create and expire execution log partitions",
+                replace_existing=True,
+                next_run_time=datetime.now(timezone.utc),  # Run immediately at startup
+                **misfire_options,
+            )
+            logger.info("Execution log retention job scheduled (daily at 3:30 AM)")
+        except ImportError:
+            logger.warning("Execution log retention job not available")
+
+        # Execution archival - hourly at :15 (no-op unless enabled and S3 configured)
+        try:
+            from src.jobs.schedulers.execution_archival import archive_old_executions
+            scheduler.add_job(
+                archive_old_executions,
+                CronTrigger(minute=15),  # Every hour at :15
+                id="execution_archival",
+                name="Archive old executions to object storage",
+                replace_existing=True,
+                **misfire_options,
+            )
+            logger.info("Execution archival job scheduled (hourly at :15)")
+        except ImportError:
+            logger.warning("Execution archival job not available")
+
         # Stuck event delivery cleanup - every 5 minutes (run immediately at startup)
         try:
             from src.jobs.schedulers.event_cleanup import cleanup_stuck_events
@@ -228,7 +275,10 @@ class Scheduler:
             channels=[
                 "bifrost:scheduler:git-op",
                 "bifrost:scheduler:reimport",
+                "bifrost:scheduler:schedules",
             ],
+            # Publishers use SPUBLISH when sharded, which SUBSCRIBE never sees
+            sharded=self.settings.pubsub_sharded,
             on_message=self._handle_pubsub_message,
         )
         await self._pubsub_listener.start()
@@ -240,6 +290,9 @@ class Scheduler:
             await self._handle_git_operation(data)
         elif channel == "bifrost:scheduler:reimport":
             await self._handle_reimport(data)
+        elif channel == "bifrost:scheduler:schedules":
+            if data.get("next_fire_at"):
+                self._schedule_timer.wake(datetime.fromisoformat(data["next_fire_at"]))
         else:
             logger.warning(f"Unknown channel: {channel}")
 
@@ -546,6 +599,10 @@ class Scheduler:
             await self._pubsub_listener.stop()
             logger.info("Pub/sub listener stopped")
 
+        # Stop schedule timer
+        await self._schedule_timer.stop()
+        logger.info("Schedule timer stopped")
+
         # Stop scheduler
         if self._scheduler:
             self._scheduler.shutdown(wait=False)
@@ -4,6 +4,7 @@ Provides validation, next run calculation, and human-readable descriptions for C
 """
 
 import logging
+from datetime import datetime
 
 from croniter import croniter
 
@@ -64,6 +65,22 @@ def is_cron_expression_valid(expression: str) -> bool:
     return True
 
 
+def next_fire_time(expression: str, after: datetime) -> datetime | None:
+    """
+    Next time a CRON expression matches, strictly after `after`.
+
+    Args:
+        expression: CRON expression string
+        after: Timezone-aware start time (the result is in the same timezone)
+
+    Returns:
+        The next match, or None if the expression is invalid
+    """
+    if not is_cron_expression_valid(expression):
+        return None
+    return croniter(expression, after).get_next(datetime)
+
+
 def cron_to_human_readable(expression: str) -> str:
     """
     Convert CRON expression to human-readable description.
@@ -4,7 +4,8 @@ Provides fast full-text search with regex support.
 Platform admin resource - no org scoping.
 
 Search queries the database directly:
-- All code files (workflows, modules): search file_index content
+- All code files (workflows, modules): search file_index content,
+  pre-filtered through its trigram index
 - Forms/Agents: search serialized JSON representations from DB
 """
 
@@ -20,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models import SearchRequest, SearchResponse, SearchResult
 from src.models.orm import Form, Agent
 from src.models.orm.file_index import FileIndex
+from src.services.file_index_search import search_file_index
 
 logger = logging.getLogger(__name__)
 
@@ -114,12 +116,14 @@ async def search_files_db(
     start_time = time.time()
 
     # Validate regex if enabled
+    flags = 0 if request.case_sensitive else re.IGNORECASE
     if request.is_regex:
         try:
-            flags = 0 if request.case_sensitive else re.IGNORECASE
-            re.compile(request.query, flags)
+            regex = re.compile(request.query, flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {str(e)}")
+    else:
+        regex = re.compile(re.escape(request.query), flags)
 
     all_results: List[SearchResult] = []
     files_searched = 0
@@ -131,33 +135,32 @@ async def search_files_db(
         # e.g., "**/*.py" -> "%.py", "workflows/*.py" -> "workflows/%.py"
         like_pattern = request.include_pattern.replace("**/*", "%").replace("**", "%").replace("*", "%")
 
-    # 1. Search all code files via file_index (workflows, modules, all Python)
-    fi_conditions = [
-        FileIndex.content.isnot(None),
-    ]
+    # 1. Search all code files via file_index (workflows, modules, all Python).
+    # Candidates are narrowed by the trigram index on content before the
+    # regex runs, and the scan stops once max_results is exceeded.
+    fi_conditions = []
     if root_path:
         fi_conditions.append(FileIndex.path.like(f"{root_path}%"))
     if like_pattern:
         fi_conditions.append(FileIndex.path.like(like_pattern))
-    code_stmt = (
-        select(FileIndex.path, FileIndex.content)
-        .where(*fi_conditions)
-        .limit(MAX_RESULTS_PER_TYPE)
+    code_search = await search_file_index(
+        db,
+        regex,
+        conditions=fi_conditions,
+        max_results=request.max_results + 1,
+        max_files=MAX_RESULTS_PER_TYPE,
+        every_match=True,
     )
-    code_result = await db.execute(code_stmt)
-    for row in code_result:
-        files_searched += 1
-        if row.content:
-            results = _search_content(
-                row.content,
-                row.path,
-                request.query,
-                request.case_sensitive,
-                request.is_regex,
-            )
-            all_results.extend(results)
-            if len(all_results) >= request.max_results:
-                break
+    files_searched += code_search.files_searched
+    for hit in code_search.matches:
+        all_results.append(SearchResult(
+            file_path=hit.path,
+            line=hit.line_number,
+            column=hit.column,
+            match_text=hit.line,
+            context_before=hit.lines[hit.line_number - 2] if hit.line_number > 1 else None,
+            context_after=hit.lines[hit.line_number] if hit.line_number < len(hit.lines) else None,
+        ))
 
     # 2. Search forms (serialize to JSON and search)
     # Forms use virtual paths: forms/{uuid}.form.yaml
@@ -0,0 +1,148 @@
+"""
+Event Intake
+
+Durable buffer between the webhook receiver and Postgres for fast-ack mode
+(settings.webhook_fast_ack).
+
+The receiver validates a webhook through its adapter, appends the accepted
+event to the intake stream (bifrost:events:intake) and returns 202. The
+event ID is assigned here, so the event materializer can insert it
+idempotently however often the entry is redelivered.
+
+A webhook carrying a sender-assigned delivery ID header gets an idempotency
+key. The append and the key are written by one Lua script, so a sender
+retrying within settings.webhook_idempotency_window_seconds gets 202
+without a second event. Webhooks without one are never deduplicated: the
+same body is a legitimate repeat for many senders (e.g. Microsoft Graph
+change notifications).
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from src.config import get_settings
+from src.core.cache.keys import event_idempotency_key, event_intake_stream_key
+from src.services.webhooks.protocol import Deliver, WebhookRequest
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# Consumer group of the event materializers
+EVENT_MATERIALIZER_GROUP = "event-materializer"
+
+# Headers carrying a sender-assigned delivery ID, in order of preference
+IDEMPOTENCY_HEADERS = (
+    "idempotency-key",
+    "x-idempotency-key",
+    "webhook-id",
+    "x-github-delivery",
+    "x-shopify-webhook-id",
+)
+
+# KEYS[1] = intake stream, KEYS[2] = idempotency key (optional)
+# ARGV[1] = idempotency window in seconds, ARGV[2] = event ID,
+# ARGV[3..] = stream entry field/value pairs
+# Returns {1, event ID} when appended, {0, first event ID} for a duplicate
+_APPEND_EVENT_SCRIPT = """
+if KEYS[2] then
+    local existing = redis.call('GET', KEYS[2])
+    if existing then
+        return {0, existing}
+    end
+    redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[1])
+end
+redis.call('XADD', KEYS[1], '*', unpack(ARGV, 3))
+return {1, ARGV[2]}
+"""
+
+
+@dataclass
+class IntakeEvent:
+    """One accepted webhook event read back from the intake stream."""
+
+    entry_id: str
+    event_id: uuid.UUID
+    event_source_id: uuid.UUID
+    event_type: str | None
+    data: Any
+    headers: dict[str, str] | None
+    source_ip: str | None
+    received_at: datetime
+
+
+def idempotency_key(request: WebhookRequest) -> str | None:
+    """
+    Key identifying retries of the same webhook delivery.
+
+    Returns:
+        The sender's delivery ID header, or None when it sends none (the
+        delivery is not deduplicated)
+    """
+    for header in IDEMPOTENCY_HEADERS:
+        value = request.headers.get(header)
+        if value:
+            return f"h:{value}"
+    return None
+
+
+async def append_intake_event(
+    r: "Redis",
+    event_source_id: uuid.UUID,
+    deliver: Deliver,
+    request: WebhookRequest,
+) -> tuple[uuid.UUID, bool]:
+    """
+    Append an accepted webhook event to the intake stream.
+
+    Returns:
+        (event ID, whether it was appended); a duplicate returns the ID of
+        the event first accepted under the same idempotency key
+    """
+    event_id = uuid.uuid4()
+    fields = {
+        "event_id": str(event_id),
+        "source_id": str(event_source_id),
+        "event_type": deliver.event_type or "",
+        "data": json.dumps(deliver.data, default=str),
+        "headers": json.dumps(deliver.raw_headers) if deliver.raw_headers is not None else "",
+        "source_ip": request.client_ip or "",
+        "received_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    keys = [event_intake_stream_key()]
+    key = idempotency_key(request)
+    if key is not None:
+        keys.append(event_idempotency_key(str(event_source_id), key))
+
+    args: list[Any] = [get_settings().webhook_idempotency_window_seconds, str(event_id)]
+    for field, value in fields.items():
+        args.extend((field, value))
+
+    appended, returned_id = await r.register_script(_APPEND_EVENT_SCRIPT)(keys=keys, args=args)
+    if isinstance(returned_id, bytes):
+        returned_id = returned_id.decode()
+    return uuid.UUID(returned_id), bool(appended)
+
+
+def parse_intake_entry(entry_id: str, data: dict[str, str]) -> IntakeEvent:
+    """
+    Decode an intake stream entry written by append_intake_event.
+
+    Raises:
+        KeyError, ValueError: If the entry is malformed
+    """
+    return IntakeEvent(
+        entry_id=entry_id,
+        event_id=uuid.UUID(data["event_id"]),
+        event_source_id=uuid.UUID(data["source_id"]),
+        event_type=data.get("event_type") or None,
+        data=json.loads(data["data"]),
+        headers=json.loads(data["headers"]) if data.get("headers") else None,
+        source_ip=data.get("source_ip") or None,
+        received_at=datetime.fromisoformat(data["received_at"]),
+    )
@@ -0,0 +1,420 @@
+"""
+Event Materializer
+
+Turns webhook events buffered in the intake stream (fast-ack mode, see
+src.services.events.intake) into Event and EventDelivery rows, then queues
+their workflow executions.
+
+Each worker runs one materializer. They share the EVENT_MATERIALIZER_GROUP
+consumer group, so every entry is read by one of them. A batch of entries
+is handled as:
+
+1. Load the active subscriptions of every source in the batch (one query)
+   and match them to the events in Python.
+2. Insert the events (ON CONFLICT DO NOTHING on the intake-assigned ID) and
+   the deliveries of the newly inserted ones, in one transaction.
+3. Broadcast the new events and queue the pending deliveries of every event
+   in the batch.
+4. Acknowledge and delete the entries, and record the per-source intake lag.
+
+Entries read by a materializer that stops (or stalls) before step 4 stay
+pending and are claimed by another one after INTAKE_PENDING_IDLE_MS.
+Redelivered events are not inserted twice, and queueing claims each
+pending delivery with a PENDING -> QUEUED update first, so a delivery is
+queued once even while the original materializer is still working on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable
+
+from redis.exceptions import ResponseError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from bifrost._logging import stream_entries
+from src.core.cache.keys import event_intake_lag_key, event_intake_stream_key
+from src.jobs.rabbitmq import LatencyHistogram
+from src.models.enums import EventDeliveryStatus, EventStatus
+from src.models.orm.events import Event, EventDelivery, EventSource, EventSubscription
+from src.repositories.events import EventSubscriptionRepository
+from src.services.events.intake import (
+    EVENT_MATERIALIZER_GROUP,
+    IntakeEvent,
+    parse_intake_entry,
+)
+from src.services.events.processor import EventProcessor
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Max entries materialized per batch
+READ_COUNT = 500
+
+# How long a read waits for new entries (below the shared client's socket timeout)
+BLOCK_MS = 1000
+
+# How often entries abandoned by a stopped materializer are claimed
+CLAIM_INTERVAL_SECONDS = 30.0
+
+# Idle time after which another materializer's pending entries are claimed
+INTAKE_PENDING_IDLE_MS = 60000
+
+# Intake lag buckets: received by the API until the event row is committed
+LAG_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+def matching_subscriptions(
+    subscriptions: list[EventSubscription],
+    event_type: str | None,
+) -> list[EventSubscription]:
+    """
+    Subscriptions of one source that receive an event of `event_type`.
+
+    Same rules as EventSubscriptionRepository.get_active_for_event:
+    subscriptions without an event_type filter match every event, and
+    events without a type only match those.
+    """
+    return [
+        subscription
+        for subscription in subscriptions
+        if subscription.event_type is None or subscription.event_type == event_type
+    ]
+
+
+class EventMaterializer:
+    """
+    Background task materializing the webhook intake stream.
+
+    Attributes:
+        materialized: Number of events inserted
+        batches: Number of batches committed
+        lag: Per event source histogram of intake lag
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        read_count: int = READ_COUNT,
+        block_ms: int = BLOCK_MS,
+        claim_interval: float = CLAIM_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+            read_count: Max entries materialized per batch
+            block_ms: How long a read waits for new entries
+            claim_interval: Seconds between claims of abandoned entries
+        """
+        self._session_factory = session_factory
+        self.read_count = read_count
+        self.block_ms = block_ms
+        self.claim_interval = claim_interval
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+        self._group_ready = False
+        self._last_claim = 0.0
+
+        self.materialized = 0
+        self.batches = 0
+        self.lag: dict[str, LatencyHistogram] = {}
+
+    async def start(self) -> None:
+        """Start the consumer task."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="event-materializer")
+
+    async def stop(self) -> None:
+        """Finish the current batch and stop the consumer task."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Materialized counts and per-source intake lag for diagnostics."""
+        return {
+            "materialized": self.materialized,
+            "batches": self.batches,
+            "lag": {source_id: histogram.snapshot() for source_id, histogram in self.lag.items()},
+        }
+
+    async def _run(self) -> None:
+        """Consume until stop() is requested."""
+        from src.core.cache.redis_client import get_shared_redis
+
+        while not self._stopping.is_set():
+            try:
+                await self.poll(await get_shared_redis())
+            except Exception as e:
+                logger.warning(f"Event materializer poll failed: {e}")
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def poll(self, r: "Redis") -> int:
+        """
+        Read the next batch of intake entries and materialize it.
+
+        Returns:
+            Number of events inserted
+        """
+        if not self._group_ready:
+            await self._create_group(r)
+
+        try:
+            response = await r.xreadgroup(
+                EVENT_MATERIALIZER_GROUP,
+                self.consumer,
+                {event_intake_stream_key(): ">"},
+                count=self.read_count,
+                block=self.block_ms,
+            )
+        except ResponseError as e:
+            if "NOGROUP" in str(e):
+                # Stream or group removed (e.g. Redis flushed); recreate next poll
+                self._group_ready = False
+                return 0
+            raise
+        entries = list(stream_entries(response))
+
+        now = time.monotonic()
+        if now - self._last_claim >= self.claim_interval:
+            self._last_claim = now
+            entries.extend(await self._claim(r))
+        if not entries:
+            return 0
+
+        events = []
+        for entry_id, data in entries:
+            try:
+                events.append(parse_intake_entry(entry_id, data))
+            except Exception as e:
+                # Acknowledged below with the rest; retrying cannot fix it
+                logger.warning(f"Dropping malformed intake entry {entry_id}: {e}")
+
+        done, inserted = await self._materialize(events)
+        await self._fan_out(done, inserted)
+
+        # Malformed entries are acknowledged along with the materialized ones
+        parsed_ids = {event.entry_id for event in events}
+        done_ids = {event.entry_id for event in done}
+        acked = [
+            entry_id for entry_id, _ in entries
+            if entry_id in done_ids or entry_id not in parsed_ids
+        ]
+        if acked:
+            pipe = r.pipeline(transaction=False)
+            pipe.xack(event_intake_stream_key(), EVENT_MATERIALIZER_GROUP, *acked)
+            pipe.xdel(event_intake_stream_key(), *acked)
+            for source_id, record in self._observe_lag(done).items():
+                pipe.hset(event_intake_lag_key(), source_id, json.dumps(record))
+            await pipe.execute()
+
+        return len(inserted)
+
+    async def _create_group(self, r: "Redis") -> None:
+        """Create the consumer group (and stream) if they do not exist yet."""
+        try:
+            await r.xgroup_create(
+                event_intake_stream_key(), EVENT_MATERIALIZER_GROUP, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def _claim(self, r: "Redis") -> list[tuple[str, dict[str, str]]]:
+        """Take over entries left unacknowledged by a stopped materializer."""
+        response = await r.xautoclaim(
+            event_intake_stream_key(),
+            EVENT_MATERIALIZER_GROUP,
+            self.consumer,
+            min_idle_time=INTAKE_PENDING_IDLE_MS,
+            count=self.read_count,
+        )
+        return [(entry_id, data) for entry_id, data in response[1] if data]
+
+    async def _materialize(
+        self, events: list[IntakeEvent]
+    ) -> tuple[list[IntakeEvent], dict[uuid.UUID, int]]:
+        """
+        Insert a batch of events in one transaction.
+
+        If that fails, each event is retried in its own transaction so one
+        bad event does not hold back the others; its entry stays pending
+        and is claimed again later.
+
+        Returns:
+            (events now recorded in the database, delivery count of each
+            event inserted by this call)
+        """
+        if not events:
+            return [], {}
+        try:
+            return events, await self._insert(events)
+        except Exception as e:
+            if len(events) == 1:
+                logger.warning(f"Failed to materialize event {events[0].event_id}: {e}")
+                return [], {}
+            logger.warning(f"Failed to materialize {len(events)} events ({e}), retrying individually")
+
+        done: list[IntakeEvent] = []
+        inserted: dict[uuid.UUID, int] = {}
+        for event in events:
+            try:
+                inserted.update(await self._insert([event]))
+                done.append(event)
+            except Exception as e:
+                logger.warning(f"Failed to materialize event {event.event_id}: {e}")
+        return done, inserted
+
+    async def _insert(self, events: list[IntakeEvent]) -> dict[uuid.UUID, int]:
+        """
+        Insert events and the deliveries of their matching subscriptions.
+
+        Events of deleted sources are skipped.
+
+        Returns:
+            Delivery count of each event inserted (events already present are left out)
+        """
+        async with self._session_factory() as session:
+            source_ids = list({event.event_source_id for event in events})
+            existing = set((await session.execute(
+                select(EventSource.id).where(EventSource.id.in_(source_ids))
+            )).scalars().all())
+            subscriptions: defaultdict[uuid.UUID, list[EventSubscription]] = defaultdict(list)
+            for subscription in await EventSubscriptionRepository(session).get_active_for_sources(
+                list(existing)
+            ):
+                if subscription.workflow_id and subscription.workflow:
+                    subscriptions[subscription.event_source_id].append(subscription)
+
+            event_rows = []
+            delivery_rows = []
+            for event in events:
+                if event.event_source_id not in existing:
+                    logger.warning(
+                        f"Event source {event.event_source_id} deleted, dropping event {event.event_id}"
+                    )
+                    continue
+                matches = matching_subscriptions(
+                    subscriptions[event.event_source_id], event.event_type
+                )
+                event_rows.append({
+                    "id": event.event_id,
+                    "event_source_id": event.event_source_id,
+                    "event_type": event.event_type,
+                    "received_at": event.received_at,
+                    "headers": event.headers,
+                    "data": event.data,
+                    "source_ip": event.source_ip,
+                    "status": EventStatus.PROCESSING if matches else EventStatus.COMPLETED,
+                })
+                delivery_rows.extend(
+                    {
+                        "id": uuid.uuid4(),
+                        "event_id": event.event_id,
+                        "event_subscription_id": subscription.id,
+                        "workflow_id": subscription.workflow_id,
+                        "status": EventDeliveryStatus.PENDING,
+                    }
+                    for subscription in matches
+                )
+
+            if not event_rows:
+                return {}
+
+            result = await session.execute(
+                pg_insert(Event)
+                .values(event_rows)
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(Event.id)
+            )
+            inserted = dict.fromkeys(result.scalars().all(), 0)
+            # Deliveries of redelivered events were inserted with them
+            delivery_rows = [row for row in delivery_rows if row["event_id"] in inserted]
+            for row in delivery_rows:
+                inserted[row["event_id"]] += 1
+            if delivery_rows:
+                await session.execute(insert(EventDelivery), delivery_rows)
+            await session.commit()
+
+        self.materialized += len(inserted)
+        self.batches += 1
+        return inserted
+
+    async def _fan_out(self, events: list[IntakeEvent], inserted: dict[uuid.UUID, int]) -> None:
+        """
+        Broadcast new events and queue their deliveries.
+
+        Redelivered events are queued again too, in case the materializer
+        that inserted them stopped before queueing; only the deliveries this
+        call moves from PENDING to QUEUED are published.
+        """
+        if not events:
+            return
+        async with self._session_factory() as session:
+            processor = EventProcessor(session)
+            for event in events:
+                if event.event_id in inserted:
+                    await processor.broadcast_event_created(Event(
+                        id=event.event_id,
+                        event_source_id=event.event_source_id,
+                        event_type=event.event_type,
+                        received_at=event.received_at,
+                        source_ip=event.source_ip,
+                        status=EventStatus.RECEIVED,
+                    ))
+                    if not inserted[event.event_id]:
+                        continue
+                try:
+                    await processor.queue_event_deliveries(event.event_id)
+                    await session.commit()
+                except Exception as e:
+                    logger.error(
+                        f"Error queueing deliveries for event {event.event_id}: {e}",
+                        exc_info=True,
+                    )
+                    await session.rollback()
+
+    def _observe_lag(self, events: list[IntakeEvent]) -> dict[str, dict[str, Any]]:
+        """
+        Record intake lag per event source.
+
+        Returns:
+            Lag record of each source in the batch, for the lag hash
+        """
+        now = datetime.now(timezone.utc)
+        records: dict[str, dict[str, Any]] = {}
+        for event in events:
+            source_id = str(event.event_source_id)
+            lag_ms = max((now - event.received_at).total_seconds() * 1000, 0.0)
+            histogram = self.lag.get(source_id)
+            if histogram is None:
+                histogram = self.lag[source_id] = LatencyHistogram(LAG_BUCKETS_MS)
+            histogram.observe(lag_ms)
+
+            record = records.setdefault(source_id, {
+                "lag_ms": 0.0,
+                "events": 0,
+                "materialized_at": now.isoformat(),
+            })
+            record["lag_ms"] = round(max(record["lag_ms"], lag_ms), 3)
+            record["events"] += 1
+        return records
@@ -192,6 +192,67 @@ class EventProcessor:
             - Deliver: Event was accepted and will be processed
             - Rejected: Request was rejected (invalid signature, etc.)
         """
+        result, webhook_source = await self._handle_request(source_id, request)
+        if isinstance(result, Deliver) and webhook_source is not None:
+            # Process the event
+            return await self._process_delivery(
+                webhook_source=webhook_source,
+                event_source=webhook_source.event_source,
+                deliver=result,
+                request=request,
+            )
+        return result
+
+    async def accept_webhook(
+        self,
+        source_id: str,
+        request: WebhookRequest,
+    ) -> HandleResult:
+        """
+        Validate an incoming webhook and append accepted events to the intake stream.
+
+        Fast-ack counterpart of process_webhook: nothing is written to the
+        database; the event materializer inserts the event and its deliveries.
+
+        Raises:
+            Exception: If the event could not be appended to the stream
+        """
+        result, webhook_source = await self._handle_request(source_id, request)
+        if isinstance(result, Deliver) and webhook_source is not None:
+            from src.core.cache.redis_client import get_shared_redis
+            from src.services.events.intake import append_intake_event
+
+            event_id, appended = await append_intake_event(
+                await get_shared_redis(),
+                webhook_source.event_source.id,
+                result,
+                request,
+            )
+            if appended:
+                logger.info(
+                    f"Event accepted: {event_id}",
+                    extra={
+                        "event_id": str(event_id),
+                        "event_source_id": source_id,
+                        "event_type": result.event_type,
+                    },
+                )
+            else:
+                logger.info(f"Duplicate webhook delivery for event: {event_id}")
+        return result
+
+    async def _handle_request(
+        self,
+        source_id: str,
+        request: WebhookRequest,
+    ) -> tuple[HandleResult, WebhookSource | None]:
+        """
+        Look up the webhook source and let its adapter handle the request.
+
+        Returns:
+            (adapter result, webhook source); the source is None when the
+            request was rejected before reaching the adapter
+        """
         # Validate and parse source_id as UUID
         try:
             from uuid import UUID as PyUUID
@@ -201,7 +262,7 @@ class EventProcessor:
             return Rejected(
                 message="Invalid webhook URL",
                 status_code=404,
-            )
+            ), None
 
         # Look up webhook source by event_source_id
         webhook_source = await self._webhook_repo.get_by_event_source_id(source_uuid)
@@ -211,7 +272,7 @@ class EventProcessor:
             return Rejected(
                 message="Webhook not found",
                 status_code=404,
-            )
+            ), None
 
         event_source = webhook_source.event_source
         if not event_source or not event_source.is_active:
@@ -219,7 +280,7 @@ class EventProcessor:
             return Rejected(
                 message="Webhook is inactive",
                 status_code=404,
-            )
+            ), None
 
         # Get the adapter for this webhook
         adapter = get_adapter(webhook_source.adapter_name)
@@ -228,7 +289,7 @@ class EventProcessor:
             return Rejected(
                 message="Webhook adapter not configured",
                 status_code=500,
-            )
+            ), None
 
         # Let adapter handle the request
         config = webhook_source.config or {}
@@ -241,34 +302,28 @@ class EventProcessor:
             return Rejected(
                 message="Error processing webhook",
                 status_code=500,
-            )
+            ), None
 
         # Handle adapter result
         if isinstance(result, ValidationResponse):
             # Validation/handshake response - return directly without logging event
             logger.debug(f"Webhook validation response: {source_id}")
-            return result
+            return result, webhook_source
 
         if isinstance(result, Rejected):
             # Request rejected by adapter (invalid signature, etc.)
             logger.warning(f"Webhook rejected: {source_id} - {result.message}")
-            return result
+            return result, webhook_source
 
         if isinstance(result, Deliver):
-            # Process the event
-            return await self._process_delivery(
-                webhook_source=webhook_source,
-                event_source=event_source,
-                deliver=result,
-                request=request,
-            )
+            return result, webhook_source
 
         # Unknown result type
         logger.error(f"Unknown adapter result type: {type(result)}")
         return Rejected(
             message="Internal error",
             status_code=500,
-        )
+        ), None
 
     async def _process_delivery(
         self,
@@ -368,6 +423,14 @@ class EventProcessor:
             event_type=deliver.event_type,
         )
 
+    async def broadcast_event_created(self, event: Event) -> None:
+        """Broadcast a newly recorded event to WebSocket subscribers."""
+        await self._broadcast_event_update(
+            event_source_id=event.event_source_id,
+            event=event,
+            update_type="event_created",
+        )
+
     async def _broadcast_event_update(
         self,
         event_source_id: uuid.UUID,
@@ -432,60 +495,81 @@ class EventProcessor:
         Returns:
             Number of deliveries queued
         """
-        # Get all pending deliveries for this event
+        from src.jobs.rabbitmq import PublishError, batch_publishes
+
+        # Get the event data
+        event = await self._event_repo.get_by_id(event_id)
+        if not event:
+            logger.error(f"Event not found when queueing deliveries: {event_id}")
+            return 0
+
+        # Claim the pending deliveries before publishing: a reclaimed intake
+        # entry can queue the same event while the materializer that first
+        # read it is still doing so
+        claimed = await self._delivery_repo.claim_pending(event_id)
         deliveries = await self._delivery_repo.get_by_event(event_id)
 
-        queued = 0
-        for delivery in deliveries:
-            if delivery.status != EventDeliveryStatus.PENDING:
-                continue
-
-            # Get the event data
-            event = await self._event_repo.get_by_id(event_id)
-            if not event:
-                logger.error(f"Event not found when queueing delivery: {event_id}")
-                continue
-
-            try:
-                await self._queue_workflow_execution(delivery, event)
-                delivery.status = EventDeliveryStatus.QUEUED
-                queued += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to queue delivery {delivery.id}: {e}",
-                    exc_info=True,
-                )
+        # Publish all executions as one batch on exit rather than one
+        # confirm round trip per delivery
+        batched: list[EventDelivery] = []
+        try:
+            async with batch_publishes():
+                for delivery in deliveries:
+                    if delivery.id not in claimed:
+                        continue
+
+                    try:
+                        await self._queue_workflow_execution(delivery, event)
+                        delivery.status = EventDeliveryStatus.QUEUED
+                        batched.append(delivery)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to queue delivery {delivery.id}: {e}",
+                            exc_info=True,
+                        )
+                        delivery.status = EventDeliveryStatus.FAILED
+                        delivery.error_message = str(e)
+        except PublishError as e:
+            # Only the executions the broker did not confirm failed
+            unconfirmed = {message.get("execution_id") for message in e.failed}
+            failed = [d for d in batched if str(d.execution_id) in unconfirmed]
+            logger.error(
+                f"Failed to publish {len(failed)}/{len(batched)} deliveries for event {event_id}: {e}",
+                exc_info=True,
+            )
+            for delivery in failed:
                 delivery.status = EventDeliveryStatus.FAILED
-                delivery.error_message = str(e)
+                delivery.error_message = f"Failed to publish execution: {e}"
+            batched = [d for d in batched if d not in failed]
+
+        queued = len(batched)
 
         await self.session.flush()
 
-        # Broadcast update after queueing
-        if event:
-            # Count current delivery statuses
-            all_deliveries = await self._delivery_repo.get_by_event(event_id)
-            success_count = sum(
-                1 for d in all_deliveries if d.status == EventDeliveryStatus.SUCCESS
-            )
-            failed_count = sum(
-                1 for d in all_deliveries if d.status == EventDeliveryStatus.FAILED
-            )
-            queued_count = sum(
-                1 for d in all_deliveries if d.status == EventDeliveryStatus.QUEUED
-            )
-            pending_count = sum(
-                1 for d in all_deliveries if d.status == EventDeliveryStatus.PENDING
-            )
+        # Broadcast update after queueing, with current delivery statuses
+        all_deliveries = await self._delivery_repo.get_by_event(event_id)
+        success_count = sum(
+            1 for d in all_deliveries if d.status == EventDeliveryStatus.SUCCESS
+        )
+        failed_count = sum(
+            1 for d in all_deliveries if d.status == EventDeliveryStatus.FAILED
+        )
+        queued_count = sum(
+            1 for d in all_deliveries if d.status == EventDeliveryStatus.QUEUED
+        )
+        pending_count = sum(
+            1 for d in all_deliveries if d.status == EventDeliveryStatus.PENDING
+        )
 
-            await self._broadcast_event_update(
-                event_source_id=event.event_source_id,
-                event=event,
-                update_type="deliveries_queued",
-                success_count=success_count,
-                failed_count=failed_count,
-                queued_count=queued_count,
-                pending_count=pending_count,
-            )
+        await self._broadcast_event_update(
+            event_source_id=event.event_source_id,
+            event=event,
+            update_type="deliveries_queued",
+            success_count=success_count,
+            failed_count=failed_count,
+            queued_count=queued_count,
+            pending_count=pending_count,
+        )
 
         return queued
 
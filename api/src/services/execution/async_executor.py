@@ -10,8 +10,8 @@ Flow:
 
 For sync execution (sync=True):
 - Caller provides execution_id (already stored in Redis)
-- Worker pushes result to Redis
-- Caller waits on Redis BLPOP
+- Worker pushes result to Redis and notifies RESULT_READY_CHANNEL
+- Caller waits on SyncResultWaiter (redis_client.wait_for_result)
 """
 
 import logging
@@ -48,7 +48,7 @@ async def enqueue_workflow_execution(
         parameters: Workflow parameters
         form_id: Optional form ID if triggered by form
         execution_id: Optional pre-generated execution ID (for sync execution)
-        sync: If True, worker will push result to Redis for caller to BLPOP
+        sync: If True, worker will push result to Redis for the caller's SyncResultWaiter
         api_key_id: Optional workflow ID whose API key triggered this execution
         file_path: Optional file path (for fast direct loading, avoids filesystem scan)
 
@@ -80,7 +80,7 @@ async def enqueue_workflow_execution(
         sync=sync,
     )
 
-    # Add to queue tracking (publishes position updates to all queued executions)
+    # Add to queue tracking (sends this execution its rank and the current queue epoch)
     await add_to_queue(execution_id)
 
     # Prepare queue message (minimal - worker reads full context from Redis)
@@ -129,7 +129,7 @@ async def enqueue_code_execution(
         code_base64: Base64-encoded Python code
         parameters: Script parameters
         execution_id: Optional pre-generated execution ID (for sync execution)
-        sync: If True, worker will push result to Redis for caller to BLPOP
+        sync: If True, worker will push result to Redis for the caller's SyncResultWaiter
 
     Returns:
         execution_id: UUID of the queued execution
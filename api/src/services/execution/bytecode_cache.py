@@ -0,0 +1,114 @@
+"""
+Bytecode Cache for Workspace Modules
+
+Compiling large workspace modules (e.g. shared/halopsa.py) dominates the
+startup time of short executions. This cache keeps compiled code objects
+keyed by (path, content_hash) so a module is only compiled once per
+content version:
+
+1. In-process LRU (per worker process, survives across executions)
+2. Redis, as marshalled bytecode (shared, so a fresh worker doesn't recompile)
+3. compile() as the fallback, populating both tiers
+
+Keys include the interpreter cache tag (e.g. "cpython-311") because the
+marshal format is specific to the Python version.
+
+Usage:
+    from src.services.execution.bytecode_cache import get_code
+
+    code = get_code("shared/halopsa.py", source, content_hash)
+    exec(code, module.__dict__)
+"""
+
+import hashlib
+import logging
+import marshal
+import sys
+import threading
+from collections import OrderedDict
+from types import CodeType
+
+from src.core.module_cache_sync import get_bytecode_sync, set_bytecode_sync
+
+logger = logging.getLogger(__name__)
+
+# Max compiled modules kept in-process per worker
+MAX_CACHED_CODE_OBJECTS = 512
+
+_CACHE_TAG = sys.implementation.cache_tag or sys.implementation.name
+
+_code_cache: "OrderedDict[tuple[str, str], CodeType]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def bytecode_key(path: str, content_hash: str) -> str:
+    """
+    Build the shared cache key for a module version.
+
+    The path is part of the key because it is baked into the code object
+    as co_filename (used in tracebacks).
+    """
+    path_digest = hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+    return f"{_CACHE_TAG}:{content_hash}:{path_digest}"
+
+
+def get_code(path: str, source: str, content_hash: str | None = None) -> CodeType:
+    """
+    Get the compiled code object for a module's source.
+
+    Args:
+        path: Workspace-relative path, used as the code filename
+        source: Python source code
+        content_hash: SHA-256 of the source if already known (computed otherwise)
+
+    Returns:
+        Compiled code object
+
+    Raises:
+        SyntaxError: If the source does not compile
+    """
+    if not content_hash:
+        content_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    local_key = (path, content_hash)
+    with _lock:
+        code = _code_cache.get(local_key)
+        if code is not None:
+            _code_cache.move_to_end(local_key)
+            return code
+
+    shared_key = bytecode_key(path, content_hash)
+    code = _load_shared(shared_key)
+    if code is None:
+        code = compile(source, filename=path, mode="exec")
+        set_bytecode_sync(shared_key, marshal.dumps(code))
+        logger.debug(f"Compiled {path} ({content_hash[:12]})")
+
+    with _lock:
+        _code_cache[local_key] = code
+        _code_cache.move_to_end(local_key)
+        while len(_code_cache) > MAX_CACHED_CODE_OBJECTS:
+            _code_cache.popitem(last=False)
+
+    return code
+
+
+def _load_shared(shared_key: str) -> CodeType | None:
+    """Load bytecode compiled by another worker, ignoring corrupt entries."""
+    data = get_bytecode_sync(shared_key)
+    if not data:
+        return None
+    try:
+        code = marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as e:
+        logger.warning(f"Discarding corrupt shared bytecode {shared_key}: {e}")
+        return None
+    if not isinstance(code, CodeType):
+        return None
+    return code
+
+
+def clear_bytecode_cache() -> None:
+    """Clear the in-process cache. Used for testing."""
+    with _lock:
+        _code_cache.clear()
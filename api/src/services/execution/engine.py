@@ -3,34 +3,55 @@ Unified Execution Engine
 Single source of truth for all code execution (workflows, scripts, data providers)
 """
 
+import asyncio
 import inspect
 import logging
 import os
 import sys
-from contextlib import redirect_stdout, redirect_stderr
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from io import StringIO
 from pathlib import Path
+from types import CodeType
 from typing import Any, get_type_hints, get_origin, get_args, Union
 
-from pydantic import BaseModel
-
 from src.sdk.context import Caller, ExecutionContext, Organization
 from src.sdk.error_handling import WorkflowError
 from src.sdk.errors import UserError, WorkflowExecutionException
 from src.models.enums import ExecutionStatus
-from src.core.cache import get_cached_data_provider, cache_data_provider_result
+from src.core.cache import (
+    acquire_compute_lock,
+    cache_data_provider_result,
+    get_cached_data_provider,
+    record_data_provider_cache_outcome,
+    release_compute_lock,
+    wait_for_data_provider_result,
+)
+from src.services.execution.output_capture import capture_output
+from src.services.execution.variable_capture import (
+    LocalsCapture,
+    capture_code_for,
+    limits_for_mode,
+    serialize_locals,
+    serialize_value,
+)
 
 logger = logging.getLogger(__name__)
 
+# Owner token of the WorkflowLogHandler that keeps records logged in the
+# current context. Handlers sit on the root logger, so when several
+# executions share a process (async slots) each keeps only its own records.
+_log_owner: ContextVar[object | None] = ContextVar("bifrost_log_owner", default=None)
+
 # Import unified log streaming (Redis Stream + PubSub)
 try:
-    from bifrost._logging import log_and_broadcast, flush_logs_to_postgres
+    from bifrost._logging import flush_logs_to_postgres, flush_shipped_logs, ship_log
     STREAM_LOGGING_AVAILABLE = True
 except ImportError:
     STREAM_LOGGING_AVAILABLE = False
-    log_and_broadcast = None  # type: ignore
+    ship_log = None  # type: ignore
+    flush_shipped_logs = None  # type: ignore
     flush_logs_to_postgres = None  # type: ignore
 
 # Import bifrost context management for SDK support
@@ -83,6 +104,7 @@ class ExecutionRequest:
     # Execution settings
     timeout_seconds: int = 1800          # Default 30 minutes
     cache_ttl_seconds: int = 300         # For data providers
+    variable_capture: str = "full"       # off, summary or full
 
     # Parameters
     parameters: dict[str, Any] = field(default_factory=dict)
@@ -283,23 +305,52 @@ async def execute(request: ExecutionRequest) -> ExecutionResult:
     # which creates credentials in ~/.bifrost/credentials.json before each execution.
     # The SDK's get_client() finds these credentials automatically.
 
+    # Whether this execution holds the data provider compute lock
+    holds_compute_lock = False
+
     try:
-        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+        with capture_output(stdout_capture, stderr_capture):
             # Check Redis cache for data providers
             if is_data_provider and not request.no_cache and DATA_PROVIDER_CACHE_AVAILABLE and get_cached_data_provider:
                 org_id = request.organization.id if request.organization else None
+                provider_name = request.name or ""
                 cached_result = await get_cached_data_provider(
                     org_id,
-                    request.name or "",
-                    request.parameters
+                    provider_name,
+                    request.parameters,
+                    allow_stale=True
                 )
-                if cached_result:
+                if cached_result and not cached_result.get("stale"):
+                    await record_data_provider_cache_outcome(org_id, provider_name, "hit")
                     return _build_cached_result(
                         request.execution_id,
                         cached_result,
                         start_time
                     )
 
+                # Single-flight: only the lock holder computes. Others get the
+                # stale value if there is one, or wait for the holder's result.
+                holds_compute_lock = await acquire_compute_lock(
+                    org_id, provider_name, request.parameters
+                )
+                if not holds_compute_lock:
+                    outcome = "stale"
+                    if not cached_result:
+                        outcome = "coalesced"
+                        cached_result = await wait_for_data_provider_result(
+                            org_id, provider_name, request.parameters
+                        )
+                    if cached_result:
+                        await record_data_provider_cache_outcome(org_id, provider_name, outcome)
+                        return _build_cached_result(
+                            request.execution_id,
+                            cached_result,
+                            start_time
+                        )
+                    # Holder failed or timed out - compute it ourselves
+
+                await record_data_provider_cache_outcome(org_id, provider_name, "miss")
+
             # Convert scripts to callables for unified execution
             if is_script:
                 assert request.code is not None
@@ -315,7 +366,8 @@ async def execute(request: ExecutionRequest) -> ExecutionResult:
                 context,
                 request.parameters,
                 execution_id=request.execution_id,
-                broadcaster=request.broadcaster
+                broadcaster=request.broadcaster,
+                variable_capture=request.variable_capture,
             )
 
             # Cache result to Redis if data provider
@@ -329,6 +381,9 @@ async def execute(request: ExecutionRequest) -> ExecutionResult:
                     request.cache_ttl_seconds
                 )
                 cache_expires_at_str = expires_at.isoformat()
+                if holds_compute_lock:
+                    await release_compute_lock(org_id, request.name or "", request.parameters)
+                    holds_compute_lock = False
 
         # Process captured logs (from scripts or workflows with platform admin)
         logger.info(
@@ -566,6 +621,14 @@ async def execute(request: ExecutionRequest) -> ExecutionResult:
         )
 
     finally:
+        # Failed data provider - let waiters stop waiting and compute themselves
+        if holds_compute_lock:
+            await release_compute_lock(
+                request.organization.id if request.organization else None,
+                request.name or "",
+                request.parameters
+            )
+
         # NOTE: flush_pending_changes, flush_logs_to_postgres, and cleanup_execution_cache
         # are now called from workflow_execution.py's _process_execution_result() callback.
         # This avoids event loop issues when running in thread workers (each thread creates
@@ -600,7 +663,7 @@ def _script_to_callable(code: str, name: str):
     streaming.
 
     The script code is wrapped in an async main() function to enable:
-    - Proper variable capture via sys.settrace()
+    - Variable capture from main's locals
     - Function-level logging that can be filtered
     - Support for both sync and async code
 
@@ -618,7 +681,7 @@ def _script_to_callable(code: str, name: str):
     script_code = base64.b64decode(code).decode('utf-8')
 
     # Wrap script code in an async main() function
-    # This allows sys.settrace() to capture variables properly
+    # This lets variable capture read the script's variables from main's locals
     # Add return statement to capture 'result' variable if set
     wrapped_code = f"""async def main():
 {textwrap.indent(script_code, '    ')}
@@ -633,7 +696,7 @@ def _script_to_callable(code: str, name: str):
         Async wrapper that executes the script code.
 
         The script code runs inside an async main() function, allowing:
-        - sys.settrace() to capture variables from main's frame
+        - variable capture from main's frame
         - await to work in user scripts
         - Proper logging with script-specific logger
         """
@@ -698,6 +761,11 @@ def _script_to_callable(code: str, name: str):
     # Set function metadata for trace filtering
     script_wrapper.__name__ = name
     script_wrapper.__module__ = f'<script:{name}>'
+    # Variables are captured from main(), not from this wrapper
+    script_wrapper._capture_code = next(  # type: ignore[attr-defined]
+        (c for c in compiled_code.co_consts if isinstance(c, CodeType) and c.co_name == 'main'),
+        None,
+    )
 
     return script_wrapper
 
@@ -707,14 +775,16 @@ async def _execute_workflow_with_trace(
     context: ExecutionContext,
     parameters: dict[str, Any],
     execution_id: str | None = None,
-    broadcaster: Any = None
+    broadcaster: Any = None,
+    variable_capture: str | None = None,
 ) -> tuple[Any, dict[str, Any], list[str]]:
     """
-    Execute a workflow function with variable capture using sys.settrace().
+    Execute a workflow function with variable capture.
 
     This is the same approach used for scripts, ensuring consistency.
-    Captures all local variables from the function as it executes.
-    Streams logs in real-time via SignalR if broadcaster is provided.
+    Captures the function's local variables when it returns or raises
+    (see variable_capture.py). Streams logs in real-time via SignalR if
+    broadcaster is provided.
 
     Args:
         func: Workflow function to execute
@@ -722,6 +792,7 @@ async def _execute_workflow_with_trace(
         parameters: Function parameters
         execution_id: Execution ID for Web PubSub broadcasts
         broadcaster: WebPubSubBroadcaster for real-time log streaming
+        variable_capture: Capture mode ("off", "summary" or "full", default full)
 
     Returns:
         Tuple of (result, captured_variables, logs)
@@ -748,8 +819,15 @@ async def _execute_workflow_with_trace(
     })
 
     # Set up logging capture for the workflow
+    log_owner = object()
+
     class WorkflowLogHandler(logging.Handler):
         def emit(self, record: logging.LogRecord) -> None:
+            # Records logged by another execution in this process
+            current_owner = _log_owner.get()
+            if current_owner is not None and current_owner is not log_owner:
+                return
+
             # Fast reject known noisy third-party loggers
             if record.name.split(".")[0] in _NOISY_LOGGERS:
                 return
@@ -806,9 +884,11 @@ async def _execute_workflow_with_trace(
                 # Redis Stream is the single source of truth for logs
                 # - PubSub delivers immediately to WebSocket clients
                 # - Background worker persists from Stream to Postgres
+                # ship_log() only queues the record; a background thread writes
+                # batches so the workflow never waits on Redis round trips
                 try:
-                    if STREAM_LOGGING_AVAILABLE and log_and_broadcast:
-                        log_and_broadcast(
+                    if STREAM_LOGGING_AVAILABLE and ship_log:
+                        ship_log(
                             execution_id=execution_id,
                             level=record.levelname,
                             message=record.getMessage(),
@@ -831,86 +911,24 @@ async def _execute_workflow_with_trace(
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Set logger level to capture DEBUG messages
     root_logger.addHandler(handler)
+    log_owner_token = _log_owner.set(log_owner)
 
-    def remove_circular_refs(obj, seen=None):
-        """
-        Remove circular references from objects to make them JSON serializable.
-
-        Recursively walks through dicts/lists/tuples and replaces circular references
-        with a string marker. Non-serializable objects are converted to string repr.
-        """
-        if seen is None:
-            seen = set()
-
-        obj_id = id(obj)
-        if obj_id in seen:
-            return "[Circular Reference]"
-
-        seen = seen.copy()  # Copy seen set for this branch
-        seen.add(obj_id)
-
-        try:
-            if isinstance(obj, dict):
-                return {k: remove_circular_refs(v, seen) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                cleaned = [remove_circular_refs(item, seen) for item in obj]
-                return cleaned if isinstance(obj, list) else tuple(cleaned)
-            elif isinstance(obj, set):
-                return [remove_circular_refs(item, seen) for item in obj]
-            elif isinstance(obj, BaseModel):
-                # Convert Pydantic models to dict and recursively clean
-                return remove_circular_refs(obj.model_dump(), seen)
-            else:
-                # Test if primitive type is JSON serializable
-                import json
-                json.dumps(obj)
-                return obj
-        except (TypeError, ValueError):
-            # Not serializable - return type name
-            return f"<{type(obj).__name__}>"
+    # Variable capture: locals of the workflow's own code object are recorded
+    # when it returns (or taken from the traceback when it raises) and
+    # serialized once, within the limits of the workflow's capture mode
+    capture_limits = limits_for_mode(variable_capture)
+    locals_capture = LocalsCapture(capture_code_for(func)) if capture_limits else None
 
     # Helper to capture variables from locals
     def capture_variables_from_locals(local_vars: dict[str, Any]) -> None:
         """Capture variables from a frame's local variables, excluding params and internals."""
+        if capture_limits is None:
+            return
         param_names = set(parameters.keys()) | {'context', 'self'}
-
-        for k, v in local_vars.items():
-            # Skip parameters, private vars, callables, and modules
-            if (not k.startswith('_')
-                and k not in param_names
-                and not callable(v)
-                and not isinstance(v, type(sys))):
-                # Remove circular references to make JSON serializable
-                cleaned_value = remove_circular_refs(v)
-                captured_vars[k] = cleaned_value
+        captured_vars.update(serialize_locals(local_vars, param_names, capture_limits))
 
     exception_to_raise = None
 
-    # Set up trace function to capture variables on return or exception
-    def trace_func(frame, event, arg):
-        # Trace the workflow function OR script's main() function
-        # Scripts wrap their code in an async main() function
-        if frame.f_code.co_name not in (func_name, 'main'):
-            return None
-
-        # Capture variables when returning or raising exception
-        if event in ('return', 'exception'):
-            capture_variables_from_locals(frame.f_locals)
-
-        return trace_func
-
-    # Build trace function chain (with existing trace if present, e.g., debugpy)
-    existing_trace = sys.gettrace()
-
-    def chained_trace_func(frame, event, arg):
-        # Call our trace function first
-        trace_func(frame, event, arg)
-
-        # Then call the existing trace function (e.g., debugpy)
-        if existing_trace:
-            return existing_trace(frame, event, arg)
-        return chained_trace_func
-
     try:
         # Inspect function signature to determine if it expects context parameter
         sig = inspect.signature(func)
@@ -942,8 +960,9 @@ async def _execute_workflow_with_trace(
         # This includes both signature-matched params and extra params
         context.parameters = dict(parameters)
         # Also add to captured_vars so they appear in execution details
-        for key, value in parameters.items():
-            captured_vars[key] = remove_circular_refs(value)
+        if capture_limits is not None:
+            for key, value in parameters.items():
+                captured_vars[key] = serialize_value(value, capture_limits)
 
         # Check if first parameter is for context (by type annotation OR by name as fallback)
         first_param_is_context = False
@@ -983,20 +1002,26 @@ async def _execute_workflow_with_trace(
             )
             set_write_buffer(buffer)
 
-        # Set up trace function for variable capture
-        sys.settrace(chained_trace_func if existing_trace else trace_func)
+        # Start recording the workflow's locals for variable capture
+        if locals_capture:
+            locals_capture.start()
         try:
             # Run the workflow directly - isolation is provided by subprocess
             result = await _run_workflow_async()
         finally:
-            # Clear trace function
-            sys.settrace(None)
+            # Stop recording
+            if locals_capture:
+                locals_capture.stop()
             # Clear context
             if BIFROST_CONTEXT_AVAILABLE:
                 clear_execution_context()
             # Clear write buffer
             if WRITE_BUFFER_AVAILABLE and clear_write_buffer:
                 clear_write_buffer()
+
+        # Capture variables from the workflow's locals at return
+        if locals_capture and locals_capture.locals is not None:
+            capture_variables_from_locals(locals_capture.locals)
     except TypeError as e:
         # Check if this is the "got multiple values" error caused by missing context parameter
         if "got multiple values for argument" in str(e):
@@ -1017,17 +1042,10 @@ async def _execute_workflow_with_trace(
             # Different TypeError - handle normally
             raise
     except Exception as e:
-        # On exception, extract variables from the traceback
-        # Find the workflow/script function frame in the traceback
-        tb_frame = e.__traceback__
-        while tb_frame:
-            frame_name = tb_frame.tb_frame.f_code.co_name
-            # Look for workflow function or script's main() function
-            if frame_name in (func_name, 'main'):
-                # Found the workflow/script function frame - capture variables
-                capture_variables_from_locals(tb_frame.tb_frame.f_locals)
-                break
-            tb_frame = tb_frame.tb_next
+        # On exception, extract variables from the workflow/script function's
+        # frame in the traceback
+        if locals_capture and locals_capture.record_from_traceback(e.__traceback__):
+            capture_variables_from_locals(locals_capture.locals or {})
 
         # Log the error through the logger so it gets streamed in real-time
         workflow_logger = logging.getLogger(func.__module__)
@@ -1057,6 +1075,13 @@ async def _execute_workflow_with_trace(
         # Note: trace function cleanup is handled in _run_workflow_in_thread
         # Clean up the logging handler
         root_logger.removeHandler(handler)
+        _log_owner.reset(log_owner_token)
+        # Make sure every shipped log reached the stream before the result is
+        # reported (the consumer persists the stream once it sees the result).
+        # Wait from a thread: with async slots the loop runs other executions.
+        if execution_id and STREAM_LOGGING_AVAILABLE and flush_shipped_logs:
+            if not await asyncio.to_thread(flush_shipped_logs):
+                logger.warning(f"Timed out flushing logs for execution {execution_id}")
         # Note: Extra params are now stored in context.parameters instead of being
         # injected into func.__globals__, so no cleanup needed here
 
@@ -0,0 +1,268 @@
+"""
+Log Persister
+
+Streams execution logs from Redis to Postgres while executions run.
+
+Every log entry is appended to its execution's stream (bifrost:logs:{id})
+and the execution is added to the active streams set. The persister polls
+that set, reads new entries of every active stream through the
+LOG_PERSISTER_GROUP consumer group (one pipelined round trip), COPYs them
+into execution_logs in one transaction, then acknowledges and deletes
+them. Redis therefore only holds the last few hundred milliseconds of each
+execution's logs, however long or chatty the execution is.
+
+When an execution completes, load_stream_logs() waits briefly for batches
+in flight to be acknowledged, then takes everything still pending or not
+yet picked up, and the result write persists it with the execution's final
+status; clear_stream_logs() then drops the stream.
+
+Entries read by a persister that dies (or whose COPY fails) before
+acknowledging them stay pending in the group and are claimed by another
+persister after LOG_PENDING_IDLE_MS, or by the finalizer. A crash between
+the COPY commit and the acknowledgement can therefore persist a batch
+twice; it never loses one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable
+from uuid import UUID
+
+from redis.exceptions import ResponseError
+
+from bifrost._logging import (
+    LOG_PENDING_IDLE_MS,
+    LOG_PERSISTER_GROUP,
+    parse_stream_entry,
+    stream_entries,
+)
+from src.core.cache.keys import active_log_streams_key, execution_logs_stream_key
+from src.repositories.execution_logs import ExecutionLogRepository
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# How often active streams are polled for new entries
+POLL_INTERVAL_SECONDS = 0.5
+
+# Max entries read per stream per poll
+READ_COUNT = 1000
+
+# How often entries abandoned by a stopped persister are claimed
+CLAIM_INTERVAL_SECONDS = 30.0
+
+
+class LogPersister:
+    """
+    Background task persisting active execution log streams.
+
+    Attributes:
+        persisted: Number of log rows written
+        batches: Number of COPY transactions committed
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        read_count: int = READ_COUNT,
+        claim_interval: float = CLAIM_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+            poll_interval: Seconds between polls of the active streams
+            read_count: Max entries read per stream per poll
+            claim_interval: Seconds between claims of abandoned entries
+        """
+        self._session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.read_count = read_count
+        self.claim_interval = claim_interval
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+        self._last_claim = 0.0
+
+        self.persisted = 0
+        self.batches = 0
+
+    async def start(self) -> None:
+        """Start the polling task."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="log-persister")
+
+    async def stop(self) -> None:
+        """Persist what is readable right now and stop the polling task."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Poll loop; one last poll runs after stop() is requested."""
+        from src.core.cache.redis_client import get_shared_redis
+
+        while True:
+            try:
+                await self.poll(await get_shared_redis())
+            except Exception as e:
+                logger.warning(f"Log persister poll failed: {e}")
+
+            if self._stopping.is_set():
+                return
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def poll(self, r: "Redis") -> int:
+        """
+        Read new entries from every active stream and persist them.
+
+        Returns:
+            Number of log rows persisted
+        """
+        execution_ids = sorted(await r.smembers(active_log_streams_key()))  # type: ignore[misc]
+        if not execution_ids:
+            return 0
+
+        entries = await self._read(r, execution_ids)
+        now = time.monotonic()
+        if now - self._last_claim >= self.claim_interval:
+            self._last_claim = now
+            for execution_id, claimed in (await self._claim(r, execution_ids)).items():
+                entries[execution_id].extend(claimed)
+
+        entries = {execution_id: batch for execution_id, batch in entries.items() if batch}
+        if not entries:
+            return 0
+
+        persisted_ids = await self._persist(entries)
+        if persisted_ids:
+            pipe = r.pipeline(transaction=False)
+            for execution_id in persisted_ids:
+                stream_key = execution_logs_stream_key(execution_id)
+                ids = [entry_id for entry_id, _ in entries[execution_id]]
+                pipe.xack(stream_key, LOG_PERSISTER_GROUP, *ids)
+                pipe.xdel(stream_key, *ids)
+            await pipe.execute()
+
+        return sum(len(entries[execution_id]) for execution_id in persisted_ids)
+
+    async def _read(
+        self, r: "Redis", execution_ids: list[str]
+    ) -> defaultdict[str, list[tuple[str, dict[str, str]]]]:
+        """Read undelivered entries of each stream in one round trip."""
+        pipe = r.pipeline(transaction=False)
+        for execution_id in execution_ids:
+            pipe.xreadgroup(
+                LOG_PERSISTER_GROUP,
+                self.consumer,
+                {execution_logs_stream_key(execution_id): ">"},
+                count=self.read_count,
+            )
+        responses = await pipe.execute(raise_on_error=False)
+
+        entries: defaultdict[str, list[tuple[str, dict[str, str]]]] = defaultdict(list)
+        finished = []
+        for execution_id, response in zip(execution_ids, responses):
+            if isinstance(response, ResponseError) and "NOGROUP" in str(response):
+                # Stream cleared after completion (or predates the group)
+                finished.append(execution_id)
+            elif isinstance(response, Exception):
+                logger.warning(f"Failed to read logs of {execution_id[:8]}...: {response}")
+            else:
+                entries[execution_id].extend(stream_entries(response))
+
+        if finished:
+            await r.srem(active_log_streams_key(), *finished)  # type: ignore[misc]
+        return entries
+
+    async def _claim(
+        self, r: "Redis", execution_ids: list[str]
+    ) -> dict[str, list[tuple[str, dict[str, str]]]]:
+        """Take over entries left unacknowledged by a stopped persister."""
+        pipe = r.pipeline(transaction=False)
+        for execution_id in execution_ids:
+            pipe.xautoclaim(
+                execution_logs_stream_key(execution_id),
+                LOG_PERSISTER_GROUP,
+                self.consumer,
+                min_idle_time=LOG_PENDING_IDLE_MS,
+                count=self.read_count,
+            )
+        responses = await pipe.execute(raise_on_error=False)
+
+        claimed = {}
+        for execution_id, response in zip(execution_ids, responses):
+            if isinstance(response, Exception):
+                continue
+            entries = [(entry_id, data) for entry_id, data in response[1] if data]
+            if entries:
+                claimed[execution_id] = entries
+        return claimed
+
+    async def _persist(
+        self, entries: dict[str, list[tuple[str, dict[str, str]]]]
+    ) -> list[str]:
+        """
+        COPY the entries of all streams in one transaction.
+
+        If that fails, each execution is retried in its own transaction so
+        one bad stream does not hold back the others; its entries stay
+        pending and are claimed again later.
+
+        Returns:
+            Execution IDs whose entries were committed
+        """
+        rows = {execution_id: self._rows(execution_id, batch) for execution_id, batch in entries.items()}
+        try:
+            await self._copy([row for batch in rows.values() for row in batch])
+            return list(rows)
+        except Exception as e:
+            if len(rows) == 1:
+                logger.warning(f"Failed to persist logs: {e}")
+                return []
+            logger.warning(f"Failed to persist logs of {len(rows)} executions ({e}), retrying individually")
+
+        persisted = []
+        for execution_id, batch in rows.items():
+            try:
+                await self._copy(batch)
+                persisted.append(execution_id)
+            except Exception as e:
+                logger.warning(f"Failed to persist logs of {execution_id[:8]}...: {e}")
+        return persisted
+
+    async def _copy(self, rows: list[dict[str, Any]]) -> None:
+        """Write rows in their own transaction."""
+        async with self._session_factory() as session:
+            await ExecutionLogRepository(session).copy_logs(rows)
+            await session.commit()
+        self.persisted += len(rows)
+        self.batches += 1
+
+    @staticmethod
+    def _rows(
+        execution_id: str, batch: list[tuple[str, dict[str, str]]]
+    ) -> list[dict[str, Any]]:
+        """Parse stream entries, skipping (and acknowledging) malformed ones."""
+        exec_uuid = UUID(execution_id)
+        rows = []
+        for entry_id, data in batch:
+            try:
+                rows.append(parse_stream_entry(exec_uuid, entry_id, data))
+            except Exception as e:
+                logger.warning(f"Failed to parse log entry {entry_id}: {e}")
+        return rows
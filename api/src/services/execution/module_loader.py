@@ -236,6 +236,7 @@ def exec_from_db(
     code: str,
     path: str,
     function_name: str,
+    content_hash: str | None = None,
 ) -> ModuleType:
     """
     Execute workflow code from database and return the module.
@@ -249,6 +250,7 @@ def exec_from_db(
         path: The workspace-relative path (e.g., "workflows/process_order.py")
               Used for __file__ injection and traceback filenames
         function_name: The function name to find (for validation)
+        content_hash: SHA-256 of code; enables the worker bytecode cache
 
     Returns:
         A ModuleType object with all defined functions and metadata
@@ -292,9 +294,15 @@ def exec_from_db(
         "__spec__": None,
     }
 
-    # Compile with filename for meaningful stack traces
+    # Compile with filename for meaningful stack traces.
+    # Workers pass content_hash so unchanged code reuses cached bytecode.
     try:
-        code_obj = compile(code, filename=file_path_for_traceback, mode='exec')
+        if content_hash:
+            from src.services.execution.bytecode_cache import get_code
+
+            code_obj = get_code(file_path_for_traceback, code, content_hash)
+        else:
+            code_obj = compile(code, filename=file_path_for_traceback, mode='exec')
     except SyntaxError as e:
         logger.error(f"Syntax error in workflow code at {path}: {e}")
         raise
@@ -325,6 +333,7 @@ def load_workflow_from_db(
     code: str,
     path: str,
     function_name: str,
+    content_hash: str | None = None,
 ) -> tuple[Callable[..., Any] | None, WorkflowMetadata | None, str | None]:
     """
     Load a workflow by executing code from the database.
@@ -336,6 +345,7 @@ def load_workflow_from_db(
         code: Python source code from file_index or S3
         path: Workspace-relative path for __file__ injection
         function_name: Python function name to find (e.g., "get_client_detail")
+        content_hash: SHA-256 of code; enables the worker bytecode cache
 
     Returns:
         Tuple of (callable, metadata, error_message):
@@ -343,7 +353,9 @@ def load_workflow_from_db(
         - On failure: (None, None, error_message)
     """
     try:
-        module = exec_from_db(code=code, path=path, function_name=function_name)
+        module = exec_from_db(
+            code=code, path=path, function_name=function_name, content_hash=content_hash
+        )
     except (SyntaxError, ImportError) as e:
         logger.error(f"Failed to execute workflow from DB: {e}")
         user_friendly_error = (
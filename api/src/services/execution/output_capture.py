@@ -0,0 +1,103 @@
+"""
+Per-task stdout/stderr capture for executions.
+
+contextlib.redirect_stdout swaps sys.stdout for the whole process, which
+is only safe while one execution runs at a time. With async slots
+(several executions on one event loop) a task would capture, or restore
+over, another task's output.
+
+capture_output() instead routes writes through a stream installed once
+as sys.stdout/sys.stderr that looks up the target for the current
+context (contextvars), so each asyncio task (and threads started with
+asyncio.to_thread, which copy the context) writes to its own capture.
+Writes from contexts without a capture go to the original stream.
+
+Usage:
+    with capture_output(stdout_capture, stderr_capture):
+        await run_workflow()
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, TextIO
+
+# (stdout, stderr) targets for the current context, None = not captured
+_targets: ContextVar[tuple[TextIO, TextIO] | None] = ContextVar(
+    "bifrost_output_capture", default=None
+)
+
+_install_lock = threading.Lock()
+_users = 0
+
+
+class _RoutedStream:
+    """Stream that writes to the current context's capture target."""
+
+    def __init__(self, original: TextIO, index: int):
+        self.original = original
+        self._index = index
+
+    def _target(self) -> TextIO:
+        targets = _targets.get()
+        return self.original if targets is None else targets[self._index]
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def writelines(self, lines: Any) -> None:
+        self._target().writelines(lines)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+def _install() -> None:
+    """Route sys.stdout/sys.stderr through the current context."""
+    global _users
+    with _install_lock:
+        if not isinstance(sys.stdout, _RoutedStream):
+            sys.stdout = _RoutedStream(sys.stdout, 0)  # type: ignore[assignment]
+        if not isinstance(sys.stderr, _RoutedStream):
+            sys.stderr = _RoutedStream(sys.stderr, 1)  # type: ignore[assignment]
+        _users += 1
+
+
+def _uninstall() -> None:
+    """Restore the original streams once no capture is active."""
+    global _users
+    with _install_lock:
+        _users -= 1
+        if _users > 0:
+            return
+        if isinstance(sys.stdout, _RoutedStream):
+            sys.stdout = sys.stdout.original
+        if isinstance(sys.stderr, _RoutedStream):
+            sys.stderr = sys.stderr.original
+
+
+@contextmanager
+def capture_output(stdout: TextIO, stderr: TextIO) -> Iterator[None]:
+    """
+    Capture stdout/stderr written by the current context.
+
+    Args:
+        stdout: Stream receiving the context's stdout writes
+        stderr: Stream receiving the context's stderr writes
+    """
+    _install()
+    token = _targets.set((stdout, stderr))
+    try:
+        yield
+    finally:
+        _targets.reset(token)
+        _uninstall()
@@ -11,15 +11,36 @@ Key features:
 - Crash detection and process replacement
 - Heartbeat publishing for UI visibility
 - Manual process recycling via API
+- Optional workers forked from a preloaded template process ("forkserver" spawn mode)
 
 Architecture:
     ProcessPoolManager (runs in consumer process)
         |
         +-- min_workers to max_workers processes
-        +-- Each process: work_queue (in) + result_queue (out)
+        +-- Each process: work_queue (in) + result_queue (out), both pipes
+        |   (see worker_channel)
         +-- Monitor loop checks health and timeouts
-        +-- Result loop collects execution results
+        +-- Result loop handles execution results as workers write them
+        |   (each result pipe is watched with loop.add_reader)
         +-- Heartbeat loop publishes status to Redis/WebSocket
+
+The execution context is sent to the worker with the execution_id over
+its work pipe. The copy written to Redis (bifrost:exec:{id}:context) is
+written in the background and only read for crash recovery and queue
+reporting.
+
+Spawn modes (settings.worker_spawn_mode):
+    "spawn"      - each worker is a fresh interpreter that imports src,
+                   SQLAlchemy, pydantic, httpx and the SDK itself (default)
+    "forkserver" - opt-in: a multiprocessing forkserver preloads
+                   worker_template (heavy imports, cached requirements,
+                   virtual import hook) once, and workers are forked from it
+
+After a package install the template is stale: replacements use "spawn"
+until every worker forked from the old template has exited, then the
+forkserver is restarted so the next workers fork from a fresh template.
+Restarting relies on CPython internals of multiprocessing.forkserver; if
+they are unavailable the pool falls back to "spawn" for good.
 """
 
 from __future__ import annotations
@@ -28,14 +49,18 @@ import asyncio
 import json
 import logging
 import multiprocessing
+import multiprocessing.forkserver
 import os
+import pickle
 import signal
 import subprocess
+import sys
+import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from multiprocessing import Queue as MPQueue
 from queue import Empty
 from typing import Any, Awaitable, Callable
 
@@ -43,10 +68,31 @@ import psutil
 import redis.asyncio as redis
 
 from src.config import get_settings
-from src.services.execution.simple_worker import run_worker_process as simple_run_worker_process
+from src.services.execution.simple_worker import (
+    WORKER_CANCEL_MESSAGE,
+    WORKER_READY_MESSAGE,
+    run_worker_process as simple_run_worker_process,
+)
+from src.services.execution.worker_channel import WorkerChannel, channel_pair
 
 logger = logging.getLogger(__name__)
 
+# Worker process start methods (see module docstring)
+SPAWN_MODES = ("spawn", "forkserver")
+
+# Module preloaded by the forkserver in "forkserver" mode
+WORKER_TEMPLATE_MODULE = "src.services.execution.worker_template"
+
+# Number of recent spawn-to-ready latencies kept for the heartbeat
+SPAWN_LATENCY_SAMPLES = 50
+
+# Contexts larger than this (encoded) are written to the work pipe from a
+# thread, so a slow reader can't block the event loop (Linux pipe buffer)
+INLINE_SEND_MAX_BYTES = 64 * 1024
+
+# TTL of the crash-recovery context copy in Redis
+CONTEXT_TTL_SECONDS = 3600
+
 
 def _get_installed_packages() -> list[dict[str, str]]:
     """
@@ -75,7 +121,7 @@ class ProcessState(Enum):
 
     States:
     - IDLE: Ready to accept work
-    - BUSY: Currently executing
+    - BUSY: Currently executing (with async slots, may still have free slots)
     - KILLED: Process was terminated (pending removal)
     """
 
@@ -93,11 +139,13 @@ class ExecutionInfo:
         execution_id: Unique identifier for the execution
         started_at: When the execution started
         timeout_seconds: Execution timeout in seconds
+        cancel_requested_at: When the worker was asked to cancel it (async slots)
     """
 
     execution_id: str
     started_at: datetime
     timeout_seconds: int
+    cancel_requested_at: datetime | None = None
 
     @property
     def elapsed_seconds(self) -> float:
@@ -120,23 +168,37 @@ class ProcessHandle:
         process: The multiprocessing.Process instance
         pid: Process ID (set after process.start())
         state: Current ProcessState
-        work_queue: Queue for sending execution_ids to process
-        result_queue: Queue for receiving results from process
+        work_queue: Channel for sending executions (id + context) to process
+        send_lock: Held while a message is written to work_queue, so the
+            event loop never waits on a write running in a thread
+        result_queue: Channel for receiving results from process
         started_at: When the process was spawned
-        current_execution: Info about current execution (if BUSY)
+        current_execution: Info about current execution (if BUSY; the most
+            recently routed one when running several)
+        executions: Running executions by ID
+        slots: Executions the process runs concurrently (async slots)
         executions_completed: Number of executions this process has completed
+        spawn_mode: Start method used for this process ("spawn" or "forkserver")
+        spawned_monotonic: time.monotonic() just before the process was started
+        ready_ms: Spawn-to-ready latency, once the worker reported ready
     """
 
     id: str
     process: Any  # multiprocessing.Process or SpawnProcess
     pid: int | None
     state: ProcessState
-    work_queue: MPQueue  # type: ignore[type-arg]
-    result_queue: MPQueue  # type: ignore[type-arg]
+    work_queue: WorkerChannel
+    result_queue: WorkerChannel
     started_at: datetime
+    send_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     current_execution: ExecutionInfo | None = None
+    executions: dict[str, ExecutionInfo] = field(default_factory=dict)
+    slots: int = 1
     executions_completed: int = 0
     pending_recycle: bool = False  # Mark for recycle after current execution
+    spawn_mode: str = "spawn"
+    spawned_monotonic: float = 0.0
+    ready_ms: float | None = None
 
     @property
     def is_alive(self) -> bool:
@@ -148,6 +210,37 @@ class ProcessHandle:
         """Seconds since process was started."""
         return (datetime.now(timezone.utc) - self.started_at).total_seconds()
 
+    @property
+    def running_executions(self) -> list[ExecutionInfo]:
+        """Executions currently running in this process."""
+        if self.executions:
+            return list(self.executions.values())
+        return [self.current_execution] if self.current_execution else []
+
+    @property
+    def free_slots(self) -> int:
+        """Number of additional executions this process can accept."""
+        if self.pending_recycle or self.state == ProcessState.KILLED:
+            return 0
+        if self.state == ProcessState.IDLE:
+            return self.slots
+        if self.slots == 1:
+            return 0
+        return max(0, self.slots - len(self.running_executions))
+
+
+def _main_module_preload() -> list[str]:
+    """
+    Forkserver preload entry for this process's main module.
+
+    Only for `python -m package.module` (how the worker runs): children
+    re-run the module by name, so preloading it caches its imports.
+    """
+    spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+    if spec is not None and not spec.name.endswith("__main__"):
+        return [spec.name]
+    return []
+
 
 # Type alias for result callback
 ResultCallback = Callable[[dict[str, Any]], Awaitable[None]]
@@ -160,7 +253,8 @@ class ProcessPoolManager:
     The ProcessPoolManager:
     1. Spawns min_workers processes on startup
     2. Scales up to max_workers under load
-    3. Routes executions to IDLE processes
+    3. Routes executions to processes with a free slot (one per process,
+       or async_slots when workers run executions concurrently)
     4. Monitors for timeouts and crashes
     5. Publishes heartbeats for UI visibility
 
@@ -189,6 +283,8 @@ class ProcessPoolManager:
         heartbeat_interval_seconds: int = 10,
         registration_ttl_seconds: int = 30,
         on_result: ResultCallback | None = None,
+        spawn_mode: str = "spawn",
+        async_slots: int = 1,
     ):
         """
         Initialize the process pool manager.
@@ -202,6 +298,9 @@ class ProcessPoolManager:
             heartbeat_interval_seconds: Interval for heartbeat publications
             registration_ttl_seconds: TTL for worker registration in Redis
             on_result: Async callback for handling execution results
+            spawn_mode: Worker start method, "spawn" or "forkserver"
+            async_slots: Executions each worker runs concurrently on one
+                event loop (1 = one at a time)
         """
         self.min_workers = min_workers
         self.max_workers = max_workers
@@ -211,6 +310,18 @@ class ProcessPoolManager:
         self.heartbeat_interval_seconds = heartbeat_interval_seconds
         self.registration_ttl_seconds = registration_ttl_seconds
         self.on_result = on_result
+        if spawn_mode not in SPAWN_MODES:
+            logger.warning(f"Unknown worker spawn mode {spawn_mode!r}, using 'spawn'")
+            spawn_mode = "spawn"
+        self.spawn_mode = spawn_mode
+        self.async_slots = max(1, async_slots)
+
+        # Worker template state ("forkserver" mode)
+        self._template_configured = False
+        self._template_stale = False
+
+        # Recent spawn-to-ready latencies (ms)
+        self._ready_latencies: deque[float] = deque(maxlen=SPAWN_LATENCY_SAMPLES)
 
         # Worker ID from HOSTNAME env var (Docker container name) or UUID
         self.worker_id = os.environ.get("HOSTNAME", str(uuid.uuid4()))
@@ -222,6 +333,7 @@ class ProcessPoolManager:
         # State
         self._shutdown = False
         self._started = False
+        self._waiting_executions = 0  # route_execution calls waiting for a slot
 
         # Async tasks
         self._monitor_task: asyncio.Task[None] | None = None
@@ -236,6 +348,12 @@ class ProcessPoolManager:
         # Lock for idle process waiting
         self._idle_condition = asyncio.Condition()
 
+        # Messages read from result pipes, handled in order by the result loop
+        self._results: asyncio.Queue[tuple[ProcessHandle, dict[str, Any]]] = asyncio.Queue()
+
+        # Background writes of crash-recovery context copies
+        self._context_writes: set[asyncio.Task[None]] = set()
+
     async def _get_redis(self) -> redis.Redis:  # type: ignore[type-arg]
         """Get or create Redis connection."""
         if self._redis is None:
@@ -246,20 +364,39 @@ class ProcessPoolManager:
             )
         return self._redis
 
+    def _get_spawn_context(self) -> tuple[str, Any]:
+        """
+        Get the multiprocessing context for the next worker.
+
+        Returns:
+            Tuple of (spawn mode, multiprocessing context)
+        """
+        if self.spawn_mode != "forkserver" or self._template_stale:
+            return "spawn", multiprocessing.get_context("spawn")
+
+        ctx = multiprocessing.get_context("forkserver")
+        if not self._template_configured:
+            # Only takes effect when the forkserver (re)starts. The main
+            # module is preloaded too: every child re-runs it as __mp_main__,
+            # and its imports must not go through the virtual import hook.
+            ctx.set_forkserver_preload(_main_module_preload() + [WORKER_TEMPLATE_MODULE])
+            self._template_configured = True
+        return "forkserver", ctx
+
     def _spawn_process(self) -> ProcessHandle:
         """
         Spawn a new worker process.
 
-        Creates queues for communication and starts the worker process.
+        Creates pipes for communication and starts the worker process.
         The new process is set to IDLE state.
 
         Returns:
             ProcessHandle instance for the new process
         """
-        # Create communication queues
-        ctx = multiprocessing.get_context("spawn")
-        work_queue: MPQueue[str] = ctx.Queue()
-        result_queue: MPQueue[dict[str, Any]] = ctx.Queue()
+        # Create communication pipes: (pool end, worker end)
+        spawn_mode, ctx = self._get_spawn_context()
+        work_reader, work_queue = channel_pair(ctx)
+        result_queue, result_writer = channel_pair(ctx)
 
         # Generate process ID
         self._process_counter += 1
@@ -271,11 +408,17 @@ class ProcessPoolManager:
         # - Workspace module clearing between executions
         process = ctx.Process(
             target=simple_run_worker_process,
-            args=(work_queue, result_queue, process_id),
+            args=(work_reader, result_writer, process_id, self.async_slots),
             name=process_id,
         )
+        spawned_monotonic = time.monotonic()
         process.start()
 
+        # The worker has its own copies now. Closing ours means the pool
+        # sees EOF on the result pipe as soon as the worker exits.
+        work_reader.close()
+        result_writer.close()
+
         # Create handle
         handle = ProcessHandle(
             id=process_id,
@@ -286,17 +429,94 @@ class ProcessPoolManager:
             result_queue=result_queue,
             started_at=datetime.now(timezone.utc),
             current_execution=None,
+            slots=self.async_slots,
             executions_completed=0,
+            spawn_mode=spawn_mode,
+            spawned_monotonic=spawned_monotonic,
         )
 
         self.processes[process_id] = handle
+        self._watch_results(handle)
 
         logger.info(
-            f"Spawned worker process {process_id} with PID={process.pid}"
+            f"Spawned worker process {process_id} with PID={process.pid} ({spawn_mode}"
+            f"{f', {self.async_slots} slots' if self.async_slots > 1 else ''})"
         )
 
         return handle
 
+    def _watch_results(self, handle: ProcessHandle) -> None:
+        """Wake the result loop whenever the process writes a message."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.add_reader(handle.result_queue.fileno(), self._on_result_readable, handle)
+
+    def _unwatch_results(self, handle: ProcessHandle) -> None:
+        """Stop watching a process's result pipe and close its channels."""
+        if handle.result_queue.closed:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(handle.result_queue.fileno())
+        except RuntimeError:
+            pass
+        handle.result_queue.close()
+        handle.work_queue.close()
+
+    def _on_result_readable(self, handle: ProcessHandle) -> None:
+        """Read one message from a process's result pipe (reader callback)."""
+        try:
+            message = handle.result_queue.get_nowait()
+        except Empty:
+            return
+        except (EOFError, OSError):
+            # Process exited - health checks take care of the handle
+            self._unwatch_results(handle)
+            return
+        except Exception as e:
+            logger.exception(f"Failed to read result from {handle.id}: {e}")
+            return
+        self._results.put_nowait((handle, message))
+
+    def _handle_worker_ready(self, handle: ProcessHandle, message: dict[str, Any]) -> None:
+        """Record a worker's spawn-to-ready latency."""
+        handle.ready_ms = (time.monotonic() - handle.spawned_monotonic) * 1000
+        self._ready_latencies.append(handle.ready_ms)
+        logger.info(
+            f"Worker process {handle.id} ready in {handle.ready_ms:.0f}ms ({handle.spawn_mode})"
+        )
+
+    def _maybe_restart_worker_template(self) -> None:
+        """
+        Restart a stale worker template once nothing forked from it is left.
+
+        Stopping the forkserver while its children run would make them look
+        dead to the pool (their exit status is reported through it), so this
+        waits for all of them to exit first. multiprocessing has no public
+        way to stop its forkserver; if the private one fails, workers are
+        spawned from then on.
+        """
+        if not self._template_stale:
+            return
+
+        try:
+            server = multiprocessing.forkserver._forkserver
+            template_pid = server._forkserver_pid
+            if template_pid is not None:
+                try:
+                    if psutil.Process(template_pid).children():
+                        return
+                except psutil.NoSuchProcess:
+                    pass
+                server._stop()
+                logger.info("Stopped stale worker template; next workers fork from a fresh one")
+        except Exception as e:
+            logger.warning(f"Could not restart the worker template, using 'spawn' from now on: {e}")
+            self.spawn_mode = "spawn"
+
+        self._template_stale = False
+
     async def start(self) -> None:
         """
         Start the pool manager and spawn initial workers.
@@ -433,6 +653,11 @@ class ProcessPoolManager:
         # Terminate all processes
         for handle in list(self.processes.values()):
             await self._terminate_process(handle)
+            self._unwatch_results(handle)
+
+        # Let pending crash-recovery context writes finish
+        if self._context_writes:
+            await asyncio.gather(*self._context_writes, return_exceptions=True)
 
         # Unregister from Redis
         await self._unregister_worker()
@@ -499,23 +724,43 @@ class ProcessPoolManager:
                 return handle
         return None
 
-    async def _wait_for_idle_process(self, timeout: float = 30.0) -> ProcessHandle | None:
+    def _get_free_slot_process(self) -> ProcessHandle | None:
         """
-        Wait for an idle process to become available.
+        Get the process with the most free slots.
+
+        With one slot per process this is the first IDLE process. With
+        async slots, idle processes are preferred so executions spread
+        across processes before they share an event loop.
+
+        Returns:
+            ProcessHandle with a free slot, or None if every slot is taken
+        """
+        best: ProcessHandle | None = None
+        for handle in self.processes.values():
+            free = handle.free_slots
+            if free == 0 or not handle.is_alive:
+                continue
+            if best is None or free > best.free_slots:
+                best = handle
+        return best
+
+    async def _wait_for_free_slot(self, timeout: float = 30.0) -> ProcessHandle | None:
+        """
+        Wait for a slot to become available.
 
         Args:
             timeout: Maximum seconds to wait
 
         Returns:
-            ProcessHandle with IDLE state, or None if timeout
+            ProcessHandle with a free slot, or None if timeout
         """
         async with self._idle_condition:
             try:
                 await asyncio.wait_for(
-                    self._idle_condition.wait_for(lambda: self._get_idle_process() is not None),
+                    self._idle_condition.wait_for(lambda: self._get_free_slot_process() is not None),
                     timeout=timeout
                 )
-                return self._get_idle_process()
+                return self._get_free_slot_process()
             except asyncio.TimeoutError:
                 return None
 
@@ -525,64 +770,111 @@ class ProcessPoolManager:
         context: dict[str, Any],
     ) -> None:
         """
-        Route an execution to an idle process.
+        Route an execution to a process with a free slot.
 
-        The context is written to Redis, and the execution_id is sent
-        to the process via the work queue.
+        The execution_id and the JSON-encoded context are sent to the
+        process via its work pipe. A copy of the context is written to
+        Redis in the background for crash recovery.
 
         Args:
             execution_id: Unique identifier for the execution
-            context: Execution context data (written to Redis)
+            context: Execution context data
         """
-        # Write context to Redis
-        await self._write_context_to_redis(execution_id, context)
+        context_json = json.dumps(context, default=str)
+
+        # Crash-recovery copy (not on the dispatch path)
+        write = asyncio.create_task(self._write_context_to_redis(execution_id, context_json))
+        self._context_writes.add(write)
+        write.add_done_callback(self._context_writes.discard)
 
-        # Find or create idle process
-        idle = self._get_idle_process()
-        if idle is None:
+        # Find a free slot or create a process
+        target = self._get_free_slot_process()
+        if target is None:
             # Scale up if possible
             if len(self.processes) < self.max_workers:
-                idle = self._spawn_process()
+                target = self._spawn_process()
             else:
-                # Wait for a process to become idle
-                idle = await self._wait_for_idle_process()
-                if idle is None:
-                    raise RuntimeError("No idle process available after timeout")
+                # Wait for a slot to free up
+                self._waiting_executions += 1
+                try:
+                    target = await self._wait_for_free_slot()
+                finally:
+                    self._waiting_executions -= 1
+                if target is None:
+                    raise RuntimeError("No free process slot available after timeout")
 
         # Get timeout from context or use default
         timeout = context.get("timeout_seconds", self.execution_timeout_seconds)
 
         # Assign work
-        idle.state = ProcessState.BUSY
-        idle.current_execution = ExecutionInfo(
+        exec_info = ExecutionInfo(
             execution_id=execution_id,
             started_at=datetime.now(timezone.utc),
             timeout_seconds=timeout,
         )
-
-        # Send to process
-        idle.work_queue.put_nowait(execution_id)
+        target.state = ProcessState.BUSY
+        target.executions[execution_id] = exec_info
+        target.current_execution = exec_info
+
+        # Send to process (the encoded context goes out-of-band, unpickled)
+        context_bytes = context_json.encode()
+        message = {
+            "execution_id": execution_id,
+            "context": pickle.PickleBuffer(context_bytes),
+            "timeout_seconds": timeout,
+        }
+        await self._send_work(
+            target, message, offload=len(context_bytes) > INLINE_SEND_MAX_BYTES
+        )
 
         logger.info(
-            f"Routed {execution_id[:8]}... to {idle.id} "
+            f"Routed {execution_id[:8]}... to {target.id} "
             f"(timeout={timeout}s)"
         )
 
+    async def _send_work(
+        self,
+        handle: ProcessHandle,
+        message: dict[str, Any],
+        offload: bool = False,
+    ) -> None:
+        """
+        Write a message to a process's work channel.
+
+        Writes to one channel are serialized by the handle's send_lock:
+        with async slots, routing and cancels for the same process can
+        overlap, and a large message written from a thread would otherwise
+        interleave its frames with another message.
+
+        Args:
+            handle: Target process
+            message: Message to send
+            offload: Write from a thread (large messages may fill the pipe)
+        """
+        async with handle.send_lock:
+            if offload:
+                await asyncio.to_thread(handle.work_queue.put_nowait, message)
+            else:
+                handle.work_queue.put_nowait(message)
+
     async def _write_context_to_redis(
         self,
         execution_id: str,
-        context: dict[str, Any],
+        context_json: str,
     ) -> None:
         """
-        Write execution context to Redis for worker to read.
+        Write the crash-recovery copy of an execution context to Redis.
 
         Args:
             execution_id: Execution ID
-            context: Context data to store
+            context_json: JSON-encoded context data
         """
-        r = await self._get_redis()
-        context_key = f"bifrost:exec:{execution_id}:context"
-        await r.setex(context_key, 3600, json.dumps(context, default=str))
+        try:
+            r = await self._get_redis()
+            context_key = f"bifrost:exec:{execution_id}:context"
+            await r.setex(context_key, CONTEXT_TTL_SECONDS, context_json)
+        except Exception as e:
+            logger.warning(f"Failed to write context copy for {execution_id[:8]}...: {e}")
 
     async def _monitor_loop(self) -> None:
         """
@@ -592,6 +884,7 @@ class ProcessPoolManager:
         1. Check for timed-out executions and kill processes
         2. Check for crashed processes and replace them
         3. Scale down excess idle processes
+        4. Restart a stale worker template once it has no children
         """
         logger.info("Monitor loop started")
 
@@ -600,6 +893,7 @@ class ProcessPoolManager:
                 await self._check_timeouts()
                 await self._check_process_health()
                 await self._maybe_scale_down()
+                self._maybe_restart_worker_template()
             except Exception as e:
                 logger.exception(f"Monitor loop error: {e}")
 
@@ -611,36 +905,77 @@ class ProcessPoolManager:
         """
         Check for timed-out executions and kill their processes.
 
-        For each BUSY process, checks if the execution has exceeded
-        its timeout. If so, kills the process and spawns a replacement.
+        For each BUSY process, checks if an execution has exceeded its
+        timeout. If so, kills the process and spawns a replacement.
+
+        With async slots the worker times out (and cancels) each task
+        itself, so the process is only killed when a task has not stopped
+        graceful_shutdown_seconds after its timeout or cancellation, e.g.
+        because it blocks the event loop.
         """
         for handle in list(self.processes.values()):
             if handle.state != ProcessState.BUSY:
                 continue
-            if handle.current_execution is None:
-                continue
 
-            exec_info = handle.current_execution
-            elapsed = exec_info.elapsed_seconds
+            for exec_info in handle.running_executions:
+                if self._cancel_overdue(exec_info):
+                    logger.warning(
+                        f"Execution {exec_info.execution_id} did not stop after "
+                        f"cancellation, killing {handle.id}"
+                    )
+                    await self._kill_and_report(handle, exec_info, self._report_cancellation)
+                    break
 
-            if elapsed > exec_info.timeout_seconds:
-                logger.warning(
-                    f"Execution {exec_info.execution_id} timed out after "
-                    f"{elapsed:.1f}s (timeout={exec_info.timeout_seconds}s)"
-                )
+                elapsed = exec_info.elapsed_seconds
+                limit = exec_info.timeout_seconds
+                if handle.slots > 1:
+                    limit += self.graceful_shutdown_seconds
+
+                if elapsed > limit:
+                    logger.warning(
+                        f"Execution {exec_info.execution_id} timed out after "
+                        f"{elapsed:.1f}s (timeout={exec_info.timeout_seconds}s)"
+                    )
+                    await self._kill_and_report(handle, exec_info, self._report_timeout)
+                    break
+
+    def _cancel_overdue(self, exec_info: ExecutionInfo) -> bool:
+        """Check if a worker failed to cancel an execution in time."""
+        if exec_info.cancel_requested_at is None:
+            return False
+        waited = (datetime.now(timezone.utc) - exec_info.cancel_requested_at).total_seconds()
+        return waited > self.graceful_shutdown_seconds
 
-                # Kill process
-                await self._kill_process(handle)
+    async def _kill_and_report(
+        self,
+        handle: ProcessHandle,
+        exec_info: ExecutionInfo,
+        report: Callable[[ExecutionInfo], Awaitable[None]],
+    ) -> None:
+        """
+        Kill a process, report its executions and replace it.
 
-                # Report timeout
-                await self._report_timeout(exec_info)
+        Args:
+            handle: ProcessHandle to kill
+            exec_info: Execution that caused the kill, passed to report
+            report: Reporter for exec_info (timeout or cancellation); other
+                executions sharing the process are reported as crashed
+        """
+        others = [e for e in handle.running_executions if e is not exec_info]
 
-                # Remove from pool
-                del self.processes[handle.id]
+        # Kill process
+        await self._kill_process(handle)
 
-                # Spawn replacement if below min_workers
-                if len(self.processes) < self.min_workers:
-                    self._spawn_process()
+        await report(exec_info)
+        for other in others:
+            await self._report_crash(other)
+
+        # Remove from pool (may already be gone after a recycle)
+        self.processes.pop(handle.id, None)
+
+        # Spawn replacement if below min_workers
+        if len(self.processes) < self.min_workers:
+            self._spawn_process()
 
     async def _kill_process(self, handle: ProcessHandle) -> None:
         """
@@ -874,30 +1209,36 @@ class ProcessPoolManager:
         """
         Handle cancellation request for a running execution.
 
-        Finds the process handling the execution and kills it.
+        Finds the process handling the execution and kills it. With async
+        slots only the execution's task is cancelled (by the worker); the
+        monitor loop kills the process if the task does not stop.
 
         Args:
             execution_id: Execution ID to cancel
         """
         # Find process handling this execution
         for handle in list(self.processes.values()):
-            if (
-                handle.current_execution
-                and handle.current_execution.execution_id == execution_id
-            ):
-                logger.info(f"Cancelling execution {execution_id[:8]}...")
+            for exec_info in handle.running_executions:
+                if exec_info.execution_id != execution_id:
+                    continue
 
-                # Kill process (same as timeout)
-                await self._kill_process(handle)
-
-                # Report cancellation
-                await self._report_cancellation(handle.current_execution)
+                logger.info(f"Cancelling execution {execution_id[:8]}...")
 
-                # Remove from pool and replace
-                del self.processes[handle.id]
-                if len(self.processes) < self.min_workers:
-                    self._spawn_process()
+                if handle.slots > 1:
+                    if exec_info.cancel_requested_at is not None:
+                        return
+                    exec_info.cancel_requested_at = datetime.now(timezone.utc)
+                    try:
+                        await self._send_work(handle, {
+                            "type": WORKER_CANCEL_MESSAGE,
+                            "execution_id": execution_id,
+                        })
+                        return
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Could not send cancel to {handle.id}: {e}")
 
+                # Kill process (same as timeout)
+                await self._kill_and_report(handle, exec_info, self._report_cancellation)
                 return
 
         logger.debug(
@@ -940,9 +1281,9 @@ class ProcessPoolManager:
                     f"(exit_code={handle.process.exitcode})"
                 )
 
-                # Report crash if there was an execution in progress
-                if handle.current_execution:
-                    await self._report_crash(handle.current_execution)
+                # Report crash for executions in progress
+                for exec_info in handle.running_executions:
+                    await self._report_crash(exec_info)
 
                 to_remove.append(process_id)
 
@@ -1029,27 +1370,26 @@ class ProcessPoolManager:
 
     async def _result_loop(self) -> None:
         """
-        Collect results from all process result queues.
+        Handle results from worker processes as they arrive.
 
-        Polls result queues from all processes (non-blocking) and
-        handles completed executions.
+        Messages are read by _on_result_readable (registered with
+        loop.add_reader for every result pipe) and handled here in order.
+        Messages from processes no longer in the pool (killed after a
+        timeout or cancellation) are dropped.
         """
         logger.info("Result loop started")
 
         while not self._shutdown:
+            handle, result = await self._results.get()
             try:
-                for handle in list(self.processes.values()):
-                    try:
-                        result = handle.result_queue.get_nowait()
-                        await self._handle_result(handle, result)
-                    except Empty:
-                        pass
-                    except Exception as e:
-                        logger.exception(f"Result loop error for {handle.id}: {e}")
+                if self.processes.get(handle.id) is not handle:
+                    continue
+                if result.get("type") == WORKER_READY_MESSAGE:
+                    self._handle_worker_ready(handle, result)
+                    continue
+                await self._handle_result(handle, result)
             except Exception as e:
-                logger.exception(f"Result loop error: {e}")
-
-            await asyncio.sleep(0.1)
+                logger.exception(f"Result loop error for {handle.id}: {e}")
 
         logger.info("Result loop stopped")
 
@@ -1065,27 +1405,31 @@ class ProcessPoolManager:
             handle: ProcessHandle that produced the result
             result: Result data from the worker
         """
-        # Clear current execution
-        handle.current_execution = None
+        # Clear the finished execution
+        handle.executions.pop(result.get("execution_id"), None)
+        handle.current_execution = next(iter(handle.executions.values()), None)
         handle.executions_completed += 1
 
-        # Check if should recycle (pending flag or execution count threshold)
-        if handle.pending_recycle:
+        # Check if should recycle (pending flag or execution count threshold).
+        # A process running other executions (async slots) gets no new work
+        # and is recycled once they finish.
+        if (
+            self.recycle_after_executions > 0
+            and handle.executions_completed >= self.recycle_after_executions
+        ):
+            handle.pending_recycle = True
+
+        if handle.pending_recycle and handle.current_execution is None:
             logger.info(f"Recycling process {handle.id} (pending recycle flag)")
             await self._recycle_process(handle)
-            return
-
-        if self.recycle_after_executions > 0:
-            if handle.executions_completed >= self.recycle_after_executions:
-                await self._recycle_process(handle)
-                return
-
-        # Return to IDLE state
-        handle.state = ProcessState.IDLE
+        elif not handle.pending_recycle:
+            # Return to IDLE state once nothing is running
+            if handle.current_execution is None:
+                handle.state = ProcessState.IDLE
 
-        # Notify any waiters that an idle process is available
-        async with self._idle_condition:
-            self._idle_condition.notify_all()
+            # Notify any waiters that a slot is available
+            async with self._idle_condition:
+                self._idle_condition.notify_all()
 
         # Forward result to callback
         if self.on_result:
@@ -1366,6 +1710,10 @@ class ProcessPoolManager:
         idle_handles: list[ProcessHandle] = []
         marked_for_later = 0
 
+        # The template preloaded modules that may have just changed
+        if self.spawn_mode == "forkserver":
+            self._template_stale = True
+
         for handle in list(self.processes.values()):
             if handle.state == ProcessState.IDLE:
                 # Idle process - mark for immediate recycle
@@ -1517,6 +1865,8 @@ class ProcessPoolManager:
                 "uptime_seconds": p.uptime_seconds,
                 "executions_completed": p.executions_completed,
                 "pending_recycle": p.pending_recycle,
+                "spawn_mode": p.spawn_mode,
+                "ready_ms": p.ready_ms,
             }
             if p.current_execution:
                 info["execution"] = {
@@ -1524,6 +1874,16 @@ class ProcessPoolManager:
                     "started_at": p.current_execution.started_at.isoformat(),
                     "elapsed_seconds": p.current_execution.elapsed_seconds,
                 }
+            if p.slots > 1:
+                info["slots"] = p.slots
+                info["executions"] = [
+                    {
+                        "execution_id": e.execution_id,
+                        "started_at": e.started_at.isoformat(),
+                        "elapsed_seconds": e.elapsed_seconds,
+                    }
+                    for e in p.running_executions
+                ]
             processes.append(info)
 
         idle_count = len([p for p in self.processes.values() if p.state == ProcessState.IDLE])
@@ -1541,6 +1901,24 @@ class ProcessPoolManager:
             "busy_count": busy_count,
             "min_workers": self.min_workers,
             "max_workers": self.max_workers,
+            "spawn_mode": self.spawn_mode,
+            "spawn_ready_ms": self._spawn_latency_summary(),
+            "async_slots": self.async_slots,
+            "free_slots": sum(p.free_slots for p in self.processes.values() if p.is_alive),
+            "running_count": sum(len(p.running_executions) for p in self.processes.values()),
+            "waiting_count": self._waiting_executions,
+        }
+
+    def _spawn_latency_summary(self) -> dict[str, Any]:
+        """Summarize recent spawn-to-ready latencies (ms)."""
+        samples = sorted(self._ready_latencies)
+        if not samples:
+            return {"count": 0, "last": None, "avg": None, "p95": None}
+        return {
+            "count": len(samples),
+            "last": round(self._ready_latencies[-1], 1),
+            "avg": round(sum(samples) / len(samples), 1),
+            "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
         }
 
     def _get_process_memory(self, pid: int | None) -> float:
@@ -1625,6 +2003,8 @@ def get_process_pool() -> ProcessPoolManager:
             recycle_after_executions=settings.recycle_after_executions,
             heartbeat_interval_seconds=settings.worker_heartbeat_interval_seconds,
             registration_ttl_seconds=settings.worker_registration_ttl_seconds,
+            spawn_mode=settings.worker_spawn_mode,
+            async_slots=settings.worker_async_slots,
         )
     return _pool
 
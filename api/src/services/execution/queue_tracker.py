@@ -2,10 +2,25 @@
 Queue position tracking for workflow executions.
 
 Uses a Redis sorted set to track pending executions and provide
-queue position visibility. Updates are event-driven - positions
-are recalculated and published when the queue changes.
+queue position visibility.
+
+Positions are not pushed to every queued execution on each change.
+Instead, every removal from the queue bumps a counter (the queue epoch):
+
+1. On enqueue, the execution gets its rank and the current epoch (one
+   message to that execution only)
+2. On removal, one compact queue_update message with the new epoch and
+   depth is published on the shared "queue" channel, coalesced to at
+   most one per QUEUE_UPDATE_INTERVAL_SECONDS per process
+3. Clients compute position = rank - (epoch - enqueue_epoch), clamped
+   to [1, depth]
+
+This is exact while the queue drains in order; removals behind an
+execution (e.g. a later one being cancelled) make the estimate low until
+the next exact position is sent (on subscribe via get_queue_ticket()).
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -17,9 +32,21 @@ logger = logging.getLogger(__name__)
 # Redis key for the queue sorted set
 QUEUE_KEY = "bifrost:queue:pending"
 
+# Redis key for the removal counter (queue epoch)
+QUEUE_EPOCH_KEY = "bifrost:queue:epoch"
+
+# Pub/sub channel for queue_update messages
+QUEUE_CHANNEL = "queue"
+
+# Minimum time between queue_update messages from one process
+QUEUE_UPDATE_INTERVAL_SECONDS = 0.25
+
 # Module-level redis client
 _redis: aioredis.Redis | None = None
 
+# Pending coalesced queue_update publish (one per process)
+_update_task: asyncio.Task | None = None
+
 
 async def _get_redis() -> aioredis.Redis:
     """Get Redis client, creating if needed."""
@@ -37,7 +64,10 @@ async def _get_redis() -> aioredis.Redis:
 
 async def add_to_queue(execution_id: str) -> int:
     """
-    Add execution to queue tracking and publish position updates.
+    Add execution to queue tracking and publish its starting position.
+
+    Only the new execution is notified: appending to the queue doesn't
+    change anyone else's position.
 
     Args:
         execution_id: Unique execution ID
@@ -48,24 +78,26 @@ async def add_to_queue(execution_id: str) -> int:
     r = await _get_redis()
     timestamp = time.time()
 
-    # Add to sorted set with timestamp as score
-    await r.zadd(QUEUE_KEY, {execution_id: timestamp})
+    # Add to sorted set with timestamp as score, then read rank and epoch
+    pipe = r.pipeline(transaction=True)
+    pipe.zadd(QUEUE_KEY, {execution_id: timestamp})
+    pipe.zrank(QUEUE_KEY, execution_id)
+    pipe.get(QUEUE_EPOCH_KEY)
+    _, rank, epoch = await pipe.execute()
 
-    # Get position (0-based rank + 1 for 1-based position)
-    rank = await r.zrank(QUEUE_KEY, execution_id)
+    # Convert 0-based rank to 1-based position
     position = (rank + 1) if rank is not None else 1
 
     logger.debug(f"Added execution {execution_id} to queue at position {position}")
 
-    # Publish updated positions to all queued executions
-    await publish_all_queue_positions()
+    await publish_queue_ticket(execution_id, position, int(epoch or 0))
 
     return position
 
 
 async def remove_from_queue(execution_id: str) -> None:
     """
-    Remove execution from queue tracking and publish position updates.
+    Remove execution from queue tracking and schedule a queue update.
 
     Called when execution starts running or is cancelled before starting.
 
@@ -79,8 +111,8 @@ async def remove_from_queue(execution_id: str) -> None:
 
     if removed:
         logger.debug(f"Removed execution {execution_id} from queue")
-        # Publish updated positions to remaining queued executions
-        await publish_all_queue_positions()
+        await r.incrby(QUEUE_EPOCH_KEY, removed)
+        schedule_queue_update()
 
 
 async def get_queue_position(execution_id: str) -> int | None:
@@ -128,30 +160,96 @@ async def get_all_queue_positions() -> list[tuple[str, int]]:
     return [(member, idx + 1) for idx, member in enumerate(members)]
 
 
-async def publish_all_queue_positions() -> None:
+async def get_queue_ticket(execution_id: str) -> tuple[int, int] | None:
+    """
+    Get an execution's exact position together with the current epoch.
+
+    Used to (re)seed a client's position, e.g. when it subscribes to an
+    execution that is already queued.
+
+    Returns:
+        (position, epoch) or None if not in queue
+    """
+    r = await _get_redis()
+    pipe = r.pipeline(transaction=True)
+    pipe.zrank(QUEUE_KEY, execution_id)
+    pipe.get(QUEUE_EPOCH_KEY)
+    rank, epoch = await pipe.execute()
+
+    if rank is None:
+        return None
+    return rank + 1, int(epoch or 0)
+
+
+async def publish_queue_ticket(execution_id: str, position: int, epoch: int) -> None:
     """
-    Publish current queue position to all queued executions.
+    Publish an execution's queue position and the epoch it was read at.
 
-    Called after any queue mutation (add/remove) to update
-    all waiting clients with their new positions.
+    Args:
+        execution_id: Execution ID
+        position: 1-based position at the given epoch
+        epoch: Queue epoch when the position was read
     """
     from src.core.pubsub import publish_execution_update
 
-    positions = await get_all_queue_positions()
+    try:
+        await publish_execution_update(
+            execution_id,
+            "Pending",
+            {
+                "queuePosition": position,
+                "queueEpoch": epoch,
+                "waitReason": "queued",
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish queue position for {execution_id}: {e}")
+
+
+async def publish_queue_update() -> None:
+    """
+    Publish the current queue epoch and depth on the queue channel.
+
+    One message regardless of queue length; clients derive their own
+    positions from it.
+    """
+    from src.core.pubsub import manager
+
+    r = await _get_redis()
+    pipe = r.pipeline(transaction=True)
+    pipe.get(QUEUE_EPOCH_KEY)
+    pipe.zcard(QUEUE_KEY)
+    epoch, depth = await pipe.execute()
+
+    await manager.broadcast(
+        QUEUE_CHANNEL,
+        {
+            "type": "queue_update",
+            "epoch": int(epoch or 0),
+            "depth": depth,
+        },
+    )
+
+
+def schedule_queue_update() -> None:
+    """
+    Schedule a coalesced queue_update publish.
+
+    Removals within QUEUE_UPDATE_INTERVAL_SECONDS share one publish.
+    """
+    global _update_task
+    if _update_task is not None and not _update_task.done():
+        return
+    _update_task = asyncio.create_task(_publish_queue_update_later())
 
-    for exec_id, position in positions:
-        try:
-            await publish_execution_update(
-                exec_id,
-                "Pending",
-                {
-                    "queuePosition": position,
-                    "waitReason": "queued",
-                }
-            )
-        except Exception as e:
-            # Don't let one failed publish stop others
-            logger.warning(f"Failed to publish queue position for {exec_id}: {e}")
+
+async def _publish_queue_update_later() -> None:
+    """Wait for the coalescing interval, then publish one queue update."""
+    await asyncio.sleep(QUEUE_UPDATE_INTERVAL_SECONDS)
+    try:
+        await publish_queue_update()
+    except Exception as e:
+        logger.warning(f"Failed to publish queue update: {e}")
 
 
 async def cleanup_stale_entries(max_age_seconds: int = 600) -> int:
@@ -175,7 +273,8 @@ async def cleanup_stale_entries(max_age_seconds: int = 600) -> int:
 
     if removed:
         logger.info(f"Cleaned up {removed} stale queue entries")
-        await publish_all_queue_positions()
+        await r.incrby(QUEUE_EPOCH_KEY, removed)
+        schedule_queue_update()
 
     return removed
 
@@ -192,11 +291,17 @@ async def get_all_pending_executions() -> list[dict]:
 
     # Get execution IDs from sorted set
     exec_ids = await r.zrange(QUEUE_KEY, 0, -1)
+    if not exec_ids:
+        return []
 
-    items = []
+    # Fetch all execution contexts (stored when queued) in one round trip
+    pipe = r.pipeline(transaction=False)
     for exec_id in exec_ids:
-        # Get execution context from Redis (stored when queued)
-        context = await r.get(f"bifrost:exec:{exec_id}:context")
+        pipe.get(f"bifrost:exec:{exec_id}:context")
+    contexts = await pipe.execute()
+
+    items = []
+    for exec_id, context in zip(exec_ids, contexts):
         if context:
             try:
                 data = json.loads(context)
@@ -147,6 +147,7 @@ async def get_workflow_for_execution(
         - function_name: Python function name
         - path: Relative path (for __file__ injection and Redis/S3 loading)
         - timeout_seconds: Execution timeout
+        - variable_capture: Variable capture mode (off, summary or full)
         - time_saved: ROI time saved value
         - value: ROI value
         - execution_mode: sync or async
@@ -177,6 +178,7 @@ async def get_workflow_for_execution(
             "function_name": workflow_record.function_name,
             "path": workflow_record.path,
             "timeout_seconds": workflow_record.timeout_seconds or 1800,
+            "variable_capture": workflow_record.variable_capture or "full",
             "time_saved": workflow_record.time_saved or 0,
             "value": float(workflow_record.value) if workflow_record.value else 0.0,
             "execution_mode": workflow_record.execution_mode or "async",
@@ -332,7 +334,7 @@ async def run_workflow(
         input_data: Input parameters for the workflow
         form_id: Optional form ID if triggered by form
         transient: If True, don't persist execution record
-        sync: If True, wait for result via Redis BLPOP. If False, return PENDING immediately.
+        sync: If True, wait for result via Redis. If False, return PENDING immediately.
 
     Returns:
         WorkflowExecutionResponse with execution results (or PENDING status if sync=False)
@@ -417,7 +419,7 @@ async def _enqueue_workflow_async(
     """
     Enqueue workflow for execution via RabbitMQ.
 
-    If sync=True, waits for result via Redis BLPOP.
+    If sync=True, waits for result via Redis.
     If sync=False, returns immediately with PENDING status.
     """
     from src.services.execution.async_executor import enqueue_workflow_execution
@@ -441,7 +443,7 @@ async def _enqueue_workflow_async(
             status=ExecutionStatus.PENDING,
         )
 
-    # Wait for result via Redis BLPOP
+    # Wait for result via Redis
     redis_client = get_redis_client()
     result = await redis_client.wait_for_result(execution_id, timeout_seconds=1800)
 
@@ -513,7 +515,7 @@ async def execute_tool(
     """
     Execute a workflow as a tool (for AI agent tool calls).
 
-    Uses sync execution via RabbitMQ with Redis BLPOP for result.
+    Uses sync execution via RabbitMQ with Redis for result.
 
     Args:
         workflow_id: Workflow UUID
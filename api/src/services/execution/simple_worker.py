@@ -3,22 +3,33 @@ Simple Worker Process for Execution Isolation.
 
 This module provides a straightforward worker process that runs executions
 one at a time in a simple loop. It's designed to be spawned by ProcessPoolManager
-and communicate via multiprocessing queues.
+and communicate via pipes (see worker_channel).
 
 Key features:
-- Simple loop: wait for execution_id -> execute -> return result
+- Simple loop: wait for execution -> execute -> return result
 - Graceful SIGTERM handling (complete current work or exit)
 - Reuses existing engine.execute() for actual execution
-- Context is read from Redis, result is returned via queue
+- Context arrives with the execution_id over the work pipe (read from
+  Redis only if it's missing), result is returned via the result pipe
 
 Each worker process handles one execution at a time, providing clean
 isolation between executions.
 
+Async slots (BIFROST_WORKER_ASYNC_SLOTS > 1): the worker instead runs up
+to that many executions concurrently as tasks on one persistent event loop,
+so I/O-bound workflows waiting on external APIs share a process. The SDK
+context, write buffer, log handler, stdout/stderr capture and variable
+capture are per task (contextvars). Timeouts and cancellation act on the
+task; the pool kills the process only if a task does not stop.
+
 IMPORTANT: Workers are long-lived processes. Workspace modules (workflows,
-data providers) are loaded from Redis via the virtual import hook and cleared
-from sys.modules before each execution to pick up code changes. For package
-installs, the ProcessPoolManager recycles worker processes so fresh Python
-interpreters can see newly installed packages.
+data providers) are loaded from Redis via the virtual import hook and kept in
+sys.modules between executions. Before each execution the worker snapshots the
+workspace manifest (one round trip), compares the content_hash of every
+imported workspace module against it and re-imports them only if something
+changed. For package installs, the
+ProcessPoolManager recycles worker processes so fresh Python interpreters
+can see newly installed packages.
 
 Persistence: On startup, workers call _install_requirements_from_cache_sync()
 to install packages from the cached requirements.txt in Redis. This ensures
@@ -29,21 +40,32 @@ for the full persistence flow.
 from __future__ import annotations
 
 import asyncio
+import importlib
 import json
 import logging
 import os
 import resource
 import signal
 import sys
+from collections import deque
 from datetime import datetime, timezone
-from multiprocessing import Queue
 from queue import Empty
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.execution.worker_channel import WorkerChannel
+    from src.services.execution.workspace_snapshot import WorkspaceSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Message type a worker puts on its result queue once it is ready for work
+WORKER_READY_MESSAGE = "worker_ready"
+
+# Message type the pool sends to cancel one execution (async slots)
+WORKER_CANCEL_MESSAGE = "cancel"
+
 
-def _install_requirements_from_cache_sync(worker_id: str) -> None:
+def _install_requirements_from_cache_sync(worker_id: str) -> bool:
     """
     Install packages from cached requirements.txt.
 
@@ -61,6 +83,9 @@ def _install_requirements_from_cache_sync(worker_id: str) -> None:
 
     Args:
         worker_id: Worker identifier for logging
+
+    Returns:
+        True if the cached requirements are installed (or there are none)
     """
     import subprocess
     import tempfile
@@ -86,14 +111,14 @@ def _install_requirements_from_cache_sync(worker_id: str) -> None:
 
             if not data:
                 logger.info(f"[{worker_id}] No cached requirements.txt found")
-                return
+                return True
 
             cached: dict[str, Any] = json.loads(data)
             content = cached.get("content", "")
 
             if not content.strip():
                 logger.info(f"[{worker_id}] Cached requirements.txt is empty")
-                return
+                return True
 
             # Write to temp file and install
             with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
@@ -125,7 +150,7 @@ def _install_requirements_from_cache_sync(worker_id: str) -> None:
                 except OSError:
                     pass
 
-            return  # Success, exit retry loop
+            return result.returncode == 0  # Exit retry loop
 
         except redis.ConnectionError as e:
             if attempt < max_retries - 1:
@@ -141,32 +166,38 @@ def _install_requirements_from_cache_sync(worker_id: str) -> None:
 
         except json.JSONDecodeError as e:
             logger.warning(f"[{worker_id}] Invalid JSON in cached requirements: {e}")
-            return
+            return False
 
         except subprocess.TimeoutExpired:
             logger.warning(f"[{worker_id}] pip install timed out after 5 minutes")
-            return
+            return False
 
         except Exception as e:
             logger.warning(f"[{worker_id}] Failed to install requirements: {e}")
-            return
+            return False
+
+    return False
 
 
 def run_worker_process(
-    work_queue: Queue,
-    result_queue: Queue,
+    work_queue: WorkerChannel,
+    result_queue: WorkerChannel,
     worker_id: str,
+    slots: int = 1,
 ) -> None:
     """
     Entry point for worker process.
 
-    Simple loop: wait for execution_id -> execute -> return result.
+    Simple loop: wait for execution -> execute -> return result.
     Designed to be the target of multiprocessing.Process().
 
     Args:
-        work_queue: Queue to receive execution_ids from ProcessPoolManager
-        result_queue: Queue to send results back to ProcessPoolManager
+        work_queue: Channel to receive executions from ProcessPoolManager,
+            as {"execution_id", "context"} (JSON bytes) or a bare execution_id
+        result_queue: Channel to send results back to ProcessPoolManager
         worker_id: Unique identifier for this worker (for logging)
+        slots: Executions to run concurrently (> 1 runs them as tasks on one
+            event loop, see _run_slots)
     """
     # Configure logging for this worker process
     logging.basicConfig(
@@ -188,7 +219,11 @@ def run_worker_process(
 
     # Install packages from cached requirements.txt
     # This ensures packages persist across container restarts
-    _install_requirements_from_cache_sync(worker_id)
+    # (already done once by the worker template when forked from it)
+    template = sys.modules.get("src.services.execution.worker_template")
+    if template is None or not template.requirements_installed:
+        _install_requirements_from_cache_sync(worker_id)
+    importlib.invalidate_caches()
 
     # Install virtual import hook FIRST (before any workspace imports)
     from src.services.execution.virtual_import import install_virtual_import_hook
@@ -207,26 +242,48 @@ def run_worker_process(
 
     logger.info(f"Worker {worker_id} started (PID={os.getpid()})")
 
+    # Tell the pool we're ready (it measures spawn-to-ready latency)
+    result_queue.put({
+        "type": WORKER_READY_MESSAGE,
+        "worker_id": worker_id,
+        "pid": os.getpid(),
+        "forked_from_template": template is not None,
+        "slots": slots,
+    })
+
+    if slots > 1:
+        asyncio.run(_run_slots(work_queue, result_queue, worker_id))
+        logger.info(f"Worker {worker_id} exiting")
+        return
+
     execution_id: str | None = None
 
     while not shutdown_requested:
         try:
             # Block waiting for work (with timeout to check shutdown flag)
             try:
-                execution_id = work_queue.get(timeout=1.0)
+                message = work_queue.get(timeout=1.0)
             except Empty:
                 continue
+            except EOFError:
+                logger.info(f"Worker {worker_id} work pipe closed")
+                break
 
+            execution_id, context_json = _parse_work_message(message)
             if execution_id is None:
                 continue
 
             logger.info(f"Worker {worker_id} processing execution: {execution_id[:8]}...")
 
-            # Clear workspace modules so we pick up any code changes from Redis
-            _clear_workspace_modules()
+            # Snapshot the workspace manifest and drop modules whose code changed
+            snapshot = _activate_workspace_snapshot()
+            _refresh_workspace_modules(snapshot)
 
             # Execute and return result
-            result = _execute_sync(execution_id, worker_id)
+            try:
+                result = _execute_sync(execution_id, worker_id, context_json)
+            finally:
+                _deactivate_workspace_snapshot()
             result_queue.put(result)
 
             logger.info(
@@ -260,29 +317,319 @@ def run_worker_process(
     logger.info(f"Worker {worker_id} exiting")
 
 
-def _clear_workspace_modules() -> None:
+def _parse_work_message(message: Any) -> tuple[str | None, bytes | None]:
     """
-    Clear workspace modules from sys.modules.
+    Split a work message into execution_id and encoded context.
+
+    Returns:
+        Tuple of (execution_id, context JSON or None to read it from Redis)
+    """
+    if isinstance(message, dict):
+        if message.get("type") == WORKER_CANCEL_MESSAGE:
+            return None, None
+        return message.get("execution_id"), message.get("context")
+    return message, None
 
-    Called before each execution to ensure any code changes from Redis
-    are picked up. The virtual import hook will re-fetch from Redis
-    on the next import.
+
+async def _run_slots(
+    work_queue: WorkerChannel,
+    result_queue: WorkerChannel,
+    worker_id: str,
+) -> None:
+    """
+    Run executions concurrently as tasks on this event loop.
+
+    Work messages are read when the work pipe becomes readable
+    (loop.add_reader), so the loop keeps running the other executions
+    while it waits for work. The pool never sends more executions than
+    the worker has slots. Each execution runs in its own task, bounded by
+    its timeout; a cancel message cancels just that task. Results are
+    written to the result pipe from the loop thread, so messages from
+    different tasks never interleave.
+
+    A fresh workspace snapshot is activated for every execution, so files
+    saved meanwhile can be imported even if the worker is never idle. If
+    imported workspace modules changed while other executions run, the
+    worker drains first: it holds the new execution (and later work) until
+    the running ones finish, still handling their cancel messages, then
+    clears the modules. The snapshot is deactivated once no execution is
+    running. SIGTERM stops taking work and waits for the running executions.
+    """
+    loop = asyncio.get_running_loop()
+    inbox: asyncio.Queue[Any] = asyncio.Queue()
+    deferred: deque[Any] = deque()
+    tasks: dict[str, asyncio.Task[None]] = {}
+
+    def on_work_readable() -> None:
+        try:
+            inbox.put_nowait(work_queue.get_nowait())
+        except Empty:
+            return
+        except (EOFError, OSError):
+            logger.info(f"Worker {worker_id} work pipe closed")
+            loop.remove_reader(work_queue.fileno())
+            inbox.put_nowait(None)
+
+    def on_shutdown_signal() -> None:
+        logger.info(f"Worker {worker_id} received SIGTERM, will exit after current work")
+        inbox.put_nowait(None)
+
+    def handle_cancel(message: Any) -> bool:
+        """Cancel the task a cancel message names. Returns False for other messages."""
+        if not (isinstance(message, dict) and message.get("type") == WORKER_CANCEL_MESSAGE):
+            return False
+        task = tasks.get(message.get("execution_id", ""))
+        if task is not None:
+            logger.info(f"Worker {worker_id} cancelling {message['execution_id'][:8]}...")
+            task.cancel()
+        return True
+
+    async def drain() -> None:
+        """Wait for the running executions, deferring new work until they finish."""
+        logger.info(
+            f"Worker {worker_id} workspace modules changed, "
+            f"waiting for {len(tasks)} running executions"
+        )
+        while tasks:
+            getter = asyncio.ensure_future(inbox.get())
+            await asyncio.wait([getter, *tasks.values()], return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                continue
+            message = getter.result()
+            if not handle_cancel(message):
+                deferred.append(message)
+
+    async def run_slot(
+        execution_id: str,
+        context_json: bytes | None,
+        timeout_seconds: float | None,
+    ) -> None:
+        try:
+            result = await _execute_slot(execution_id, worker_id, context_json, timeout_seconds)
+        finally:
+            tasks.pop(execution_id, None)
+            if not tasks:
+                _deactivate_workspace_snapshot()
+        result_queue.put_nowait(result)
+        logger.info(
+            f"Worker {worker_id} completed execution: {execution_id[:8]}... "
+            f"success={result.get('success', False)}"
+        )
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, on_shutdown_signal)
+    loop.add_reader(work_queue.fileno(), on_work_readable)
+
+    try:
+        while True:
+            message = deferred.popleft() if deferred else await inbox.get()
+            if message is None:
+                break
+
+            if handle_cancel(message):
+                continue
+
+            execution_id, context_json = _parse_work_message(message)
+            if execution_id is None:
+                continue
+
+            logger.info(
+                f"Worker {worker_id} processing execution: {execution_id[:8]}... "
+                f"({len(tasks) + 1} running)"
+            )
+
+            # Snapshot the workspace manifest and drop modules whose code
+            # changed. Clearing sys.modules would pull modules out from under
+            # running executions, so a change waits for them to finish.
+            snapshot = _activate_workspace_snapshot()
+            if tasks and _changed_workspace_modules(snapshot):
+                await drain()
+                # The last execution to finish deactivated the snapshot
+                snapshot = _activate_workspace_snapshot()
+            if not tasks:
+                _refresh_workspace_modules(snapshot)
+
+            timeout_seconds = message.get("timeout_seconds") if isinstance(message, dict) else None
+            tasks[execution_id] = asyncio.create_task(
+                run_slot(execution_id, context_json, timeout_seconds)
+            )
+    finally:
+        if not work_queue.closed:
+            loop.remove_reader(work_queue.fileno())
+        if tasks:
+            logger.info(f"Worker {worker_id} waiting for {len(tasks)} running executions")
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+async def _execute_slot(
+    execution_id: str,
+    worker_id: str,
+    context_json: bytes | None,
+    timeout_seconds: float | None,
+) -> dict[str, Any]:
+    """
+    Run one execution as an async slot task.
+
+    Args:
+        execution_id: Unique execution identifier
+        worker_id: Worker identifier (for logging/tracking)
+        context_json: JSON-encoded context sent by the pool
+        timeout_seconds: Execution timeout (None = the pool enforces it)
+
+    Returns:
+        Result dict, with a TimeoutError or CancelledError result if the
+        task timed out or was cancelled
+    """
+    start_time = datetime.now(timezone.utc)
+    try:
+        return await asyncio.wait_for(
+            _execute_async(execution_id, worker_id, context_json),
+            timeout=timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        error = f"Execution timed out after {timeout_seconds}s"
+        error_type = "TimeoutError"
+    except asyncio.CancelledError:
+        error = "Execution was cancelled"
+        error_type = "CancelledError"
+    except Exception as e:
+        logger.exception(f"Execution {execution_id} failed: {e}")
+        error = str(e)
+        error_type = type(e).__name__
+
+    logger.warning(f"Execution {execution_id[:8]}... stopped: {error}")
+    return {
+        "execution_id": execution_id,
+        "success": False,
+        "error": error,
+        "error_type": error_type,
+        "duration_ms": int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000),
+        "worker_id": worker_id,
+    }
+
+
+def _get_workspace_modules() -> dict[str, Any]:
+    """
+    Get workspace modules currently in sys.modules.
 
     We identify workspace modules by checking if their __loader__ is
     our VirtualModuleLoader class.
+
+    Returns:
+        Dict of module name -> VirtualModuleLoader
     """
     from src.services.execution.virtual_import import VirtualModuleLoader
 
-    # Find all modules loaded by our virtual import system
-    modules_to_clear = [
-        name for name, module in sys.modules.items()
+    return {
+        name: module.__loader__
+        for name, module in list(sys.modules.items())
         if (
             module is not None
             and hasattr(module, '__loader__')
             and isinstance(module.__loader__, VirtualModuleLoader)
         )
+    }
+
+
+def _activate_workspace_snapshot() -> WorkspaceSnapshot | None:
+    """
+    Snapshot the workspace module manifest for the next execution.
+
+    While active, the virtual import hook resolves imports from the
+    snapshot instead of issuing Redis GETs per import attempt.
+
+    Returns:
+        The active snapshot, or None if disabled or unavailable
+    """
+    from src.config import get_settings
+
+    if not get_settings().worker_workspace_snapshot:
+        return None
+
+    from src.services.execution.workspace_snapshot import activate_snapshot
+
+    return activate_snapshot()
+
+
+def _deactivate_workspace_snapshot() -> None:
+    """Stop resolving imports from the execution's snapshot."""
+    from src.services.execution.workspace_snapshot import deactivate_snapshot
+
+    deactivate_snapshot()
+
+
+def _refresh_workspace_modules(snapshot: WorkspaceSnapshot | None = None) -> None:
+    """
+    Keep imported workspace modules unless their code changed.
+
+    Called before each execution. The content_hash recorded on each
+    module's loader is compared against the workspace snapshot when one
+    is active, or against Redis in a single MGET otherwise. If every
+    module is current, they all stay imported and the execution skips
+    re-importing them entirely.
+
+    If any module changed (or vanished), all workspace modules are cleared:
+    unchanged modules may hold references to objects from the changed one,
+    so clearing only the changed module could leave stale code reachable.
+    Re-importing the unchanged ones is still cheap because their compiled
+    bytecode is cached (see bytecode_cache.py).
+
+    Setting BIFROST_WORKER_REUSE_WORKSPACE_MODULES=false restores the old
+    behaviour of clearing everything before each execution.
+    """
+    from src.config import get_settings
+
+    if not get_settings().worker_reuse_workspace_modules:
+        _clear_workspace_modules()
+        return
+
+    stale = _changed_workspace_modules(snapshot)
+    if stale:
+        logger.debug(f"Workspace modules changed: {stale}")
+        _clear_workspace_modules()
+    else:
+        logger.debug("Reusing workspace modules")
+
+
+def _changed_workspace_modules(snapshot: WorkspaceSnapshot | None = None) -> list[str]:
+    """
+    Imported workspace modules whose code changed or vanished.
+
+    Hashes come from the snapshot when one is active, or from Redis in a
+    single MGET otherwise. If they cannot be checked, every imported
+    workspace module counts as changed.
+    """
+    loaders = _get_workspace_modules()
+    if not loaders:
+        return []
+
+    paths = sorted({loader.path for loader in loaders.values()})
+    if snapshot is not None:
+        current = {path: snapshot.get_hash(path) for path in paths}
+    else:
+        from src.core.module_cache_sync import get_module_hashes_sync
+
+        try:
+            current = get_module_hashes_sync(paths)
+        except Exception as e:
+            logger.warning(f"Could not check workspace module hashes, treating all as changed: {e}")
+            return list(loaders)
+
+    return [
+        name for name, loader in loaders.items()
+        if not loader.content_hash or current.get(loader.path) != loader.content_hash
     ]
 
+
+def _clear_workspace_modules() -> None:
+    """
+    Clear workspace modules from sys.modules.
+
+    The virtual import hook will re-fetch from Redis on the next import.
+    """
+    modules_to_clear = list(_get_workspace_modules())
+
     # Remove them from sys.modules so they'll be re-imported
     for name in modules_to_clear:
         del sys.modules[name]
@@ -291,7 +638,11 @@ def _clear_workspace_modules() -> None:
         logger.debug(f"Cleared {len(modules_to_clear)} workspace modules: {modules_to_clear}")
 
 
-def _execute_sync(execution_id: str, worker_id: str) -> dict[str, Any]:
+def _execute_sync(
+    execution_id: str,
+    worker_id: str,
+    context_json: bytes | None = None,
+) -> dict[str, Any]:
     """
     Synchronous wrapper that runs async execution.
 
@@ -301,12 +652,14 @@ def _execute_sync(execution_id: str, worker_id: str) -> dict[str, Any]:
     Args:
         execution_id: Unique execution identifier
         worker_id: Worker identifier (for logging/tracking)
+        context_json: JSON-encoded context sent by the pool (None = read
+            it from Redis)
 
     Returns:
         Result dict with success, result, error, duration_ms, etc.
     """
     try:
-        result = asyncio.run(_execute_async(execution_id, worker_id))
+        result = asyncio.run(_execute_async(execution_id, worker_id, context_json))
         return result
     except Exception as e:
         logger.exception(f"Execution {execution_id} failed: {e}")
@@ -320,12 +673,17 @@ def _execute_sync(execution_id: str, worker_id: str) -> dict[str, Any]:
         }
 
 
-async def _execute_async(execution_id: str, worker_id: str) -> dict[str, Any]:
+async def _execute_async(
+    execution_id: str,
+    worker_id: str,
+    context_json: bytes | None = None,
+) -> dict[str, Any]:
     """
-    Read context from Redis, execute workflow, return result.
+    Decode context, execute workflow, return result.
 
     This is the core async execution logic. It:
-    1. Reads execution context from Redis
+    1. Decodes the execution context sent by the pool (or reads the
+       Redis copy if none was sent)
     2. Builds an ExecutionRequest
     3. Calls the existing execute() engine
     4. Formats and returns the result
@@ -333,14 +691,18 @@ async def _execute_async(execution_id: str, worker_id: str) -> dict[str, Any]:
     Args:
         execution_id: Unique execution identifier
         worker_id: Worker identifier (for logging/tracking)
+        context_json: JSON-encoded context sent by the pool
 
     Returns:
         Result dict with execution outcome
     """
     start_time = datetime.now(timezone.utc)
 
-    # 1. Read context from Redis
-    context = await _read_context_from_redis(execution_id)
+    # 1. Decode context (Redis only as a fallback)
+    if context_json is not None:
+        context = json.loads(context_json)
+    else:
+        context = await _read_context_from_redis(execution_id)
     if context is None:
         return {
             "execution_id": execution_id,
@@ -0,0 +1,443 @@
+"""
+Variable Capture for Workflow Executions
+
+Records the workflow function's local variables when it returns (or raises)
+and converts them into bounded, JSON-safe values for execution details.
+
+Only the workflow's own code object is observed:
+
+1. Python 3.12+: sys.monitoring PY_RETURN enabled locally on that code
+   object, so no other function pays for tracing
+2. Python 3.11: a sys.settrace tracer that is only installed until that
+   code object's frame is entered; the capture then holds the frame, which
+   keeps its final locals readable after it returns, and reads them on stop()
+
+On exceptions the locals come from the traceback, so nothing is traced for
+the failure path. Serialization happens once, after the run, and is bounded
+by depth, item, string and node limits.
+
+Capture modes (per workflow, Workflow.variable_capture):
+- "off": no variables are captured
+- "summary": shallow, truncated values
+- "full": deep values up to generous limits (default)
+
+Usage:
+    from src.services.execution.variable_capture import LocalsCapture
+
+    capture = LocalsCapture(capture_code_for(func))
+    capture.start()
+    try:
+        result = await func(...)
+    finally:
+        capture.stop()
+    variables = serialize_locals(capture.locals or {}, exclude, FULL_LIMITS)
+"""
+
+import datetime
+import decimal
+import inspect
+import logging
+import sys
+import threading
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import CodeType, FrameType, ModuleType, TracebackType
+from typing import Any, Callable, Literal
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+CaptureMode = Literal["off", "summary", "full"]
+
+CAPTURE_MODES: tuple[str, ...] = ("off", "summary", "full")
+DEFAULT_CAPTURE_MODE: CaptureMode = "full"
+
+
+@dataclass(frozen=True)
+class CaptureLimits:
+    """Bounds applied when serializing one captured variable."""
+
+    max_depth: int
+    max_items: int
+    max_string_length: int
+    max_nodes: int
+
+
+FULL_LIMITS = CaptureLimits(max_depth=16, max_items=1000, max_string_length=10_000, max_nodes=50_000)
+SUMMARY_LIMITS = CaptureLimits(max_depth=2, max_items=10, max_string_length=200, max_nodes=100)
+
+_LIMITS_BY_MODE: dict[str, CaptureLimits | None] = {
+    "off": None,
+    "summary": SUMMARY_LIMITS,
+    "full": FULL_LIMITS,
+}
+
+
+def normalize_capture_mode(value: str | None) -> CaptureMode:
+    """Return a valid capture mode, falling back to the default."""
+    if value in CAPTURE_MODES:
+        return value  # type: ignore[return-value]
+    return DEFAULT_CAPTURE_MODE
+
+
+def limits_for_mode(mode: str | None) -> CaptureLimits | None:
+    """Get the serialization limits for a capture mode (None when off)."""
+    return _LIMITS_BY_MODE[normalize_capture_mode(mode)]
+
+
+# =============================================================================
+# Bounded serializer
+# =============================================================================
+
+
+class _Serializer:
+    """
+    Converts a value to JSON-safe data within CaptureLimits.
+
+    Cycles are detected by identity against the containers on the current
+    path (not every container seen), so shared references are still shown
+    in full. Handlers are looked up by exact type first, then by MRO, and
+    the result is cached in the dispatch table.
+    """
+
+    def __init__(self, limits: CaptureLimits):
+        self.limits = limits
+        self.nodes = 0
+        self.active: set[int] = set()
+
+    def serialize(self, obj: Any, depth: int = 0) -> Any:
+        self.nodes += 1
+        if self.nodes > self.limits.max_nodes:
+            return "<truncated>"
+        handler = _DISPATCH.get(type(obj))
+        if handler is None:
+            handler = _resolve_handler(type(obj))
+        return handler(self, obj, depth)
+
+    def _primitive(self, obj: Any, depth: int) -> Any:
+        return obj
+
+    def _string(self, obj: str, depth: int) -> str:
+        limit = self.limits.max_string_length
+        if len(obj) <= limit:
+            return obj
+        return f"{obj[:limit]}... ({len(obj) - limit} more chars)"
+
+    def _bytes(self, obj: bytes | bytearray, depth: int) -> str:
+        return f"<{type(obj).__name__} len={len(obj)}>"
+
+    def _isoformat(self, obj: Any, depth: int) -> str:
+        return obj.isoformat()
+
+    def _str(self, obj: Any, depth: int) -> str:
+        return str(obj)
+
+    def _dict(self, obj: dict, depth: int) -> Any:
+        if depth >= self.limits.max_depth:
+            return f"<{type(obj).__name__} len={len(obj)}>"
+        obj_id = id(obj)
+        if obj_id in self.active:
+            return "[Circular Reference]"
+        self.active.add(obj_id)
+        try:
+            result: dict[Any, Any] = {}
+            for index, (key, value) in enumerate(obj.items()):
+                if index >= self.limits.max_items:
+                    result["..."] = f"{len(obj) - index} more keys"
+                    break
+                if not isinstance(key, (str, int, float, bool)) and key is not None:
+                    key = str(key)
+                result[key] = self.serialize(value, depth + 1)
+            return result
+        finally:
+            self.active.discard(obj_id)
+
+    def _sequence(self, obj: Any, depth: int) -> Any:
+        if depth >= self.limits.max_depth:
+            return f"<{type(obj).__name__} len={len(obj)}>"
+        obj_id = id(obj)
+        if obj_id in self.active:
+            return "[Circular Reference]"
+        self.active.add(obj_id)
+        try:
+            result: list[Any] = []
+            for index, item in enumerate(obj):
+                if index >= self.limits.max_items:
+                    result.append(f"... {len(obj) - index} more items")
+                    break
+                result.append(self.serialize(item, depth + 1))
+            return tuple(result) if isinstance(obj, tuple) else result
+        finally:
+            self.active.discard(obj_id)
+
+    def _model(self, obj: BaseModel, depth: int) -> Any:
+        obj_id = id(obj)
+        if obj_id in self.active:
+            return "[Circular Reference]"
+        self.active.add(obj_id)
+        try:
+            return self._dict(obj.model_dump(), depth)
+        except Exception:
+            return self._fallback(obj, depth)
+        finally:
+            self.active.discard(obj_id)
+
+    def _fallback(self, obj: Any, depth: int) -> str:
+        return f"<{type(obj).__name__}>"
+
+
+_Handler = Callable[[_Serializer, Any, int], Any]
+
+_DISPATCH: dict[type, _Handler] = {
+    type(None): _Serializer._primitive,
+    bool: _Serializer._primitive,
+    int: _Serializer._primitive,
+    float: _Serializer._primitive,
+    str: _Serializer._string,
+    bytes: _Serializer._bytes,
+    bytearray: _Serializer._bytes,
+    dict: _Serializer._dict,
+    list: _Serializer._sequence,
+    tuple: _Serializer._sequence,
+    set: _Serializer._sequence,
+    frozenset: _Serializer._sequence,
+    datetime.datetime: _Serializer._isoformat,
+    datetime.date: _Serializer._isoformat,
+    datetime.time: _Serializer._isoformat,
+    uuid.UUID: _Serializer._str,
+    decimal.Decimal: _Serializer._str,
+    BaseModel: _Serializer._model,
+}
+
+_dispatch_lock = threading.Lock()
+
+
+def _resolve_handler(cls: type) -> _Handler:
+    """Find the handler for a type via its MRO and cache it."""
+    handler: _Handler = _Serializer._fallback
+    for base in cls.__mro__[1:]:
+        if base in _DISPATCH:
+            handler = _DISPATCH[base]
+            break
+    with _dispatch_lock:
+        _DISPATCH[cls] = handler
+    return handler
+
+
+def serialize_value(obj: Any, limits: CaptureLimits = FULL_LIMITS) -> Any:
+    """
+    Convert a value to bounded, JSON-safe data.
+
+    Containers deeper than max_depth are summarized, collections are cut at
+    max_items, strings at max_string_length, and the whole value stops
+    expanding after max_nodes. Unsupported types become "<TypeName>".
+    """
+    return _Serializer(limits).serialize(obj)
+
+
+def serialize_locals(
+    local_vars: dict[str, Any],
+    exclude: set[str],
+    limits: CaptureLimits,
+) -> dict[str, Any]:
+    """
+    Serialize a frame's locals, skipping excluded names, private names,
+    callables and modules.
+    """
+    captured: dict[str, Any] = {}
+    for name, value in local_vars.items():
+        if (
+            name.startswith("_")
+            or name in exclude
+            or callable(value)
+            or isinstance(value, ModuleType)
+        ):
+            continue
+        captured[name] = serialize_value(value, limits)
+    return captured
+
+
+# =============================================================================
+# Locals recording
+# =============================================================================
+
+
+def capture_code_for(func: Any) -> CodeType | None:
+    """
+    Get the code object whose locals should be captured for a callable.
+
+    Script wrappers expose their generated main() via _capture_code;
+    decorated functions are unwrapped to the user's function.
+    """
+    code = getattr(func, "_capture_code", None)
+    if code is None:
+        code = getattr(inspect.unwrap(func), "__code__", None)
+    return code
+
+
+_monitoring = getattr(sys, "monitoring", None)
+
+# Tool IDs tried for sys.monitoring (0-2 and 5 are reserved for debuggers,
+# coverage, profilers and optimizers)
+_MONITORING_TOOL_IDS = (4, 3)
+
+_tool_id: int | None = None
+_monitored_codes: dict[CodeType, int] = {}
+_monitoring_lock = threading.Lock()
+
+# The capture for the execution running in the current context. Monitoring
+# callbacks and tracers are process-wide, so this keeps concurrent
+# executions apart.
+_current_capture: ContextVar["LocalsCapture | None"] = ContextVar(
+    "bifrost_locals_capture", default=None
+)
+
+
+# Python < 3.12: one tracer per thread shared by every capture still waiting
+# for its frame, installed by the first and removed as soon as none is left
+# waiting (captures of concurrent executions can enter and stop in any order)
+_settrace_state = threading.local()
+
+
+def _release_settrace() -> None:
+    """Drop one waiting capture, restoring the previous tracer after the last."""
+    state = _settrace_state
+    state.waiting -= 1
+    if state.waiting == 0:
+        sys.settrace(state.previous)
+        state.previous = None
+
+
+def _dispatch_trace(frame: FrameType, event: str, arg: Any) -> Any:
+    """sys.settrace tracer handing the captured code's frame to its capture."""
+    previous = getattr(_settrace_state, "previous", None)
+    previous_local = previous(frame, event, arg) if previous else None
+    capture = _current_capture.get()
+    if capture is not None and capture._frame is None and frame.f_code is capture.code:
+        # Holding the frame keeps its locals readable after it returns, so
+        # nothing needs tracing once it is entered
+        capture._frame = frame
+        capture._settrace = False
+        _release_settrace()
+    return previous_local
+
+
+def _on_py_return(code: CodeType, instruction_offset: int, retval: Any) -> None:
+    """sys.monitoring PY_RETURN callback for monitored workflow code."""
+    capture = _current_capture.get()
+    if capture is None or code is not capture.code:
+        return
+    frame = sys._getframe(1)
+    if frame.f_code is code:
+        capture.record(frame)
+
+
+def _acquire_tool_id() -> int | None:
+    """Claim a sys.monitoring tool ID for this process (None if all taken)."""
+    global _tool_id
+    if _tool_id is not None or _monitoring is None:
+        return _tool_id
+    for tool_id in _MONITORING_TOOL_IDS:
+        if _monitoring.get_tool(tool_id) is None:
+            _monitoring.use_tool_id(tool_id, "bifrost-variable-capture")
+            _monitoring.register_callback(tool_id, _monitoring.events.PY_RETURN, _on_py_return)
+            _tool_id = tool_id
+            return tool_id
+    logger.debug("No free sys.monitoring tool ID, using settrace for variable capture")
+    return None
+
+
+class LocalsCapture:
+    """
+    Records the locals of one code object when its frame returns.
+
+    Only a shallow copy of the locals is taken while the workflow runs;
+    serialization happens after the run.
+    """
+
+    def __init__(self, code: CodeType | None):
+        self.code = code
+        self.locals: dict[str, Any] | None = None
+        self._token: Any = None
+        self._monitoring = False
+        self._settrace = False
+        self._frame: FrameType | None = None
+
+    def record(self, frame: FrameType) -> None:
+        """Snapshot a frame's locals."""
+        self.locals = dict(frame.f_locals)
+
+    def record_from_traceback(self, tb: TracebackType | None) -> bool:
+        """
+        Snapshot the locals of the captured code's frame in a traceback.
+
+        Returns:
+            True if the frame was found
+        """
+        while tb is not None:
+            if tb.tb_frame.f_code is self.code:
+                self.record(tb.tb_frame)
+                return True
+            tb = tb.tb_next
+        return False
+
+    def start(self) -> None:
+        """Begin observing returns of the captured code."""
+        if self.code is None:
+            return
+        self._token = _current_capture.set(self)
+
+        with _monitoring_lock:
+            tool_id = _acquire_tool_id()
+            if tool_id is not None and _monitoring is not None:
+                count = _monitored_codes.get(self.code, 0)
+                if count == 0:
+                    _monitoring.set_local_events(tool_id, self.code, _monitoring.events.PY_RETURN)
+                _monitored_codes[self.code] = count + 1
+                self._monitoring = True
+                return
+
+        self._start_settrace()
+
+    def stop(self) -> None:
+        """Stop observing and release any tracing state."""
+        if self.code is None:
+            return
+
+        if self._monitoring:
+            with _monitoring_lock:
+                count = _monitored_codes.get(self.code, 1) - 1
+                if count <= 0:
+                    _monitored_codes.pop(self.code, None)
+                    if _tool_id is not None and _monitoring is not None:
+                        _monitoring.set_local_events(_tool_id, self.code, 0)
+                else:
+                    _monitored_codes[self.code] = count
+            self._monitoring = False
+        elif self._settrace:
+            _release_settrace()
+            self._settrace = False
+
+        if self._frame is not None:
+            self.record(self._frame)
+            self._frame = None
+
+        if self._token is not None:
+            _current_capture.reset(self._token)
+            self._token = None
+
+    def _start_settrace(self) -> None:
+        """
+        Fallback for Python < 3.12: trace calls only until the captured code's
+        frame is entered, then keep a reference to it and read its locals on
+        stop().
+        """
+        state = _settrace_state
+        if getattr(state, "waiting", 0) == 0:
+            state.previous = sys.gettrace()
+            state.waiting = 0
+            sys.settrace(_dispatch_trace)
+        state.waiting += 1
+        self._settrace = True
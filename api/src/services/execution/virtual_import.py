@@ -31,6 +31,8 @@ from types import ModuleType
 from typing import Any
 
 from src.core.module_cache_sync import get_module_index_sync, get_module_sync
+from src.services.execution.bytecode_cache import get_code
+from src.services.execution.workspace_snapshot import WorkspaceSnapshot, get_active_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -203,9 +205,19 @@ class VirtualModuleLoader(Loader):
 
     Compiles and executes Python code in the module's namespace,
     setting __file__ to the relative path for meaningful tracebacks.
+    Compiled code is reused across executions via the bytecode cache.
+
+    The content_hash is kept on the loader so workers can tell whether
+    an already-imported module is still current (see simple_worker).
     """
 
-    def __init__(self, path: str, content: str, is_package: bool = False):
+    def __init__(
+        self,
+        path: str,
+        content: str,
+        is_package: bool = False,
+        content_hash: str | None = None,
+    ):
         """
         Initialize loader with module content.
 
@@ -213,10 +225,12 @@ class VirtualModuleLoader(Loader):
             path: Relative file path (e.g., "shared/halopsa.py")
             content: Python source code
             is_package: True if this is a package (__init__.py)
+            content_hash: SHA-256 of content, if known
         """
         self.path = path
         self.content = content
         self.is_package = is_package
+        self.content_hash = content_hash
 
     def create_module(self, spec: ModuleSpec) -> ModuleType | None:
         """Return None to use default module creation semantics."""
@@ -234,9 +248,9 @@ class VirtualModuleLoader(Loader):
             # Use the directory portion of the relative path
             module.__path__ = [str(Path(self.path).parent)]
 
-        # Compile and execute
+        # Compile (or reuse cached bytecode) and execute
         try:
-            code = compile(self.content, filename=self.path, mode="exec")
+            code = get_code(self.path, self.content, self.content_hash)
             exec(code, module.__dict__)
         except SyntaxError as e:
             logger.error(f"Syntax error in virtual module {self.path}: {e}")
@@ -251,7 +265,9 @@ class VirtualModuleFinder(MetaPathFinder):
     Meta path finder that loads workspace modules from Redis cache.
 
     Converts Python module names to file paths and fetches directly
-    from Redis. Each import attempt does a Redis GET for the module path.
+    from Redis. Each import attempt does a Redis GET for the module path,
+    unless a workspace snapshot is active for the current execution, in
+    which case lookups are answered in-process (see workspace_snapshot.py).
 
     Key design points:
     - No hardcoded prefix required - works with any module name
@@ -315,6 +331,10 @@ class VirtualModuleFinder(MetaPathFinder):
         This ensures newly-added modules are immediately available
         without needing to refresh a cached index.
         """
+        snapshot = get_active_snapshot()
+        if snapshot is not None:
+            return self._find_spec_from_snapshot(fullname, snapshot)
+
         # Convert module name to potential file paths
         possible_paths = self._module_name_to_paths(fullname)
 
@@ -326,7 +346,9 @@ class VirtualModuleFinder(MetaPathFinder):
                 continue
 
             # Create loader and spec
-            loader = VirtualModuleLoader(file_path, cached["content"], is_package)
+            loader = VirtualModuleLoader(
+                file_path, cached["content"], is_package, cached.get("hash") or None
+            )
             spec = ModuleSpec(
                 fullname,
                 loader,
@@ -348,21 +370,54 @@ class VirtualModuleFinder(MetaPathFinder):
         has_submodules = any(path.startswith(prefix) for path in module_index)
 
         if has_submodules:
-            # Create a namespace package spec (empty module with __path__)
-            loader = NamespacePackageLoader(base_path)
-            spec = ModuleSpec(
-                fullname,
-                loader,
-                is_package=True,
-                origin=None,  # Namespace packages have no origin
-            )
-            spec.submodule_search_locations = [base_path]
-            logger.debug(f"Virtual namespace package: {fullname} -> {base_path}/")
-            return spec
+            return self._namespace_spec(fullname, base_path)
 
         # Not in our cache - let filesystem finder handle it
         return None
 
+    def _find_spec_from_snapshot(
+        self, fullname: str, snapshot: WorkspaceSnapshot
+    ) -> ModuleSpec | None:
+        """
+        Resolve a module from the execution's workspace snapshot.
+
+        Existence checks and namespace detection are answered from the
+        in-process manifest; Redis is only hit to fetch the body of a
+        module that is actually being loaded (and not already cached).
+        """
+        for file_path, is_package in self._module_name_to_paths(fullname):
+            if snapshot.get_hash(file_path) is None:
+                continue
+
+            cached = snapshot.get_module(file_path)
+            if not cached:
+                continue
+
+            loader = VirtualModuleLoader(
+                file_path, cached["content"], is_package, cached.get("hash") or None
+            )
+            logger.debug(f"Virtual import (snapshot): {fullname} -> {file_path}")
+            return ModuleSpec(fullname, loader, is_package=is_package, origin=file_path)
+
+        base_path = "/".join(fullname.split("."))
+        if snapshot.has_directory(base_path):
+            return self._namespace_spec(fullname, base_path)
+
+        return None
+
+    def _namespace_spec(self, fullname: str, base_path: str) -> ModuleSpec:
+        """Create a namespace package spec (empty module with __path__)."""
+        loader = NamespacePackageLoader(base_path)
+        spec = ModuleSpec(
+            fullname,
+            loader,
+            is_package=True,
+            origin=None,  # Namespace packages have no origin
+        )
+        spec.submodule_search_locations = [base_path]
+        logger.debug(f"Virtual namespace package: {fullname} -> {base_path}/")
+        return spec
+
     def _module_name_to_paths(self, fullname: str) -> list[tuple[str, bool]]:
         """
         Convert module name to potential file paths.
@@ -174,15 +174,16 @@ async def _run_execution(execution_id: str, context_data: dict[str, Any]) -> dic
             # Consumer provides metadata only; worker is self-sufficient for code loading.
             if function_name and file_path:
                 try:
-                    from src.core.module_cache_sync import get_module_sync
+                    from src.services.execution.workspace_snapshot import get_workspace_module
 
-                    cached = get_module_sync(file_path)
+                    cached = get_workspace_module(file_path)
                     if cached:
                         loaded_code = cached["content"]
                         workflow_func, metadata, load_error = load_workflow_from_db(
                             code=loaded_code,
                             path=file_path,
                             function_name=function_name,
+                            content_hash=cached.get("hash") or None,
                         )
                         logger.info(
                             f"Loaded workflow '{name}' from cache (path={file_path})"
@@ -251,6 +252,7 @@ async def _run_execution(execution_id: str, context_data: dict[str, Any]) -> dic
             tags=context_data.get("tags", []),
             timeout_seconds=context_data.get("timeout_seconds", 1800),
             cache_ttl_seconds=context_data.get("cache_ttl_seconds", 300),
+            variable_capture=context_data.get("variable_capture", "full"),
             parameters=context_data.get("parameters", {}),
             startup=context_data.get("startup"),  # Launch workflow results
             roi=context_data.get("roi"),  # ROI initialization
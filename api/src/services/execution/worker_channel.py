@@ -0,0 +1,108 @@
+"""
+Pipe transport between ProcessPoolManager and its worker processes.
+
+Each worker has two one-way channels: work (pool -> worker) and results
+(worker -> pool). They replace multiprocessing.Queue:
+
+- The reading end exposes a file descriptor, so the pool waits for
+  results with loop.add_reader() and handles them as soon as they are
+  written instead of polling every worker on a timer
+- Messages are written directly to the pipe (no feeder thread) and
+  pickled with protocol 5; buffers wrapped in pickle.PickleBuffer (such as
+  the encoded execution context) are sent as separate frames instead of
+  being copied into the pickle stream
+
+Frame layout per message: one frame with the number of out-of-band
+buffers followed by the pickle stream, then one frame per buffer. A
+message's frames are written under the channel's write lock, so writers
+in different threads never interleave their frames.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+import threading
+from multiprocessing.connection import Connection
+from queue import Empty
+from typing import Any
+
+# Header of the first frame: number of out-of-band buffer frames that follow
+_HEADER = struct.Struct("!I")
+
+
+class WorkerChannel:
+    """
+    One end of a one-way pipe, with a queue-like API.
+
+    Only one process may write to a channel. Within it, any number of
+    threads may: each message (header frame and its buffer frames) is
+    written as one unit under a lock.
+    """
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+        self._write_lock = threading.Lock()
+
+    def fileno(self) -> int:
+        """File descriptor to wait on for incoming messages."""
+        return self._conn.fileno()
+
+    @property
+    def closed(self) -> bool:
+        return self._conn.closed
+
+    def put_nowait(self, message: Any) -> None:
+        """
+        Send a message.
+
+        Returns once the message is written to the pipe; only blocks while
+        the pipe buffer is full (the reader is behind) or another thread is
+        writing a message.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+        with self._write_lock:
+            self._conn.send_bytes(_HEADER.pack(len(buffers)) + payload)
+            for buffer in buffers:
+                self._conn.send_bytes(buffer.raw())
+
+    def put(self, message: Any) -> None:
+        """Send a message (same as put_nowait)."""
+        self.put_nowait(message)
+
+    def get(self, timeout: float | None = None) -> Any:
+        """
+        Receive a message.
+
+        Raises:
+            Empty: If no message arrived within timeout
+            EOFError: If the other end was closed
+        """
+        if not self._conn.poll(timeout):
+            raise Empty
+        frame = self._conn.recv_bytes()
+        (count,) = _HEADER.unpack_from(frame)
+        buffers = [self._conn.recv_bytes() for _ in range(count)]
+        return pickle.loads(memoryview(frame)[_HEADER.size:], buffers=buffers)
+
+    def get_nowait(self) -> Any:
+        """Receive a message if one is available (raises Empty otherwise)."""
+        return self.get(0)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def channel_pair(ctx: Any) -> tuple[WorkerChannel, WorkerChannel]:
+    """
+    Create a one-way channel.
+
+    Args:
+        ctx: multiprocessing context the worker is started with
+
+    Returns:
+        Tuple of (reading end, writing end)
+    """
+    reader, writer = ctx.Pipe(duplex=False)
+    return WorkerChannel(reader), WorkerChannel(writer)
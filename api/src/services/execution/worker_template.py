@@ -0,0 +1,92 @@
+"""
+Worker Template (Zygote) for the Process Pool.
+
+In the "forkserver" spawn mode, ProcessPoolManager starts workers through
+a multiprocessing forkserver whose only preload is this module. Importing
+it once in the forkserver process:
+
+1. Adds the user site-packages directory to sys.path (see simple_worker)
+2. Installs packages from the cached requirements.txt
+3. Imports the heavy modules every worker needs (SQLAlchemy, pydantic,
+   httpx, redis, the execution engine and the SDK)
+4. Installs the virtual import hook
+
+Every worker is then forked from this warm process instead of starting a
+fresh interpreter and re-importing everything ("spawn"), so replacing a
+worker after a timeout, cancellation, crash or recycle is cheap.
+
+Nothing here may open connections or start threads that a forked child
+would inherit. The sync Redis client used for requirements is closed
+before returning, and redis-py connection pools reset themselves in a
+child after fork.
+
+The template is never used directly by the pool; ProcessPoolManager only
+references it by name (WORKER_TEMPLATE_MODULE).
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Modules imported once in the template and shared by every forked worker
+PRELOAD_MODULES = (
+    # Imported by multiprocessing in each forked child, after the virtual
+    # import hook (which would otherwise look it up in Redis)
+    "gc",
+    "sqlalchemy",
+    "sqlalchemy.ext.asyncio",
+    "pydantic",
+    "httpx",
+    "redis",
+    "redis.asyncio",
+    "src.models",
+    "src.services.execution.engine",
+    "src.services.execution.simple_worker",
+    "bifrost",
+)
+
+# Whether the cached requirements were installed in the template. Forked
+# workers skip their own install when this is True.
+requirements_installed = False
+
+# Seconds spent preloading (for logs)
+preload_seconds = 0.0
+
+
+def preload() -> None:
+    """Prepare this process as a worker template (idempotent)."""
+    global requirements_installed, preload_seconds
+
+    started = time.monotonic()
+
+    import site
+    user_site = site.getusersitepackages()
+    if site.ENABLE_USER_SITE and os.path.exists(user_site) and user_site not in sys.path:
+        sys.path.insert(0, user_site)
+
+    from src.services.execution.simple_worker import _install_requirements_from_cache_sync
+    requirements_installed = _install_requirements_from_cache_sync("worker-template")
+    importlib.invalidate_caches()
+
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # Workers import it themselves if it's actually needed
+            logger.warning(f"Worker template failed to preload {name}: {e}")
+
+    # Install the hook last so preloading never goes through it
+    from src.services.execution.virtual_import import install_virtual_import_hook
+    install_virtual_import_hook()
+
+    preload_seconds = time.monotonic() - started
+    logger.info(f"Worker template ready in {preload_seconds:.2f}s (PID={os.getpid()})")
+
+
+preload()
@@ -0,0 +1,215 @@
+"""
+Workspace Snapshot for Virtual Imports
+
+Without a snapshot, every import attempt costs a Redis GET per candidate
+path (x.py and x/__init__.py), plus a scan of the whole module index for
+namespace packages. A snapshot replaces that with one round trip per
+execution:
+
+1. At execution start the worker fetches the module hash manifest
+   (path -> content_hash) with a single pipelined HGETALL.
+2. find_spec() resolves modules and namespace packages from that
+   manifest in-process (dict + directory trie), with no network I/O.
+3. Module bodies are pulled lazily when a module is actually loaded, in
+   MGET batches that prefetch the module's siblings. Bodies are kept
+   in-process keyed by (path, content_hash), so unchanged modules are
+   never fetched twice by the same worker.
+
+The snapshot is only used when it is authoritative (the manifest covers
+every path in the module index). Otherwise the worker falls back to the
+per-import lookups in module_cache_sync, which also self-heal the manifest.
+
+Usage:
+    from src.services.execution.workspace_snapshot import activate_snapshot
+
+    activate_snapshot()       # at execution start
+    ...                       # imports resolve from the snapshot
+    deactivate_snapshot()     # at execution end
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import PurePosixPath
+
+from src.core.module_cache import CachedModule
+from src.core.module_cache_sync import get_module_manifest_sync, get_module_sync, get_modules_sync
+
+logger = logging.getLogger(__name__)
+
+# Max module bodies fetched per Redis round trip
+BODY_BATCH_SIZE = 32
+
+# Max module bodies kept in-process per worker
+MAX_CACHED_BODIES = 1024
+
+_bodies: "OrderedDict[tuple[str, str], CachedModule]" = OrderedDict()
+_bodies_lock = threading.Lock()
+
+_active: "WorkspaceSnapshot | None" = None
+
+
+class WorkspaceSnapshot:
+    """
+    Point-in-time view of the workspace module manifest.
+
+    Answers "does this module exist, and with which hash?" without
+    network I/O, and fetches bodies on demand.
+    """
+
+    def __init__(self, hashes: dict[str, str]):
+        """
+        Build the snapshot.
+
+        Args:
+            hashes: Module path -> content hash
+        """
+        self.hashes = hashes
+        self._by_dir: dict[str, list[str]] = {}
+        self._trie: dict[str, dict] = {}
+
+        for path in hashes:
+            parent = str(PurePosixPath(path).parent)
+            self._by_dir.setdefault(parent, []).append(path)
+
+            node = self._trie
+            for part in path.split("/")[:-1]:
+                node = node.setdefault(part, {})
+
+    def get_hash(self, path: str) -> str | None:
+        """Get the content hash of a module, or None if not in the workspace."""
+        return self.hashes.get(path)
+
+    def has_directory(self, dir_path: str) -> bool:
+        """Check whether any module lives under dir_path (namespace package check)."""
+        node = self._trie
+        for part in dir_path.split("/"):
+            child = node.get(part)
+            if child is None:
+                return False
+            node = child
+        return True
+
+    def get_module(self, path: str) -> CachedModule | None:
+        """
+        Get a module body, batching Redis fetches with its siblings.
+
+        Falls back to get_module_sync (which tries S3) when Redis no longer
+        holds the body, e.g. after TTL expiry.
+        """
+        content_hash = self.hashes.get(path)
+        if content_hash is None:
+            return None
+
+        with _bodies_lock:
+            cached = _bodies.get((path, content_hash))
+            if cached is not None:
+                _bodies.move_to_end((path, content_hash))
+                return cached
+
+        batch = [path] + self._uncached_siblings(path)[: BODY_BATCH_SIZE - 1]
+        fetched = get_modules_sync(batch)
+        for fetched_path, module in fetched.items():
+            # Only keep bodies that match the snapshot; a newer body would
+            # disagree with the hash the worker pinned for this execution
+            if module.get("hash") == self.hashes.get(fetched_path):
+                _store_body(fetched_path, module)
+
+        module = fetched.get(path)
+        if module is None:
+            module = get_module_sync(path)
+            if module is not None and module.get("hash"):
+                _store_body(path, module)
+        return module
+
+    def _uncached_siblings(self, path: str) -> list[str]:
+        """Other modules in the same directory whose bodies aren't cached yet."""
+        parent = str(PurePosixPath(path).parent)
+        with _bodies_lock:
+            return [
+                sibling for sibling in self._by_dir.get(parent, [])
+                if sibling != path and (sibling, self.hashes[sibling]) not in _bodies
+            ]
+
+
+def _store_body(path: str, module: CachedModule) -> None:
+    """Cache a module body in-process, evicting the least recently used."""
+    key = (path, module["hash"])
+    with _bodies_lock:
+        _bodies[key] = module
+        _bodies.move_to_end(key)
+        while len(_bodies) > MAX_CACHED_BODIES:
+            _bodies.popitem(last=False)
+
+
+def load_snapshot() -> WorkspaceSnapshot | None:
+    """
+    Fetch the manifest and build a snapshot.
+
+    Returns:
+        The snapshot, or None if the manifest is empty, incomplete or
+        Redis is unavailable (callers fall back to per-import lookups).
+    """
+    try:
+        hashes, index_size = get_module_manifest_sync()
+    except Exception as e:
+        logger.warning(f"Could not load workspace manifest: {e}")
+        return None
+
+    if not hashes or len(hashes) < index_size:
+        logger.debug(
+            f"Workspace manifest incomplete ({len(hashes)}/{index_size} modules), "
+            "using per-import lookups"
+        )
+        return None
+
+    return WorkspaceSnapshot(hashes)
+
+
+def activate_snapshot() -> WorkspaceSnapshot | None:
+    """
+    Load a snapshot and make it the one used by the virtual import hook.
+
+    Returns:
+        The active snapshot, or None if snapshot mode is unavailable
+    """
+    global _active
+    _active = load_snapshot()
+    return _active
+
+
+def deactivate_snapshot() -> None:
+    """Stop resolving imports from the snapshot."""
+    global _active
+    _active = None
+
+
+def get_active_snapshot() -> WorkspaceSnapshot | None:
+    """Get the snapshot used by the virtual import hook, if any."""
+    return _active
+
+
+def get_workspace_module(path: str) -> CachedModule | None:
+    """
+    Get a module body through the active snapshot when there is one.
+
+    Unlike import resolution, explicit loads (the workflow entrypoint) fall
+    back to get_module_sync for paths the snapshot doesn't know about, so
+    a file saved after the snapshot was taken can still run.
+
+    Args:
+        path: Module path relative to workspace
+
+    Returns:
+        CachedModule if found, None otherwise
+    """
+    if _active is not None and _active.get_hash(path) is not None:
+        return _active.get_module(path)
+    return get_module_sync(path)
+
+
+def clear_snapshot_cache() -> None:
+    """Clear the active snapshot and cached bodies. Used for testing."""
+    deactivate_snapshot()
+    with _bodies_lock:
+        _bodies.clear()
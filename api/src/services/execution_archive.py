@@ -0,0 +1,187 @@
+"""
+Execution Archive
+
+Cold storage for the bulky parts of old executions: their logs, result and
+variables move out of Postgres into one zstd-compressed JSONL object per
+execution in the S3 bucket, and the execution row keeps only the object key
+(Execution.archive_key).
+
+Objects are content-addressed (archive/executions/<sha256 of the JSONL>),
+so re-archiving after a failed commit rewrites the same object, and reads
+verify the content against the key. The first line holds the execution's
+result and variables, every following line is one log entry in sequence
+order.
+
+Reads go through a small in-process LRU cache, so paging through an
+archived execution's logs, result and variables costs one download.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from src.config import get_settings
+from src.models import ExecutionLogPublic
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PREFIX = "archive/executions/"
+
+# Max archives kept decoded in-process
+MAX_CACHED_ARCHIVES = 32
+
+# Log levels hidden from non-admins (matches the live execution_logs queries)
+ADMIN_ONLY_LEVELS = ("DEBUG", "TRACEBACK")
+
+_archives: "OrderedDict[str, ExecutionArchive]" = OrderedDict()
+_archives_lock = threading.Lock()
+
+
+@dataclass
+class ExecutionArchive:
+    """Archived result, variables and logs of one execution."""
+
+    execution_id: str
+    result: Any = None
+    variables: dict | None = None
+    logs: list[dict[str, Any]] = field(default_factory=list)
+
+    def log_entries(self, include_admin_levels: bool) -> list[ExecutionLogPublic]:
+        """Archived logs as API models, optionally hiding admin-only levels."""
+        return [
+            ExecutionLogPublic(
+                id=log.get("id"),
+                timestamp=log.get("timestamp") or "",
+                level=log.get("level") or "info",
+                message=log.get("message") or "",
+                data=log.get("data"),
+                sequence=log.get("sequence") or 0,
+            )
+            for log in self.logs
+            if include_admin_levels or log.get("level") not in ADMIN_ONLY_LEVELS
+        ]
+
+
+def archive_key(payload: bytes) -> str:
+    """Object key for an uncompressed archive payload."""
+    return f"{ARCHIVE_PREFIX}{hashlib.sha256(payload).hexdigest()}.jsonl.zst"
+
+
+def serialize_archive(archive: ExecutionArchive) -> bytes:
+    """Encode an archive as JSONL (header line, then one line per log)."""
+    header = {
+        "execution_id": archive.execution_id,
+        "result": archive.result,
+        "variables": archive.variables,
+    }
+    lines = [json.dumps(header, default=str)]
+    lines.extend(json.dumps(log, default=str) for log in archive.logs)
+    return ("\n".join(lines) + "\n").encode()
+
+
+def deserialize_archive(payload: bytes) -> ExecutionArchive:
+    """Decode the JSONL written by serialize_archive."""
+    lines = payload.decode().splitlines()
+    header = json.loads(lines[0])
+    return ExecutionArchive(
+        execution_id=header["execution_id"],
+        result=header.get("result"),
+        variables=header.get("variables"),
+        logs=[json.loads(line) for line in lines[1:] if line],
+    )
+
+
+def log_record(
+    log_id: int,
+    level: str,
+    message: str,
+    data: dict | None,
+    timestamp: datetime | None,
+    sequence: int,
+) -> dict[str, Any]:
+    """Archive line for one execution_logs row."""
+    return {
+        "id": log_id,
+        "level": level,
+        "message": message,
+        "data": data,
+        "timestamp": timestamp.isoformat() if timestamp else None,
+        "sequence": sequence,
+    }
+
+
+def compress(payload: bytes) -> bytes:
+    """zstd-compress an archive payload."""
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=10).compress(payload)
+
+
+def decompress(blob: bytes) -> bytes:
+    """Decompress an archive object."""
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompressobj().decompress(blob)
+
+
+async def upload_archive(s3: Any, archive: ExecutionArchive) -> str:
+    """
+    Write an archive object with an open S3 client.
+
+    Returns:
+        The object key to store on the execution
+    """
+    payload = serialize_archive(archive)
+    key = archive_key(payload)
+    await s3.put_object(
+        Bucket=get_settings().s3_bucket,
+        Key=key,
+        Body=compress(payload),
+        ContentType="application/zstd",
+    )
+    return key
+
+
+async def load_archive(key: str) -> ExecutionArchive:
+    """
+    Fetch an archived execution, from the in-process cache when possible.
+
+    Raises:
+        FileNotFoundError: If the object is missing
+        ValueError: If the object does not match its content address
+    """
+    with _archives_lock:
+        cached = _archives.get(key)
+        if cached is not None:
+            _archives.move_to_end(key)
+            return cached
+
+    from src.services.file_storage.s3_client import S3StorageClient
+
+    blob = await S3StorageClient(get_settings()).read_uploaded_file(key)
+    payload = decompress(blob)
+    if archive_key(payload) != key:
+        raise ValueError(f"Archived execution {key} does not match its content hash")
+
+    archive = deserialize_archive(payload)
+    _store(key, archive)
+    return archive
+
+
+def _store(key: str, archive: ExecutionArchive) -> None:
+    with _archives_lock:
+        _archives[key] = archive
+        _archives.move_to_end(key)
+        while len(_archives) > MAX_CACHED_ARCHIVES:
+            _archives.popitem(last=False)
+
+
+def clear_archive_cache() -> None:
+    """Drop every cached archive (for tests)."""
+    with _archives_lock:
+        _archives.clear()
@@ -0,0 +1,447 @@
+"""
+Incremental execution rollups.
+
+Dashboard totals used to be computed with count/sum over the whole
+executions table on every refresh. Instead, executions are folded into
+hourly and daily buckets (execution_rollups_hourly / execution_rollups_daily)
+from a created_at high-water mark, and totals are read as:
+
+    rollup buckets (created_at <= watermark)
+    + a live scan of executions created after the watermark
+
+The watermark only passes executions that have finished: it stays behind
+the oldest Pending/Running/Cancelling execution and a few minutes behind
+now (so rows committed late are not skipped). It is stored in
+metrics_rollup_checkpoints in the same transaction as the buckets.
+
+Running/pending counts come from the process pool heartbeats instead of
+scanning executions.
+
+verify_execution_rollups() compares the daily buckets against a full scan
+(correctness-check mode; expensive, run on demand or via
+BIFROST_METRICS_ROLLUP_VERIFY).
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, fields
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import case, delete, func, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import get_redis
+from src.core.database import get_session_factory
+from src.core.metrics import lock_metrics_checkpoint
+from src.models import (
+    Execution as ExecutionModel,
+    ExecutionRollupDaily,
+    ExecutionRollupHourly,
+    MetricsRollupCheckpoint,
+)
+from src.models.enums import ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "execution_rollups"
+
+# Executions created within this window are not rolled up yet
+ROLLUP_LAG = timedelta(minutes=5)
+
+# Largest created_at range folded in one transaction (initial backfill)
+MAX_ROLLUP_WINDOW = timedelta(days=31)
+
+# Hourly buckets are only needed for the last 24 hours
+HOURLY_RETENTION = timedelta(days=8)
+
+# Unfinished executions. Literal (not bound) so the planner can match the
+# partial index ix_executions_active_created.
+ACTIVE_EXECUTIONS = text("executions.status IN ('Pending', 'Running', 'Cancelling')")
+
+
+@dataclass
+class ExecutionTotals:
+    """Execution counts over a set of executions."""
+
+    execution_count: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    timeout_count: int = 0
+    cancelled_count: int = 0
+    success_duration_ms: int = 0
+    success_duration_count: int = 0
+    total_memory_bytes: int = 0
+    total_cpu_seconds: float = 0.0
+
+    def __add__(self, other: "ExecutionTotals") -> "ExecutionTotals":
+        return ExecutionTotals(**{
+            f.name: getattr(self, f.name) + getattr(other, f.name)
+            for f in fields(self)
+        })
+
+    @property
+    def success_rate(self) -> float:
+        """Success percentage (0-100)."""
+        if not self.execution_count:
+            return 0.0
+        return self.success_count / self.execution_count * 100
+
+    @property
+    def avg_success_duration_ms(self) -> float:
+        """Average duration of successful executions."""
+        if not self.success_duration_count:
+            return 0.0
+        return self.success_duration_ms / self.success_duration_count
+
+    @classmethod
+    def from_row(cls, row: Any) -> "ExecutionTotals":
+        """Build totals from a row with one column per field (NULL = 0)."""
+        mapping = row._mapping
+        totals = cls()
+        for f in fields(cls):
+            value = mapping.get(f.name)
+            if value is not None:
+                setattr(
+                    totals,
+                    f.name,
+                    float(value) if isinstance(f.default, float) else int(value),
+                )
+        return totals
+
+
+COUNTER_FIELDS = tuple(f.name for f in fields(ExecutionTotals))
+
+
+def _execution_aggregates() -> list[Any]:
+    """Aggregate columns over executions, labelled like ExecutionTotals."""
+    status = ExecutionModel.status
+    success = status == ExecutionStatus.SUCCESS.value
+    has_duration = success & ExecutionModel.duration_ms.isnot(None)
+    return [
+        func.count(ExecutionModel.id).label("execution_count"),
+        func.sum(case((success, 1), else_=0)).label("success_count"),
+        func.sum(case((status == ExecutionStatus.FAILED.value, 1), else_=0)).label("failed_count"),
+        func.sum(case((status == ExecutionStatus.TIMEOUT.value, 1), else_=0)).label("timeout_count"),
+        func.sum(case((status == ExecutionStatus.CANCELLED.value, 1), else_=0)).label("cancelled_count"),
+        func.sum(case((has_duration, ExecutionModel.duration_ms), else_=0)).label("success_duration_ms"),
+        func.sum(case((has_duration, 1), else_=0)).label("success_duration_count"),
+        func.sum(func.coalesce(ExecutionModel.peak_memory_bytes, 0)).label("total_memory_bytes"),
+        func.sum(func.coalesce(ExecutionModel.cpu_total_seconds, 0.0)).label("total_cpu_seconds"),
+    ]
+
+
+def _bucket_aggregates(model: type) -> list[Any]:
+    """Sum columns over rollup buckets, labelled like ExecutionTotals."""
+    return [func.sum(getattr(model, name)).label(name) for name in COUNTER_FIELDS]
+
+
+def _truncate_created_at(unit: str) -> Any:
+    """created_at truncated to an hour/day in UTC (literal args so GROUP BY matches)."""
+    return func.date_trunc(
+        literal_column(f"'{unit}'"), ExecutionModel.created_at, literal_column("'UTC'")
+    )
+
+
+def _to_position(moment: datetime) -> int:
+    """Checkpoint position (microseconds since the epoch) for a timestamp."""
+    delta = moment - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_position(position: int) -> datetime:
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=position)
+
+
+async def get_rollup_watermark(db: AsyncSession) -> datetime | None:
+    """
+    Get the created_at up to which executions are rolled up.
+
+    Returns:
+        The watermark, or None if nothing has been rolled up yet
+    """
+    result = await db.execute(
+        select(MetricsRollupCheckpoint.position)
+        .where(MetricsRollupCheckpoint.name == CHECKPOINT_NAME)
+    )
+    position = result.scalar_one_or_none()
+    if position is None or position < 0:
+        return None
+    return _from_position(position)
+
+
+async def _rollup_target(db: AsyncSession, now: datetime) -> datetime:
+    """Newest created_at that can be rolled up without missing a status change."""
+    target = now - ROLLUP_LAG
+    result = await db.execute(
+        select(func.min(ExecutionModel.created_at))
+        .where(ACTIVE_EXECUTIONS)
+    )
+    oldest_active = result.scalar()
+    if oldest_active is not None:
+        target = min(target, oldest_active - timedelta(microseconds=1))
+    return target
+
+
+async def _apply_buckets(
+    db: AsyncSession, start: datetime, end: datetime
+) -> int:
+    """
+    Add executions created in (start, end] to the hourly and daily buckets.
+
+    Returns:
+        Number of executions rolled up
+    """
+    hour = _truncate_created_at("hour").label("hour")
+    result = await db.execute(
+        select(hour, *_execution_aggregates())
+        .where(ExecutionModel.created_at > start)
+        .where(ExecutionModel.created_at <= end)
+        .group_by(hour)
+    )
+
+    hourly: list[dict[str, Any]] = []
+    daily: dict[date, ExecutionTotals] = {}
+    for row in result.all():
+        totals = ExecutionTotals.from_row(row)
+        bucket = row.hour.astimezone(timezone.utc)
+        hourly.append({"hour": bucket, **asdict(totals)})
+        day = bucket.date()
+        daily[day] = daily.get(day, ExecutionTotals()) + totals
+
+    for model, key, values in (
+        (ExecutionRollupHourly, "hour", hourly),
+        (
+            ExecutionRollupDaily,
+            "date",
+            [{"date": day, **asdict(totals)} for day, totals in daily.items()],
+        ),
+    ):
+        if not values:
+            continue
+        stmt = insert(model).values(values)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={
+                name: getattr(model, name) + getattr(stmt.excluded, name)
+                for name in COUNTER_FIELDS
+            },
+        ))
+
+    return sum(totals.execution_count for totals in daily.values())
+
+
+async def advance_execution_rollups(now: datetime | None = None) -> dict[str, Any]:
+    """
+    Fold executions created since the watermark into the rollup buckets.
+
+    Each step (at most MAX_ROLLUP_WINDOW of created_at) commits its buckets
+    together with the new watermark, so an interrupted run resumes where
+    the last committed step ended.
+
+    Args:
+        now: Current time (for tests)
+
+    Returns:
+        Summary with the new watermark and the number of executions rolled up
+    """
+    now = now or datetime.now(timezone.utc)
+    session_factory = get_session_factory()
+    rolled_up = 0
+
+    async with session_factory() as db:
+        target = await _rollup_target(db, now)
+
+    while True:
+        async with session_factory() as db:
+            position = await lock_metrics_checkpoint(db, CHECKPOINT_NAME)
+            if position >= 0:
+                start = _from_position(position)
+            else:
+                # First run: start just before the oldest execution
+                result = await db.execute(select(func.min(ExecutionModel.created_at)))
+                first = result.scalar()
+                if first is None:
+                    await db.commit()
+                    return {"watermark": None, "rolled_up": 0}
+                start = first - timedelta(microseconds=1)
+
+            if start >= target:
+                await db.commit()
+                return {"watermark": start.isoformat(), "rolled_up": rolled_up}
+
+            end = min(target, start + MAX_ROLLUP_WINDOW)
+            rolled_up += await _apply_buckets(db, start, end)
+            await db.execute(
+                update(MetricsRollupCheckpoint)
+                .where(MetricsRollupCheckpoint.name == CHECKPOINT_NAME)
+                .values(position=_to_position(end))
+            )
+            await db.execute(
+                delete(ExecutionRollupHourly)
+                .where(ExecutionRollupHourly.hour < now - HOURLY_RETENTION)
+            )
+            await db.commit()
+
+        if end >= target:
+            return {"watermark": end.isoformat(), "rolled_up": rolled_up}
+
+
+async def _scan_totals(db: AsyncSession, *conditions: Any) -> ExecutionTotals:
+    result = await db.execute(select(*_execution_aggregates()).where(*conditions))
+    return ExecutionTotals.from_row(result.one())
+
+
+async def get_execution_totals(
+    db: AsyncSession, since: datetime | None = None
+) -> ExecutionTotals:
+    """
+    Get execution totals from the rollups plus executions past the watermark.
+
+    Args:
+        db: Database session
+        since: Only count executions created at or after this time
+            (None = all time)
+
+    Returns:
+        Execution totals
+    """
+    watermark = await get_rollup_watermark(db)
+    if watermark is None:
+        conditions = [ExecutionModel.created_at >= since] if since else []
+        return await _scan_totals(db, *conditions)
+
+    if since is None:
+        result = await db.execute(select(*_bucket_aggregates(ExecutionRollupDaily)))
+        totals = ExecutionTotals.from_row(result.one())
+    else:
+        # Whole hours from the buckets, the partial first hour from executions
+        first_hour = since.replace(minute=0, second=0, microsecond=0)
+        if first_hour < since:
+            first_hour += timedelta(hours=1)
+        result = await db.execute(
+            select(*_bucket_aggregates(ExecutionRollupHourly))
+            .where(ExecutionRollupHourly.hour >= first_hour)
+        )
+        totals = ExecutionTotals.from_row(result.one())
+        if since < first_hour and since <= watermark:
+            totals += await _scan_totals(
+                db,
+                ExecutionModel.created_at >= since,
+                ExecutionModel.created_at < first_hour,
+                ExecutionModel.created_at <= watermark,
+            )
+
+    tail = [ExecutionModel.created_at > watermark]
+    if since is not None:
+        tail.append(ExecutionModel.created_at >= since)
+    return totals + await _scan_totals(db, *tail)
+
+
+async def get_live_execution_counts(db: AsyncSession | None = None) -> tuple[int, int]:
+    """
+    Get the number of running and pending executions.
+
+    Summed from the process pool heartbeats: running = executions in a
+    worker process, pending = executions waiting for a free process.
+    Falls back to counting Running/Pending executions (via the partial
+    index on unfinished executions) if Redis is unavailable.
+
+    Args:
+        db: Database session for the fallback
+
+    Returns:
+        (running, pending)
+    """
+    try:
+        async with get_redis() as r:
+            keys = [
+                key async for key in r.scan_iter(match="bifrost:pool:*:heartbeat", count=100)
+            ]
+            heartbeats = await r.mget(keys) if keys else []
+    except Exception as e:
+        logger.warning(f"Could not read pool heartbeats ({e}), counting executions")
+        if db is None:
+            return 0, 0
+        result = await db.execute(
+            select(
+                func.sum(case((ExecutionModel.status == ExecutionStatus.RUNNING.value, 1), else_=0)),
+                func.sum(case((ExecutionModel.status == ExecutionStatus.PENDING.value, 1), else_=0)),
+            ).where(ACTIVE_EXECUTIONS)
+        )
+        running, pending = result.one()
+        return int(running or 0), int(pending or 0)
+
+    running = pending = 0
+    for raw in heartbeats:
+        if not raw:
+            continue
+        try:
+            heartbeat = json.loads(raw)
+        except (TypeError, ValueError):
+            continue
+        running += int(heartbeat.get("running_count", heartbeat.get("busy_count", 0)))
+        pending += int(heartbeat.get("waiting_count", 0))
+    return running, pending
+
+
+async def verify_execution_rollups(db: AsyncSession) -> dict[str, Any]:
+    """
+    Compare the daily rollups against a full scan of executions.
+
+    Scans every execution up to the watermark (expensive), so this is a
+    correctness check, not part of the normal refresh. Differences appear
+    when rolled-up executions change status or are deleted afterwards.
+
+    Returns:
+        {"watermark", "ok", "mismatches": [{"date", "rollup", "scan"}]}
+    """
+    watermark = await get_rollup_watermark(db)
+    if watermark is None:
+        return {"watermark": None, "ok": True, "mismatches": []}
+
+    day = _truncate_created_at("day").label("day")
+    result = await db.execute(
+        select(day, *_execution_aggregates())
+        .where(ExecutionModel.created_at <= watermark)
+        .group_by(day)
+    )
+    scanned = {
+        row.day.astimezone(timezone.utc).date(): ExecutionTotals.from_row(row)
+        for row in result.all()
+    }
+
+    result = await db.execute(select(ExecutionRollupDaily))
+    rolled = {
+        row.date: ExecutionTotals(**{name: getattr(row, name) for name in COUNTER_FIELDS})
+        for row in result.scalars().all()
+    }
+
+    mismatches = []
+    for bucket in sorted(set(scanned) | set(rolled)):
+        expected = scanned.get(bucket, ExecutionTotals())
+        actual = rolled.get(bucket, ExecutionTotals())
+        if not _totals_match(expected, actual):
+            mismatches.append({
+                "date": bucket.isoformat(),
+                "rollup": asdict(actual),
+                "scan": asdict(expected),
+            })
+
+    return {
+        "watermark": watermark.isoformat(),
+        "ok": not mismatches,
+        "mismatches": mismatches,
+    }
+
+
+def _totals_match(a: ExecutionTotals, b: ExecutionTotals) -> bool:
+    for name in COUNTER_FIELDS:
+        left, right = getattr(a, name), getattr(b, name)
+        if isinstance(left, float) or isinstance(right, float):
+            if abs(left - right) > 1e-6 * max(1.0, abs(left), abs(right)):
+                return False
+        elif left != right:
+            return False
+    return True
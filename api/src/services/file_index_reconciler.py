@@ -11,12 +11,18 @@ from __future__ import annotations
 import hashlib
 import logging
 
-from sqlalchemy import delete, select
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.orm.file_index import FileIndex
 from src.services.file_index_service import _is_text_file
+from src.services.file_index_sync import (
+    DELETE_BATCH_SIZE,
+    FileIndexWriter,
+    delete_index_paths,
+    diff_index,
+    load_index_hashes,
+)
 from src.services.repo_storage import RepoStorage
 
 logger = logging.getLogger(__name__)
@@ -36,52 +42,48 @@ async def reconcile_file_index(
 
     # Get all files from S3
     s3_paths = set(await repo.list())
-    # Filter to text files only
-    s3_text_paths = {p for p in s3_paths if _is_text_file(p)}
+    # Filter to text files only. S3 listings carry no SHA-256, so files
+    # already indexed are taken as unchanged.
+    s3_text_paths = {p: None for p in s3_paths if _is_text_file(p)}
 
-    # Get all paths from file_index
-    result = await db.execute(select(FileIndex.path))
-    db_paths = {row[0] for row in result.all()}
+    # Diff against the hashes in file_index
+    diff = diff_index(s3_text_paths, await load_index_hashes(db), present=s3_paths)
+    stats["unchanged"] = diff.unchanged
 
     # Files in S3 but not in DB -> add
-    to_add = s3_text_paths - db_paths
-    for path in to_add:
+    writer = FileIndexWriter(db)
+    for path in diff.changed:
         try:
             content = await repo.read(path)
             content_str = content.decode("utf-8")
             content_hash = hashlib.sha256(content).hexdigest()
-
-            stmt = insert(FileIndex).values(
-                path=path,
-                content=content_str,
-                content_hash=content_hash,
-            ).on_conflict_do_nothing()
-            await db.execute(stmt)
+            await writer.add(path, content_str, content_hash)
             stats["added"] += 1
         except Exception as e:
             logger.warning(f"Failed to index {path}: {e}")
+    await writer.flush()
 
     # Files in DB but not in S3 -> reverse-sync (write DB content to S3)
     # This handles the case where the pre-migration backfill populated
     # file_index but S3 was unavailable at the time.
-    to_reverse_sync = db_paths - s3_paths
-    for path in to_reverse_sync:
-        try:
-            fi_result = await db.execute(
-                select(FileIndex.content).where(FileIndex.path == path)
+    orphaned: list[str] = []
+    for start in range(0, len(diff.stale), DELETE_BATCH_SIZE):
+        fi_result = await db.execute(
+            select(FileIndex.path, FileIndex.content).where(
+                FileIndex.path.in_(diff.stale[start:start + DELETE_BATCH_SIZE])
             )
-            content_str = fi_result.scalar_one_or_none()
-            if content_str is not None:
+        )
+        for path, content_str in fi_result.all():
+            if content_str is None:
+                # No content in DB either — orphaned row, remove it
+                orphaned.append(path)
+                continue
+            try:
                 await repo.write(path, content_str.encode("utf-8"))
                 stats["reverse_synced"] += 1
-            else:
-                # No content in DB either — orphaned row, remove it
-                await db.execute(
-                    delete(FileIndex).where(FileIndex.path == path)
-                )
-                stats["removed"] += 1
-        except Exception as e:
-            logger.warning(f"Failed to reverse-sync {path}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to reverse-sync {path}: {e}")
+    stats["removed"] = await delete_index_paths(db, orphaned)
 
     await db.commit()
 
@@ -0,0 +1,226 @@
+"""
+File Index Search — regex search over file_index backed by its trigram index.
+
+Shared by the code editor search and the MCP search_content tool.
+The literal substrings every match of the regex must contain are turned
+into LIKE/ILIKE predicates, which Postgres answers from the pg_trgm GIN
+index on file_index.content. Only the candidate files it returns are
+fetched, a page at a time in path order, and searched with the exact
+Python regex, stopping as soon as enough matches are found. Each
+candidate is split into lines once; matches keep a reference to those
+lines for context.
+
+The literals are read from the regex parser's private modules (re._parser,
+re._constants, re._casefix). Without them, or if they change shape, no
+predicates are derived and every file is searched.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.orm.file_index import FileIndex
+
+logger = logging.getLogger(__name__)
+
+# Candidate files fetched per query
+CANDIDATE_PAGE_SIZE = 50
+
+# Shortest literal worth a predicate (pg_trgm indexes 3-character trigrams)
+MIN_LITERAL_LENGTH = 3
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+    from re._casefix import _EXTRA_CASES
+
+    _REPEATS = (
+        sre_constants.MAX_REPEAT,
+        sre_constants.MIN_REPEAT,
+        sre_constants.POSSESSIVE_REPEAT,
+    )
+except (ImportError, AttributeError):
+    logger.warning("Regex parser internals unavailable; file_index search scans every file")
+    sre_constants = sre_parse = None  # type: ignore[assignment]
+
+
+@dataclass
+class LineMatch:
+    """A regex match on one line of a file."""
+
+    path: str
+    line_number: int  # 1-indexed
+    column: int
+    lines: list[str] = field(repr=False)
+
+    @property
+    def line(self) -> str:
+        return self.lines[self.line_number - 1]
+
+    def context(self, context_lines: int) -> tuple[list[str], list[str]]:
+        """Numbered lines before and after the match ("12: text")."""
+        idx = self.line_number - 1
+        start = max(0, idx - context_lines)
+        end = min(len(self.lines), idx + context_lines + 1)
+        before = [f"{i + 1}: {self.lines[i]}" for i in range(start, idx)]
+        after = [f"{i + 1}: {self.lines[i]}" for i in range(idx + 1, end)]
+        return before, after
+
+
+@dataclass
+class SearchOutcome:
+    """Matches of a search, up to its limit."""
+
+    matches: list[LineMatch] = field(default_factory=list)
+    files_searched: int = 0
+    truncated: bool = False
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_fragment(literal: str, ignore_case: bool) -> str:
+    """
+    LIKE pattern fragment for a literal.
+
+    Case-insensitive Python regexes match some characters ILIKE would not
+    (e.g. "s" also matches "ſ"), so those, and any non-ASCII character,
+    become the single-character wildcard.
+    """
+    if not ignore_case:
+        return _escape_like(literal)
+    return "".join(
+        "_" if not ch.isascii() or ord(ch.lower()) in _EXTRA_CASES else _escape_like(ch)
+        for ch in literal
+    )
+
+
+def _required_literals(parsed: Any, ignore_case: bool) -> list[tuple[str, bool]]:
+    """(literal, ignore_case) runs that any match of a parsed sequence contains."""
+    runs: list[tuple[str, bool]] = []
+    current: list[str] = []
+
+    def end_run() -> None:
+        if current:
+            runs.append(("".join(current), ignore_case))
+            current.clear()
+
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            current.append(chr(av))
+        elif op is sre_constants.AT:
+            continue  # zero-width; adjacent literals stay adjacent
+        elif op is sre_constants.SUBPATTERN:
+            end_run()
+            _group, add_flags, _del_flags, sub = av
+            runs.extend(_required_literals(sub, ignore_case or bool(add_flags & re.IGNORECASE)))
+        elif op is sre_constants.ATOMIC_GROUP:
+            end_run()
+            runs.extend(_required_literals(av, ignore_case))
+        elif op in _REPEATS:
+            end_run()
+            low, _high, sub = av
+            if low >= 1:
+                runs.extend(_required_literals(sub, ignore_case))
+        else:
+            # Alternations, classes, lookarounds, backreferences: no requirement
+            end_run()
+    end_run()
+    return runs
+
+
+def content_filters(regex: re.Pattern[str]) -> list[ColumnElement[bool]]:
+    """
+    LIKE/ILIKE predicates on file_index.content implied by a regex.
+
+    Every file containing a match satisfies all of them, so they only
+    narrow the files to search. Returns [] when nothing can be derived,
+    including when the regex parser internals are unavailable.
+    """
+    if sre_parse is None:
+        return []
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+        literals = _required_literals(parsed, bool(regex.flags & re.IGNORECASE))
+    except Exception:
+        return []
+
+    filters: list[ColumnElement[bool]] = []
+    seen: set[tuple[str, bool]] = set()
+    for literal, ignore_case in literals:
+        fragment = _like_fragment(literal, ignore_case)
+        if not any(len(part) >= MIN_LITERAL_LENGTH for part in fragment.split("_")):
+            continue
+        if (fragment, ignore_case) in seen:
+            continue
+        seen.add((fragment, ignore_case))
+        like = f"%{fragment}%"
+        filters.append(FileIndex.content.ilike(like) if ignore_case else FileIndex.content.like(like))
+    return filters
+
+
+async def search_file_index(
+    db: AsyncSession,
+    regex: re.Pattern[str],
+    *,
+    conditions: list[ColumnElement[bool]] | None = None,
+    max_results: int,
+    max_files: int | None = None,
+    every_match: bool = False,
+) -> SearchOutcome:
+    """
+    Search file_index content line by line.
+
+    Args:
+        db: Database session
+        regex: Pattern matched against each line
+        conditions: Extra filters on FileIndex (path, prefix, ...)
+        max_results: Stop after this many matches (truncated is set if more exist)
+        max_files: Stop after searching this many files
+        every_match: One result per match (with its column) instead of per line
+
+    Returns:
+        SearchOutcome with matches in path and line order
+    """
+    outcome = SearchOutcome()
+    query = (
+        select(FileIndex.path, FileIndex.content)
+        .where(FileIndex.content.isnot(None), *(conditions or []), *content_filters(regex))
+        .order_by(FileIndex.path)
+    )
+
+    last_path: str | None = None
+    while True:
+        page_size = CANDIDATE_PAGE_SIZE
+        if max_files is not None:
+            page_size = min(page_size, max_files - outcome.files_searched)
+            if page_size <= 0:
+                return outcome
+        page = query.limit(page_size)
+        if last_path is not None:
+            page = page.where(FileIndex.path > last_path)
+        rows = (await db.execute(page)).all()
+
+        for row in rows:
+            outcome.files_searched += 1
+            lines = row.content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+            for line_idx, line in enumerate(lines):
+                found = regex.finditer(line) if every_match else filter(None, [regex.search(line)])
+                for match in found:
+                    if len(outcome.matches) >= max_results:
+                        outcome.truncated = True
+                        return outcome
+                    outcome.matches.append(
+                        LineMatch(row.path, line_idx + 1, match.start(), lines)
+                    )
+
+        if len(rows) < page_size:
+            return outcome
+        last_path = rows[-1].path
@@ -0,0 +1,132 @@
+"""
+File Index Sync — bring file_index in line with a set of files by hash.
+
+Shared by git sync, workspace reindex and the file_index reconciler.
+Callers hash the files they have, diff them against the stored hashes
+(path and content_hash only, never content), and then write only the
+changed files through FileIndexWriter, which flushes bounded multi-row
+upserts, and delete stale rows in chunks.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.orm.file_index import FileIndex
+
+logger = logging.getLogger(__name__)
+
+# Rows and content bytes per multi-row upsert
+UPSERT_BATCH_ROWS = 200
+UPSERT_BATCH_BYTES = 8 * 1024 * 1024
+
+# Paths per DELETE ... WHERE path IN (...)
+DELETE_BATCH_SIZE = 1000
+
+
+@dataclass
+class IndexDiff:
+    """Difference between files on hand and the stored file_index rows."""
+
+    changed: list[str] = field(default_factory=list)
+    stale: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+async def load_index_hashes(db: AsyncSession) -> dict[str, str | None]:
+    """Stored content hash of every file_index row, by path."""
+    result = await db.execute(select(FileIndex.path, FileIndex.content_hash))
+    return {path: content_hash for path, content_hash in result.all()}
+
+
+def diff_index(
+    current: Mapping[str, str | None],
+    stored: Mapping[str, str | None],
+    present: Collection[str] | None = None,
+) -> IndexDiff:
+    """
+    Diff the files on hand against the stored hashes.
+
+    Args:
+        current: Hash of each file that belongs in the index. None means the
+            hash is unknown, so the file only counts as changed when it is not
+            indexed yet.
+        stored: Result of load_index_hashes()
+        present: Every path that still exists, indexed or not (defaults to
+            the keys of current). Stored paths outside it are stale.
+    """
+    diff = IndexDiff()
+    for path, content_hash in current.items():
+        if path not in stored or (content_hash is not None and stored[path] != content_hash):
+            diff.changed.append(path)
+        else:
+            diff.unchanged += 1
+
+    present = current if present is None else present
+    diff.stale = [path for path in stored if path not in present]
+    return diff
+
+
+class FileIndexWriter:
+    """
+    Buffers file_index rows and writes them as multi-row upserts.
+
+    A batch is flushed once it holds UPSERT_BATCH_ROWS rows or
+    UPSERT_BATCH_BYTES of content; call flush() after the last add().
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_rows: int = UPSERT_BATCH_ROWS,
+        max_bytes: int = UPSERT_BATCH_BYTES,
+    ):
+        self.db = db
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.written = 0
+        self._rows: dict[str, dict[str, str]] = {}
+        self._bytes = 0
+
+    async def add(self, path: str, content: str, content_hash: str) -> None:
+        """Queue a row, flushing the batch when it is full."""
+        self._rows[path] = {"path": path, "content": content, "content_hash": content_hash}
+        self._bytes += len(content)
+        if len(self._rows) >= self.max_rows or self._bytes >= self.max_bytes:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the queued rows."""
+        if not self._rows:
+            return
+        stmt = insert(FileIndex).values(list(self._rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FileIndex.path],
+            set_={
+                "content": stmt.excluded.content,
+                "content_hash": stmt.excluded.content_hash,
+                "updated_at": text("NOW()"),
+            },
+        )
+        await self.db.execute(stmt)
+        self.written += len(self._rows)
+        self._rows = {}
+        self._bytes = 0
+
+
+async def delete_index_paths(db: AsyncSession, paths: Collection[str]) -> int:
+    """Delete file_index rows in chunks. Returns the number of rows deleted."""
+    paths = list(paths)
+    deleted = 0
+    for start in range(0, len(paths), DELETE_BATCH_SIZE):
+        result = await db.execute(
+            delete(FileIndex).where(FileIndex.path.in_(paths[start:start + DELETE_BATCH_SIZE]))
+        )
+        deleted += max(result.rowcount or 0, 0)
+    return deleted
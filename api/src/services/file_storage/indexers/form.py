@@ -260,6 +260,10 @@ class FormIndexer:
                 )
                 self.db.add(field_orm)
 
+        # Forms written from files bypass the form routes' cache invalidation
+        from src.core.cache import invalidate_form
+        await invalidate_form(None, str(form_id))
+
         logger.debug(f"Indexed form: {name} from {path}")
         return content_modified
 
@@ -295,6 +299,8 @@ class FormIndexer:
         count = result.rowcount if result.rowcount else 0
 
         if count > 0:
+            from src.core.cache import invalidate_form
+            await invalidate_form(None, str(form_id))
             logger.info(f"Deleted form {form_id} from database for deleted file: {path}")
 
         return count
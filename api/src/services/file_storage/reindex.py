@@ -10,12 +10,18 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import Settings
 from src.models.orm.file_index import FileIndex
+from src.services.file_index_sync import (
+    FileIndexWriter,
+    delete_index_paths,
+    diff_index,
+    load_index_hashes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -117,15 +123,16 @@ class WorkspaceReindexService:
         """
         Reindex file_index table from local filesystem.
 
-        Ensures DB matches actual files on disk.
-        Also reconciles orphaned workflows/data_providers.
+        Ensures DB matches actual files on disk, writing only files whose
+        content hash differs from file_index. Also reconciles orphaned
+        workflows/data_providers.
 
         Args:
             local_path: Local workspace directory (e.g., /tmp/bifrost/workspace)
 
         Returns:
-            Dict with counts: files_indexed, files_removed, workflows_deactivated,
-            data_providers_deactivated
+            Dict with counts: files_indexed (new or changed), files_removed,
+            workflows_deactivated, data_providers_deactivated
         """
         from src.models import Workflow
         from src.services.editor.file_filter import is_excluded_path
@@ -146,19 +153,14 @@ class WorkspaceReindexService:
                     existing_paths.add(rel_path)
 
         # 2. Remove orphaned file_index entries (files no longer on disk)
-        if existing_paths:
-            del_stmt = delete(FileIndex).where(
-                ~FileIndex.path.in_(existing_paths),
-                ~FileIndex.path.endswith("/"),  # Skip folder markers
-            )
-        else:
-            del_stmt = delete(FileIndex).where(
-                ~FileIndex.path.endswith("/"),
-            )
-        result = await self.db.execute(del_stmt)
-        counts["files_removed"] = result.rowcount if result.rowcount > 0 else 0
-
-        # 3. For each existing file, upsert into file_index
+        stored = await load_index_hashes(self.db)
+        stale = [
+            path for path in diff_index({}, stored, present=existing_paths).stale
+            if not path.endswith("/")  # Skip folder markers
+        ]
+        counts["files_removed"] = await delete_index_paths(self.db, stale)
+
+        # 3. For each existing file, upsert into file_index if its hash changed
         # Process files in dependency order to prevent FK constraint violations
         py_files = sorted([p for p in existing_paths if p.endswith(".py")])
         form_files = sorted([p for p in existing_paths if p.endswith(".form.yaml")])
@@ -169,7 +171,7 @@ class WorkspaceReindexService:
         ])
         ordered_paths = py_files + form_files + agent_files + other_files
 
-        now = datetime.now(timezone.utc)
+        writer = FileIndexWriter(self.db)
 
         for rel_path in ordered_paths:
             file_path = local_path / rel_path
@@ -180,28 +182,16 @@ class WorkspaceReindexService:
                 continue
 
             content_hash = self._compute_hash(content)
-            content_str = content.decode("utf-8", errors="replace")
-
-            # Upsert file_index record
-            stmt = insert(FileIndex).values(
-                path=rel_path,
-                content=content_str,
-                content_hash=content_hash,
-                updated_at=now,
-            ).on_conflict_do_update(
-                index_elements=[FileIndex.path],
-                set_={
-                    "content": content_str,
-                    "content_hash": content_hash,
-                    "updated_at": now,
-                },
-            )
-            await self.db.execute(stmt)
+            if stored.get(rel_path) != content_hash:
+                await writer.add(
+                    rel_path, content.decode("utf-8", errors="replace"), content_hash
+                )
 
             # Extract metadata (workflows/data_providers)
             await self._extract_metadata(rel_path, content)
 
-            counts["files_indexed"] += 1
+        await writer.flush()
+        counts["files_indexed"] = writer.written
 
         # 4. Clean up endpoints for orphaned endpoint-enabled workflows
         result = await self.db.execute(
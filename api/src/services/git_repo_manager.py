@@ -2,8 +2,26 @@
 Git Repo Manager — S3-backed persistent git working tree.
 
 Manages the lifecycle of a local git working tree backed by S3 _repo/.
-Uses `aws s3 sync` for efficient incremental transfer of the entire
-directory tree including .git/ objects.
+
+With settings.git_worktree_cache_dir set (the default), the working tree
+is kept on the node between operations, next to a manifest recording the
+S3 ETag, size and mtime of every file as of the last sync. Each checkout
+lists _repo/ and downloads only the objects whose ETag changed (or whose
+local copy was modified), deletes local files no longer in S3, and on exit
+uploads only files changed locally and deletes the ones removed. Objects
+are streamed between S3 and disk in chunks, and files larger than one part
+are uploaded as multipart uploads, so no transfer holds a whole file in
+memory. If the
+incremental sync fails, the tree is synced in full with `aws s3 sync` and
+the manifest is dropped; the next checkout rebuilds it, reusing local files
+whose MD5 still matches their ETag.
+
+Without a cache dir, each checkout syncs the whole tree into a temp dir
+with `aws s3 sync` and back with --delete.
+
+Either way the Redis git lock (bifrost:git-lock) serializes git operations
+across the deployment, so the cache only ever diverges from S3 through the
+other writers below, which the ETag comparison picks up.
 
 Individual file writes (code editor, form/agent CRUD) continue using
 the Python S3 client (RepoStorage/FileIndexService). This manager is
@@ -13,12 +31,16 @@ only used for bulk sync operations (git clone/fetch/merge/push).
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
 import shutil
 import tempfile
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import redis.asyncio as redis
 
@@ -30,9 +52,83 @@ logger = logging.getLogger(__name__)
 GIT_LOCK_KEY = "bifrost:git-lock"
 GIT_LOCK_TIMEOUT = 300  # 5 minutes
 
+# Layout of the cache dir: the working tree and its sync manifest
+CACHE_WORKTREE = "repo"
+CACHE_MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Concurrent S3 transfers during an incremental sync
+TRANSFER_CONCURRENCY = 16
+
+# Bytes read from a download stream at a time
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this are uploaded in parts of (at least) this size.
+# S3 parts are 5 MiB to 5 GiB, at most 10,000 per upload.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_PARTS = 10_000
+
+# Max keys per DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+
+def _file_stat(path: Path) -> tuple[int, int]:
+    """(size, mtime_ns) identifying a local file's content between syncs."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _scan(root: Path) -> dict[str, tuple[int, int]]:
+    """Every file under root as {relative path: (size, mtime_ns)}."""
+    files = {}
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = Path(dirpath) / name
+            if path.is_file():
+                files[path.relative_to(root).as_posix()] = _file_stat(path)
+    return files
+
+
+def _md5_matches(path: Path, etag: str) -> bool:
+    """Whether a local file has the content of an object with this (non-multipart) ETag."""
+    if "-" in etag:
+        return False
+    digest = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest() == etag
+
+
+def _remove(root: Path, rel: str) -> None:
+    """Delete a file and the directories it leaves empty (up to root)."""
+    path = root / rel
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    while parent != root:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+
+
+def _temp_path(path: Path) -> Path:
+    """Sibling file a new version of path is written to before os.replace()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.with_name(f".{path.name}.bifrost-tmp")
+
+
+def _write_file(path: Path, content: bytes) -> tuple[int, int]:
+    """Replace a file atomically and return its new stat."""
+    tmp = _temp_path(path)
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return _file_stat(path)
+
 
 class GitRepoManager:
-    """Context manager that syncs _repo/ between S3 and a local temp dir."""
+    """Context manager that syncs _repo/ between S3 and a local working tree."""
 
     def __init__(self, settings: Settings | None = None):
         self._settings = settings or get_settings()
@@ -41,7 +137,7 @@ class GitRepoManager:
     async def checkout(self) -> AsyncIterator[Path]:
         """
         Acquire a deployment-scoped Redis lock, sync _repo/ from S3 to a
-        temp dir, yield it, then sync back and release the lock.
+        local dir, yield it, then sync back and release the lock.
 
         The lock prevents concurrent git operations from overwriting each
         other's changes in the shared S3 _repo/ prefix.
@@ -53,6 +149,11 @@ class GitRepoManager:
                 ...
             # On exit: changes synced back to S3, lock released
         """
+        if self._settings.git_worktree_cache_dir:
+            async with self._cached_checkout(Path(self._settings.git_worktree_cache_dir)) as work_dir:
+                yield work_dir
+            return
+
         tmp_dir = Path(tempfile.mkdtemp(prefix="bifrost-repo-"))
         try:
             async with self._acquire_lock():
@@ -62,6 +163,37 @@ class GitRepoManager:
         finally:
             shutil.rmtree(tmp_dir, ignore_errors=True)
 
+    @asynccontextmanager
+    async def _cached_checkout(self, cache_dir: Path) -> AsyncIterator[Path]:
+        """
+        checkout() against the persistent working tree in cache_dir.
+
+        A failed operation leaves its changes in the tree; the next
+        checkout restores every file whose stat no longer matches the
+        manifest and removes files S3 does not have.
+        """
+        work_dir = cache_dir / CACHE_WORKTREE
+        async with self._acquire_lock():
+            try:
+                files = await self.sync_down_incremental(work_dir)
+            except Exception as e:
+                logger.warning(f"Incremental sync_down failed, syncing in full: {e}")
+                self._drop_manifest(cache_dir)
+                shutil.rmtree(work_dir, ignore_errors=True)
+                await self.sync_down(work_dir)
+                files = None
+
+            yield work_dir
+
+            if files is not None:
+                try:
+                    await self.sync_up_incremental(work_dir, files)
+                    return
+                except Exception as e:
+                    logger.warning(f"Incremental sync_up failed, syncing in full: {e}")
+                    self._drop_manifest(cache_dir)
+            await self.sync_up(work_dir)
+
     @asynccontextmanager
     async def _acquire_lock(self) -> AsyncIterator[None]:
         """Acquire a Redis lock for the duration of a git operation."""
@@ -103,6 +235,198 @@ class GitRepoManager:
         logger.info(f"sync_up: {source} -> {s3_uri}")
         await self._run_aws_cli(cmd)
 
+    async def sync_down_incremental(self, work_dir: Path) -> dict[str, dict[str, Any]]:
+        """
+        Bring the cached working tree up to date with S3 _repo/.
+
+        Returns:
+            The manifest entries of the synced tree, for sync_up_incremental()
+        """
+        from src.services.repo_storage import REPO_PREFIX
+
+        work_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest(work_dir.parent)
+        local = await asyncio.to_thread(_scan, work_dir)
+
+        async with self._s3_client() as client:
+            remote = await self._list_etags(client)
+
+            files: dict[str, dict[str, Any]] = {}
+            downloads = []
+            for rel, etag in remote.items():
+                stat = local.get(rel)
+                entry = manifest.get(rel)
+                if stat is not None:
+                    if entry and entry["etag"] == etag and (entry["size"], entry["mtime_ns"]) == stat:
+                        files[rel] = entry
+                        continue
+                    if not entry and await asyncio.to_thread(_md5_matches, work_dir / rel, etag):
+                        files[rel] = {"etag": etag, "size": stat[0], "mtime_ns": stat[1]}
+                        continue
+                downloads.append(rel)
+
+            semaphore = asyncio.Semaphore(TRANSFER_CONCURRENCY)
+
+            async def download(rel: str) -> None:
+                async with semaphore:
+                    etag = await self._download(client, f"{REPO_PREFIX}{rel}", work_dir / rel)
+                size, mtime_ns = await asyncio.to_thread(_file_stat, work_dir / rel)
+                files[rel] = {"etag": etag, "size": size, "mtime_ns": mtime_ns}
+
+            await asyncio.gather(*(download(rel) for rel in downloads))
+
+        removed = [rel for rel in local if rel not in remote]
+        for rel in removed:
+            _remove(work_dir, rel)
+
+        self._save_manifest(work_dir.parent, files)
+        logger.info(
+            f"sync_down: {len(downloads)} downloaded, {len(removed)} removed, "
+            f"{len(files) - len(downloads)} unchanged"
+        )
+        return files
+
+    async def sync_up_incremental(
+        self, work_dir: Path, files: dict[str, dict[str, Any]]
+    ) -> None:
+        """
+        Upload files changed since sync_down_incremental() and delete removed ones.
+
+        Args:
+            files: Manifest entries returned by sync_down_incremental()
+        """
+        from src.services.repo_storage import REPO_PREFIX
+
+        local = await asyncio.to_thread(_scan, work_dir)
+        uploads = [
+            rel for rel, stat in local.items()
+            if rel not in files or (files[rel]["size"], files[rel]["mtime_ns"]) != stat
+        ]
+        deletes = [rel for rel in files if rel not in local]
+
+        async with self._s3_client() as client:
+            semaphore = asyncio.Semaphore(TRANSFER_CONCURRENCY)
+
+            async def upload(rel: str) -> None:
+                async with semaphore:
+                    etag = await self._upload(
+                        client, f"{REPO_PREFIX}{rel}", work_dir / rel, local[rel][0]
+                    )
+                files[rel] = {
+                    "etag": etag,
+                    "size": local[rel][0],
+                    "mtime_ns": local[rel][1],
+                }
+
+            await asyncio.gather(*(upload(rel) for rel in uploads))
+
+            for start in range(0, len(deletes), DELETE_BATCH_SIZE):
+                batch = deletes[start:start + DELETE_BATCH_SIZE]
+                await client.delete_objects(
+                    Bucket=self._settings.s3_bucket,
+                    Delete={"Objects": [{"Key": f"{REPO_PREFIX}{rel}"} for rel in batch], "Quiet": True},
+                )
+            for rel in deletes:
+                files.pop(rel, None)
+
+        self._save_manifest(work_dir.parent, files)
+        logger.info(f"sync_up: {len(uploads)} uploaded, {len(deletes)} deleted")
+
+    async def _download(self, client: Any, key: str, path: Path) -> str:
+        """Stream an object into a file, replacing it atomically. Returns the ETag."""
+        response = await client.get_object(Bucket=self._settings.s3_bucket, Key=key)
+        body = response["Body"]
+        tmp = await asyncio.to_thread(_temp_path, path)
+        try:
+            with await asyncio.to_thread(tmp.open, "wb") as f:
+                while chunk := await body.read(DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            await asyncio.to_thread(os.replace, tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        finally:
+            body.close()
+        return response["ETag"].strip('"')
+
+    async def _upload(self, client: Any, key: str, path: Path, size: int) -> str:
+        """
+        Upload a file, in parts if it is larger than MULTIPART_PART_SIZE.
+
+        Only one part is held in memory at a time. Returns the object's ETag.
+        """
+        bucket = self._settings.s3_bucket
+        if size <= MULTIPART_PART_SIZE:
+            content = await asyncio.to_thread(path.read_bytes)
+            response = await client.put_object(Bucket=bucket, Key=key, Body=content)
+            return response["ETag"].strip('"')
+
+        part_size = max(MULTIPART_PART_SIZE, -(-size // MULTIPART_MAX_PARTS))
+        upload = await client.create_multipart_upload(Bucket=bucket, Key=key)
+        upload_id = upload["UploadId"]
+        try:
+            parts = []
+            with await asyncio.to_thread(path.open, "rb") as f:
+                while chunk := await asyncio.to_thread(f.read, part_size):
+                    number = len(parts) + 1
+                    response = await client.upload_part(
+                        Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=chunk
+                    )
+                    parts.append({"ETag": response["ETag"], "PartNumber": number})
+            response = await client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+        return response["ETag"].strip('"')
+
+    async def _list_etags(self, client: Any) -> dict[str, str]:
+        """ETag of every object under _repo/, by relative path."""
+        from src.services.repo_storage import REPO_PREFIX
+
+        etags: dict[str, str] = {}
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self._settings.s3_bucket, Prefix=REPO_PREFIX):
+            for obj in page.get("Contents", []):
+                rel = obj["Key"][len(REPO_PREFIX):]
+                if rel and not rel.endswith("/"):
+                    etags[rel] = obj["ETag"].strip('"')
+        return etags
+
+    def _load_manifest(self, cache_dir: Path) -> dict[str, dict[str, Any]]:
+        """Manifest entries of the last sync, or {} if missing or for another bucket."""
+        try:
+            manifest = json.loads((cache_dir / CACHE_MANIFEST).read_text())
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("bucket") != self._settings.s3_bucket:
+            return {}
+        return manifest.get("files", {})
+
+    def _save_manifest(self, cache_dir: Path, files: dict[str, dict[str, Any]]) -> None:
+        """Write the manifest atomically."""
+        payload = {"version": MANIFEST_VERSION, "bucket": self._settings.s3_bucket, "files": files}
+        _write_file(cache_dir / CACHE_MANIFEST, json.dumps(payload).encode())
+
+    @staticmethod
+    def _drop_manifest(cache_dir: Path) -> None:
+        (cache_dir / CACHE_MANIFEST).unlink(missing_ok=True)
+
+    @asynccontextmanager
+    async def _s3_client(self) -> AsyncIterator[Any]:
+        from aiobotocore.session import get_session
+
+        session = get_session()
+        async with session.create_client(
+            "s3",
+            endpoint_url=self._settings.s3_endpoint_url,
+            aws_access_key_id=self._settings.s3_access_key,
+            aws_secret_access_key=self._settings.s3_secret_key,
+            region_name=self._settings.s3_region,
+        ) as client:
+            yield client
+
     async def has_git_dir(self) -> bool:
         """Check if .git/HEAD exists in S3 _repo/ (quick existence check)."""
         from src.services.repo_storage import RepoStorage
@@ -134,7 +458,6 @@ class GitRepoManager:
 
     def _build_env(self) -> dict[str, str]:
         """Build environment variables for the aws CLI process."""
-        import os
         env = {**os.environ}
         if self._settings.s3_access_key:
             env["AWS_ACCESS_KEY_ID"] = self._settings.s3_access_key
@@ -11,6 +11,7 @@ Key principles:
 5. Preflight validates repo health (syntax, lint, refs, orphans)
 """
 
+import asyncio
 import hashlib
 import logging
 import subprocess
@@ -74,9 +75,16 @@ def _content_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
-def _walk_tree(root: Path) -> dict[str, bytes]:
-    """Walk a directory tree and return {relative_path: content} for all files."""
-    files: dict[str, bytes] = {}
+def _hash_tree(root: Path) -> dict[str, str | None]:
+    """
+    Walk a directory tree and return {relative_path: content hash} for all files.
+
+    Only files that belong in file_index (text files) are read and hashed;
+    other paths map to None.
+    """
+    from src.services.file_index_service import _is_text_file
+
+    files: dict[str, str | None] = {}
     for p in root.rglob("*"):
         if p.is_dir():
             continue
@@ -84,7 +92,7 @@ def _walk_tree(root: Path) -> dict[str, bytes]:
         # Skip .git internals
         if rel.startswith(".git/") or rel == ".git":
             continue
-        files[rel] = p.read_bytes()
+        files[rel] = _content_hash(p.read_bytes()) if _is_text_file(rel) else None
     return files
 
 
@@ -512,6 +520,7 @@ class GitHubSyncService:
                     await self._delete_removed_entities(work_dir)
                     await self._update_file_index(work_dir)
                 await self.db.commit()
+                await self._mark_sdk_cache_stale()
 
                 # Pop stash to restore local changes (after import reads clean state)
                 await _progress("Cleaning up...")
@@ -662,6 +671,7 @@ class GitHubSyncService:
                     await self._delete_removed_entities(work_dir)
                     await self._update_file_index(work_dir)
                 await self.db.commit()
+                await self._mark_sdk_cache_stale()
 
                 # Sync app preview files from repo to _apps/{id}/preview/
                 await self._sync_app_previews(work_dir)
@@ -896,6 +906,11 @@ class GitHubSyncService:
 
         return all_ops
 
+    async def _mark_sdk_cache_stale(self) -> None:
+        """Make the next SDK cache pre-warm of every org re-read imported entities."""
+        from src.core.cache import bump_cache_versions
+        await bump_cache_versions(None, "config", "forms", "roles", "org")
+
     async def _import_all_entities(self, work_dir: Path) -> int:
         """Import all entities from the working tree into the DB.
 
@@ -1082,6 +1097,7 @@ class GitHubSyncService:
                 await self._delete_removed_entities(work_dir)
                 await self._update_file_index(work_dir)
             await self.db.commit()
+            await self._mark_sdk_cache_stale()
 
             # Re-run indexers on all registered workflow files
             await self._reindex_registered_workflows(work_dir)
@@ -2026,6 +2042,7 @@ class GitHubSyncService:
         from sqlalchemy.dialects.postgresql import insert
 
         from src.models.orm.events import EventSource, EventSubscription, ScheduleSource, WebhookSource
+        from src.services.cron_parser import next_fire_time
         from src.services.sync_ops import SyncOp  # noqa: F401
 
         es_id = UUID(mes.id)
@@ -2051,17 +2068,20 @@ class GitHubSyncService:
 
         # Upsert schedule source if applicable
         if mes.source_type == "schedule" and mes.cron_expression:
+            next_fire_at = next_fire_time(mes.cron_expression, datetime.now(timezone.utc))
             sched_stmt = insert(ScheduleSource).values(
                 event_source_id=es_id,
                 cron_expression=mes.cron_expression,
                 timezone=mes.timezone or "UTC",
                 enabled=mes.schedule_enabled if mes.schedule_enabled is not None else True,
+                next_fire_at=next_fire_at,
             ).on_conflict_do_update(
                 index_elements=["event_source_id"],
                 set_={
                     "cron_expression": mes.cron_expression,
                     "timezone": mes.timezone or "UTC",
                     "enabled": mes.schedule_enabled if mes.schedule_enabled is not None else True,
+                    "next_fire_at": next_fire_at,
                     "updated_at": datetime.now(timezone.utc),
                 },
             )
@@ -2228,45 +2248,37 @@ class GitHubSyncService:
         return ops
 
     async def _update_file_index(self, work_dir: Path) -> None:
-        """Update file_index from all files in the working tree, remove stale entries."""
-        from sqlalchemy import delete, text
-        from sqlalchemy.dialects.postgresql import insert
+        """
+        Update file_index from the working tree: upsert text files whose hash
+        changed, remove entries for files no longer in the tree.
+        """
+        from src.services.file_index_sync import (
+            FileIndexWriter,
+            delete_index_paths,
+            diff_index,
+            load_index_hashes,
+        )
 
-        from src.models.orm.file_index import FileIndex
-        from src.services.file_index_service import _is_text_file
+        tree = await asyncio.to_thread(_hash_tree, work_dir)
+        stored = await load_index_hashes(self.db)
+        current = {path: content_hash for path, content_hash in tree.items() if content_hash is not None}
+        diff = diff_index(current, stored, present=tree)
 
-        files = _walk_tree(work_dir)
-        repo_paths = set()
-        for rel_path, content in files.items():
-            repo_paths.add(rel_path)
-            if _is_text_file(rel_path):
-                try:
-                    content_str = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    continue
-                content_hash = _content_hash(content)
-                stmt = insert(FileIndex).values(
-                    path=rel_path,
-                    content=content_str,
-                    content_hash=content_hash,
-                ).on_conflict_do_update(
-                    index_elements=[FileIndex.path],
-                    set_={
-                        "content": content_str,
-                        "content_hash": content_hash,
-                        "updated_at": text("NOW()"),
-                    },
-                )
-                await self.db.execute(stmt)
+        writer = FileIndexWriter(self.db)
+        for rel_path in diff.changed:
+            content = (work_dir / rel_path).read_bytes()
+            try:
+                content_str = content.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            await writer.add(rel_path, content_str, _content_hash(content))
+        await writer.flush()
 
-        # Remove file_index entries that no longer exist in the repo
-        existing_result = await self.db.execute(select(FileIndex.path))
-        existing_paths = {row[0] for row in existing_result.all()}
-        stale_paths = existing_paths - repo_paths
-        if stale_paths:
-            await self.db.execute(
-                delete(FileIndex).where(FileIndex.path.in_(stale_paths))
-            )
+        removed = await delete_index_paths(self.db, diff.stale)
+        logger.info(
+            f"file_index: {writer.written} updated, {removed} removed, "
+            f"{diff.unchanged} unchanged"
+        )
 
     # -----------------------------------------------------------------
     # Internal: preflight validation
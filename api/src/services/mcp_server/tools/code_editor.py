@@ -25,10 +25,10 @@ from dataclasses import dataclass
 from typing import Any
 
 from fastmcp.tools.tool import ToolResult
-from sqlalchemy import select
 
 from src.core.database import get_db_context
 from src.models.orm.file_index import FileIndex
+from src.services.file_index_search import search_file_index
 from src.services.file_storage import FileStorageService
 from src.services.repo_storage import RepoStorage
 from src.services.mcp_server.tool_result import (
@@ -117,22 +117,6 @@ def _normalize_line_endings(content: str) -> str:
     return content.replace("\r\n", "\n").replace("\r", "\n")
 
 
-def _get_lines_with_context(
-    content: str, line_number: int, context_lines: int = 3
-) -> tuple[list[str], list[str]]:
-    """Get context lines before and after a given line number (1-indexed)."""
-    lines = content.split("\n")
-    idx = line_number - 1  # Convert to 0-indexed
-
-    start_before = max(0, idx - context_lines)
-    end_after = min(len(lines), idx + context_lines + 1)
-
-    before = [f"{i + 1}: {lines[i]}" for i in range(start_before, idx)]
-    after = [f"{i + 1}: {lines[i]}" for i in range(idx + 1, end_after)]
-
-    return before, after
-
-
 def _find_match_locations(content: str, search_string: str) -> list[dict[str, Any]]:
     """Find all locations where search_string appears in content."""
     locations = []
@@ -318,38 +302,27 @@ async def search_content(
     except re.error as e:
         return error_result(f"Invalid regex pattern: {e}")
 
-    matches: list[dict[str, Any]] = []
-
     try:
         async with get_db_context() as db:
-            query = select(FileIndex.path, FileIndex.content).where(
-                FileIndex.content.isnot(None),
+            outcome = await search_file_index(
+                db,
+                regex,
+                conditions=[FileIndex.path == path] if path else None,
+                max_results=max_results,
             )
-            if path:
-                query = query.where(FileIndex.path == path)
-
-            result = await db.execute(query)
-            all_files = result.all()
-
-            for row in all_files:
-                content = _normalize_line_endings(row.content)
-                file_lines = content.split("\n")
-                for i, line in enumerate(file_lines):
-                    if regex.search(line):
-                        before, after = _get_lines_with_context(content, i + 1, context_lines)
-                        matches.append({
-                            "path": row.path,
-                            "line_number": i + 1,
-                            "match": line,
-                            "context_before": before,
-                            "context_after": after,
-                        })
-                        if len(matches) >= max_results:
-                            break
-                if len(matches) >= max_results:
-                    break
-
-        truncated = len(matches) >= max_results
+
+        matches: list[dict[str, Any]] = []
+        for hit in outcome.matches:
+            before, after = hit.context(context_lines)
+            matches.append({
+                "path": hit.path,
+                "line_number": hit.line_number,
+                "match": hit.line,
+                "context_before": before,
+                "context_after": after,
+            })
+
+        truncated = outcome.truncated
         display = format_grep_matches(matches, pattern)
         return success_result(display, {
             "matches": matches,
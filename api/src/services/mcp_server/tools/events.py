@@ -118,6 +118,7 @@ async def create_event_source(
     a subscription to the workflow exists.
     """
     from src.core.database import get_db_context
+    from src.jobs.schedulers.cron_scheduler import reschedule
     from src.models.enums import EventSourceType
     from src.models.orm.events import EventSource, EventSubscription, ScheduleSource, WebhookSource
     from src.services.webhooks.registry import get_adapter_registry
@@ -239,6 +240,7 @@ async def create_event_source(
                         created_at=now,
                         updated_at=now,
                     )
+                    await reschedule(schedule_source, now)
                     db.add(schedule_source)
                     await db.flush()
 
@@ -401,6 +403,7 @@ async def update_event_source(
 ) -> ToolResult:
     """Update an existing event source."""
     from src.core.database import get_db_context
+    from src.jobs.schedulers.cron_scheduler import reschedule
     from src.models.enums import EventSourceType
     from src.models.orm.events import EventSource, WebhookSource
     from src.repositories.events import EventSourceRepository
@@ -439,6 +442,9 @@ async def update_event_source(
                     ss.enabled = schedule_enabled
                 ss.updated_at = datetime.now(_tz.utc)
 
+            if source.schedule_source:
+                await reschedule(source.schedule_source)
+
             await db.flush()
 
             # Reload
@@ -9,6 +9,7 @@ This container is responsible for:
 - Executing workflow code (with thread pool for blocking code)
 - Pushing results to Redis for sync execution requests
 - Package installation
+- Materializing fast-ack webhook events (settings.webhook_fast_ack)
 
 Can be scaled horizontally (replicas: N) for increased throughput.
 """
@@ -19,10 +20,11 @@ import signal
 import sys
 
 from src.config import get_settings
-from src.core.database import init_db, close_db
+from src.core.database import init_db, close_db, get_session_factory
 from src.jobs.rabbitmq import rabbitmq
 from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
 from src.jobs.consumers.package_install import PackageInstallConsumer
+from src.services.events.materializer import EventMaterializer
 
 # Configure logging
 logging.basicConfig(
@@ -56,6 +58,7 @@ class Worker:
         self.running = False
         self._shutdown_event = asyncio.Event()
         self._consumers: list = []
+        self._event_materializer: EventMaterializer | None = None
 
     async def start(self) -> None:
         """Start the worker."""
@@ -72,6 +75,11 @@ class Worker:
         logger.info("Starting RabbitMQ consumers...")
         await self._start_consumers()
 
+        if self.settings.webhook_fast_ack:
+            logger.info("Starting event materializer...")
+            self._event_materializer = EventMaterializer(get_session_factory())
+            await self._event_materializer.start()
+
         logger.info("Bifrost Worker started")
         logger.info("Waiting for messages... (Ctrl+C to stop)")
 
@@ -100,6 +108,14 @@ class Worker:
         logger.info("Stopping Bifrost Worker...")
         self.running = False
 
+        # Stop the event materializer before the consumers
+        if self._event_materializer is not None:
+            try:
+                await self._event_materializer.stop()
+                logger.info("Stopped event materializer")
+            except Exception as e:
+                logger.error(f"Error stopping event materializer: {e}")
+
         # Stop consumers
         for consumer in self._consumers:
             try:
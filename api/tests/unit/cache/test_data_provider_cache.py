@@ -1,24 +1,47 @@
 """Unit tests for data provider Redis cache."""
 
 import json
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.core.cache.data_provider_cache import (
     TTL_DATA_PROVIDER,
+    TTL_STALE,
     acquire_compute_lock,
     cache_result,
     compute_param_hash,
     data_provider_cache_key,
     data_provider_lock_key,
+    data_provider_ready_channel,
     get_cached_result,
+    get_data_provider_stats,
     invalidate_data_provider,
+    record_cache_outcome,
     release_compute_lock,
+    wait_for_result,
 )
 
 
+@contextmanager
+def _patched_redis(mock_redis):
+    """Patch get_redis() to yield mock_redis."""
+    with patch("src.core.cache.data_provider_cache.get_redis") as mock_get_redis:
+        mock_get_redis.return_value.__aenter__ = AsyncMock(return_value=mock_redis)
+        mock_get_redis.return_value.__aexit__ = AsyncMock(return_value=None)
+        yield
+
+
+def _entry(expires_in: timedelta, stale_for: timedelta | None = None) -> str:
+    now = datetime.now(timezone.utc)
+    entry = {"data": {"users": [1]}, "expires_at": (now + expires_in).isoformat()}
+    if stale_for is not None:
+        entry["stale_until"] = (now + expires_in + stale_for).isoformat()
+    return json.dumps(entry)
+
+
 class TestKeyGeneration:
     """Tests for cache key generation functions."""
 
@@ -157,7 +180,7 @@ class TestCacheResult:
 
             mock_redis.setex.assert_called_once()
             call_args = mock_redis.setex.call_args
-            assert call_args[0][1] == 300  # TTL
+            assert call_args[0][1] == 300 + TTL_STALE  # TTL plus stale window
 
             # Verify expiration is in the future
             assert expires_at > datetime.now(timezone.utc)
@@ -175,7 +198,7 @@ class TestCacheResult:
             await cache_result("org-123", "get_users", None, {"data": 1})
 
             call_args = mock_redis.setex.call_args
-            assert call_args[0][1] == TTL_DATA_PROVIDER
+            assert call_args[0][1] == TTL_DATA_PROVIDER + TTL_STALE
 
 
 class TestInvalidateDataProvider:
@@ -258,3 +281,114 @@ class TestStampedeProtection:
 
             await release_compute_lock("org-123", "get_users", {"id": 1})
             mock_redis.delete.assert_called_once()
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving expired entries within their stale window."""
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_hidden_by_default(self):
+        """Stale entries are a miss unless allow_stale, and are kept."""
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=_entry(timedelta(minutes=-1), timedelta(minutes=5)))
+        with _patched_redis(mock_redis):
+            assert await get_cached_result("org-123", "get_users", None) is None
+            mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_returned_when_allowed(self):
+        """allow_stale returns the entry marked as stale."""
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=_entry(timedelta(minutes=-1), timedelta(minutes=5)))
+        with _patched_redis(mock_redis):
+            result = await get_cached_result("org-123", "get_users", None, allow_stale=True)
+            assert result is not None
+            assert result["stale"] is True
+            assert result["data"] == {"users": [1]}
+
+    @pytest.mark.asyncio
+    async def test_past_stale_window_is_deleted(self):
+        """Entries past their stale window are deleted even with allow_stale."""
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=_entry(timedelta(minutes=-10), timedelta(minutes=5)))
+        with _patched_redis(mock_redis):
+            assert await get_cached_result("org-123", "get_users", None, allow_stale=True) is None
+            mock_redis.delete.assert_called_once()
+
+
+class TestWaitForResult:
+    """Tests for coalescing onto another execution's computation."""
+
+    def _redis(self, lock_held: bool = True):
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.get_message = AsyncMock(return_value={"type": "message", "data": "1"})
+        pubsub.aclose = AsyncMock()
+        mock_redis = AsyncMock()
+        mock_redis.pubsub = MagicMock(return_value=pubsub)
+        mock_redis.exists = AsyncMock(return_value=1 if lock_held else 0)
+        return mock_redis, pubsub
+
+    @pytest.mark.asyncio
+    async def test_returns_result_after_release(self):
+        """Waits on the ready channel and returns the holder's result."""
+        mock_redis, pubsub = self._redis()
+        mock_redis.get = AsyncMock(side_effect=[None, _entry(timedelta(minutes=5), timedelta(minutes=5))])
+        with _patched_redis(mock_redis):
+            result = await wait_for_result("org-123", "get_users", {"id": 1})
+
+        assert result is not None
+        assert result["data"] == {"users": [1]}
+        param_hash = compute_param_hash({"id": 1})
+        pubsub.subscribe.assert_awaited_once_with(
+            data_provider_ready_channel("org-123", "get_users", param_hash)
+        )
+        pubsub.get_message.assert_awaited_once()
+        pubsub.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_lock_released_without_result(self):
+        """Returns None so the caller computes when the holder failed."""
+        mock_redis, pubsub = self._redis(lock_held=False)
+        mock_redis.get = AsyncMock(return_value=None)
+        with _patched_redis(mock_redis):
+            assert await wait_for_result("org-123", "get_users", None) is None
+
+        pubsub.get_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_times_out(self):
+        """Returns None after the timeout while the lock is still held."""
+        mock_redis, pubsub = self._redis()
+        mock_redis.get = AsyncMock(return_value=None)
+        pubsub.get_message = AsyncMock(return_value=None)
+        with _patched_redis(mock_redis):
+            assert await wait_for_result("org-123", "get_users", None, timeout=0) is None
+
+    @pytest.mark.asyncio
+    async def test_release_announces_on_ready_channel(self):
+        """Releasing the lock publishes to the ready channel."""
+        mock_redis = AsyncMock()
+        with _patched_redis(mock_redis):
+            await release_compute_lock("org-123", "get_users", None)
+
+        mock_redis.publish.assert_awaited_once_with(
+            data_provider_ready_channel("org-123", "get_users", "empty"), "1"
+        )
+
+
+class TestCacheStats:
+    """Tests for per-provider outcome counters."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_read(self):
+        mock_redis = AsyncMock()
+        mock_redis.hgetall = AsyncMock(return_value={"hit": "3", "coalesced": "2"})
+        with _patched_redis(mock_redis):
+            await record_cache_outcome("org-123", "get_users", "hit")
+            stats = await get_data_provider_stats("org-123", "get_users")
+
+        mock_redis.hincrby.assert_awaited_once_with(
+            "bifrost:org:org-123:dp_stats:get_users", "hit", 1
+        )
+        assert stats == {"hit": 3, "miss": 0, "stale": 0, "coalesced": 2}
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.core.cache.invalidation import (
+    bump_cache_versions,
     cleanup_execution_cache,
     invalidate_all_config,
     invalidate_all_orgs,
@@ -22,6 +23,28 @@ from src.core.cache.invalidation import (
 )
 
 
+class TestBumpCacheVersions:
+    """Tests for bumping cache versions after bulk writes."""
+
+    @pytest.mark.asyncio
+    async def test_bumps_each_kind(self):
+        mock_redis = AsyncMock()
+        with patch("src.core.cache.invalidation.get_shared_redis", return_value=mock_redis):
+            await bump_cache_versions(None, "config", "forms")
+
+        assert [c.args[0] for c in mock_redis.incr.call_args_list] == [
+            "bifrost:global:cache_version:config",
+            "bifrost:global:cache_version:forms",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_handles_error(self):
+        mock_redis = AsyncMock()
+        mock_redis.incr.side_effect = Exception("Redis error")
+        with patch("src.core.cache.invalidation.get_shared_redis", return_value=mock_redis):
+            await bump_cache_versions("org-1", "roles")
+
+
 class TestConfigInvalidation:
     """Tests for config cache invalidation."""
 
@@ -58,6 +81,14 @@ class TestConfigInvalidation:
 
             assert mock_redis.delete.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_invalidate_config_bumps_cache_version(self, mock_redis):
+        """invalidate_config bumps the scope's config version for pre-warm."""
+        with patch("src.core.cache.invalidation.get_shared_redis", return_value=mock_redis):
+            await invalidate_config("org-123", "api_key")
+
+            mock_redis.incr.assert_called_once_with("bifrost:org:org-123:cache_version:config")
+
     @pytest.mark.asyncio
     async def test_invalidate_config_handles_error(self, mock_redis):
         """invalidate_config handles Redis errors gracefully."""
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from redis.exceptions import ResponseError
 
 from bifrost._logging import (
     append_log_to_stream,
@@ -18,10 +19,20 @@ from bifrost._logging import (
     append_log_to_stream_async,
     read_logs_from_stream,
     flush_logs_to_postgres,
+    load_stream_logs,
+    clear_stream_logs,
     close_thread_redis,
+    LogShipper,
 )
 
 
+def _appended(script_call) -> tuple[list[str], dict[str, str]]:
+    """Keys and stream entry of a call to the log append script."""
+    keys = script_call.kwargs["keys"]
+    fields = script_call.kwargs["args"][4:]
+    return keys, dict(zip(fields[::2], fields[1::2]))
+
+
 class TestAppendLogToStream:
     """Tests for sync append_log_to_stream function."""
 
@@ -31,7 +42,8 @@ class TestAppendLogToStream:
 
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
             mock_redis = MagicMock()
-            mock_redis.xadd.return_value = "1234567890-0"
+            script = mock_redis.register_script.return_value
+            script.return_value = "1234567890-0"
             mock_get_redis.return_value = mock_redis
 
             entry_id = append_log_to_stream(
@@ -42,14 +54,16 @@ class TestAppendLogToStream:
             )
 
             assert entry_id == "1234567890-0"
-            mock_redis.xadd.assert_called_once()
+            script.assert_called_once()
 
             # Verify the call arguments
-            call_args = mock_redis.xadd.call_args
-            stream_key = call_args[0][0]
-            entry = call_args[0][1]
+            keys, entry = _appended(script.call_args)
 
-            assert f"bifrost:logs:{exec_id}" == stream_key
+            assert keys == [
+                f"bifrost:logs:{exec_id}",
+                f"bifrost:logs:{exec_id}:seq",
+                "bifrost:logs:active",
+            ]
             assert entry["execution_id"] == exec_id
             assert entry["level"] == "INFO"
             assert entry["message"] == "Test log message"
@@ -61,7 +75,8 @@ class TestAppendLogToStream:
 
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
             mock_redis = MagicMock()
-            mock_redis.xadd.return_value = "1234567890-0"
+            script = mock_redis.register_script.return_value
+            script.return_value = "1234567890-0"
             mock_get_redis.return_value = mock_redis
 
             entry_id = append_log_to_stream(
@@ -71,15 +86,15 @@ class TestAppendLogToStream:
             )
 
             assert entry_id is not None
-            call_args = mock_redis.xadd.call_args
-            entry = call_args[0][1]
+            _, entry = _appended(script.call_args)
             assert entry["execution_id"] == str(exec_uuid)
 
     def test_append_log_to_stream_normalizes_level(self):
         """Normalizes log level to uppercase."""
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
             mock_redis = MagicMock()
-            mock_redis.xadd.return_value = "1234567890-0"
+            script = mock_redis.register_script.return_value
+            script.return_value = "1234567890-0"
             mock_get_redis.return_value = mock_redis
 
             append_log_to_stream(
@@ -88,15 +103,15 @@ class TestAppendLogToStream:
                 message="Warning message",
             )
 
-            call_args = mock_redis.xadd.call_args
-            entry = call_args[0][1]
+            _, entry = _appended(script.call_args)
             assert entry["level"] == "WARNING"
 
     def test_append_log_to_stream_handles_none_metadata(self):
         """Handles None metadata by serializing to empty object."""
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
             mock_redis = MagicMock()
-            mock_redis.xadd.return_value = "1234567890-0"
+            script = mock_redis.register_script.return_value
+            script.return_value = "1234567890-0"
             mock_get_redis.return_value = mock_redis
 
             append_log_to_stream(
@@ -106,15 +121,14 @@ class TestAppendLogToStream:
                 metadata=None,
             )
 
-            call_args = mock_redis.xadd.call_args
-            entry = call_args[0][1]
+            _, entry = _appended(script.call_args)
             assert entry["metadata"] == "{}"
 
     def test_append_log_to_stream_returns_none_on_error(self):
         """Returns None and resets connection on error."""
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
             mock_redis = MagicMock()
-            mock_redis.xadd.side_effect = Exception("Connection failed")
+            mock_redis.register_script.return_value.side_effect = Exception("Connection failed")
             mock_get_redis.return_value = mock_redis
 
             with patch("bifrost._logging._local") as mock_local:
@@ -160,6 +174,19 @@ class TestPublishLogToPubsub:
             assert message["message"] == "Test message"
             assert message["metadata"] == {"key": "value"}
 
+    def test_publish_log_to_pubsub_sharded(self):
+        """Uses SPUBLISH when sharded pub/sub is enabled."""
+        with patch("bifrost._logging._get_sync_redis") as mock_get_redis, \
+                patch("src.config.get_settings") as mock_settings:
+            mock_settings.return_value.pubsub_sharded = True
+            mock_redis = MagicMock()
+            mock_get_redis.return_value = mock_redis
+
+            publish_log_to_pubsub(execution_id="exec-123", level="INFO", message="m")
+
+            assert mock_redis.spublish.call_args[0][0] == "bifrost:execution:exec-123"
+            mock_redis.publish.assert_not_called()
+
     def test_publish_log_to_pubsub_handles_error(self):
         """Handles publish errors gracefully."""
         with patch("bifrost._logging._get_sync_redis") as mock_get_redis:
@@ -243,7 +270,9 @@ class TestAsyncLogFunctions:
 
         with patch("src.core.cache.get_redis") as mock_get_redis:
             mock_redis = AsyncMock()
-            mock_redis.xadd.return_value = "async-entry-id"
+            mock_redis.register_script = MagicMock(
+                return_value=AsyncMock(return_value="async-entry-id")
+            )
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
 
             entry_id = await append_log_to_stream_async(
@@ -259,7 +288,9 @@ class TestAsyncLogFunctions:
         """Async version returns None on error."""
         with patch("src.core.cache.get_redis") as mock_get_redis:
             mock_redis = AsyncMock()
-            mock_redis.xadd.side_effect = Exception("Async error")
+            mock_redis.register_script = MagicMock(
+                return_value=AsyncMock(side_effect=Exception("Async error"))
+            )
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
 
             entry_id = await append_log_to_stream_async(
@@ -270,12 +301,24 @@ class TestAsyncLogFunctions:
 
             assert entry_id is None
 
+    @staticmethod
+    def _persisted(*logs):
+        """Patch the session factory so the repository returns these rows."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(logs)
+        session.execute = AsyncMock(return_value=result)
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        return patch("src.core.database.get_session_factory", return_value=factory)
+
     @pytest.mark.asyncio
     async def test_read_logs_from_stream_success(self):
         """Successfully reads logs from stream."""
         exec_id = str(uuid4())
 
-        with patch("src.core.cache.get_redis") as mock_get_redis:
+        with patch("src.core.cache.get_redis") as mock_get_redis, self._persisted():
             mock_redis = AsyncMock()
             mock_redis.xrange.return_value = [
                 ("1234-0", {
@@ -284,6 +327,7 @@ class TestAsyncLogFunctions:
                     "message": "First log",
                     "metadata": "{}",
                     "timestamp": "2025-01-01T00:00:00",
+                    "seq": "0",
                 }),
                 ("1234-1", {
                     "execution_id": exec_id,
@@ -291,6 +335,7 @@ class TestAsyncLogFunctions:
                     "message": "Second log",
                     "metadata": '{"error": true}',
                     "timestamp": "2025-01-01T00:00:01",
+                    "seq": "1",
                 }),
             ]
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
@@ -298,21 +343,46 @@ class TestAsyncLogFunctions:
             logs = await read_logs_from_stream(exec_id)
 
             assert len(logs) == 2
-            assert logs[0].id == "1234-0"
+            assert logs[0].id == "0"
             assert logs[0].level == "INFO"
             assert logs[0].message == "First log"
             assert logs[1].level == "ERROR"
             assert logs[1].metadata == {"error": True}
 
+    @pytest.mark.asyncio
+    async def test_read_logs_includes_persisted_entries(self):
+        """Entries the persister already moved to Postgres come before the stream tail."""
+        exec_id = str(uuid4())
+        persisted = [
+            MagicMock(sequence=seq, level="INFO", message=f"persisted {seq}", log_metadata=None,
+                      timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc))
+            for seq in (1, 2)
+        ]
+
+        with patch("src.core.cache.get_redis") as mock_get_redis, self._persisted(*persisted):
+            mock_redis = AsyncMock()
+            mock_redis.xrange.return_value = [
+                # Persisted but not deleted yet, then not persisted
+                ("1234-2", {"level": "INFO", "message": "persisted 2", "timestamp": "2025-01-01T00:00:00", "seq": "2"}),
+                ("1234-3", {"level": "INFO", "message": "tail", "timestamp": "2025-01-01T00:00:00", "seq": "3"}),
+            ]
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            logs = await read_logs_from_stream(exec_id, start="1")
+
+        assert [(log.id, log.message) for log in logs] == [
+            ("1", "persisted 1"), ("2", "persisted 2"), ("3", "tail"),
+        ]
+
     @pytest.mark.asyncio
     async def test_read_logs_from_stream_empty(self):
         """Returns empty list when no logs."""
-        with patch("src.core.cache.get_redis") as mock_get_redis:
+        with patch("src.core.cache.get_redis") as mock_get_redis, self._persisted():
             mock_redis = AsyncMock()
             mock_redis.xrange.return_value = []
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
 
-            logs = await read_logs_from_stream("exec-123")
+            logs = await read_logs_from_stream(str(uuid4()))
 
             assert logs == []
 
@@ -327,7 +397,9 @@ class TestFlushLogsToPostgres:
 
         with patch("src.core.cache.get_redis") as mock_get_redis:
             mock_redis = AsyncMock()
-            mock_redis.xrange.return_value = []
+            mock_redis.xpending.return_value = {"pending": 0, "consumers": []}
+            mock_redis.xautoclaim.return_value = ["0-0", [], []]
+            mock_redis.xreadgroup.return_value = []
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
 
             count = await flush_logs_to_postgres(exec_id)
@@ -336,29 +408,41 @@ class TestFlushLogsToPostgres:
 
     @pytest.mark.asyncio
     async def test_flush_logs_persists_entries(self):
-        """Successfully persists entries and clears stream."""
+        """Persists the unread entries with COPY and clears the stream."""
         exec_id = str(uuid4())
+        stream_key = f"bifrost:logs:{exec_id}"
 
         with patch("src.core.cache.get_redis") as mock_get_redis:
             mock_redis = AsyncMock()
-            mock_redis.xrange.return_value = [
-                ("1234-0", {
-                    "level": "INFO",
-                    "message": "Log 1",
-                    "metadata": "{}",
-                    "timestamp": "2025-01-01T00:00:00",
-                }),
-                ("1234-1", {
-                    "level": "INFO",
-                    "message": "Log 2",
-                    "metadata": "{}",
-                    "timestamp": "2025-01-01T00:00:01",
-                }),
+            mock_redis.xpending.return_value = {"pending": 0, "consumers": []}
+            mock_redis.xautoclaim.return_value = ["0-0", [], []]
+            mock_redis.xreadgroup.side_effect = [
+                [[stream_key, [
+                    ("1234-0", {
+                        "level": "INFO",
+                        "message": "Log 1",
+                        "metadata": "{}",
+                        "timestamp": "2025-01-01T00:00:00",
+                        "seq": "7",
+                    }),
+                    ("1234-1", {
+                        "level": "INFO",
+                        "message": "Log 2",
+                        "metadata": "{}",
+                        "timestamp": "2025-01-01T00:00:01",
+                        "seq": "8",
+                    }),
+                ]]],
+                [],
             ]
             mock_get_redis.return_value.__aenter__.return_value = mock_redis
 
             # Patch at the location where it's used, not where it's defined
-            with patch("src.core.database.get_session_factory") as mock_session_factory:
+            with patch("src.core.database.get_session_factory") as mock_session_factory, \
+                    patch(
+                        "src.repositories.execution_logs.ExecutionLogRepository.copy_logs",
+                        new_callable=AsyncMock,
+                    ) as mock_copy:
                 mock_db = MagicMock()
                 mock_db.commit = AsyncMock()  # commit is async
                 mock_session_factory.return_value.return_value.__aenter__.return_value = mock_db
@@ -366,9 +450,120 @@ class TestFlushLogsToPostgres:
                 count = await flush_logs_to_postgres(exec_id)
 
                 assert count == 2
-                mock_db.add_all.assert_called_once()
+                rows = mock_copy.call_args[0][0]
+                assert [row["sequence"] for row in rows] == [7, 8]
                 mock_db.commit.assert_called_once()
-                mock_redis.delete.assert_called_once()
+                mock_redis.delete.assert_called_once_with(stream_key, f"{stream_key}:seq")
+                mock_redis.srem.assert_called_once_with("bifrost:logs:active", exec_id)
+
+
+class TestLoadStreamLogs:
+    """Tests for reading the unpersisted remainder of a stream."""
+
+    @pytest.mark.asyncio
+    async def test_claims_abandoned_entries_and_orders_by_sequence(self):
+        """Entries pending on a stopped persister are read with the new ones."""
+        exec_id = str(uuid4())
+        stream_key = f"bifrost:logs:{exec_id}"
+
+        with patch("src.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.xpending.return_value = {"pending": 0, "consumers": []}
+            mock_redis.xautoclaim.return_value = ["0-0", [
+                ("1-0", {"level": "INFO", "message": "claimed", "seq": "0",
+                         "timestamp": "2025-01-01T00:00:00+00:00"}),
+                ("1-1", {}),  # trimmed while pending
+            ], []]
+            mock_redis.xreadgroup.side_effect = [
+                [[stream_key, [("2-0", {"level": "INFO", "message": "new", "seq": "1",
+                                        "timestamp": "2025-01-01T00:00:01+00:00"})]]],
+                [],
+            ]
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            rows = await load_stream_logs(exec_id)
+
+        assert [row["message"] for row in rows] == ["claimed", "new"]
+        assert [row["sequence"] for row in rows] == [0, 1]
+        assert rows[0]["timestamp"] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        # Everything still pending is taken, however recently it was read
+        assert mock_redis.xautoclaim.call_args.kwargs["min_idle_time"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_in_flight_persister_batch(self):
+        """A batch a persister is still writing is acknowledged before the remainder is read."""
+        exec_id = str(uuid4())
+        in_flight = {"pending": 2, "consumers": [{"name": "host-1", "pending": 2}]}
+        done = {"pending": 0, "consumers": []}
+
+        with patch("src.core.cache.get_redis") as mock_get_redis, \
+                patch("bifrost._logging.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            mock_redis = AsyncMock()
+            mock_redis.xpending.side_effect = [in_flight, in_flight, done]
+            mock_redis.xautoclaim.return_value = ["0-0", [], []]
+            mock_redis.xreadgroup.return_value = []
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            assert await load_stream_logs(exec_id) == []
+
+        assert mock_redis.xpending.await_count == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_claims_batch_of_a_failed_persister_after_wait(self, monkeypatch):
+        """Entries whose COPY failed are claimed once the wait runs out."""
+        monkeypatch.setattr("bifrost._logging.LOG_FINALIZE_WAIT_SECONDS", 0)
+        exec_id = str(uuid4())
+
+        with patch("src.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.xpending.return_value = {"pending": 1, "consumers": [{"name": "host-1", "pending": 1}]}
+            mock_redis.xautoclaim.return_value = ["0-0", [
+                ("1-0", {"level": "INFO", "message": "unpersisted", "seq": "0",
+                         "timestamp": "2025-01-01T00:00:00+00:00"}),
+            ], []]
+            mock_redis.xreadgroup.return_value = []
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            rows = await load_stream_logs(exec_id)
+
+        assert [row["message"] for row in rows] == ["unpersisted"]
+
+    @pytest.mark.asyncio
+    async def test_stream_without_group_is_read_in_full(self):
+        """Streams written before the persister group existed fall back to XRANGE."""
+        exec_id = str(uuid4())
+
+        with patch("src.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_redis.xpending.side_effect = ResponseError("NOGROUP No such key")
+            mock_redis.xrange.return_value = [
+                ("1-0", {"level": "INFO", "message": "a", "timestamp": "2025-01-01T00:00:00"}),
+                ("1-1", {"level": "WARNING", "message": "b", "timestamp": "2025-01-01T00:00:01"}),
+            ]
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            rows = await load_stream_logs(exec_id)
+
+        assert [(row["message"], row["sequence"]) for row in rows] == [("a", 0), ("b", 1)]
+        # Naive timestamps are taken as UTC
+        assert rows[0]["timestamp"].tzinfo is timezone.utc
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_stream_counter_and_active_entry(self):
+        """Clearing removes every Redis key the append script maintains."""
+        exec_id = str(uuid4())
+
+        with patch("src.core.cache.get_redis") as mock_get_redis:
+            mock_redis = AsyncMock()
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+
+            await clear_stream_logs(exec_id)
+
+        mock_redis.delete.assert_called_once_with(
+            f"bifrost:logs:{exec_id}", f"bifrost:logs:{exec_id}:seq"
+        )
+        mock_redis.srem.assert_called_once_with("bifrost:logs:active", exec_id)
 
 
 class TestCloseThreadRedis:
@@ -391,3 +586,57 @@ class TestCloseThreadRedis:
 
             # Should not raise
             close_thread_redis()
+
+
+class TestLogShipper:
+    """Tests for the buffered LogShipper."""
+
+    def test_ships_batch_with_one_pipeline(self):
+        """Records are appended + published in a single pipeline."""
+        with patch("bifrost._logging._new_sync_redis") as mock_new:
+            shipper = LogShipper()
+            pipe = mock_new.return_value.pipeline.return_value
+            script = mock_new.return_value.register_script.return_value
+            exec_id = str(uuid4())
+
+            for i in range(3):
+                assert shipper.submit(exec_id, "info", f"message {i}")
+            assert shipper.flush(timeout=2.0)
+
+        assert script.call_count == 3
+        assert all(c.kwargs["client"] is pipe for c in script.call_args_list)
+        assert pipe.publish.call_count == 3
+        assert pipe.execute.call_count == 1
+        entries = [_appended(c)[1] for c in script.call_args_list]
+        assert [e["message"] for e in entries] == ["message 0", "message 1", "message 2"]
+        assert entries[-1]["level"] == "INFO"
+        assert shipper.stats.shipped == 3
+
+    def test_drops_when_buffer_full(self):
+        """A full buffer drops new records after the backpressure wait."""
+        shipper = LogShipper(max_buffered=1, backpressure_timeout=0.01)
+        # Pretend the flusher is running but stalled
+        shipper._ensure_thread = lambda: None  # type: ignore[method-assign]
+
+        assert shipper.submit("exec", "INFO", "first")
+        assert not shipper.submit("exec", "INFO", "second")
+
+        assert shipper.stats.enqueued == 1
+        assert shipper.stats.dropped == 1
+        assert shipper.stats.backpressure_waits == 1
+
+    def test_redis_error_counts_failed(self):
+        """Write errors are counted and don't break the flusher."""
+        with patch("bifrost._logging._new_sync_redis") as mock_new:
+            mock_new.return_value.pipeline.return_value.execute.side_effect = Exception("down")
+            shipper = LogShipper()
+
+            shipper.submit("exec", "INFO", "lost")
+            assert shipper.flush(timeout=2.0)
+
+        assert shipper.stats.failed == 1
+        assert shipper.stats.shipped == 0
+
+    def test_flush_without_records_returns_immediately(self):
+        """Flushing an idle shipper succeeds."""
+        assert LogShipper().flush(timeout=0.1)
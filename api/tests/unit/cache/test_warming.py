@@ -0,0 +1,123 @@
+"""Unit tests for version-skipping SDK cache pre-warm."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.cache.keys import cache_version_key, cache_warm_key
+from src.core.cache.warming import prewarm_sdk_cache
+
+
+class _FakeRedis:
+    """Minimal string store for versions and warm markers."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.mget = AsyncMock(side_effect=lambda keys: [self.store.get(k) for k in keys])
+        self.set = AsyncMock(side_effect=self._set)
+
+    async def _set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.fixture
+def org_id() -> str:
+    return str(uuid4())
+
+
+@pytest.fixture
+def user_id() -> str:
+    return str(uuid4())
+
+
+@pytest.fixture
+def fake_redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def refreshers():
+    """Patch the per-kind refresh functions and the session factory."""
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=MagicMock())
+    session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch("src.core.cache.warming._prewarm_configs", new_callable=AsyncMock) as configs, \
+            patch("src.core.cache.warming._prewarm_forms", new_callable=AsyncMock) as forms, \
+            patch("src.core.cache.warming._prewarm_roles", new_callable=AsyncMock) as roles, \
+            patch("src.core.cache.warming._prewarm_organization", new_callable=AsyncMock) as org, \
+            patch("src.core.database.get_session_factory", return_value=lambda: session):
+        yield {"config": configs, "forms": forms, "roles": roles, "org": org}
+
+
+async def _prewarm(fake_redis, org_id, user_id, is_admin=False):
+    with patch("src.core.cache.warming.get_shared_redis", AsyncMock(return_value=fake_redis)):
+        await prewarm_sdk_cache("exec-1", org_id, user_id, is_admin)
+
+
+class TestPrewarmVersionSkipping:
+    @pytest.mark.asyncio
+    async def test_first_prewarm_refreshes_all_kinds(self, fake_redis, refreshers, org_id, user_id):
+        await _prewarm(fake_redis, org_id, user_id)
+
+        for refresh in refreshers.values():
+            refresh.assert_awaited_once()
+        assert fake_redis.store[cache_warm_key(org_id, "config")] == "0.0"
+        assert fake_redis.store[cache_warm_key(org_id, "forms", f"{user_id}:member")] == "0.0.0.0"
+
+    @pytest.mark.asyncio
+    async def test_current_cache_is_a_single_roundtrip(self, fake_redis, refreshers, org_id, user_id):
+        await _prewarm(fake_redis, org_id, user_id)
+        for refresh in refreshers.values():
+            refresh.reset_mock()
+        fake_redis.mget.reset_mock()
+        fake_redis.set.reset_mock()
+
+        await _prewarm(fake_redis, org_id, user_id)
+
+        fake_redis.mget.assert_awaited_once()
+        fake_redis.set.assert_not_awaited()
+        for refresh in refreshers.values():
+            refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_version_bump_refreshes_only_dependent_kinds(self, fake_redis, refreshers, org_id, user_id):
+        await _prewarm(fake_redis, org_id, user_id)
+        for refresh in refreshers.values():
+            refresh.reset_mock()
+
+        # A global role change affects roles and accessible forms
+        fake_redis.store[cache_version_key(None, "roles")] = "1"
+        await _prewarm(fake_redis, org_id, user_id)
+
+        refreshers["roles"].assert_awaited_once()
+        refreshers["forms"].assert_awaited_once()
+        refreshers["config"].assert_not_awaited()
+        refreshers["org"].assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_forms_are_warmed_per_user(self, fake_redis, refreshers, org_id, user_id):
+        await _prewarm(fake_redis, org_id, user_id)
+        refreshers["forms"].reset_mock()
+
+        await _prewarm(fake_redis, org_id, str(uuid4()))
+        await _prewarm(fake_redis, org_id, user_id, is_admin=True)
+
+        assert refreshers["forms"].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_retried(self, fake_redis, refreshers, org_id, user_id):
+        refreshers["config"].side_effect = RuntimeError("db down")
+
+        await _prewarm(fake_redis, org_id, user_id)
+
+        assert cache_warm_key(org_id, "config") not in fake_redis.store
+        assert cache_warm_key(org_id, "roles") in fake_redis.store
+
+    @pytest.mark.asyncio
+    async def test_global_scope_has_no_org_kind(self, fake_redis, refreshers, user_id):
+        await _prewarm(fake_redis, None, user_id)
+
+        refreshers["org"].assert_not_awaited()
+        assert fake_redis.store[cache_warm_key(None, "config")] == "0"
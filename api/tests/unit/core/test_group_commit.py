@@ -0,0 +1,88 @@
+"""Tests for group-committed database writes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.group_commit import GroupCommitter
+
+
+class _FakeSessions:
+    """Session factory recording which writes shared a transaction."""
+
+    def __init__(self, fail_commit_when=None):
+        self.transactions: list[list[str]] = []
+        self.fail_commit_when = fail_commit_when
+
+    def __call__(self):
+        writes: list[str] = []
+        session = MagicMock()
+        session.writes = writes
+
+        async def commit():
+            if self.fail_commit_when and self.fail_commit_when(writes):
+                raise RuntimeError("commit failed")
+            self.transactions.append(list(writes))
+
+        session.commit = AsyncMock(side_effect=commit)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        return session
+
+
+def _write(name):
+    async def op(session):
+        session.writes.append(name)
+        return name
+    return op
+
+
+@pytest.fixture
+async def committer():
+    sessions = _FakeSessions()
+    committer = GroupCommitter(sessions, window_seconds=0.01)
+    committer.sessions = sessions
+    await committer.start()
+    yield committer
+    await committer.stop()
+
+
+class TestGroupCommitter:
+    async def test_concurrent_writes_share_one_transaction(self, committer):
+        results = await asyncio.gather(*(committer.submit(_write(f"w{i}")) for i in range(5)))
+
+        assert results == [f"w{i}" for i in range(5)]
+        assert committer.sessions.transactions == [[f"w{i}" for i in range(5)]]
+
+    async def test_batches_are_capped(self, committer):
+        committer.max_batch = 2
+
+        await asyncio.gather(*(committer.submit(_write(f"w{i}")) for i in range(5)))
+
+        assert [len(t) for t in committer.sessions.transactions] == [2, 2, 1]
+
+    async def test_failed_write_only_fails_its_caller(self):
+        sessions = _FakeSessions(fail_commit_when=lambda writes: "bad" in writes)
+        committer = GroupCommitter(sessions, window_seconds=0.01)
+        await committer.start()
+        try:
+            results = await asyncio.gather(
+                committer.submit(_write("a")),
+                committer.submit(_write("bad")),
+                committer.submit(_write("b")),
+                return_exceptions=True,
+            )
+        finally:
+            await committer.stop()
+
+        assert results[0] == "a" and results[2] == "b"
+        assert isinstance(results[1], RuntimeError)
+        assert sessions.transactions == [["a"], ["b"]]
+
+    async def test_submit_without_flusher_commits_alone(self):
+        sessions = _FakeSessions()
+        committer = GroupCommitter(sessions)
+
+        assert await committer.submit(_write("a")) == "a"
+        assert sessions.transactions == [["a"]]
@@ -0,0 +1,112 @@
+"""Tests for recording execution metrics as Redis counters."""
+
+from datetime import date
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core import metrics
+
+
+def _hash_ops(args):
+    """Split the script ARGV into {suffix: [(op, field, value), ...]}."""
+    hashes = {}
+    i = 3
+    while i < len(args):
+        suffix, count = args[i], args[i + 1]
+        i += 2
+        hashes[suffix] = [tuple(args[i + 3 * n:i + 3 * n + 3]) for n in range(count)]
+        i += 3 * count
+    return hashes
+
+
+class TestRecordExecutionMetrics:
+    """Test record_execution_metrics."""
+
+    @pytest.mark.asyncio
+    async def test_increments_org_global_and_roi_counters_in_one_call(self):
+        org_id = uuid4()
+        workflow_id = uuid4()
+        mock_redis = AsyncMock()
+
+        with patch.object(metrics, "get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+            await metrics.record_execution_metrics(
+                org_id=f"ORG:{org_id}",
+                status="Success",
+                duration_ms=1200,
+                peak_memory_bytes=2048,
+                time_saved=5,
+                value=2.5,
+                workflow_id=str(workflow_id),
+            )
+
+        mock_redis.eval.assert_awaited_once()
+        args = mock_redis.eval.await_args.args
+        assert args[1] == 2
+        hashes = _hash_ops(args[4:])
+        today = date.today().isoformat()
+
+        daily_ops = [
+            ("i", "execution_count", 1),
+            ("i", "success_count", 1),
+            ("i", "total_duration_ms", 1200),
+            ("m", "max_duration_ms", 1200),
+            ("i", "total_memory_bytes", 2048),
+            ("m", "peak_memory_bytes", 2048),
+            ("i", "total_time_saved", 5),
+            ("f", "total_value", 2.5),
+        ]
+        assert hashes == {
+            f"daily:{today}:global": daily_ops,
+            f"daily:{today}:{org_id}": daily_ops,
+            f"roi:{today}:{workflow_id}:{org_id}": [
+                ("i", "execution_count", 1),
+                ("i", "success_count", 1),
+                ("i", "total_time_saved", 5),
+                ("f", "total_value", 2.5),
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_does_not_count_roi(self):
+        mock_redis = AsyncMock()
+
+        with patch.object(metrics, "get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+            await metrics.record_execution_metrics(
+                org_id=None,
+                status="Failed",
+                duration_ms=10,
+                time_saved=5,
+                value=2.5,
+            )
+
+        hashes = _hash_ops(mock_redis.eval.await_args.args[4:])
+        assert hashes == {
+            f"daily:{date.today().isoformat()}:global": [
+                ("i", "execution_count", 1),
+                ("i", "failed_count", 1),
+                ("i", "total_duration_ms", 10),
+                ("m", "max_duration_ms", 10),
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_direct_upserts_when_redis_fails(self):
+        workflow_id = str(uuid4())
+        mock_redis = AsyncMock()
+        mock_redis.eval.side_effect = ConnectionError("redis down")
+
+        with patch.object(metrics, "get_redis") as mock_get_redis, \
+                patch.object(metrics, "update_daily_metrics", AsyncMock()) as daily, \
+                patch.object(metrics, "update_workflow_roi_daily", AsyncMock()) as roi:
+            mock_get_redis.return_value.__aenter__.return_value = mock_redis
+            await metrics.record_execution_metrics(
+                org_id=None, status="Success", workflow_id=workflow_id
+            )
+
+        daily.assert_awaited_once()
+        roi.assert_awaited_once()
+        assert roi.await_args.kwargs["workflow_id"] == workflow_id
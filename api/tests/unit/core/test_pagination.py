@@ -0,0 +1,101 @@
+"""Tests for keyset pagination continuation tokens."""
+
+import base64
+import json
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.pagination import (
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    parse_continuation_token,
+    seek_before,
+)
+from src.models import Execution
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+class TestContinuationTokens:
+    """Test encoding and parsing of tokens."""
+
+    def test_round_trip(self):
+        started_at = datetime(2026, 3, 14, 9, 30, 1, 250000, tzinfo=timezone.utc)
+        execution_id = uuid4()
+
+        token = encode_cursor(started_at, execution_id)
+
+        assert "=" not in token
+        assert decode_cursor(token) == Cursor(started_at, str(execution_id))
+
+    def test_integer_ids_stay_integers(self):
+        assert decode_cursor(encode_cursor(None, 17)) == Cursor(None, 17)
+
+    def test_legacy_offset_tokens_are_offsets(self):
+        assert parse_continuation_token("50") == (None, 50)
+
+    @pytest.mark.parametrize("token", [None, "", "not-a-cursor", "bm90IGpzb24"])
+    def test_missing_or_bad_tokens_start_from_first_page(self, token):
+        assert parse_continuation_token(token) == (None, 0)
+
+    def test_ids_are_converted_to_the_column_type(self):
+        execution_id = uuid4()
+        token = encode_cursor(None, execution_id)
+
+        assert parse_continuation_token(token, UUID) == (Cursor(None, execution_id), 0)
+        assert parse_continuation_token(encode_cursor(None, 17), int) == (Cursor(None, 17), 0)
+
+    @pytest.mark.parametrize(
+        ("row_id", "id_type"),
+        [("not-a-uuid", UUID), (17, UUID), (str(uuid4()), int), (True, int), ([1], int)],
+    )
+    def test_invalid_ids_start_from_first_page(self, row_id, id_type):
+        token = base64.urlsafe_b64encode(json.dumps([None, row_id]).encode()).decode()
+
+        assert parse_continuation_token(token, id_type) == (None, 0)
+
+    def test_decode_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            decode_cursor("%%%")
+
+
+class TestSeekBefore:
+    """Test the keyset predicate."""
+
+    def test_row_comparison_with_typed_id(self):
+        execution_id = uuid4()
+        cursor = Cursor(datetime(2026, 3, 14, tzinfo=timezone.utc), str(execution_id))
+
+        clause = seek_before(cursor, Execution.started_at, Execution.id)
+
+        assert _sql(clause).startswith("(executions.started_at, executions.id) <")
+        values = clause.compile().params.values()
+        assert execution_id in values
+
+    def test_bounds_timestamp_alone_for_partition_pruning(self):
+        cursor = Cursor(datetime(2026, 3, 14, tzinfo=timezone.utc), str(uuid4()))
+
+        sql = _sql(seek_before(cursor, Execution.started_at, Execution.id))
+
+        assert "AND executions.started_at <=" in sql
+
+    def test_null_timestamp_continues_through_nulls(self):
+        cursor = Cursor(None, str(uuid4()))
+
+        sql = _sql(seek_before(cursor, Execution.started_at, Execution.id))
+
+        assert "executions.started_at IS NULL AND executions.id <" in sql
+        assert "executions.started_at IS NOT NULL" in sql
+
+    def test_accepts_already_typed_id(self):
+        execution_id = uuid4()
+
+        clause = seek_before(Cursor(None, execution_id), Execution.started_at, Execution.id)
+
+        assert execution_id in clause.compile().params.values()
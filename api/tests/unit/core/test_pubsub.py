@@ -0,0 +1,139 @@
+"""Tests for WebSocket channel subscriptions and fan-out."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.pubsub import ConnectionManager
+
+
+def _socket() -> MagicMock:
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    websocket.close = AsyncMock()
+    return websocket
+
+
+@pytest.fixture
+def manager():
+    manager = ConnectionManager()
+    manager._redis = MagicMock()
+    manager._redis.close = AsyncMock()
+    manager._pubsub_listener = MagicMock()
+    manager._pubsub_listener.stop = AsyncMock()
+    manager._pubsub_listener.set_channels = AsyncMock(
+        side_effect=lambda channels: setattr(manager, "subscribed", sorted(channels))
+    )
+    return manager
+
+
+class TestSubscriptions:
+    """Redis subscriptions follow the locally watched channels."""
+
+    async def test_connect_subscribes_local_channels_only(self, manager):
+        """Only channels with a local socket are subscribed."""
+        await manager.connect(_socket(), ["execution:1", "user:u"])
+
+        assert manager.subscribed == ["bifrost:execution:1", "bifrost:user:u"]
+
+    async def test_channel_kept_until_last_socket_leaves(self, manager):
+        """Channels are reference counted by their local sockets."""
+        first, second = _socket(), _socket()
+        await manager.connect(first, ["execution:1"])
+        await manager.connect(second, ["execution:1", "system"])
+
+        manager.disconnect(first)
+        await asyncio.sleep(0)
+        assert manager.subscribed == ["bifrost:execution:1", "bifrost:system"]
+
+        assert manager.unsubscribe(second, "execution:1")
+        await asyncio.sleep(0)
+        assert manager.subscribed == ["bifrost:system"]
+        assert not manager.unsubscribe(second, "execution:1")
+
+    async def test_subscribe_adds_channel(self, manager):
+        """Channels added after connecting are subscribed before returning."""
+        websocket = _socket()
+        await manager.connect(websocket, [])
+
+        await manager.subscribe(websocket, "git:job")
+
+        assert manager.subscribed == ["bifrost:git:job"]
+        assert manager.connections["git:job"] == {websocket}
+
+
+class TestFanOut:
+    """Local delivery through per-socket send queues."""
+
+    async def test_messages_are_delivered_in_order(self, manager):
+        """Each socket receives its channel's messages in publish order."""
+        websocket = _socket()
+        await manager.connect(websocket, ["execution:1"])
+
+        await manager._send_local("execution:1", {"n": 1})
+        await manager._send_local("execution:1", {"n": 2})
+        await manager._send_local("other", {"n": 3})
+        await asyncio.sleep(0.01)
+
+        sent = [call.args[0] for call in websocket.send_text.await_args_list]
+        assert sent == ['{"n": 1}', '{"n": 2}']
+        await manager.close()
+
+    async def test_slow_socket_does_not_delay_others(self, manager):
+        """A socket stuck in send_text does not hold back the rest."""
+        stuck, fast = _socket(), _socket()
+        stuck.send_text = AsyncMock(side_effect=asyncio.Event().wait)
+        await manager.connect(stuck, ["execution:1"])
+        await manager.connect(fast, ["execution:1"])
+
+        await manager._send_local("execution:1", {"n": 1})
+        await asyncio.sleep(0.01)
+
+        fast.send_text.assert_awaited_once_with('{"n": 1}')
+        await manager.close()
+
+    async def test_slow_socket_is_dropped_when_queue_full(self, manager):
+        """A socket whose queue is full is disconnected and closed."""
+        stuck = _socket()
+        stuck.send_text = AsyncMock(side_effect=asyncio.Event().wait)
+        await manager.connect(stuck, ["execution:1"])
+
+        with patch("src.core.pubsub.get_settings") as settings:
+            settings.return_value.websocket_send_queue_size = 2
+            for n in range(4):
+                await manager._send_local("execution:1", {"n": n})
+        await asyncio.sleep(0.01)
+
+        assert "execution:1" not in manager.connections
+        assert stuck not in manager._queues
+        stuck.close.assert_awaited_once()
+        assert stuck.close.await_args.kwargs["code"] == 1013
+
+    async def test_failed_send_disconnects_socket(self, manager):
+        """A socket that errors on send is removed from its channels."""
+        broken = _socket()
+        broken.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        await manager.connect(broken, ["execution:1"])
+
+        await manager._send_local("execution:1", {"n": 1})
+        await asyncio.sleep(0.01)
+
+        assert "execution:1" not in manager.connections
+
+
+class TestPublish:
+    """Publishing to Redis."""
+
+    async def test_sharded_publish_uses_spublish(self, manager):
+        """With sharded pub/sub enabled messages go out with SPUBLISH."""
+        manager._redis.spublish = AsyncMock()
+        manager._redis.publish = AsyncMock()
+
+        with patch("src.core.pubsub.get_settings") as settings:
+            settings.return_value.pubsub_sharded = True
+            assert await manager._publish_to_redis("execution:1", {"n": 1})
+
+        manager._redis.spublish.assert_awaited_once_with("bifrost:execution:1", '{"n": 1}')
+        manager._redis.publish.assert_not_called()
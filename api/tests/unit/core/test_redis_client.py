@@ -1,12 +1,34 @@
 """
 Unit tests for Redis client for sync execution results.
 
-Tests the BLPOP/RPUSH pattern for synchronous workflow execution.
+Tests the RPUSH + ready notification pattern for synchronous workflow execution.
 """
 
+import asyncio
 import pytest
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class _FakeListener:
+    """Stand-in for ResilientPubSubListener (no Redis connection)."""
+
+    def __init__(self, **kwargs):
+        self.on_message = kwargs["on_message"]
+
+    async def start(self):
+        return None
+
+    async def stop(self):
+        return None
+
+
+def _mock_pipeline(redis, results: list[list]) -> MagicMock:
+    """Attach a pipeline mock whose execute() returns each result in turn."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=results)
+    redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
 
 
 class TestRedisClient:
@@ -71,42 +93,100 @@ class TestRedisClient:
         assert payload["error"] == "Something went wrong"
         assert payload["error_type"] == "RuntimeError"
 
+    async def test_push_result_publishes_ready_notification(self, mock_redis):
+        """Test that pushing a result notifies waiting API instances."""
+        from src.core.redis_client import RedisClient, RESULT_READY_CHANNEL
+
+        client = RedisClient()
+        client._redis = mock_redis
+
+        await client.push_result(execution_id="exec-123", status="Success")
+
+        mock_redis.publish.assert_called_once_with(
+            RESULT_READY_CHANNEL, json.dumps({"execution_id": "exec-123"})
+        )
+
     async def test_wait_for_result_success(self, mock_redis):
-        """Test waiting for execution result from Redis."""
+        """Test waiting for a result that is already available."""
         from src.core.redis_client import RedisClient, RESULT_KEY_PREFIX
 
         expected_result = {"status": "Success", "result": {"data": "test"}}
-        mock_redis.blpop.return_value = (
-            f"{RESULT_KEY_PREFIX}exec-789",
-            json.dumps(expected_result),
-        )
+        pipe = _mock_pipeline(mock_redis, [[json.dumps(expected_result)]])
 
         client = RedisClient()
         client._redis = mock_redis
 
-        result = await client.wait_for_result(
-            execution_id="exec-789",
-            timeout_seconds=30,
-        )
+        with patch("src.core.redis_client.ResilientPubSubListener", _FakeListener):
+            result = await client.wait_for_result(
+                execution_id="exec-789",
+                timeout_seconds=30,
+            )
 
         assert result == expected_result
-        mock_redis.blpop.assert_called_once()
+        pipe.lpop.assert_called_once_with(f"{RESULT_KEY_PREFIX}exec-789")
+        mock_redis.blpop.assert_not_called()
+        assert client._result_waiter.waiting == 0
+
+    async def test_wait_for_result_woken_by_notification(self, mock_redis):
+        """Test that a ready notification resolves the waiting caller."""
+        from src.core.redis_client import RedisClient
+
+        expected_result = {"status": "Success", "result": 1}
+        _mock_pipeline(mock_redis, [[None], [json.dumps(expected_result)]])
+
+        client = RedisClient()
+        client._redis = mock_redis
+
+        with patch("src.core.redis_client.ResilientPubSubListener", _FakeListener):
+            waiter = asyncio.create_task(
+                client.wait_for_result(execution_id="exec-1", timeout_seconds=5)
+            )
+            await asyncio.sleep(0.01)
+            assert client._result_waiter.waiting == 1
+
+            # Notifications for executions not waited on here are ignored
+            await client._result_waiter._on_message("ch", {"execution_id": "other"})
+            await client._result_waiter._on_message("ch", {"execution_id": "exec-1"})
+
+            assert await waiter == expected_result
 
     async def test_wait_for_result_timeout(self, mock_redis):
         """Test timeout when waiting for result."""
         from src.core.redis_client import RedisClient
 
-        mock_redis.blpop.return_value = None  # Timeout
+        _mock_pipeline(mock_redis, [[None]])
 
         client = RedisClient()
         client._redis = mock_redis
 
-        result = await client.wait_for_result(
-            execution_id="exec-timeout",
-            timeout_seconds=5,
-        )
+        with patch("src.core.redis_client.ResilientPubSubListener", _FakeListener):
+            result = await client.wait_for_result(
+                execution_id="exec-timeout",
+                timeout_seconds=0.01,
+            )
 
         assert result is None
+        assert client._result_waiter.waiting == 0
+
+    async def test_wait_for_result_cancelled(self, mock_redis):
+        """Test that cancelling a caller removes its waiter."""
+        from src.core.redis_client import RedisClient
+
+        _mock_pipeline(mock_redis, [[None]])
+
+        client = RedisClient()
+        client._redis = mock_redis
+
+        with patch("src.core.redis_client.ResilientPubSubListener", _FakeListener):
+            waiter = asyncio.create_task(
+                client.wait_for_result(execution_id="exec-1", timeout_seconds=5)
+            )
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert client._result_waiter.waiting == 0
 
     async def test_close(self, mock_redis):
         """Test closing Redis connection."""
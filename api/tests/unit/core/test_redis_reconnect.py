@@ -332,3 +332,74 @@ class TestResilientPubSubListenerAsync:
                 await listener.start()
 
             await listener.stop()
+
+
+class TestDynamicChannels:
+    """Tests for changing subscriptions while connected."""
+
+    @pytest.fixture
+    def mock_pubsub(self):
+        from unittest.mock import MagicMock
+        pubsub = MagicMock()
+        for method in ("subscribe", "unsubscribe", "ssubscribe", "sunsubscribe", "psubscribe"):
+            setattr(pubsub, method, AsyncMock())
+        pubsub.close = AsyncMock()
+        return pubsub
+
+    async def test_set_channels_subscribes_only_the_difference(self, mock_pubsub):
+        """Only added channels are subscribed and removed ones unsubscribed."""
+        listener = ResilientPubSubListener(
+            redis_url="redis://localhost:6379",
+            channels=["bifrost:a", "bifrost:b"],
+            on_message=AsyncMock(),
+        )
+        listener._pubsub = mock_pubsub
+
+        await listener.set_channels(["bifrost:b", "bifrost:c"])
+
+        mock_pubsub.subscribe.assert_awaited_once_with("bifrost:c")
+        mock_pubsub.unsubscribe.assert_awaited_once_with("bifrost:a")
+        assert listener.channels == ["bifrost:b", "bifrost:c"]
+
+        await listener.set_channels(["bifrost:c", "bifrost:b"])
+        assert mock_pubsub.subscribe.await_count == 1
+
+    async def test_set_channels_while_disconnected_applies_on_reconnect(self, mock_pubsub):
+        """Channels set without a connection are subscribed by _connect."""
+        from unittest.mock import MagicMock, patch
+
+        listener = ResilientPubSubListener(
+            redis_url="redis://localhost:6379",
+            on_message=AsyncMock(),
+        )
+        await listener.set_channels(["bifrost:x"])
+
+        redis_instance = MagicMock()
+        redis_instance.pubsub = MagicMock(return_value=mock_pubsub)
+        redis_instance.close = AsyncMock()
+        with patch("src.core.redis_reconnect.Redis.from_url", return_value=redis_instance):
+            assert await listener._connect() is True
+
+        mock_pubsub.subscribe.assert_awaited_once_with("bifrost:x")
+        await listener._cleanup()
+
+    async def test_sharded_listener_uses_ssubscribe(self, mock_pubsub):
+        """Sharded listeners subscribe with SSUBSCRIBE and accept smessages."""
+        callback = AsyncMock()
+        listener = ResilientPubSubListener(
+            redis_url="redis://localhost:6379",
+            on_message=callback,
+            sharded=True,
+        )
+        listener._pubsub = mock_pubsub
+
+        await listener.set_channels(["bifrost:a"])
+        await listener.set_channels([])
+        await listener._handle_message(
+            {"type": "smessage", "channel": b"bifrost:a", "data": '{"x": 1}'}
+        )
+
+        mock_pubsub.ssubscribe.assert_awaited_once_with("bifrost:a")
+        mock_pubsub.sunsubscribe.assert_awaited_once_with("bifrost:a")
+        mock_pubsub.subscribe.assert_not_called()
+        callback.assert_awaited_once_with("bifrost:a", {"x": 1})
@@ -0,0 +1,133 @@
+"""
+Unit tests for the worker bytecode cache and workspace module reuse.
+"""
+
+import marshal
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+from src.services.execution import bytecode_cache
+from src.services.execution.bytecode_cache import bytecode_key, clear_bytecode_cache, get_code
+from src.services.execution.virtual_import import VirtualModuleLoader
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start each test with an empty in-process cache."""
+    clear_bytecode_cache()
+    yield
+    clear_bytecode_cache()
+
+
+@pytest.fixture
+def shared():
+    """Patch the shared Redis tier with an in-memory dict."""
+    store: dict[str, bytes] = {}
+    with patch.object(bytecode_cache, "get_bytecode_sync", side_effect=store.get), \
+         patch.object(bytecode_cache, "set_bytecode_sync", side_effect=store.__setitem__):
+        yield store
+
+
+class TestGetCode:
+    """Tests for get_code."""
+
+    def test_compiles_on_miss_and_shares(self, shared):
+        code = get_code("shared/utils.py", "X = 1", "abc")
+
+        assert code.co_filename == "shared/utils.py"
+        assert bytecode_key("shared/utils.py", "abc") in shared
+
+    def test_reuses_in_process_code_object(self, shared):
+        first = get_code("shared/utils.py", "X = 1", "abc")
+        with patch("builtins.compile") as mock_compile:
+            second = get_code("shared/utils.py", "X = 1", "abc")
+
+        mock_compile.assert_not_called()
+        assert second is first
+
+    def test_loads_bytecode_compiled_by_another_worker(self, shared):
+        source = "X = 42"
+        shared[bytecode_key("shared/utils.py", "abc")] = marshal.dumps(
+            compile(source, "shared/utils.py", "exec")
+        )
+
+        with patch("builtins.compile") as mock_compile:
+            code = get_code("shared/utils.py", source, "abc")
+
+        mock_compile.assert_not_called()
+        namespace: dict = {}
+        exec(code, namespace)
+        assert namespace["X"] == 42
+
+    def test_corrupt_shared_entry_recompiles(self, shared):
+        shared[bytecode_key("shared/utils.py", "abc")] = b"not bytecode"
+
+        code = get_code("shared/utils.py", "X = 1", "abc")
+
+        namespace: dict = {}
+        exec(code, namespace)
+        assert namespace["X"] == 1
+
+    def test_new_hash_recompiles(self, shared):
+        get_code("shared/utils.py", "X = 1", "v1")
+        code = get_code("shared/utils.py", "X = 2", "v2")
+
+        namespace: dict = {}
+        exec(code, namespace)
+        assert namespace["X"] == 2
+
+    def test_key_includes_path(self):
+        assert bytecode_key("a.py", "abc") != bytecode_key("b.py", "abc")
+
+    def test_syntax_error_propagates(self, shared):
+        with pytest.raises(SyntaxError):
+            get_code("broken.py", "def broken(", "abc")
+
+
+class TestRefreshWorkspaceModules:
+    """Tests for simple_worker._refresh_workspace_modules."""
+
+    @pytest.fixture
+    def workspace_module(self):
+        """Register a fake workspace module loaded by the virtual loader."""
+        module = ModuleType("ws_helper")
+        module.__loader__ = VirtualModuleLoader("ws_helper.py", "X = 1", content_hash="v1")
+        sys.modules["ws_helper"] = module
+        yield module
+        sys.modules.pop("ws_helper", None)
+
+    def test_keeps_unchanged_modules(self, workspace_module):
+        from src.services.execution.simple_worker import _refresh_workspace_modules
+
+        with patch(
+            "src.core.module_cache_sync.get_module_hashes_sync",
+            return_value={"ws_helper.py": "v1"},
+        ):
+            _refresh_workspace_modules()
+
+        assert sys.modules.get("ws_helper") is workspace_module
+
+    def test_clears_when_hash_changed(self, workspace_module):
+        from src.services.execution.simple_worker import _refresh_workspace_modules
+
+        with patch(
+            "src.core.module_cache_sync.get_module_hashes_sync",
+            return_value={"ws_helper.py": "v2"},
+        ):
+            _refresh_workspace_modules()
+
+        assert "ws_helper" not in sys.modules
+
+    def test_clears_when_redis_unavailable(self, workspace_module):
+        from src.services.execution.simple_worker import _refresh_workspace_modules
+
+        with patch(
+            "src.core.module_cache_sync.get_module_hashes_sync",
+            side_effect=ConnectionError("down"),
+        ):
+            _refresh_workspace_modules()
+
+        assert "ws_helper" not in sys.modules
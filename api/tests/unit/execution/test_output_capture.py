@@ -0,0 +1,35 @@
+"""Tests for per-task stdout/stderr capture."""
+
+import asyncio
+import sys
+from io import StringIO
+
+from src.services.execution.output_capture import capture_output
+
+
+class TestCaptureOutput:
+    async def test_concurrent_tasks_capture_their_own_output(self):
+        async def run(name):
+            stdout, stderr = StringIO(), StringIO()
+            with capture_output(stdout, stderr):
+                for _ in range(3):
+                    print(name)
+                    print(f"{name}-err", file=sys.stderr)
+                    await asyncio.sleep(0)
+            return stdout.getvalue(), stderr.getvalue()
+
+        (a_out, a_err), (b_out, b_err) = await asyncio.gather(run("a"), run("b"))
+
+        assert a_out == "a\n" * 3
+        assert b_out == "b\n" * 3
+        assert a_err == "a-err\n" * 3
+        assert b_err == "b-err\n" * 3
+
+    def test_streams_are_restored(self):
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+
+        with capture_output(StringIO(), StringIO()):
+            assert sys.stdout is not original_stdout
+
+        assert sys.stdout is original_stdout
+        assert sys.stderr is original_stderr
@@ -10,12 +10,17 @@ Tests the process pool management functionality including:
 - Crash detection replaces process
 - Recycle idle process
 - Cannot recycle busy process
+- Worker template spawn mode and spawn-to-ready latency
+- Async slots: scheduling by free slots, per-task cancellation
 
 NOTE: These tests use mocks to avoid spawning real processes.
 """
 
 import asyncio
+import json
+import multiprocessing
 from datetime import datetime, timedelta, timezone
+from queue import Empty
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -26,6 +31,7 @@ from src.services.execution.process_pool import (
     ProcessPoolManager,
     ProcessState,
 )
+from src.services.execution.worker_channel import channel_pair
 
 
 class TestProcessState:
@@ -297,7 +303,10 @@ class TestProcessPoolManagerRouting:
         assert handle.state == ProcessState.BUSY
         assert handle.current_execution is not None
         assert handle.current_execution.execution_id == "exec-123"
-        mock_work_queue.put_nowait.assert_called_once_with("exec-123")
+        mock_work_queue.put_nowait.assert_called_once()
+        message = mock_work_queue.put_nowait.call_args[0][0]
+        assert message["execution_id"] == "exec-123"
+        assert json.loads(bytes(message["context"].raw())) == {"timeout_seconds": 300}
 
     @pytest.mark.asyncio
     async def test_scale_up_when_all_busy(self):
@@ -692,6 +701,10 @@ class TestProcessPoolManagerHeartbeat:
         assert "execution" in busy_info
         assert busy_info["execution"]["execution_id"] == "exec-busy"
 
+        # Live counts for the metrics snapshot
+        assert heartbeat["running_count"] == 1
+        assert heartbeat["waiting_count"] == 0
+
 
 class TestProcessPoolManagerResultHandling:
     """Tests for result handling."""
@@ -919,6 +932,120 @@ class TestProcessPoolManagerIdleProcess:
         assert result is None
 
 
+class TestProcessPoolManagerSpawnMode:
+    """Tests for worker template (forkserver) spawn mode."""
+
+    def _make_handle(self, spawn_mode: str = "forkserver") -> ProcessHandle:
+        return ProcessHandle(
+            id="process-1",
+            process=MagicMock(),
+            pid=12345,
+            state=ProcessState.IDLE,
+            work_queue=MagicMock(),
+            result_queue=MagicMock(),
+            started_at=datetime.now(timezone.utc),
+            spawn_mode=spawn_mode,
+            spawned_monotonic=100.0,
+        )
+
+    def test_unknown_mode_falls_back_to_spawn(self):
+        """Should use spawn for unknown modes."""
+        assert ProcessPoolManager(spawn_mode="vfork").spawn_mode == "spawn"
+
+    def test_forkserver_is_opt_in(self):
+        """Should spawn workers unless forkserver is requested."""
+        pool = ProcessPoolManager()
+
+        with patch("src.services.execution.process_pool.multiprocessing.get_context") as get_context:
+            mode, _ = pool._get_spawn_context()
+
+        assert mode == "spawn"
+        get_context.assert_called_once_with("spawn")
+
+    def test_spawn_context_uses_template(self):
+        """Should fork from the template unless it is stale."""
+        pool = ProcessPoolManager(spawn_mode="forkserver")
+
+        with patch("src.services.execution.process_pool.multiprocessing.get_context") as get_context:
+            mode, _ = pool._get_spawn_context()
+            assert mode == "forkserver"
+            get_context.return_value.set_forkserver_preload.assert_called_once()
+
+            pool.mark_for_recycle()
+            mode, _ = pool._get_spawn_context()
+            assert mode == "spawn"
+
+    def test_ready_message_records_latency(self):
+        """Should record spawn-to-ready latency from the ready message."""
+        pool = ProcessPoolManager(spawn_mode="forkserver")
+        handle = self._make_handle()
+        pool.processes[handle.id] = handle
+
+        with patch("src.services.execution.process_pool.time.monotonic", return_value=100.25):
+            pool._handle_worker_ready(handle, {"type": "worker_ready"})
+
+        assert handle.ready_ms == 250.0
+        heartbeat = pool._build_heartbeat()
+        assert heartbeat["spawn_mode"] == "forkserver"
+        assert heartbeat["spawn_ready_ms"]["count"] == 1
+        assert heartbeat["spawn_ready_ms"]["last"] == 250.0
+        assert heartbeat["processes"][0]["ready_ms"] == 250.0
+
+    @pytest.mark.asyncio
+    async def test_result_loop_does_not_forward_ready_message(self):
+        """Ready messages should not be treated as execution results."""
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback)
+        handle = self._make_handle()
+        handle.result_queue.get_nowait.side_effect = [{"type": "worker_ready"}, Empty()]
+        pool.processes[handle.id] = handle
+
+        task = asyncio.create_task(pool._result_loop())
+        pool._on_result_readable(handle)
+        pool._on_result_readable(handle)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert handle.ready_ms is not None
+        assert handle.executions_completed == 0
+        callback.assert_not_called()
+
+    def test_stale_template_waits_for_children(self):
+        """Should only stop a stale template once it has no children."""
+        pool = ProcessPoolManager(spawn_mode="forkserver")
+        pool._template_stale = True
+        server = MagicMock(_forkserver_pid=999)
+
+        with patch("src.services.execution.process_pool.multiprocessing.forkserver._forkserver", server), \
+                patch("src.services.execution.process_pool.psutil.Process") as process:
+            process.return_value.children.return_value = [MagicMock()]
+            pool._maybe_restart_worker_template()
+            server._stop.assert_not_called()
+            assert pool._template_stale is True
+
+            process.return_value.children.return_value = []
+            pool._maybe_restart_worker_template()
+            server._stop.assert_called_once()
+            assert pool._template_stale is False
+
+    def test_template_restart_failure_falls_back_to_spawn(self):
+        """Should switch to spawn when the forkserver internals are unavailable."""
+        pool = ProcessPoolManager(spawn_mode="forkserver")
+        pool._template_stale = True
+        server = MagicMock(spec=["_forkserver_pid"])  # no _stop()
+        server._forkserver_pid = 999
+
+        with patch("src.services.execution.process_pool.multiprocessing.forkserver._forkserver", server), \
+                patch("src.services.execution.process_pool.psutil.Process") as process:
+            process.return_value.children.return_value = []
+            pool._maybe_restart_worker_template()
+
+        assert pool.spawn_mode == "spawn"
+        assert pool._template_stale is False
+        assert pool._get_spawn_context()[0] == "spawn"
+
+
 class TestProcessPoolManagerIntegration:
     """Integration tests for full workflows."""
 
@@ -950,7 +1077,7 @@ class TestProcessPoolManagerIntegration:
             await pool.route_execution("exec-123", {"timeout_seconds": 300})
 
         assert handle.state == ProcessState.BUSY
-        mock_work_queue.put_nowait.assert_called_once_with("exec-123")
+        assert mock_work_queue.put_nowait.call_args[0][0]["execution_id"] == "exec-123"
 
         # Simulate result
         result_data = {
@@ -964,3 +1091,227 @@ class TestProcessPoolManagerIntegration:
 
         assert handle.state == ProcessState.IDLE
         callback.assert_called_once_with(result_data)
+
+
+class TestProcessPoolManagerResultPipes:
+    """Tests for event-driven result collection over worker pipes."""
+
+    @pytest.fixture
+    def pipes(self):
+        """Handle with real pipes, plus the worker's ends of them."""
+        ctx = multiprocessing.get_context("spawn")
+        work_reader, work_writer = channel_pair(ctx)
+        result_reader, result_writer = channel_pair(ctx)
+        process = MagicMock()
+        process.is_alive.return_value = True
+        handle = ProcessHandle(
+            id="process-1",
+            process=process,
+            pid=12345,
+            state=ProcessState.BUSY,
+            work_queue=work_writer,
+            result_queue=result_reader,
+            started_at=datetime.now(timezone.utc),
+            current_execution=ExecutionInfo(
+                execution_id="exec-1",
+                started_at=datetime.now(timezone.utc),
+                timeout_seconds=300,
+            ),
+        )
+        yield handle, work_reader, result_writer
+        for channel in (work_reader, work_writer, result_reader, result_writer):
+            if not channel.closed:
+                channel.close()
+
+    @pytest.mark.asyncio
+    async def test_result_is_handled_when_written(self, pipes):
+        """Should forward a result as soon as the worker writes it."""
+        received = asyncio.Event()
+        results: list[dict] = []
+
+        async def on_result(result):
+            results.append(result)
+            received.set()
+
+        pool = ProcessPoolManager(on_result=on_result)
+        handle, _, result_writer = pipes
+        pool.processes[handle.id] = handle
+        pool._watch_results(handle)
+        task = asyncio.create_task(pool._result_loop())
+        try:
+            result_writer.put_nowait({"execution_id": "exec-1", "success": True})
+            await asyncio.wait_for(received.wait(), timeout=1.0)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            pool._unwatch_results(handle)
+
+        assert results == [{"execution_id": "exec-1", "success": True}]
+        assert handle.state == ProcessState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_worker_exit_closes_channels(self, pipes):
+        """Should stop watching a result pipe once the worker end closes."""
+        pool = ProcessPoolManager()
+        handle, work_reader, result_writer = pipes
+        pool.processes[handle.id] = handle
+        pool._watch_results(handle)
+
+        result_writer.close()
+        work_reader.close()
+        await asyncio.sleep(0.05)
+
+        assert handle.result_queue.closed
+        assert handle.work_queue.closed
+        assert pool._results.empty()
+
+    @pytest.mark.asyncio
+    async def test_context_copy_is_written_in_background(self):
+        """Should write the crash-recovery context copy without blocking routing."""
+        pool = ProcessPoolManager()
+        handle = ProcessHandle(
+            id="process-1",
+            process=MagicMock(),
+            pid=12345,
+            state=ProcessState.IDLE,
+            work_queue=MagicMock(),
+            result_queue=MagicMock(),
+            started_at=datetime.now(timezone.utc),
+        )
+        pool.processes[handle.id] = handle
+
+        with patch.object(pool, "_write_context_to_redis", new_callable=AsyncMock) as write:
+            await pool.route_execution("exec-2", {"parameters": {"n": 1}})
+            handle.work_queue.put_nowait.assert_called_once()
+            await asyncio.gather(*pool._context_writes)
+
+        write.assert_awaited_once_with("exec-2", json.dumps({"parameters": {"n": 1}}))
+
+
+def _slot_handle(process_id: str, slots: int, running: list[str]) -> ProcessHandle:
+    """ProcessHandle of an async-slots worker running the given executions."""
+    process = MagicMock()
+    process.is_alive.return_value = True
+    handle = ProcessHandle(
+        id=process_id,
+        process=process,
+        pid=12345,
+        state=ProcessState.BUSY if running else ProcessState.IDLE,
+        work_queue=MagicMock(),
+        result_queue=MagicMock(),
+        started_at=datetime.now(timezone.utc),
+        slots=slots,
+    )
+    for execution_id in running:
+        handle.executions[execution_id] = ExecutionInfo(
+            execution_id=execution_id,
+            started_at=datetime.now(timezone.utc),
+            timeout_seconds=300,
+        )
+    handle.current_execution = next(iter(handle.executions.values()), None)
+    return handle
+
+
+class TestProcessPoolManagerAsyncSlots:
+    """Tests for workers running several executions concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_routes_to_busy_process_with_free_slot(self):
+        pool = ProcessPoolManager(min_workers=1, max_workers=1, async_slots=3)
+        handle = _slot_handle("process-1", 3, ["exec-1"])
+        pool.processes["process-1"] = handle
+
+        with patch.object(pool, "_write_context_to_redis", new_callable=AsyncMock):
+            await pool.route_execution("exec-2", {"timeout_seconds": 60})
+
+        assert set(handle.executions) == {"exec-1", "exec-2"}
+        assert handle.free_slots == 1
+        message = handle.work_queue.put_nowait.call_args[0][0]
+        assert message["timeout_seconds"] == 60
+
+    def test_prefers_process_with_most_free_slots(self):
+        pool = ProcessPoolManager(async_slots=3)
+        pool.processes["process-1"] = _slot_handle("process-1", 3, ["exec-1"])
+        pool.processes["process-2"] = _slot_handle("process-2", 3, [])
+        pool.processes["process-3"] = _slot_handle("process-3", 3, ["exec-2", "exec-3", "exec-4"])
+
+        assert pool._get_free_slot_process() is pool.processes["process-2"]
+        assert pool.processes["process-3"].free_slots == 0
+
+    @pytest.mark.asyncio
+    async def test_result_frees_slot_and_idles_when_empty(self):
+        callback = AsyncMock()
+        pool = ProcessPoolManager(on_result=callback, async_slots=2)
+        handle = _slot_handle("process-1", 2, ["exec-1", "exec-2"])
+        pool.processes["process-1"] = handle
+
+        await pool._handle_result(handle, {"execution_id": "exec-1", "success": True})
+        assert handle.state == ProcessState.BUSY
+        assert handle.current_execution.execution_id == "exec-2"
+        assert handle.free_slots == 1
+
+        await pool._handle_result(handle, {"execution_id": "exec-2", "success": True})
+        assert handle.state == ProcessState.IDLE
+        assert handle.current_execution is None
+        assert callback.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pending_recycle_waits_for_running_executions(self):
+        pool = ProcessPoolManager(async_slots=2)
+        handle = _slot_handle("process-1", 2, ["exec-1", "exec-2"])
+        handle.pending_recycle = True
+        pool.processes["process-1"] = handle
+        pool._recycle_process = AsyncMock()
+
+        await pool._handle_result(handle, {"execution_id": "exec-1", "success": True})
+        pool._recycle_process.assert_not_awaited()
+        assert handle.free_slots == 0
+
+        await pool._handle_result(handle, {"execution_id": "exec-2", "success": True})
+        pool._recycle_process.assert_awaited_once_with(handle)
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_task_not_process(self):
+        pool = ProcessPoolManager(async_slots=2)
+        handle = _slot_handle("process-1", 2, ["exec-1", "exec-2"])
+        pool.processes["process-1"] = handle
+        pool._kill_process = AsyncMock()
+
+        await pool._handle_cancel_request("exec-2")
+
+        handle.work_queue.put_nowait.assert_called_once_with(
+            {"type": "cancel", "execution_id": "exec-2"}
+        )
+        pool._kill_process.assert_not_awaited()
+        assert handle.executions["exec-2"].cancel_requested_at is not None
+
+    @pytest.mark.asyncio
+    async def test_overdue_cancel_kills_process_and_reports_others(self):
+        pool = ProcessPoolManager(min_workers=0, graceful_shutdown_seconds=5, async_slots=2)
+        handle = _slot_handle("process-1", 2, ["exec-1", "exec-2"])
+        handle.executions["exec-2"].cancel_requested_at = (
+            datetime.now(timezone.utc) - timedelta(seconds=10)
+        )
+        pool.processes["process-1"] = handle
+        pool._kill_process = AsyncMock()
+        pool._report_cancellation = AsyncMock()
+        pool._report_crash = AsyncMock()
+
+        await pool._check_timeouts()
+
+        pool._kill_process.assert_awaited_once_with(handle)
+        pool._report_cancellation.assert_awaited_once_with(handle.executions["exec-2"])
+        pool._report_crash.assert_awaited_once_with(handle.executions["exec-1"])
+        assert "process-1" not in pool.processes
+
+    @pytest.mark.asyncio
+    async def test_worker_gets_grace_period_to_time_out_task(self):
+        pool = ProcessPoolManager(graceful_shutdown_seconds=5, async_slots=2)
+        handle = _slot_handle("process-1", 2, ["exec-1"])
+        handle.executions["exec-1"].started_at = datetime.now(timezone.utc) - timedelta(seconds=302)
+        pool.processes["process-1"] = handle
+        pool._kill_process = AsyncMock()
+
+        await pool._check_timeouts()
+
+        pool._kill_process.assert_not_awaited()
@@ -3,16 +3,19 @@ Unit tests for queue_tracker module.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.services.execution.queue_tracker import (
     add_to_queue,
     remove_from_queue,
     get_queue_position,
     get_queue_depth,
+    get_queue_ticket,
     get_all_queue_positions,
-    publish_all_queue_positions,
+    get_all_pending_executions,
+    publish_queue_update,
     cleanup_stale_entries,
+    QUEUE_EPOCH_KEY,
     QUEUE_KEY,
 )
 
@@ -24,6 +27,15 @@ def mock_redis():
     return mock
 
 
+@pytest.fixture
+def mock_pipeline(mock_redis):
+    """Attach a mock pipeline (sync command buffering, async execute)."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 @pytest.fixture
 def mock_get_redis(mock_redis):
     """Patch _get_redis to return our mock."""
@@ -38,32 +50,30 @@ class TestAddToQueue:
     """Tests for add_to_queue function."""
 
     @pytest.mark.asyncio
-    async def test_adds_execution_to_sorted_set(self, mock_get_redis, mock_redis):
+    async def test_adds_execution_to_sorted_set(self, mock_get_redis, mock_redis, mock_pipeline):
         """Should add execution to Redis sorted set with timestamp."""
-        mock_redis.zadd = AsyncMock()
-        mock_redis.zrank = AsyncMock(return_value=0)
+        mock_pipeline.execute.return_value = [1, 0, None]
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
+            "src.services.execution.queue_tracker.publish_queue_ticket",
             new_callable=AsyncMock
         ):
             with patch("time.time", return_value=1000.0):
                 position = await add_to_queue("exec-123")
 
-        mock_redis.zadd.assert_called_once_with(
+        mock_pipeline.zadd.assert_called_once_with(
             QUEUE_KEY,
             {"exec-123": 1000.0}
         )
         assert position == 1  # 0-based rank + 1
 
     @pytest.mark.asyncio
-    async def test_returns_correct_position(self, mock_get_redis, mock_redis):
+    async def test_returns_correct_position(self, mock_get_redis, mock_redis, mock_pipeline):
         """Should return 1-based queue position."""
-        mock_redis.zadd = AsyncMock()
-        mock_redis.zrank = AsyncMock(return_value=4)  # 5th position (0-indexed)
+        mock_pipeline.execute.return_value = [1, 4, "7"]  # 5th position (0-indexed)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
+            "src.services.execution.queue_tracker.publish_queue_ticket",
             new_callable=AsyncMock
         ):
             position = await add_to_queue("exec-456")
@@ -71,61 +81,83 @@ class TestAddToQueue:
         assert position == 5
 
     @pytest.mark.asyncio
-    async def test_publishes_queue_positions_after_add(self, mock_get_redis, mock_redis):
-        """Should publish position updates to all queued executions."""
-        mock_redis.zadd = AsyncMock()
-        mock_redis.zrank = AsyncMock(return_value=0)
+    async def test_publishes_ticket_to_new_execution_only(self, mock_get_redis, mock_redis, mock_pipeline):
+        """Should publish the new execution's position and epoch, nothing else."""
+        mock_pipeline.execute.return_value = [1, 2, "7"]
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
+            "src.core.pubsub.publish_execution_update",
             new_callable=AsyncMock
         ) as mock_publish:
             await add_to_queue("exec-789")
 
-        mock_publish.assert_called_once()
+        mock_publish.assert_called_once_with(
+            "exec-789",
+            "Pending",
+            {"queuePosition": 3, "queueEpoch": 7, "waitReason": "queued"}
+        )
 
 
 class TestRemoveFromQueue:
     """Tests for remove_from_queue function."""
 
     @pytest.mark.asyncio
-    async def test_removes_execution_from_sorted_set(self, mock_get_redis, mock_redis):
-        """Should remove execution from Redis sorted set."""
+    async def test_removes_execution_and_bumps_epoch(self, mock_get_redis, mock_redis):
+        """Should remove execution from Redis sorted set and count the removal."""
         mock_redis.zrem = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_update"
         ):
             await remove_from_queue("exec-123")
 
         mock_redis.zrem.assert_called_once_with(QUEUE_KEY, "exec-123")
+        mock_redis.incrby.assert_called_once_with(QUEUE_EPOCH_KEY, 1)
 
     @pytest.mark.asyncio
-    async def test_publishes_positions_when_entry_removed(self, mock_get_redis, mock_redis):
-        """Should publish position updates when entry is actually removed."""
+    async def test_schedules_update_when_entry_removed(self, mock_get_redis, mock_redis):
+        """Should schedule a coalesced queue update when entry is removed."""
         mock_redis.zrem = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
-        ) as mock_publish:
+            "src.services.execution.queue_tracker.schedule_queue_update"
+        ) as mock_schedule:
             await remove_from_queue("exec-123")
 
-        mock_publish.assert_called_once()
+        mock_schedule.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_does_not_publish_when_entry_not_found(self, mock_get_redis, mock_redis):
-        """Should not publish updates when entry wasn't in queue."""
+        """Should not touch the epoch or publish when entry wasn't in queue."""
         mock_redis.zrem = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
-        ) as mock_publish:
+            "src.services.execution.queue_tracker.schedule_queue_update"
+        ) as mock_schedule:
             await remove_from_queue("exec-nonexistent")
 
-        mock_publish.assert_not_called()
+        mock_schedule.assert_not_called()
+        mock_redis.incrby.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_burst_of_removals(self, mock_get_redis, mock_redis):
+        """A burst of removals should produce a single queue update."""
+        mock_redis.zrem = AsyncMock(return_value=1)
+
+        with patch(
+            "src.services.execution.queue_tracker.publish_queue_update",
+            new_callable=AsyncMock
+        ) as mock_publish, patch(
+            "src.services.execution.queue_tracker.QUEUE_UPDATE_INTERVAL_SECONDS", 0.01
+        ):
+            for i in range(10):
+                await remove_from_queue(f"exec-{i}")
+
+            from src.services.execution import queue_tracker
+            assert queue_tracker._update_task is not None
+            await queue_tracker._update_task
+
+        mock_publish.assert_called_once()
 
 
 class TestGetQueuePosition:
@@ -190,53 +222,70 @@ class TestGetAllQueuePositions:
         assert positions == []
 
 
-class TestPublishAllQueuePositions:
-    """Tests for publish_all_queue_positions function."""
+class TestGetQueueTicket:
+    """Tests for get_queue_ticket function."""
 
     @pytest.mark.asyncio
-    async def test_publishes_update_for_each_queued_execution(self, mock_get_redis, mock_redis):
-        """Should publish position update to each execution."""
-        mock_redis.zrange = AsyncMock(return_value=["exec-1", "exec-2"])
+    async def test_returns_position_and_epoch(self, mock_get_redis, mock_redis, mock_pipeline):
+        """Should return 1-based position with the current epoch."""
+        mock_pipeline.execute.return_value = [2, "11"]
+
+        assert await get_queue_ticket("exec-1") == (3, 11)
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_not_in_queue(self, mock_get_redis, mock_redis, mock_pipeline):
+        """Should return None when execution is not in queue."""
+        mock_pipeline.execute.return_value = [None, "11"]
+
+        assert await get_queue_ticket("exec-1") is None
+
+
+class TestPublishQueueUpdate:
+    """Tests for publish_queue_update function."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_one_message_with_epoch_and_depth(self, mock_get_redis, mock_redis, mock_pipeline):
+        """Should publish a single compact message on the queue channel."""
+        mock_pipeline.execute.return_value = ["42", 3]
 
         with patch(
-            "src.core.pubsub.publish_execution_update",
+            "src.core.pubsub.manager.broadcast",
             new_callable=AsyncMock
-        ) as mock_publish:
-            await publish_all_queue_positions()
+        ) as mock_broadcast:
+            await publish_queue_update()
 
-        assert mock_publish.call_count == 2
-        mock_publish.assert_any_call(
-            "exec-1",
-            "Pending",
-            {"queuePosition": 1, "waitReason": "queued"}
-        )
-        mock_publish.assert_any_call(
-            "exec-2",
-            "Pending",
-            {"queuePosition": 2, "waitReason": "queued"}
+        mock_broadcast.assert_called_once_with(
+            "queue",
+            {"type": "queue_update", "epoch": 42, "depth": 3}
         )
 
-    @pytest.mark.asyncio
-    async def test_continues_on_individual_publish_failure(self, mock_get_redis, mock_redis):
-        """Should continue publishing even if one fails."""
-        mock_redis.zrange = AsyncMock(return_value=["exec-1", "exec-2", "exec-3"])
 
-        publish_mock = AsyncMock()
-        publish_mock.side_effect = [
-            None,
-            Exception("Publish failed"),
+class TestGetAllPendingExecutions:
+    """Tests for get_all_pending_executions function."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_contexts_in_one_pipeline(self, mock_get_redis, mock_redis, mock_pipeline):
+        """Should read every context with a single pipeline round trip."""
+        mock_redis.zrange = AsyncMock(return_value=["exec-1", "exec-2"])
+        mock_pipeline.execute.return_value = [
+            '{"workflow_id": "wf-1", "name": "Sync", "organization": {"name": "Acme"}}',
             None,
         ]
 
-        with patch(
-            "src.core.pubsub.publish_execution_update",
-            publish_mock
-        ):
-            # Should not raise
-            await publish_all_queue_positions()
+        items = await get_all_pending_executions()
 
-        # All three should be attempted
-        assert publish_mock.call_count == 3
+        assert mock_pipeline.get.call_count == 2
+        mock_pipeline.execute.assert_called_once()
+        mock_redis.get.assert_not_called()
+        assert items[0]["workflow_name"] == "Sync"
+        assert items[0]["organization_name"] == "Acme"
+        assert items[1] == {
+            "execution_id": "exec-2",
+            "workflow_id": None,
+            "workflow_name": None,
+            "organization_name": None,
+            "queued_at": None,
+        }
 
 
 class TestCleanupStaleEntries:
@@ -248,8 +297,7 @@ class TestCleanupStaleEntries:
         mock_redis.zremrangebyscore = AsyncMock(return_value=2)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
+            "src.services.execution.queue_tracker.schedule_queue_update"
         ):
             with patch("time.time", return_value=1000.0):
                 removed = await cleanup_stale_entries(max_age_seconds=600)
@@ -260,20 +308,20 @@ class TestCleanupStaleEntries:
             "-inf",
             400.0
         )
+        mock_redis.incrby.assert_called_once_with(QUEUE_EPOCH_KEY, 2)
         assert removed == 2
 
     @pytest.mark.asyncio
-    async def test_publishes_positions_when_entries_removed(self, mock_get_redis, mock_redis):
-        """Should publish position updates when entries are cleaned."""
+    async def test_schedules_update_when_entries_removed(self, mock_get_redis, mock_redis):
+        """Should schedule a queue update when entries are cleaned."""
         mock_redis.zremrangebyscore = AsyncMock(return_value=1)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
-        ) as mock_publish:
+            "src.services.execution.queue_tracker.schedule_queue_update"
+        ) as mock_schedule:
             await cleanup_stale_entries()
 
-        mock_publish.assert_called_once()
+        mock_schedule.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_does_not_publish_when_no_entries_removed(self, mock_get_redis, mock_redis):
@@ -281,9 +329,8 @@ class TestCleanupStaleEntries:
         mock_redis.zremrangebyscore = AsyncMock(return_value=0)
 
         with patch(
-            "src.services.execution.queue_tracker.publish_all_queue_positions",
-            new_callable=AsyncMock
-        ) as mock_publish:
+            "src.services.execution.queue_tracker.schedule_queue_update"
+        ) as mock_schedule:
             await cleanup_stale_entries()
 
-        mock_publish.assert_not_called()
+        mock_schedule.assert_not_called()
@@ -0,0 +1,116 @@
+"""Tests for async slot execution in the simple worker."""
+
+import asyncio
+import multiprocessing
+from unittest.mock import MagicMock, patch
+
+from src.services.execution.simple_worker import (
+    WORKER_CANCEL_MESSAGE,
+    _execute_slot,
+    _parse_work_message,
+    _run_slots,
+)
+from src.services.execution.worker_channel import channel_pair
+
+WORKER = "src.services.execution.simple_worker"
+
+
+async def _slow_execution(execution_id, worker_id, context_json):
+    await asyncio.sleep(10)
+    return {"execution_id": execution_id, "success": True}
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+class TestParseWorkMessage:
+    def test_execution_message(self):
+        message = {"execution_id": "exec-1", "context": b"{}"}
+        assert _parse_work_message(message) == ("exec-1", b"{}")
+
+    def test_bare_execution_id(self):
+        assert _parse_work_message("exec-1") == ("exec-1", None)
+
+    def test_cancel_message_is_not_work(self):
+        message = {"type": WORKER_CANCEL_MESSAGE, "execution_id": "exec-1"}
+        assert _parse_work_message(message) == (None, None)
+
+
+class TestExecuteSlot:
+    async def test_timeout_only_fails_its_task(self):
+        with patch(
+            "src.services.execution.simple_worker._execute_async", _slow_execution
+        ):
+            result = await _execute_slot("exec-1", "process-1", b"{}", 0.01)
+
+        assert result["success"] is False
+        assert result["error_type"] == "TimeoutError"
+        assert result["execution_id"] == "exec-1"
+
+    async def test_cancelled_task_reports_cancellation(self):
+        with patch(
+            "src.services.execution.simple_worker._execute_async", _slow_execution
+        ):
+            task = asyncio.create_task(_execute_slot("exec-1", "process-1", b"{}", None))
+            await asyncio.sleep(0)
+            task.cancel()
+            result = await task
+
+        assert result["success"] is False
+        assert result["error_type"] == "CancelledError"
+
+
+class TestRunSlots:
+    async def test_busy_worker_refreshes_snapshot_and_drains_on_change(self, monkeypatch):
+        """A worker that is never idle still takes a fresh snapshot per execution,
+        and drains before clearing modules that changed."""
+        monkeypatch.setattr(asyncio.get_running_loop(), "add_signal_handler", lambda *args: None)
+        work_reader, work_writer = channel_pair(multiprocessing.get_context("spawn"))
+        release = {execution_id: asyncio.Event() for execution_id in ("a", "b", "c")}
+        started: list[str] = []
+        activations: list[int] = []
+        refreshed: list[int] = []
+        changed: list[str] = []
+
+        async def execute(execution_id, worker_id, context_json):
+            started.append(execution_id)
+            await release[execution_id].wait()
+            return {"execution_id": execution_id, "success": True}
+
+        def activate():
+            activations.append(len(activations) + 1)
+            return activations[-1]
+
+        with patch(f"{WORKER}._execute_async", execute), \
+                patch(f"{WORKER}._activate_workspace_snapshot", side_effect=activate), \
+                patch(f"{WORKER}._deactivate_workspace_snapshot"), \
+                patch(f"{WORKER}._changed_workspace_modules", side_effect=lambda snapshot: changed), \
+                patch(f"{WORKER}._refresh_workspace_modules", side_effect=refreshed.append):
+            worker = asyncio.create_task(_run_slots(work_reader, MagicMock(), "process-1"))
+
+            work_writer.put({"execution_id": "a", "context": b"{}"})
+            await _until(lambda: started == ["a"])
+            work_writer.put({"execution_id": "b", "context": b"{}"})
+            await _until(lambda: started == ["a", "b"])
+            assert activations == [1, 2]
+            assert refreshed == [1]
+
+            changed.append("ws_helper")
+            work_writer.put({"execution_id": "c", "context": b"{}"})
+            await asyncio.sleep(0.05)
+            assert started == ["a", "b"]
+
+            # Cancel messages are still handled while draining
+            work_writer.put({"type": WORKER_CANCEL_MESSAGE, "execution_id": "b"})
+            release["a"].set()
+            await _until(lambda: started == ["a", "b", "c"])
+            assert refreshed == [1, activations[-1]]
+
+            release["c"].set()
+            work_writer._conn.close()
+            await asyncio.wait_for(worker, timeout=2)
+
@@ -0,0 +1,207 @@
+"""Tests for bounded variable serialization and workflow locals capture."""
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from src.services.execution.variable_capture import (
+    FULL_LIMITS,
+    SUMMARY_LIMITS,
+    CaptureLimits,
+    LocalsCapture,
+    capture_code_for,
+    limits_for_mode,
+    normalize_capture_mode,
+    serialize_locals,
+    serialize_value,
+)
+
+
+class TestSerializeValue:
+    def test_primitives_pass_through(self):
+        assert serialize_value({"a": 1, "b": [1.5, None, True, "x"]}) == {
+            "a": 1,
+            "b": [1.5, None, True, "x"],
+        }
+
+    def test_cycle_is_marked(self):
+        data: dict = {"name": "root"}
+        data["self"] = data
+
+        assert serialize_value(data) == {"name": "root", "self": "[Circular Reference]"}
+
+    def test_shared_reference_is_not_a_cycle(self):
+        shared = [1, 2]
+
+        assert serialize_value({"a": shared, "b": shared}) == {"a": [1, 2], "b": [1, 2]}
+
+    def test_depth_limit_summarizes_containers(self):
+        limits = CaptureLimits(max_depth=1, max_items=10, max_string_length=100, max_nodes=100)
+
+        assert serialize_value({"inner": [1, 2, 3]}, limits) == {"inner": "<list len=3>"}
+
+    def test_item_and_string_limits(self):
+        limits = CaptureLimits(max_depth=5, max_items=2, max_string_length=3, max_nodes=100)
+
+        assert serialize_value([1, 2, 3, 4], limits) == [1, 2, "... 2 more items"]
+        assert serialize_value({"a": 1, "b": 2, "c": 3}, limits) == {"a": 1, "b": 2, "...": "1 more keys"}
+        assert serialize_value("abcdef", limits) == "abc... (3 more chars)"
+
+    def test_node_limit_truncates(self):
+        limits = CaptureLimits(max_depth=5, max_items=100, max_string_length=100, max_nodes=3)
+
+        assert serialize_value([1, 2, 3, 4], limits) == [1, 2, "<truncated>", "<truncated>"]
+
+    def test_known_types(self):
+        when = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        ident = UUID("12345678-1234-5678-1234-567812345678")
+
+        assert serialize_value(when) == when.isoformat()
+        assert serialize_value(ident) == str(ident)
+        assert serialize_value({1, 2}) == [1, 2]
+        assert serialize_value(b"abc") == "<bytes len=3>"
+
+    def test_pydantic_models_and_unknown_types(self):
+        class Item(BaseModel):
+            name: str
+
+        class Opaque:
+            pass
+
+        assert serialize_value(Item(name="x")) == {"name": "x"}
+        assert serialize_value(Opaque()) == "<Opaque>"
+
+    def test_subclasses_use_base_handler(self):
+        class Tags(list):
+            pass
+
+        assert serialize_value(Tags(["a"])) == ["a"]
+
+
+class TestCaptureModes:
+    def test_modes(self):
+        assert limits_for_mode("off") is None
+        assert limits_for_mode("summary") is SUMMARY_LIMITS
+        assert limits_for_mode("full") is FULL_LIMITS
+
+    def test_unknown_mode_defaults_to_full(self):
+        assert normalize_capture_mode(None) == "full"
+        assert normalize_capture_mode("verbose") == "full"
+
+    def test_serialize_locals_filters_names(self):
+        local_vars = {"count": 1, "_private": 2, "context": 3, "helper": len, "sys": sys}
+
+        assert serialize_locals(local_vars, {"context"}, FULL_LIMITS) == {"count": 1}
+
+
+class TestLocalsCapture:
+    async def test_records_locals_at_return(self):
+        async def workflow():
+            total = 0
+            for i in range(3):
+                total += i
+                await asyncio.sleep(0)
+            return total
+
+        capture = LocalsCapture(capture_code_for(workflow))
+        capture.start()
+        try:
+            result = await workflow()
+        finally:
+            capture.stop()
+
+        assert result == 3
+        assert capture.locals is not None
+        assert capture.locals["total"] == 3
+
+    async def test_ignores_other_functions(self):
+        async def helper():
+            other = 1
+            return other
+
+        async def workflow():
+            await helper()
+
+        capture = LocalsCapture(capture_code_for(workflow))
+        capture.start()
+        try:
+            await workflow()
+        finally:
+            capture.stop()
+
+        assert capture.locals is not None
+        assert "other" not in capture.locals
+
+    def test_records_from_traceback(self):
+        def workflow():
+            step = "fetch"
+            raise RuntimeError(step)
+
+        capture = LocalsCapture(capture_code_for(workflow))
+        try:
+            workflow()
+        except RuntimeError as e:
+            assert capture.record_from_traceback(e.__traceback__)
+
+        assert capture.locals == {"step": "fetch"}
+
+    def test_stop_restores_previous_trace(self):
+        def tracer(frame, event, arg):
+            return None
+
+        sys.settrace(tracer)
+        try:
+            capture = LocalsCapture(capture_code_for(lambda: None))
+            capture.start()
+            capture.stop()
+            assert sys.gettrace() is tracer
+        finally:
+            sys.settrace(None)
+
+    @pytest.mark.skipif(sys.version_info >= (3, 12), reason="sys.monitoring is used instead")
+    async def test_tracer_removed_once_workflow_is_entered(self):
+        tracing = []
+
+        async def workflow():
+            tracing.append(sys.gettrace())
+            total = 1
+            await asyncio.sleep(0)
+            total += 1
+            return total
+
+        capture = LocalsCapture(capture_code_for(workflow))
+        capture.start()
+        try:
+            await workflow()
+        finally:
+            capture.stop()
+
+        assert tracing == [None]
+        assert capture.locals is not None
+        assert capture.locals["total"] == 2
+
+    async def test_concurrent_captures_are_isolated(self):
+        async def workflow(name, delay):
+            await asyncio.sleep(delay)
+            label = name
+            return label
+
+        async def run(name, delay):
+            capture = LocalsCapture(capture_code_for(workflow))
+            capture.start()
+            try:
+                await workflow(name, delay)
+            finally:
+                capture.stop()
+            return capture.locals
+
+        # The first capture to start stops first
+        fast, slow = await asyncio.gather(run("fast", 0), run("slow", 0.02))
+
+        assert slow["label"] == "slow"
+        assert fast["label"] == "fast"
+        assert sys.gettrace() is None
@@ -0,0 +1,75 @@
+"""Unit tests for the pool <-> worker pipe channel."""
+
+import multiprocessing
+import pickle
+from queue import Empty
+
+import pytest
+
+from src.services.execution.worker_channel import channel_pair
+
+
+@pytest.fixture
+def channel():
+    reader, writer = channel_pair(multiprocessing.get_context("spawn"))
+    yield reader, writer
+    reader.close()
+    writer.close()
+
+
+class TestWorkerChannel:
+    def test_round_trip(self, channel):
+        reader, writer = channel
+        writer.put_nowait({"execution_id": "exec-1", "n": [1, 2]})
+
+        assert reader.get(timeout=1.0) == {"execution_id": "exec-1", "n": [1, 2]}
+
+    def test_out_of_band_buffers(self, channel):
+        reader, writer = channel
+        payload = b"x" * 200_000
+
+        # Large enough to fill the pipe buffer, so send from a thread
+        import threading
+        sender = threading.Thread(
+            target=writer.put_nowait,
+            args=({"context": pickle.PickleBuffer(payload)},),
+        )
+        sender.start()
+        message = reader.get(timeout=1.0)
+        sender.join()
+
+        assert bytes(message["context"]) == payload
+
+    def test_concurrent_writers_do_not_interleave(self, channel):
+        """Messages with out-of-band buffers written from several threads arrive intact."""
+        import threading
+        reader, writer = channel
+        payloads = {i: bytes([i]) * 100_000 for i in range(8)}
+
+        senders = [
+            threading.Thread(
+                target=writer.put_nowait,
+                args=({"n": i, "context": pickle.PickleBuffer(p)},),
+            )
+            for i, p in payloads.items()
+        ]
+        for sender in senders:
+            sender.start()
+        received = [reader.get(timeout=2.0) for _ in senders]
+        for sender in senders:
+            sender.join()
+
+        assert {m["n"]: bytes(m["context"]) for m in received} == payloads
+
+    def test_get_nowait_raises_empty(self, channel):
+        reader, _ = channel
+
+        with pytest.raises(Empty):
+            reader.get_nowait()
+
+    def test_closed_writer_raises_eof(self, channel):
+        reader, writer = channel
+        writer.close()
+
+        with pytest.raises(EOFError):
+            reader.get(timeout=1.0)
@@ -0,0 +1,171 @@
+"""
+Unit tests for workspace snapshot import resolution.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.execution import workspace_snapshot
+from src.services.execution.virtual_import import (
+    NamespacePackageLoader,
+    VirtualModuleFinder,
+    VirtualModuleLoader,
+)
+from src.services.execution.workspace_snapshot import (
+    WorkspaceSnapshot,
+    activate_snapshot,
+    clear_snapshot_cache,
+    get_active_snapshot,
+    get_workspace_module,
+)
+
+
+def _module(path: str, content: str, content_hash: str) -> dict:
+    return {"path": path, "content": content, "hash": content_hash}
+
+
+@pytest.fixture(autouse=True)
+def clean_snapshot():
+    """Reset the active snapshot and body cache around each test."""
+    clear_snapshot_cache()
+    yield
+    clear_snapshot_cache()
+
+
+class TestWorkspaceSnapshot:
+    """Tests for WorkspaceSnapshot."""
+
+    def test_has_directory(self):
+        snapshot = WorkspaceSnapshot({"modules/extensions/halopsa.py": "h1"})
+
+        assert snapshot.has_directory("modules")
+        assert snapshot.has_directory("modules/extensions")
+        assert not snapshot.has_directory("modules/extensions/halopsa")
+        assert not snapshot.has_directory("other")
+
+    def test_get_module_batches_siblings(self):
+        snapshot = WorkspaceSnapshot({
+            "shared/a.py": "ha",
+            "shared/b.py": "hb",
+            "other/c.py": "hc",
+        })
+        bodies = {
+            "shared/a.py": _module("shared/a.py", "A = 1", "ha"),
+            "shared/b.py": _module("shared/b.py", "B = 1", "hb"),
+        }
+
+        with patch.object(
+            workspace_snapshot,
+            "get_modules_sync",
+            side_effect=lambda paths: {p: bodies[p] for p in paths if p in bodies},
+        ) as mock_mget:
+            assert snapshot.get_module("shared/a.py")["content"] == "A = 1"
+            assert snapshot.get_module("shared/b.py")["content"] == "B = 1"
+
+        # Sibling was prefetched by the first call; the other directory wasn't
+        mock_mget.assert_called_once()
+        assert sorted(mock_mget.call_args[0][0]) == ["shared/a.py", "shared/b.py"]
+
+    def test_get_module_falls_back_when_body_missing(self):
+        snapshot = WorkspaceSnapshot({"shared/a.py": "ha"})
+
+        with patch.object(workspace_snapshot, "get_modules_sync", return_value={}), \
+             patch.object(
+                 workspace_snapshot,
+                 "get_module_sync",
+                 return_value=_module("shared/a.py", "A = 1", "ha"),
+             ) as mock_get:
+            assert snapshot.get_module("shared/a.py")["content"] == "A = 1"
+
+        mock_get.assert_called_once_with("shared/a.py")
+
+    def test_unknown_path_returns_none_without_io(self):
+        snapshot = WorkspaceSnapshot({"shared/a.py": "ha"})
+
+        with patch.object(workspace_snapshot, "get_modules_sync") as mock_mget:
+            assert snapshot.get_module("shared/missing.py") is None
+
+        mock_mget.assert_not_called()
+
+
+class TestActivateSnapshot:
+    """Tests for activate_snapshot."""
+
+    def test_activates_complete_manifest(self):
+        with patch.object(
+            workspace_snapshot,
+            "get_module_manifest_sync",
+            return_value=({"a.py": "h1", "b.py": "h2"}, 2),
+        ):
+            snapshot = activate_snapshot()
+
+        assert snapshot is not None
+        assert get_active_snapshot() is snapshot
+
+    def test_incomplete_manifest_is_not_used(self):
+        with patch.object(
+            workspace_snapshot,
+            "get_module_manifest_sync",
+            return_value=({"a.py": "h1"}, 5),
+        ):
+            assert activate_snapshot() is None
+
+    def test_redis_error_is_not_fatal(self):
+        with patch.object(
+            workspace_snapshot,
+            "get_module_manifest_sync",
+            side_effect=ConnectionError("down"),
+        ):
+            assert activate_snapshot() is None
+
+    def test_workspace_module_falls_back_for_unknown_path(self):
+        workspace_snapshot._active = WorkspaceSnapshot({"a.py": "h1"})
+
+        with patch.object(
+            workspace_snapshot,
+            "get_module_sync",
+            return_value=_module("new.py", "X = 1", "h2"),
+        ) as mock_get:
+            assert get_workspace_module("new.py")["content"] == "X = 1"
+
+        mock_get.assert_called_once_with("new.py")
+
+
+class TestFinderWithSnapshot:
+    """Tests for VirtualModuleFinder when a snapshot is active."""
+
+    def test_resolves_module_without_per_import_lookup(self):
+        workspace_snapshot._active = WorkspaceSnapshot({"shared/utils.py": "h1"})
+
+        with patch.object(
+            workspace_snapshot,
+            "get_modules_sync",
+            return_value={"shared/utils.py": _module("shared/utils.py", "X = 1", "h1")},
+        ), patch("src.services.execution.virtual_import.get_module_sync") as mock_get:
+            spec = VirtualModuleFinder().find_spec("shared.utils")
+
+        mock_get.assert_not_called()
+        assert spec is not None
+        assert isinstance(spec.loader, VirtualModuleLoader)
+        assert spec.loader.content_hash == "h1"
+
+    def test_resolves_namespace_package_without_index_scan(self):
+        workspace_snapshot._active = WorkspaceSnapshot({"modules/extensions/halopsa.py": "h1"})
+
+        with patch("src.services.execution.virtual_import.get_module_index_sync") as mock_index:
+            spec = VirtualModuleFinder().find_spec("modules.extensions")
+
+        mock_index.assert_not_called()
+        assert spec is not None
+        assert isinstance(spec.loader, NamespacePackageLoader)
+
+    def test_unknown_module_returns_none_without_io(self):
+        workspace_snapshot._active = WorkspaceSnapshot({"shared/utils.py": "h1"})
+
+        with patch("src.services.execution.virtual_import.get_module_sync") as mock_get, \
+             patch.object(workspace_snapshot, "get_modules_sync") as mock_mget:
+            assert VirtualModuleFinder().find_spec("requests_oauthlib") is None
+
+        mock_get.assert_not_called()
+        mock_mget.assert_not_called()
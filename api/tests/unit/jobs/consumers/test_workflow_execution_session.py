@@ -1,139 +1,102 @@
-"""Tests for WorkflowExecutionConsumer persistent DB session."""
+"""Tests for WorkflowExecutionConsumer DB session and write handling."""
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
-class TestConsumerSessionLifecycle:
-    """Test persistent DB session management."""
-
-    @pytest.fixture
-    def mock_session_factory(self):
-        """Create mock session factory."""
-        mock_session = AsyncMock()
-        mock_session.close = AsyncMock()
-        mock_session.execute = AsyncMock(return_value=MagicMock())
-
-        factory = MagicMock()
-        factory.return_value = mock_session
-        return factory, mock_session
+class TestConsumerWriteLifecycle:
+    """Test group-commit lifecycle."""
 
     @pytest.mark.asyncio
-    async def test_start_creates_db_session(self, mock_session_factory):
-        """Consumer.start() should create persistent DB session."""
+    async def test_start_and_stop_run_group_committer(self):
+        """start() starts the write committer and log persister, stop() drains them."""
         from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
 
-        factory, mock_session = mock_session_factory
-
         with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
             consumer = WorkflowExecutionConsumer()
             consumer._pool = AsyncMock()
-            consumer._pool.start = AsyncMock()
             consumer._pool_started = False
-            consumer._session_factory = factory
-            consumer._db_session = None
+            consumer._writes = AsyncMock()
+            consumer._log_persister = AsyncMock()
 
-            # Mock parent start
-            with patch.object(
-                WorkflowExecutionConsumer.__bases__[0], "start", AsyncMock()
-            ):
+            base = WorkflowExecutionConsumer.__bases__[0]
+            with patch.object(base, "start", AsyncMock()), patch.object(base, "stop", AsyncMock()):
                 await consumer.start()
+                consumer._writes.start.assert_awaited_once()
+                consumer._log_persister.start.assert_awaited_once()
 
-            assert consumer._db_session is not None
-            factory.assert_called_once()
+                await consumer.stop()
+                consumer._writes.stop.assert_awaited_once()
+                consumer._log_persister.stop.assert_awaited_once()
+                consumer._pool.stop.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_stop_closes_db_session(self, mock_session_factory):
-        """Consumer.stop() should close persistent DB session."""
+    async def test_write_passes_group_session(self):
+        """_write() runs the function with the group transaction's session."""
         from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
 
-        factory, mock_session = mock_session_factory
+        session = MagicMock()
+
+        async def submit(op):
+            return await op(session)
 
         with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
             consumer = WorkflowExecutionConsumer()
-            consumer._pool = AsyncMock()
-            consumer._pool.stop = AsyncMock()
-            consumer._pool_started = True
-            consumer._db_session = mock_session
-
-            # Mock parent stop
-            with patch.object(
-                WorkflowExecutionConsumer.__bases__[0], "stop", AsyncMock()
-            ):
-                await consumer.stop()
+            consumer._writes = MagicMock()
+            consumer._writes.submit = AsyncMock(side_effect=submit)
 
-            mock_session.close.assert_called_once()
-            assert consumer._db_session is None
+            func = AsyncMock(return_value="ok")
+            result = await consumer._write(func, execution_id="exec-1")
 
+            assert result == "ok"
+            func.assert_awaited_once_with(execution_id="exec-1", session=session)
 
-class TestConsumerSessionReconnection:
-    """Test session health check and reconnection."""
-
-    @pytest.mark.asyncio
-    async def test_get_db_session_returns_healthy_session(self):
-        """_get_db_session() returns existing session when healthy."""
-        from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
-
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_session.execute = AsyncMock(return_value=mock_result)
-
-        with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
-            consumer = WorkflowExecutionConsumer()
-            consumer._db_session = mock_session
-            consumer._session_factory = MagicMock()
-
-            result = await consumer._get_db_session()
 
-            assert result is mock_session
-            mock_session.execute.assert_called_once()  # Health check ran
+class TestConsumerResultWrites:
+    """Test that result handling commits before publishing."""
 
     @pytest.mark.asyncio
-    async def test_get_db_session_reconnects_on_stale(self):
-        """_get_db_session() reconnects when session is stale."""
-        from sqlalchemy.exc import DBAPIError
+    async def test_failure_result_is_committed_before_publish(self):
+        from src.jobs.consumers import workflow_execution
         from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
 
-        stale_session = AsyncMock()
-        stale_session.execute = AsyncMock(side_effect=DBAPIError("connection closed", None, None))
-        stale_session.close = AsyncMock()
-
-        fresh_session = AsyncMock()
-        fresh_session.execute = AsyncMock(return_value=MagicMock())
-
-        factory = MagicMock()
-        factory.return_value = fresh_session
-
-        with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
-            consumer = WorkflowExecutionConsumer()
-            consumer._db_session = stale_session
-            consumer._session_factory = factory
-
-            result = await consumer._get_db_session()
+        order: list[str] = []
 
-            assert result is fresh_session
-            stale_session.close.assert_called_once()
-            factory.assert_called_once()
+        async def submit(op):
+            order.append("commit")
 
-    @pytest.mark.asyncio
-    async def test_get_db_session_creates_when_none(self):
-        """_get_db_session() creates session when None."""
-        from src.jobs.consumers.workflow_execution import WorkflowExecutionConsumer
+        async def publish(*args, **kwargs):
+            order.append("publish")
 
-        new_session = AsyncMock()
-        new_session.execute = AsyncMock(return_value=MagicMock())
-
-        factory = MagicMock()
-        factory.return_value = new_session
+        async def record_metrics(**kwargs):
+            order.append("metrics")
 
         with patch.object(WorkflowExecutionConsumer, "__init__", lambda self: None):
             consumer = WorkflowExecutionConsumer()
-            consumer._db_session = None
-            consumer._session_factory = factory
-
-            result = await consumer._get_db_session()
-
-            assert result is new_session
-            factory.assert_called_once()
-
-
+            consumer._writes = MagicMock()
+            consumer._writes.submit = AsyncMock(side_effect=submit)
+            consumer._redis_client = AsyncMock()
+            consumer._redis_client.get_pending_execution.return_value = {
+                "workflow_id": None,
+                "org_id": None,
+                "user_id": "user-1",
+                "user_name": "User",
+            }
+            consumer._load_execution_output = AsyncMock(return_value=([], [{"message": "x"}]))
+            consumer._clear_execution_output = AsyncMock()
+
+            with patch.object(workflow_execution, "publish_execution_update", side_effect=publish), \
+                    patch.object(workflow_execution, "publish_history_update", AsyncMock()), \
+                    patch("src.core.cache.cleanup_execution_cache", AsyncMock()), \
+                    patch("src.core.metrics.record_execution_metrics", side_effect=record_metrics):
+                await consumer._handle_result({
+                    "execution_id": "exec-1",
+                    "success": False,
+                    "error": "boom",
+                    "error_type": "RuntimeError",
+                })
+
+            assert order == ["commit", "metrics", "publish"]
+            consumer._clear_execution_output.assert_awaited_once_with(
+                "exec-1", [], [{"message": "x"}]
+            )
@@ -0,0 +1,150 @@
+"""Tests for firing schedule sources at their next fire time."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.jobs.schedulers import cron_scheduler
+from src.jobs.schedulers.cron_scheduler import ScheduleTimer
+
+NOW = datetime(2026, 3, 20, 9, 0, 0, 500000, tzinfo=timezone.utc)
+
+
+def _schedule(next_fire_at: datetime | None, cron: str = "0 9 * * *") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        cron_expression=cron,
+        timezone="UTC",
+        enabled=True,
+        next_fire_at=next_fire_at,
+        event_source=SimpleNamespace(id=uuid4(), name="Daily report"),
+    )
+
+
+def _db(schedule: SimpleNamespace | None) -> MagicMock:
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = schedule
+    db.execute = AsyncMock(side_effect=[result, MagicMock()])
+    db.commit = AsyncMock()
+    return db
+
+
+def _patch_db(db: MagicMock):
+    @asynccontextmanager
+    async def context():
+        yield db
+
+    return patch.object(cron_scheduler, "get_db_context", context)
+
+
+class TestFireScheduleSource:
+    """Tests for fire_schedule_source."""
+
+    @pytest.mark.asyncio
+    async def test_fires_and_moves_to_next_time(self):
+        """A due schedule creates an event for its fire time and is rescheduled."""
+        schedule = _schedule(datetime(2026, 3, 20, 9, 0, tzinfo=timezone.utc))
+        db = _db(schedule)
+        subscriptions = AsyncMock(return_value=[])
+
+        with _patch_db(db), patch.object(
+            cron_scheduler.EventSubscriptionRepository, "get_active_for_event", subscriptions
+        ):
+            outcome = await cron_scheduler.fire_schedule_source(schedule.id, NOW)
+
+        assert outcome["fired"] and outcome["rescheduled"]
+        reschedule = db.execute.await_args_list[1].args[0]
+        assert reschedule.compile().params["next_fire_at"] == datetime(2026, 3, 21, 9, 0, tzinfo=timezone.utc)
+        event = db.add.call_args_list[0].args[0]
+        assert event.data["scheduled_time"] == "2026-03-20T09:00:00+00:00"
+        db.commit.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_first_pass_only_schedules(self):
+        """Schedules without a next fire time are scheduled without firing."""
+        schedule = _schedule(None)
+        db = _db(schedule)
+
+        with _patch_db(db):
+            outcome = await cron_scheduler.fire_schedule_source(schedule.id, NOW)
+
+        assert outcome == {"fired": False, "rescheduled": True, "deliveries_queued": 0, "error": None}
+        db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missed_fire_is_skipped(self):
+        """Fire times missed by more than the grace period are not fired late."""
+        schedule = _schedule(NOW - timedelta(hours=2))
+        db = _db(schedule)
+
+        with _patch_db(db):
+            outcome = await cron_scheduler.fire_schedule_source(schedule.id, NOW)
+
+        assert outcome["rescheduled"] and not outcome["fired"]
+        db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_expression_is_parked(self):
+        """Invalid expressions are reported once and moved out of the due set."""
+        schedule = _schedule(NOW - timedelta(seconds=1), cron="every day")
+        db = _db(schedule)
+
+        with _patch_db(db):
+            outcome = await cron_scheduler.fire_schedule_source(schedule.id, NOW)
+
+        assert not outcome["rescheduled"]
+        assert "Invalid CRON expression" in outcome["error"]
+        params = db.execute.await_args_list[1].args[0].compile().params
+        assert params["next_fire_at"] == cron_scheduler.UNSCHEDULABLE_FIRE_AT
+
+
+class TestProcessScheduleSources:
+    """Tests for process_schedule_sources."""
+
+    @pytest.mark.asyncio
+    async def test_one_failing_source_does_not_stop_others(self):
+        """Each schedule fires independently; failures are collected."""
+        good, bad = uuid4(), uuid4()
+
+        async def fire(schedule_id, now):
+            if schedule_id == bad:
+                raise RuntimeError("deadlock detected")
+            return {"fired": True, "rescheduled": True, "deliveries_queued": 2, "error": None}
+
+        with patch.object(cron_scheduler, "_due_schedule_ids", AsyncMock(return_value=[bad, good])), \
+                patch.object(cron_scheduler, "fire_schedule_source", side_effect=fire):
+            results = await cron_scheduler.process_schedule_sources()
+
+        assert results["events_created"] == 1
+        assert results["deliveries_queued"] == 2
+        assert results["errors"] == [{"schedule_source_id": str(bad), "error": "deadlock detected"}]
+
+
+class TestScheduleTimer:
+    """Tests for ScheduleTimer."""
+
+    def test_sleeps_until_next_due_time(self):
+        """The timer wakes at the next fire time, within the sleep bound."""
+        timer = ScheduleTimer(max_sleep=60)
+        soon = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+        assert 9 < timer._sleep_seconds(soon) <= 10
+        assert timer._sleep_seconds(soon + timedelta(hours=1)) == 60
+        assert timer._sleep_seconds(None) == 60
+
+    @pytest.mark.asyncio
+    async def test_wake_moves_the_next_pass_earlier(self):
+        """A schedule announced to fire soon cuts the current sleep short."""
+        timer = ScheduleTimer(max_sleep=60)
+        sleep = asyncio.create_task(timer._sleep(None))
+        await asyncio.sleep(0)
+
+        timer.wake(datetime.now(timezone.utc) + timedelta(milliseconds=50))
+
+        await asyncio.wait_for(sleep, timeout=2)
@@ -0,0 +1,70 @@
+"""Tests for archiving old executions to object storage."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.jobs.schedulers import execution_archival
+from src.services.execution_archive import ExecutionArchive
+
+
+class TestArchiveBatch:
+    """Test archiving one batch."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_then_sets_pointers_and_clears_rows(self):
+        execution_id = uuid4()
+        archive = ExecutionArchive(execution_id=str(execution_id), result={"ok": True})
+        db = MagicMock()
+        db.execute = AsyncMock()
+        s3 = MagicMock()
+        upload = AsyncMock(return_value="archive/executions/abc.jsonl.zst")
+
+        with patch.object(execution_archival, "_load_batch", AsyncMock(return_value=[archive])), \
+                patch.object(execution_archival, "upload_archive", upload):
+            archived = await execution_archival._archive_batch(
+                db, s3, datetime(2026, 3, 1, tzinfo=timezone.utc)
+            )
+
+        assert archived == 1
+        upload.assert_awaited_once_with(s3, archive)
+        pointer_update = db.execute.await_args_list[0]
+        assert pointer_update.args[1] == [
+            {"id": execution_id, "archive_key": "archive/executions/abc.jsonl.zst"}
+        ]
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert "result=NULL" in statements[1].replace(" ", "")
+        assert statements[2].startswith("DELETE FROM execution_logs")
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_uploads_nothing(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+        upload = AsyncMock()
+
+        with patch.object(execution_archival, "_load_batch", AsyncMock(return_value=[])), \
+                patch.object(execution_archival, "upload_archive", upload):
+            archived = await execution_archival._archive_batch(
+                db, MagicMock(), datetime(2026, 3, 1, tzinfo=timezone.utc)
+            )
+
+        assert archived == 0
+        upload.assert_not_awaited()
+        db.execute.assert_not_awaited()
+
+
+class TestArchiveOldExecutions:
+    """Test the scheduled job."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        settings = MagicMock(execution_archive_after_days=0, s3_configured=True)
+
+        with patch.object(execution_archival, "get_settings", return_value=settings), \
+                patch.object(execution_archival, "_archive_batch", AsyncMock()) as batch:
+            results = await execution_archival.archive_old_executions()
+
+        batch.assert_not_awaited()
+        assert results["archived"] == 0
@@ -0,0 +1,159 @@
+"""Tests for execution log partition maintenance."""
+
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.config import Settings
+from src.jobs.schedulers import execution_log_retention
+from src.jobs.schedulers.execution_log_retention import (
+    drop_expired_partitions,
+    ensure_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+def _statements(db) -> list[str]:
+    return [str(call.args[0]) for call in db.execute.await_args_list]
+
+
+class TestPartitionNames:
+    """Test partition naming."""
+
+    def test_name_round_trip(self):
+        assert partition_name(date(2026, 3, 1)) == "execution_logs_y2026m03"
+        assert partition_month("execution_logs_y2026m03") == date(2026, 3, 1)
+
+    def test_default_partition_has_no_month(self):
+        assert partition_month("execution_logs_default") is None
+
+
+class TestEnsurePartitions:
+    """Test creating upcoming partitions."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_months_across_year_end(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(first=MagicMock(return_value=None)))
+        now = datetime(2026, 11, 20, tzinfo=timezone.utc)
+
+        created = await ensure_partitions(
+            db, now, ["execution_logs_y2026m11", "execution_logs_default"]
+        )
+
+        assert created == [
+            "execution_logs_y2026m12",
+            "execution_logs_y2027m01",
+            "execution_logs_y2027m02",
+        ]
+        statements = _statements(db)
+        assert "SELECT 1 FROM execution_logs_default" in statements[0]
+        assert "FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')" in statements[1]
+        assert not any("DETACH" in s for s in statements)
+
+    @pytest.mark.asyncio
+    async def test_moves_rows_out_of_the_default_partition(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(first=MagicMock(return_value=(1,)), rowcount=5))
+        now = datetime(2026, 11, 20, tzinfo=timezone.utc)
+
+        created = await ensure_partitions(
+            db,
+            now,
+            [
+                "execution_logs_default",
+                "execution_logs_y2026m12",
+                "execution_logs_y2027m01",
+                "execution_logs_y2027m02",
+            ],
+        )
+
+        assert created == ["execution_logs_y2026m11"]
+        statements = _statements(db)
+        assert statements[1] == "ALTER TABLE execution_logs DETACH PARTITION execution_logs_default"
+        assert "CREATE TABLE IF NOT EXISTS execution_logs_y2026m11" in statements[2]
+        assert "DELETE FROM execution_logs_default" in statements[3]
+        assert "INSERT INTO execution_logs_y2026m11" in statements[3]
+        assert statements[4] == "ALTER TABLE execution_logs ATTACH PARTITION execution_logs_default DEFAULT"
+
+
+class TestDropExpiredPartitions:
+    """Test applying the retention window."""
+
+    @pytest.mark.asyncio
+    async def test_drops_only_months_entirely_before_cutoff(self):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(rowcount=4))
+        cutoff = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+        dropped, deleted = await drop_expired_partitions(
+            db,
+            cutoff,
+            [
+                "execution_logs_default",
+                "execution_logs_y2026m01",
+                "execution_logs_y2026m02",
+                "execution_logs_y2026m03",
+            ],
+        )
+
+        assert dropped == ["execution_logs_y2026m01", "execution_logs_y2026m02"]
+        assert deleted == 4
+        assert "DELETE FROM execution_logs_default" in _statements(db)[-1]
+
+
+class TestMaintainExecutionLogPartitions:
+    """Test the scheduled job."""
+
+    def test_retention_is_opt_in(self):
+        """Nothing is dropped unless an operator sets a retention window."""
+        assert Settings.model_fields["execution_log_retention_days"].default == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_retention_keeps_everything(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=db)
+        context.__aexit__ = AsyncMock(return_value=None)
+        settings = MagicMock(execution_log_retention_days=0)
+        drop = AsyncMock()
+
+        with patch.object(execution_log_retention, "get_db_context", return_value=context), \
+                patch.object(execution_log_retention, "get_settings", return_value=settings), \
+                patch.object(execution_log_retention, "list_partitions", AsyncMock(return_value=[])), \
+                patch.object(execution_log_retention, "ensure_partitions", AsyncMock(return_value=["p"])), \
+                patch.object(execution_log_retention, "drop_expired_partitions", drop):
+            results = await execution_log_retention.maintain_execution_log_partitions()
+
+        drop.assert_not_awaited()
+        db.commit.assert_awaited_once()
+        assert results["created"] == ["p"]
+        assert results["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_failed_create_does_not_abort_drops(self):
+        db = MagicMock()
+        db.commit = AsyncMock()
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=db)
+        context.__aexit__ = AsyncMock(return_value=None)
+        settings = MagicMock(execution_log_retention_days=30, execution_archive_after_days=0)
+        drop = AsyncMock(return_value=(["old"], 2))
+
+        with patch.object(execution_log_retention, "get_db_context", return_value=context), \
+                patch.object(execution_log_retention, "get_settings", return_value=settings), \
+                patch.object(execution_log_retention, "list_partitions", AsyncMock(return_value=[])), \
+                patch.object(
+                    execution_log_retention, "ensure_partitions", AsyncMock(side_effect=RuntimeError("boom"))
+                ), \
+                patch.object(execution_log_retention, "drop_expired_partitions", drop):
+            results = await execution_log_retention.maintain_execution_log_partitions()
+
+        drop.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        assert results["created"] == []
+        assert results["dropped"] == ["old"]
+        assert results["errors"] == [{"error": "boom"}]
@@ -0,0 +1,142 @@
+"""Tests for folding Redis metric counters into the daily metrics tables."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.cache.keys import METRIC_COUNTERS_PREFIX
+from src.jobs.schedulers import metrics_flush
+
+
+def _redis(buckets: dict[int, dict[str, dict]]):
+    """Mock Redis holding counter hashes per bucket."""
+    r = MagicMock()
+    r.eval = AsyncMock(return_value=max(buckets, default=0))
+    r.zrangebyscore = AsyncMock(return_value=[str(b).encode() for b in buckets])
+
+    async def smembers(key):
+        bucket = int(key[len(METRIC_COUNTERS_PREFIX):].split(":")[0])
+        return set(buckets[bucket])
+
+    r.smembers = AsyncMock(side_effect=smembers)
+    r.deleted = []
+
+    def pipeline(transaction=True):
+        pipe = MagicMock()
+        reads: list[str] = []
+        pipe.hgetall.side_effect = reads.append
+        pipe.delete.side_effect = lambda *keys: r.deleted.extend(keys)
+
+        async def execute():
+            return [
+                hashes[key]
+                for hashes in buckets.values()
+                for key in reads
+                if key in hashes
+            ]
+
+        pipe.execute = AsyncMock(side_effect=execute)
+        return pipe
+
+    r.pipeline = MagicMock(side_effect=pipeline)
+    return r
+
+
+def _session_factory(commit_side_effect=None):
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock(side_effect=commit_side_effect)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session), session
+
+
+class TestParseBucket:
+    """Test grouping counter hashes into rows."""
+
+    def test_groups_daily_and_roi_hashes(self):
+        org_id = uuid4()
+        workflow_id = uuid4()
+        prefix = f"{METRIC_COUNTERS_PREFIX}7:"
+        hashes = {
+            f"{prefix}daily:2026-03-10:global": {b"execution_count": b"3", b"total_value": b"1.5"},
+            f"{prefix}daily:2026-03-10:{org_id}": {b"execution_count": b"2"},
+            f"{prefix}roi:2026-03-10:{workflow_id}:global": {b"success_count": b"1"},
+            f"{prefix}bogus": {b"execution_count": b"1"},
+        }
+
+        daily, roi = metrics_flush._parse_bucket(7, hashes)
+
+        day = date(2026, 3, 10)
+        assert daily == {
+            (day, None): {"execution_count": 3, "total_value": 1.5},
+            (day, org_id): {"execution_count": 2},
+        }
+        assert roi == {(day, workflow_id, None): {"success_count": 1}}
+
+
+class TestFlushMetricCounters:
+    """Test flush_metric_counters checkpointing."""
+
+    @pytest.mark.asyncio
+    async def test_applies_bucket_and_deletes_its_keys(self):
+        key = f"{METRIC_COUNTERS_PREFIX}5:daily:2026-03-10:global"
+        r = _redis({5: {key: {b"execution_count": b"4"}}})
+        factory, session = _session_factory()
+
+        with patch.object(metrics_flush, "get_redis") as mock_get_redis, \
+                patch.object(metrics_flush, "get_session_factory", return_value=factory), \
+                patch.object(metrics_flush, "lock_metrics_checkpoint", AsyncMock(return_value=4)), \
+                patch.object(metrics_flush, "_apply_daily", AsyncMock()) as apply_daily:
+            mock_get_redis.return_value.__aenter__.return_value = r
+            summary = await metrics_flush.flush_metric_counters()
+
+        apply_daily.assert_awaited_once()
+        assert apply_daily.await_args.args[1] == {
+            (date(2026, 3, 10), None): {"execution_count": 4}
+        }
+        session.commit.assert_awaited_once()
+        assert key in r.deleted
+        assert summary["buckets"] == 1
+        assert summary["daily_rows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bucket_behind_checkpoint_is_deleted_without_reapplying(self):
+        key = f"{METRIC_COUNTERS_PREFIX}5:daily:2026-03-10:global"
+        r = _redis({5: {key: {b"execution_count": b"4"}}})
+        factory, _ = _session_factory()
+
+        with patch.object(metrics_flush, "get_redis") as mock_get_redis, \
+                patch.object(metrics_flush, "get_session_factory", return_value=factory), \
+                patch.object(metrics_flush, "lock_metrics_checkpoint", AsyncMock(return_value=5)), \
+                patch.object(metrics_flush, "_apply_daily", AsyncMock()) as apply_daily:
+            mock_get_redis.return_value.__aenter__.return_value = r
+            summary = await metrics_flush.flush_metric_counters()
+
+        apply_daily.assert_not_awaited()
+        assert key in r.deleted
+        assert summary["skipped_buckets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_bucket_keeps_keys_and_stops(self):
+        first = f"{METRIC_COUNTERS_PREFIX}5:daily:2026-03-10:global"
+        second = f"{METRIC_COUNTERS_PREFIX}6:daily:2026-03-10:global"
+        r = _redis({
+            5: {first: {b"execution_count": b"1"}},
+            6: {second: {b"execution_count": b"1"}},
+        })
+        factory, _ = _session_factory(commit_side_effect=RuntimeError("deadlock"))
+
+        with patch.object(metrics_flush, "get_redis") as mock_get_redis, \
+                patch.object(metrics_flush, "get_session_factory", return_value=factory), \
+                patch.object(metrics_flush, "lock_metrics_checkpoint", AsyncMock(return_value=-1)), \
+                patch.object(metrics_flush, "_apply_daily", AsyncMock()) as apply_daily:
+            mock_get_redis.return_value.__aenter__.return_value = r
+            summary = await metrics_flush.flush_metric_counters()
+
+        apply_daily.assert_awaited_once()
+        assert r.deleted == []
+        assert summary["errors"] == 1
+        assert summary["buckets"] == 0
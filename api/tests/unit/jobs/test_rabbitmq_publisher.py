@@ -0,0 +1,146 @@
+"""
+Unit tests for the RabbitMQ publisher.
+
+Tests:
+1. Queue topology is declared once per channel
+2. publish_many sends every message and surfaces failures
+3. batch_publishes defers publish_message calls and groups them per queue
+4. LatencyHistogram bucketing
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.jobs.rabbitmq import (
+    LatencyHistogram,
+    PublishError,
+    RabbitMQPublisher,
+    batch_publishes,
+    publish_message,
+)
+
+
+@pytest.fixture
+def channel() -> MagicMock:
+    channel = MagicMock()
+    channel.is_closed = False
+    channel.declare_exchange = AsyncMock()
+    channel.declare_queue = AsyncMock()
+    channel.default_exchange.publish = AsyncMock()
+    return channel
+
+
+@pytest.fixture
+def publisher(channel: MagicMock) -> RabbitMQPublisher:
+    publisher = RabbitMQPublisher()
+    publisher._channel = channel
+    return publisher
+
+
+def _published_bodies(channel: MagicMock) -> list[dict]:
+    return [
+        json.loads(call.args[0].body)
+        for call in channel.default_exchange.publish.call_args_list
+    ]
+
+
+class TestRabbitMQPublisher:
+    async def test_declares_topology_once(self, publisher, channel):
+        await publisher.publish("workflow-executions", {"n": 1})
+        await publisher.publish("workflow-executions", {"n": 2})
+
+        # DLX once, poison queue + main queue once
+        assert channel.declare_exchange.await_count == 1
+        assert channel.declare_queue.await_count == 2
+        assert channel.default_exchange.publish.await_count == 2
+
+    async def test_publish_many_sends_all_messages(self, publisher, channel):
+        await publisher.publish_many("q", [{"n": i} for i in range(5)], priority=3)
+
+        assert _published_bodies(channel) == [{"n": i} for i in range(5)]
+        for call in channel.default_exchange.publish.call_args_list:
+            assert call.kwargs["routing_key"] == "q"
+            assert call.args[0].priority == 3
+        assert publisher.latency.count == 5
+        assert publisher.batch_latency.count == 1
+
+    async def test_publish_many_raises_after_attempting_all(self, publisher, channel):
+        channel.default_exchange.publish.side_effect = [None, RuntimeError("nack"), None]
+
+        with pytest.raises(PublishError, match="nack") as exc_info:
+            await publisher.publish_many("q", [{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert channel.default_exchange.publish.await_count == 3
+        # Only the unconfirmed message is reported
+        assert exc_info.value.failed == [{"n": 2}]
+
+    async def test_publish_many_empty_is_noop(self, publisher, channel):
+        await publisher.publish_many("q", [])
+
+        channel.declare_queue.assert_not_awaited()
+        channel.default_exchange.publish.assert_not_awaited()
+
+
+class TestBatchPublishes:
+    async def test_defers_and_groups_by_queue(self, publisher):
+        publisher.publish_many = AsyncMock()
+
+        with patch("src.jobs.rabbitmq.publisher", publisher):
+            async with batch_publishes():
+                await publish_message("a", {"n": 1})
+                await publish_message("b", {"n": 2})
+                await publish_message("a", {"n": 3})
+                publisher.publish_many.assert_not_awaited()
+
+        publisher.publish_many.assert_any_await("a", [{"n": 1}, {"n": 3}], priority=0)
+        publisher.publish_many.assert_any_await("b", [{"n": 2}], priority=0)
+
+    async def test_failures_of_every_queue_are_reported(self, publisher):
+        async def publish_many(queue_name, messages, priority=0):
+            if queue_name == "a":
+                raise PublishError(messages[:1], [RuntimeError("nack")])
+
+        publisher.publish_many = AsyncMock(side_effect=publish_many)
+
+        with patch("src.jobs.rabbitmq.publisher", publisher):
+            with pytest.raises(PublishError) as exc_info:
+                async with batch_publishes():
+                    await publish_message("a", {"n": 1})
+                    await publish_message("a", {"n": 2})
+                    await publish_message("b", {"n": 3})
+
+        assert publisher.publish_many.await_count == 2
+        assert exc_info.value.failed == [{"n": 1}]
+
+    async def test_nothing_sent_when_body_raises(self, publisher):
+        publisher.publish_many = AsyncMock()
+
+        with patch("src.jobs.rabbitmq.publisher", publisher):
+            with pytest.raises(ValueError):
+                async with batch_publishes():
+                    await publish_message("a", {"n": 1})
+                    raise ValueError("boom")
+
+        publisher.publish_many.assert_not_awaited()
+
+    async def test_publish_outside_batch_is_immediate(self, publisher):
+        publisher.publish = AsyncMock()
+
+        with patch("src.jobs.rabbitmq.publisher", publisher):
+            await publish_message("a", {"n": 1}, priority=5)
+
+        publisher.publish.assert_awaited_once_with("a", {"n": 1}, priority=5)
+
+
+class TestLatencyHistogram:
+    def test_buckets(self):
+        histogram = LatencyHistogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 4
+        assert snapshot["sum_ms"] == 56.5
+        assert snapshot["buckets"] == {"le_1ms": 2, "le_10ms": 1, "gt_10ms": 1}
@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+from src.core.pagination import Cursor, decode_cursor, encode_cursor
 from src.repositories.execution_logs import ExecutionLogRepository
 
 
@@ -69,11 +70,34 @@ class TestExecutionLogRepositoryListLogs:
 
         # Assert
         assert len(logs) == 1  # Should only return limit, not limit+1
-        assert next_token == "1"  # Next offset
+        assert decode_cursor(next_token) == Cursor(mock_log.timestamp, mock_log.id)
         assert logs[0]["workflow_name"] == "test-workflow"
         assert logs[0]["organization_name"] == "Test Org"
         assert logs[0]["level"] == "ERROR"
 
+    @pytest.mark.asyncio
+    async def test_list_logs_seeks_past_cursor(
+        self, repository, mock_session, mock_log
+    ):
+        """Test that a cursor replaces OFFSET with a keyset predicate."""
+        # Arrange
+        mock_result = MagicMock()
+        mock_unique = MagicMock()
+        mock_unique.all.return_value = [mock_log]
+        mock_scalars = MagicMock()
+        mock_scalars.unique.return_value = mock_unique
+        mock_result.scalars.return_value = mock_scalars
+        mock_session.execute.return_value = mock_result
+        cursor = decode_cursor(encode_cursor(datetime.now(timezone.utc), 42))
+
+        # Act
+        await repository.list_logs(limit=10, cursor=cursor)
+
+        # Assert
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "(execution_logs.timestamp, execution_logs.id) <" in sql
+        assert "OFFSET" not in sql
+
     @pytest.mark.asyncio
     async def test_list_logs_no_more_pages(self, repository, mock_session, mock_log):
         """Test that list_logs returns None token when no more pages."""
@@ -243,3 +267,46 @@ class TestExecutionLogRepositoryListLogs:
         assert len(logs) == 1
         assert logs[0]["organization_name"] is None
         assert logs[0]["workflow_name"] == "test-workflow"
+
+
+class TestExecutionLogRepositoryCopyLogs:
+    """Tests for ExecutionLogRepository.copy_logs."""
+
+    @pytest.mark.asyncio
+    async def test_copy_logs_writes_records_with_copy(self):
+        """Rows go through asyncpg COPY with JSON-encoded metadata."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        raw = MagicMock()
+        raw.driver_connection = driver
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw)
+        session = AsyncMock()
+        session.connection = AsyncMock(return_value=connection)
+
+        execution_id = uuid4()
+        timestamp = datetime(2026, 3, 20, tzinfo=timezone.utc)
+        count = await ExecutionLogRepository(session).copy_logs([
+            {"execution_id": execution_id, "level": "INFO", "message": "a",
+             "log_metadata": {"k": 1}, "timestamp": timestamp, "sequence": 0},
+            {"execution_id": execution_id, "level": "ERROR", "message": "b",
+             "log_metadata": None, "timestamp": timestamp, "sequence": 1},
+        ])
+
+        assert count == 2
+        session.flush.assert_awaited_once()
+        args, kwargs = driver.copy_records_to_table.call_args
+        assert args == ("execution_logs",)
+        assert kwargs["columns"][0] == "execution_id"
+        assert kwargs["records"] == [
+            (execution_id, "INFO", "a", '{"k": 1}', timestamp, 0),
+            (execution_id, "ERROR", "b", None, timestamp, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_copy_logs_without_rows_skips_database(self):
+        """An empty batch does not touch the connection."""
+        session = AsyncMock()
+
+        assert await ExecutionLogRepository(session).copy_logs([]) == 0
+        session.connection.assert_not_called()
@@ -0,0 +1,156 @@
+"""Tests for the streaming execution log persister."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from redis.exceptions import ResponseError
+
+from src.services.execution.log_persister import LogPersister
+
+
+def _entry(entry_id: str, seq: int, message: str = "line") -> tuple[str, dict[str, str]]:
+    return (entry_id, {
+        "level": "INFO",
+        "message": message,
+        "metadata": "{}",
+        "timestamp": "2026-03-20T12:00:00+00:00",
+        "seq": str(seq),
+    })
+
+
+def _redis(execution_ids: list[str], *responses: list) -> tuple[MagicMock, list[MagicMock]]:
+    """Redis mock whose successive pipelines return the given responses."""
+    r = MagicMock()
+    r.smembers = AsyncMock(return_value=set(execution_ids))
+    r.srem = AsyncMock()
+    pipes = []
+    for response in responses:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=response)
+        pipes.append(pipe)
+    r.pipeline.side_effect = pipes
+    return r, pipes
+
+
+def _session_factory() -> tuple[MagicMock, MagicMock]:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+@pytest.fixture
+def copy_logs():
+    with patch(
+        "src.repositories.execution_logs.ExecutionLogRepository.copy_logs",
+        new_callable=AsyncMock,
+    ) as mock:
+        yield mock
+
+
+class TestPoll:
+    """Tests for LogPersister.poll."""
+
+    @pytest.mark.asyncio
+    async def test_persists_then_acks_and_deletes(self, copy_logs):
+        """New entries are COPYed in one transaction, then acknowledged and deleted."""
+        exec_id = str(uuid4())
+        stream_key = f"bifrost:logs:{exec_id}"
+        r, (read, ack) = _redis(
+            [exec_id],
+            [[[stream_key, [_entry("1-0", 0, "a"), _entry("1-1", 1, "b")]]]],
+            [2, 2],
+        )
+        factory, session = _session_factory()
+        persister = LogPersister(factory, claim_interval=3600)
+        persister._last_claim = float("inf")
+
+        assert await persister.poll(r) == 2
+
+        rows = copy_logs.call_args[0][0]
+        assert [(row["sequence"], row["message"]) for row in rows] == [(0, "a"), (1, "b")]
+        assert rows[0]["execution_id"] == UUID(exec_id)
+        session.commit.assert_awaited_once()
+        read.xreadgroup.assert_called_once()
+        assert read.xreadgroup.call_args[0][0] == "log-persister"
+        ack.xack.assert_called_once_with(stream_key, "log-persister", "1-0", "1-1")
+        ack.xdel.assert_called_once_with(stream_key, "1-0", "1-1")
+        assert persister.persisted == 2
+
+    @pytest.mark.asyncio
+    async def test_no_active_streams_is_a_noop(self, copy_logs):
+        """Nothing is read when no execution is logging."""
+        r, _ = _redis([])
+        factory, _ = _session_factory()
+
+        assert await LogPersister(factory).poll(r) == 0
+        r.pipeline.assert_not_called()
+        copy_logs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cleared_streams_leave_the_active_set(self, copy_logs):
+        """Streams deleted on completion are dropped from the active set."""
+        done, running = sorted([str(uuid4()), str(uuid4())])
+        r, _ = _redis(
+            [done, running],
+            [ResponseError("NOGROUP No such key or consumer group"), []],
+        )
+        factory, _ = _session_factory()
+        persister = LogPersister(factory)
+        persister._last_claim = float("inf")
+
+        assert await persister.poll(r) == 0
+        r.srem.assert_awaited_once_with("bifrost:logs:active", done)
+        copy_logs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_does_not_block_others(self, copy_logs):
+        """After a failed shared COPY each execution is retried on its own."""
+        bad, good = sorted([str(uuid4()), str(uuid4())])
+        r, (_, ack) = _redis(
+            [bad, good],
+            [
+                [[f"bifrost:logs:{bad}", [_entry("1-0", 0)]]],
+                [[f"bifrost:logs:{good}", [_entry("2-0", 0)]]],
+            ],
+            [1, 1],
+        )
+        factory, _ = _session_factory()
+        persister = LogPersister(factory)
+        persister._last_claim = float("inf")
+
+        async def copy(rows):
+            if any(str(row["execution_id"]) == bad for row in rows):
+                raise RuntimeError("foreign key violation")
+            return len(rows)
+
+        copy_logs.side_effect = copy
+
+        assert await persister.poll(r) == 1
+        # Unacknowledged entries stay pending to be claimed again later
+        ack.xack.assert_called_once_with(f"bifrost:logs:{good}", "log-persister", "2-0")
+
+    @pytest.mark.asyncio
+    async def test_claims_entries_of_stopped_persisters(self, copy_logs):
+        """Entries pending on another consumer for too long are taken over."""
+        exec_id = str(uuid4())
+        stream_key = f"bifrost:logs:{exec_id}"
+        r, (_, claim, ack) = _redis(
+            [exec_id],
+            [[[stream_key, [_entry("2-0", 1, "new")]]]],
+            [["0-0", [_entry("1-0", 0, "abandoned")], []]],
+            [1, 1],
+        )
+        factory, _ = _session_factory()
+        persister = LogPersister(factory)
+
+        assert await persister.poll(r) == 2
+
+        claim.xautoclaim.assert_called_once()
+        assert claim.xautoclaim.call_args.kwargs["min_idle_time"] > 0
+        messages = {row["message"] for row in copy_logs.call_args[0][0]}
+        assert messages == {"new", "abandoned"}
+        ack.xack.assert_called_once_with(stream_key, "log-persister", "2-0", "1-0")
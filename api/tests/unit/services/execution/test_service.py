@@ -90,6 +90,7 @@ class TestGetWorkflowForExecution:
         mock_workflow.time_saved = 5
         mock_workflow.value = 10.0
         mock_workflow.execution_mode = "async"
+        mock_workflow.variable_capture = "summary"
         mock_workflow.organization_id = org_id
 
         mock_wf_result = MagicMock()
@@ -99,7 +100,7 @@ class TestGetWorkflowForExecution:
         result = await get_workflow_for_execution(workflow_id, db=mock_session)
 
         expected_keys = {
-            "name", "function_name", "path", "timeout_seconds",
+            "name", "function_name", "path", "timeout_seconds", "variable_capture",
             "time_saved", "value", "execution_mode", "organization_id",
         }
         assert set(result.keys()) == expected_keys
@@ -108,6 +109,7 @@ class TestGetWorkflowForExecution:
         assert result["function_name"] == "run"
         assert result["path"] == "workflows/test.py"
         assert result["timeout_seconds"] == 300
+        assert result["variable_capture"] == "summary"
         assert result["organization_id"] == str(org_id)
 
     @pytest.mark.asyncio
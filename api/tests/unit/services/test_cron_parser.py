@@ -1,9 +1,12 @@
+from datetime import datetime, timezone
+
 import pytest
 
 from src.services.cron_parser import (
     validate_cron_expression,
     is_cron_expression_valid,
     cron_to_human_readable,
+    next_fire_time,
 )
 
 
@@ -143,3 +146,17 @@ class TestIsCronExpressionValid:
         assert is_cron_expression_valid("0 9 * * *") is True
         result = cron_to_human_readable("0 9 * * *")
         assert result not in ("Invalid CRON expression", "Invalid CRON expression format")
+
+
+class TestNextFireTime:
+
+    def test_next_match_after_start(self):
+        start = datetime(2026, 3, 20, 9, 0, 30, tzinfo=timezone.utc)
+        assert next_fire_time("*/15 * * * *", start) == datetime(2026, 3, 20, 9, 15, tzinfo=timezone.utc)
+
+    def test_exact_match_is_not_repeated(self):
+        start = datetime(2026, 3, 20, 9, 0, tzinfo=timezone.utc)
+        assert next_fire_time("0 9 * * *", start) == datetime(2026, 3, 21, 9, 0, tzinfo=timezone.utc)
+
+    def test_invalid_expression(self):
+        assert next_fire_time("not a cron", datetime.now(timezone.utc)) is None
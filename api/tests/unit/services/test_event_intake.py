@@ -0,0 +1,230 @@
+"""Tests for the fast-ack webhook intake and event materializer."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.services.events.intake import (
+    IntakeEvent,
+    append_intake_event,
+    idempotency_key,
+    parse_intake_entry,
+)
+from src.services.events.materializer import EventMaterializer, matching_subscriptions
+from src.services.webhooks.protocol import Deliver, WebhookRequest
+
+
+def _request(body: bytes = b'{"id": 1}', headers: dict | None = None) -> WebhookRequest:
+    return WebhookRequest(
+        method="POST",
+        path="/api/hooks/x",
+        headers=headers or {},
+        query_params={},
+        body=body,
+        client_ip="10.0.0.1",
+    )
+
+
+def _intake_entry(entry_id: str, source_id: UUID, event_type: str = "ticket.created") -> tuple[str, dict]:
+    return (entry_id, {
+        "event_id": str(uuid4()),
+        "source_id": str(source_id),
+        "event_type": event_type,
+        "data": '{"ticket": 7}',
+        "headers": '{"content-type": "application/json"}',
+        "source_ip": "10.0.0.1",
+        "received_at": (datetime.now(timezone.utc) - timedelta(seconds=2)).isoformat(),
+    })
+
+
+class TestIdempotencyKey:
+    """Tests for idempotency_key."""
+
+    def test_uses_delivery_id_header(self):
+        """A sender-assigned delivery ID identifies retries."""
+        request = _request(headers={"x-github-delivery": "abc-123"})
+        assert idempotency_key(request) == "h:abc-123"
+
+    def test_no_delivery_id_is_never_deduplicated(self):
+        """Repeated identical bodies are legitimate deliveries without a delivery ID."""
+        assert idempotency_key(_request(b'{"value": [{"changeType": "updated"}]}')) is None
+        assert idempotency_key(_request(b"")) is None
+
+
+class TestAppendIntakeEvent:
+    """Tests for append_intake_event."""
+
+    @pytest.mark.asyncio
+    async def test_appends_with_idempotency_key(self):
+        """The event is appended by the script together with its idempotency key."""
+        script = AsyncMock(side_effect=lambda keys, args: [1, args[1]])
+        r = MagicMock()
+        r.register_script.return_value = script
+        source_id = uuid4()
+
+        event_id, appended = await append_intake_event(
+            r, source_id, Deliver(data={"id": 1}, event_type="created"),
+            _request(headers={"webhook-id": "msg_1"}),
+        )
+
+        assert appended is True
+        keys = script.call_args.kwargs["keys"]
+        args = script.call_args.kwargs["args"]
+        assert keys[0] == "bifrost:events:intake"
+        assert keys[1] == f"bifrost:events:idem:{source_id}:h:msg_1"
+        assert args[1] == str(event_id)
+        fields = dict(zip(args[2::2], args[3::2]))
+        assert fields["source_id"] == str(source_id)
+        assert fields["event_type"] == "created"
+        assert json.loads(fields["data"]) == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_appends_without_idempotency_key(self):
+        """Without a delivery ID only the stream key is passed."""
+        script = AsyncMock(side_effect=lambda keys, args: [1, args[1]])
+        r = MagicMock()
+        r.register_script.return_value = script
+
+        _, appended = await append_intake_event(r, uuid4(), Deliver(data={}), _request())
+
+        assert appended is True
+        assert script.call_args.kwargs["keys"] == ["bifrost:events:intake"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_returns_first_event(self):
+        """A retried delivery returns the ID of the event first accepted."""
+        first = uuid4()
+        r = MagicMock()
+        r.register_script.return_value = AsyncMock(return_value=[0, str(first)])
+
+        event_id, appended = await append_intake_event(
+            r, uuid4(), Deliver(data={}), _request()
+        )
+
+        assert (event_id, appended) == (first, False)
+
+    def test_entry_round_trip(self):
+        """Entries decode into the event the receiver accepted."""
+        source_id = uuid4()
+        event = parse_intake_entry(*_intake_entry("1-0", source_id))
+        assert event.event_source_id == source_id
+        assert event.event_type == "ticket.created"
+        assert event.data == {"ticket": 7}
+        assert event.received_at.tzinfo is not None
+
+
+class TestMatchingSubscriptions:
+    """Tests for matching_subscriptions."""
+
+    def test_same_rules_as_get_active_for_event(self):
+        """Unfiltered subscriptions match everything; untyped events only match those."""
+        unfiltered = SimpleNamespace(event_type=None)
+        created = SimpleNamespace(event_type="created")
+        deleted = SimpleNamespace(event_type="deleted")
+        subscriptions = [unfiltered, created, deleted]
+
+        assert matching_subscriptions(subscriptions, "created") == [unfiltered, created]
+        assert matching_subscriptions(subscriptions, None) == [unfiltered]
+
+
+class TestEventMaterializer:
+    """Tests for EventMaterializer.poll."""
+
+    def _redis(self, entries: list) -> tuple[MagicMock, MagicMock]:
+        r = MagicMock()
+        r.xgroup_create = AsyncMock()
+        r.xreadgroup = AsyncMock(return_value=[["bifrost:events:intake", entries]])
+        r.xautoclaim = AsyncMock(return_value=["0-0", [], []])
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        r.pipeline.return_value = pipe
+        return r, pipe
+
+    @pytest.mark.asyncio
+    async def test_materializes_then_acks_and_records_lag(self):
+        """A batch is inserted and fanned out before its entries are acknowledged."""
+        source_id = uuid4()
+        entries = [_intake_entry("1-0", source_id), _intake_entry("1-1", source_id)]
+        r, pipe = self._redis(entries)
+        materializer = EventMaterializer(MagicMock())
+        calls = []
+
+        async def insert(events):
+            calls.append("insert")
+            return {event.event_id: 1 for event in events}
+
+        async def fan_out(events, inserted):
+            calls.append("fan_out")
+
+        with patch.object(materializer, "_insert", side_effect=insert), \
+                patch.object(materializer, "_fan_out", side_effect=fan_out):
+            assert await materializer.poll(r) == 2
+
+        assert calls == ["insert", "fan_out"]
+        r.xgroup_create.assert_awaited_once()
+        pipe.xack.assert_called_once_with("bifrost:events:intake", "event-materializer", "1-0", "1-1")
+        pipe.xdel.assert_called_once_with("bifrost:events:intake", "1-0", "1-1")
+        lag = json.loads(pipe.hset.call_args[0][2])
+        assert pipe.hset.call_args[0][1] == str(source_id)
+        assert lag["events"] == 2 and lag["lag_ms"] >= 2000
+        assert materializer.stats()["lag"][str(source_id)]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_event_stays_pending(self):
+        """After a failed batch each event is retried; failures are not acknowledged."""
+        source_id = uuid4()
+        bad, good = _intake_entry("1-0", source_id), _intake_entry("1-1", source_id)
+        r, pipe = self._redis([bad, good])
+        materializer = EventMaterializer(MagicMock())
+        bad_id = UUID(bad[1]["event_id"])
+
+        async def insert(events: list[IntakeEvent]):
+            if any(event.event_id == bad_id for event in events):
+                raise RuntimeError("deadlock detected")
+            return {event.event_id: 0 for event in events}
+
+        with patch.object(materializer, "_insert", side_effect=insert), \
+                patch.object(materializer, "_fan_out", new_callable=AsyncMock):
+            assert await materializer.poll(r) == 1
+
+        pipe.xack.assert_called_once_with("bifrost:events:intake", "event-materializer", "1-1")
+
+    @pytest.mark.asyncio
+    async def test_malformed_entries_are_dropped(self):
+        """Entries that cannot be decoded are acknowledged without being inserted."""
+        r, pipe = self._redis([("1-0", {"event_id": "not-a-uuid"})])
+        materializer = EventMaterializer(MagicMock())
+
+        with patch.object(materializer, "_insert", new_callable=AsyncMock) as insert:
+            assert await materializer.poll(r) == 0
+
+        insert.assert_not_called()
+        pipe.xack.assert_called_once_with("bifrost:events:intake", "event-materializer", "1-0")
+
+
+class TestClaimPendingDeliveries:
+    """Tests for EventDeliveryRepository.claim_pending."""
+
+    @pytest.mark.asyncio
+    async def test_only_pending_deliveries_are_claimed(self):
+        """Queueing is guarded by a PENDING -> QUEUED transition."""
+        from sqlalchemy.dialects import postgresql
+
+        from src.repositories.events import EventDeliveryRepository
+
+        claimed_id = uuid4()
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[claimed_id])))
+        )
+
+        assert await EventDeliveryRepository(session).claim_pending(uuid4()) == {claimed_id}
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE event_deliveries SET status=")
+        assert "event_deliveries.status = " in sql
+        assert "RETURNING event_deliveries.id" in sql
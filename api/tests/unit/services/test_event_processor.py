@@ -0,0 +1,53 @@
+"""Tests for queueing event deliveries."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.jobs.rabbitmq import PublishError, publish_message
+from src.models.enums import EventDeliveryStatus
+from src.services.events.processor import EventProcessor
+
+
+def _delivery() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        status=EventDeliveryStatus.PENDING,
+        execution_id=None,
+        error_message=None,
+    )
+
+
+class TestQueueEventDeliveries:
+    """Tests for EventProcessor.queue_event_deliveries."""
+
+    @pytest.mark.asyncio
+    async def test_only_unconfirmed_deliveries_fail(self):
+        """Deliveries whose messages the broker confirmed stay queued when others fail."""
+        deliveries = [_delivery() for _ in range(3)]
+        processor = EventProcessor(AsyncMock())
+        processor._event_repo = MagicMock(get_by_id=AsyncMock(return_value=SimpleNamespace(event_source_id=uuid.uuid4())))
+        processor._delivery_repo = MagicMock(
+            claim_pending=AsyncMock(return_value={d.id for d in deliveries}),
+            get_by_event=AsyncMock(return_value=deliveries),
+        )
+        processor._broadcast_event_update = AsyncMock()
+
+        async def queue(delivery, event):
+            delivery.execution_id = uuid.uuid4()
+            await publish_message("workflow-executions", {"execution_id": str(delivery.execution_id)})
+
+        async def publish_many(queue_name, messages, priority=0):
+            raise PublishError(messages[1:2], [RuntimeError("nack")])
+
+        processor._queue_workflow_execution = queue
+        publisher = MagicMock(publish_many=AsyncMock(side_effect=publish_many))
+        with patch("src.jobs.rabbitmq.publisher", publisher):
+            queued = await processor.queue_event_deliveries(uuid.uuid4())
+
+        assert queued == 2
+        assert [d.status for d in deliveries] == [
+            EventDeliveryStatus.QUEUED, EventDeliveryStatus.FAILED, EventDeliveryStatus.QUEUED,
+        ]
@@ -0,0 +1,116 @@
+"""Tests for archived execution storage."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import execution_archive
+from src.services.execution_archive import (
+    ARCHIVE_PREFIX,
+    ExecutionArchive,
+    archive_key,
+    deserialize_archive,
+    log_record,
+    serialize_archive,
+)
+
+
+def _archive() -> ExecutionArchive:
+    timestamp = datetime(2026, 3, 18, 12, 0, tzinfo=timezone.utc)
+    return ExecutionArchive(
+        execution_id="3f1c7a52-0000-4000-8000-000000000001",
+        result={"ok": True},
+        variables={"count": 3},
+        logs=[
+            log_record(1, "INFO", "started", None, timestamp, 0),
+            log_record(2, "DEBUG", "details", {"x": 1}, timestamp, 1),
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    execution_archive.clear_archive_cache()
+    yield
+    execution_archive.clear_archive_cache()
+
+
+class TestArchiveFormat:
+    """Test the JSONL encoding."""
+
+    def test_round_trip(self):
+        archive = _archive()
+
+        assert deserialize_archive(serialize_archive(archive)) == archive
+
+    def test_key_is_content_address(self):
+        payload = serialize_archive(_archive())
+
+        key = archive_key(payload)
+
+        assert key.startswith(ARCHIVE_PREFIX) and key.endswith(".jsonl.zst")
+        assert key == archive_key(serialize_archive(_archive()))
+
+    def test_log_entries_hide_debug_from_non_admins(self):
+        archive = _archive()
+
+        assert [log.message for log in archive.log_entries(True)] == ["started", "details"]
+        assert [log.message for log in archive.log_entries(False)] == ["started"]
+
+
+class TestLoadArchive:
+    """Test fetching archives through the LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_once_and_verifies_hash(self):
+        payload = serialize_archive(_archive())
+        key = archive_key(payload)
+        client = MagicMock()
+        client.read_uploaded_file = AsyncMock(return_value=payload)
+
+        with patch("src.services.file_storage.s3_client.S3StorageClient", return_value=client), \
+                patch.object(execution_archive, "decompress", side_effect=lambda blob: blob):
+            first = await execution_archive.load_archive(key)
+            second = await execution_archive.load_archive(key)
+
+        assert first is second
+        assert first.variables == {"count": 3}
+        client.read_uploaded_file.assert_awaited_once_with(key)
+
+    @pytest.mark.asyncio
+    async def test_rejects_object_that_does_not_match_its_key(self):
+        client = MagicMock()
+        client.read_uploaded_file = AsyncMock(return_value=serialize_archive(_archive()))
+
+        with patch("src.services.file_storage.s3_client.S3StorageClient", return_value=client), \
+                patch.object(execution_archive, "decompress", side_effect=lambda blob: blob):
+            with pytest.raises(ValueError):
+                await execution_archive.load_archive(f"{ARCHIVE_PREFIX}0.jsonl.zst")
+
+
+class TestRepositoryHydration:
+    """Test that repository reads fall back to the archive."""
+
+    @pytest.mark.asyncio
+    async def test_logs_of_archived_execution_come_from_archive(self):
+        from src.repositories import executions as executions_repo
+
+        user = MagicMock(is_superuser=False, user_id="u1")
+        row = MagicMock(executed_by="u1", archive_key="archive/executions/k.jsonl.zst")
+        result = MagicMock()
+        result.one_or_none.return_value = row
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        load = AsyncMock(return_value=_archive())
+
+        with patch.object(executions_repo, "load_archive", load):
+            logs, error = await executions_repo.ExecutionRepository(session).get_execution_logs(
+                uuid4(), user
+            )
+
+        assert error is None
+        assert [log.message for log in logs] == ["started"]
+        load.assert_awaited_once_with("archive/executions/k.jsonl.zst")
+        session.execute.assert_awaited_once()
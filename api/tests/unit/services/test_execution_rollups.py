@@ -0,0 +1,208 @@
+"""Tests for incremental execution rollups."""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import execution_rollups
+from src.services.execution_rollups import ExecutionTotals
+
+
+def _row(**values):
+    row = MagicMock()
+    row._mapping = values
+    for key, value in values.items():
+        setattr(row, key, value)
+    return row
+
+
+def _session_factory():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session), session
+
+
+class TestExecutionTotals:
+    """Test ExecutionTotals arithmetic."""
+
+    def test_from_row_treats_null_sums_as_zero(self):
+        totals = ExecutionTotals.from_row(_row(
+            execution_count=4,
+            success_count=3,
+            success_duration_ms=None,
+            total_cpu_seconds=1.5,
+        ))
+
+        assert totals.execution_count == 4
+        assert totals.success_duration_ms == 0
+        assert totals.total_cpu_seconds == 1.5
+        assert totals.success_rate == 75.0
+
+    def test_add_and_average(self):
+        totals = ExecutionTotals(
+            execution_count=2, success_count=2,
+            success_duration_ms=300, success_duration_count=2,
+        ) + ExecutionTotals(
+            execution_count=1, success_count=1,
+            success_duration_ms=600, success_duration_count=1,
+        )
+
+        assert totals.execution_count == 3
+        assert totals.avg_success_duration_ms == 300.0
+
+    def test_position_round_trip(self):
+        moment = datetime(2026, 3, 12, 10, 30, 15, 123456, tzinfo=timezone.utc)
+        position = execution_rollups._to_position(moment)
+        assert execution_rollups._from_position(position) == moment
+
+
+class TestGetExecutionTotals:
+    """Test combining buckets with live scans."""
+
+    @pytest.mark.asyncio
+    async def test_without_watermark_scans_executions(self):
+        db = MagicMock()
+        scan = AsyncMock(return_value=ExecutionTotals(execution_count=7))
+
+        with patch.object(execution_rollups, "get_rollup_watermark", AsyncMock(return_value=None)), \
+                patch.object(execution_rollups, "_scan_totals", scan):
+            totals = await execution_rollups.get_execution_totals(db)
+
+        assert totals.execution_count == 7
+        scan.assert_awaited_once_with(db)
+
+    @pytest.mark.asyncio
+    async def test_window_combines_hourly_buckets_head_and_tail(self):
+        since = datetime(2026, 3, 11, 10, 30, tzinfo=timezone.utc)
+        watermark = datetime(2026, 3, 12, 10, 20, tzinfo=timezone.utc)
+        db = MagicMock()
+        bucket_result = MagicMock()
+        bucket_result.one.return_value = _row(execution_count=100, success_count=90)
+        db.execute = AsyncMock(return_value=bucket_result)
+        scan = AsyncMock(side_effect=[
+            ExecutionTotals(execution_count=3),  # 10:30-11:00 head
+            ExecutionTotals(execution_count=2),  # after the watermark
+        ])
+
+        with patch.object(execution_rollups, "get_rollup_watermark", AsyncMock(return_value=watermark)), \
+                patch.object(execution_rollups, "_scan_totals", scan):
+            totals = await execution_rollups.get_execution_totals(db, since=since)
+
+        assert totals.execution_count == 105
+        assert totals.success_count == 90
+        assert scan.await_count == 2
+        bucket_query = str(db.execute.await_args.args[0])
+        assert "execution_rollups_hourly" in bucket_query
+
+
+class TestAdvanceExecutionRollups:
+    """Test moving the high-water mark forward."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_is_split_into_windows_with_checkpoints(self):
+        now = datetime(2026, 3, 12, 12, 0, tzinfo=timezone.utc)
+        target = now - execution_rollups.ROLLUP_LAG
+        start = target - timedelta(days=40)
+        positions = [execution_rollups._to_position(start)]
+        factory, session = _session_factory()
+
+        async def lock(db, name):
+            return positions[-1]
+
+        async def apply(db, window_start, window_end):
+            positions.append(execution_rollups._to_position(window_end))
+            return 1
+
+        with patch.object(execution_rollups, "get_session_factory", return_value=factory), \
+                patch.object(execution_rollups, "_rollup_target", AsyncMock(return_value=target)), \
+                patch.object(execution_rollups, "lock_metrics_checkpoint", side_effect=lock), \
+                patch.object(execution_rollups, "_apply_buckets", side_effect=apply):
+            summary = await execution_rollups.advance_execution_rollups(now)
+
+        # 40 days in 31 day windows: two committed steps ending at the target
+        assert summary["rolled_up"] == 2
+        assert summary["watermark"] == target.isoformat()
+        assert execution_rollups._from_position(positions[1]) == start + execution_rollups.MAX_ROLLUP_WINDOW
+        assert execution_rollups._from_position(positions[2]) == target
+        assert session.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_watermark_does_nothing(self):
+        now = datetime(2026, 3, 12, 12, 0, tzinfo=timezone.utc)
+        target = now - execution_rollups.ROLLUP_LAG
+        factory, _ = _session_factory()
+        apply = AsyncMock()
+
+        with patch.object(execution_rollups, "get_session_factory", return_value=factory), \
+                patch.object(execution_rollups, "_rollup_target", AsyncMock(return_value=target)), \
+                patch.object(
+                    execution_rollups,
+                    "lock_metrics_checkpoint",
+                    AsyncMock(return_value=execution_rollups._to_position(target)),
+                ), \
+                patch.object(execution_rollups, "_apply_buckets", apply):
+            summary = await execution_rollups.advance_execution_rollups(now)
+
+        apply.assert_not_awaited()
+        assert summary["rolled_up"] == 0
+
+
+class TestLiveExecutionCounts:
+    """Test running/pending counts from pool heartbeats."""
+
+    @pytest.mark.asyncio
+    async def test_sums_heartbeats(self):
+        r = MagicMock()
+
+        async def scan_iter(match, count):
+            for key in ("bifrost:pool:a:heartbeat", "bifrost:pool:b:heartbeat"):
+                yield key
+
+        r.scan_iter = scan_iter
+        r.mget = AsyncMock(return_value=[
+            json.dumps({"running_count": 3, "waiting_count": 2}),
+            json.dumps({"busy_count": 1}),  # older worker without live counts
+        ])
+
+        with patch.object(execution_rollups, "get_redis") as mock_get_redis:
+            mock_get_redis.return_value.__aenter__.return_value = r
+            assert await execution_rollups.get_live_execution_counts() == (4, 2)
+
+
+class TestVerifyExecutionRollups:
+    """Test the correctness check against a full scan."""
+
+    @pytest.mark.asyncio
+    async def test_reports_days_that_differ(self):
+        watermark = datetime(2026, 3, 12, tzinfo=timezone.utc)
+        scan_result = MagicMock()
+        scan_result.all.return_value = [
+            _row(day=datetime(2026, 3, 10, tzinfo=timezone.utc), execution_count=5, success_count=5),
+            _row(day=datetime(2026, 3, 11, tzinfo=timezone.utc), execution_count=4, success_count=3),
+        ]
+        rollup_rows = []
+        for day, count, success in ((date(2026, 3, 10), 5, 5), (date(2026, 3, 11), 3, 3)):
+            row = MagicMock()
+            row.date = day
+            for name in execution_rollups.COUNTER_FIELDS:
+                setattr(row, name, 0)
+            row.execution_count = count
+            row.success_count = success
+            rollup_rows.append(row)
+        rollup_result = MagicMock()
+        rollup_result.scalars.return_value.all.return_value = rollup_rows
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[scan_result, rollup_result])
+
+        with patch.object(execution_rollups, "get_rollup_watermark", AsyncMock(return_value=watermark)):
+            check = await execution_rollups.verify_execution_rollups(db)
+
+        assert check["ok"] is False
+        assert [m["date"] for m in check["mismatches"]] == ["2026-03-11"]
+        assert check["mismatches"][0]["scan"]["execution_count"] == 4
+        assert check["mismatches"][0]["rollup"]["execution_count"] == 3
@@ -0,0 +1,116 @@
+"""Tests for trigram-prefiltered file_index search."""
+
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.file_index_search import content_filters, search_file_index
+
+
+def _sql(filters) -> list[tuple[str, str]]:
+    """(operator, pattern) of each compiled filter."""
+    compiled = []
+    for f in filters:
+        c = f.compile(dialect=postgresql.dialect())
+        compiled.append(("ILIKE" if "ILIKE" in str(c) else "LIKE", next(iter(c.params.values()))))
+    return compiled
+
+
+def _db(pages: list[list[tuple[str, str]]]) -> AsyncMock:
+    results = []
+    for page in pages:
+        result = MagicMock()
+        result.all.return_value = [SimpleNamespace(path=p, content=c) for p, c in page]
+        results.append(result)
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=results)
+    return db
+
+
+class TestContentFilters:
+    """Tests for deriving LIKE predicates from a regex."""
+
+    def test_literal_query(self):
+        assert _sql(content_filters(re.compile(re.escape("get_user(")))) == [("LIKE", "%get\\_user(%")]
+
+    def test_required_runs_of_a_regex(self):
+        regex = re.compile(r"async\s+def\s+sync_\w+")
+        assert _sql(content_filters(regex)) == [
+            ("LIKE", "%async%"), ("LIKE", "%def%"), ("LIKE", "%sync\\_%"),
+        ]
+
+    def test_optional_parts_are_not_required(self):
+        regex = re.compile(r"(foo|bar)(?:baz)?x*quux")
+        assert _sql(content_filters(regex)) == [("LIKE", "%quux%")]
+
+    def test_case_insensitive_uses_wildcards_for_unsafe_characters(self):
+        """"s" also matches "ſ" (and "i" matches "ı") under re.IGNORECASE, which ILIKE would miss."""
+        regex = re.compile("session_token", re.IGNORECASE)
+        assert _sql(content_filters(regex)) == [("ILIKE", "%_e___on\\_token%")]
+
+    def test_scoped_ignorecase(self):
+        regex = re.compile("(?i:handler)Class")
+        assert _sql(content_filters(regex)) == [("ILIKE", "%handler%"), ("LIKE", "%Class%")]
+
+    def test_short_literals_are_dropped(self):
+        assert content_filters(re.compile(r"\d+ab")) == []
+
+    def test_without_regex_internals_nothing_is_filtered(self, monkeypatch):
+        monkeypatch.setattr("src.services.file_index_search.sre_parse", None)
+        assert content_filters(re.compile("get_user")) == []
+
+    def test_unexpected_parse_tree_is_not_filtered(self, monkeypatch):
+        monkeypatch.setattr("src.services.file_index_search._REPEATS", None)
+        assert content_filters(re.compile("abc+def")) == []
+
+
+class TestSearchFileIndex:
+    """Tests for search_file_index."""
+
+    @pytest.mark.asyncio
+    async def test_matches_with_context(self):
+        db = _db([[("a.py", "one\r\ntwo\nthree\nfour")]])
+
+        outcome = await search_file_index(db, re.compile("thr"), max_results=10)
+
+        [hit] = outcome.matches
+        assert (hit.path, hit.line_number, hit.column, hit.line) == ("a.py", 3, 0, "three")
+        assert hit.context(1) == (["2: two"], ["4: four"])
+        assert outcome.files_searched == 1
+        assert not outcome.truncated
+        query = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "file_index.content LIKE" in query
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_results(self, monkeypatch):
+        monkeypatch.setattr("src.services.file_index_search.CANDIDATE_PAGE_SIZE", 1)
+        db = _db([[("a.py", "x = 1\nx = 2")], [("b.py", "x = 3")]])
+
+        outcome = await search_file_index(db, re.compile("x ="), max_results=1)
+
+        assert [m.line_number for m in outcome.matches] == [1]
+        assert outcome.truncated
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pages_by_path(self, monkeypatch):
+        monkeypatch.setattr("src.services.file_index_search.CANDIDATE_PAGE_SIZE", 1)
+        db = _db([[("a.py", "hit")], [("b.py", "hit")], []])
+
+        outcome = await search_file_index(db, re.compile("hit"), max_results=10)
+
+        assert [m.path for m in outcome.matches] == ["a.py", "b.py"]
+        second = db.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect())
+        assert "file_index.path >" in str(second)
+        assert "a.py" in second.params.values()
+
+    @pytest.mark.asyncio
+    async def test_every_match(self):
+        db = _db([[("a.py", "foo foo")]])
+
+        outcome = await search_file_index(db, re.compile("foo"), max_results=10, every_match=True)
+
+        assert [m.column for m in outcome.matches] == [0, 4]
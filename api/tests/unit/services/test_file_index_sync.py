@@ -0,0 +1,103 @@
+"""Tests for the hash-diffing file_index sync engine."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.file_index_sync import (
+    FileIndexWriter,
+    delete_index_paths,
+    diff_index,
+    load_index_hashes,
+)
+
+
+@pytest.fixture
+def mock_db():
+    db = AsyncMock()
+    db.execute = AsyncMock(return_value=MagicMock(rowcount=0))
+    return db
+
+
+class TestDiffIndex:
+    """Tests for diff_index."""
+
+    def test_only_changed_and_new_files_are_written(self):
+        stored = {"a.py": "h1", "b.py": "h2", "gone.py": "h3"}
+        current = {"a.py": "h1", "b.py": "changed", "new.py": "h4"}
+
+        diff = diff_index(current, stored)
+
+        assert diff.changed == ["b.py", "new.py"]
+        assert diff.stale == ["gone.py"]
+        assert diff.unchanged == 1
+
+    def test_present_paths_are_not_stale(self):
+        """Paths that still exist but are not indexed (binaries) keep their rows."""
+        diff = diff_index({"a.py": "h1"}, {"a.py": "h1", "logo.png": None}, present={"a.py", "logo.png"})
+        assert diff.stale == []
+
+    def test_unknown_hash_only_adds_missing_files(self):
+        diff = diff_index({"a.py": None, "b.py": None}, {"a.py": "h1"})
+        assert diff.changed == ["b.py"]
+        assert diff.unchanged == 1
+
+    def test_null_stored_hash_is_rewritten(self):
+        assert diff_index({"a.py": "h1"}, {"a.py": None}).changed == ["a.py"]
+
+    @pytest.mark.asyncio
+    async def test_load_index_hashes(self, mock_db):
+        mock_db.execute.return_value = MagicMock(all=MagicMock(return_value=[("a.py", "h1")]))
+        assert await load_index_hashes(mock_db) == {"a.py": "h1"}
+        query = str(mock_db.execute.await_args.args[0])
+        assert "content_hash" in query and "file_index.content," not in query
+
+
+class TestFileIndexWriter:
+    """Tests for FileIndexWriter batching."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_multi_row_upserts_in_bounded_batches(self, mock_db):
+        writer = FileIndexWriter(mock_db, max_rows=2)
+
+        for i in range(5):
+            await writer.add(f"f{i}.py", f"x = {i}", f"h{i}")
+        await writer.flush()
+
+        assert mock_db.execute.await_count == 3
+        assert writer.written == 5
+        sql = str(mock_db.execute.await_args_list[0].args[0])
+        assert "ON CONFLICT (path) DO UPDATE" in sql
+        assert "excluded.content" in sql
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_byte_budget(self, mock_db):
+        writer = FileIndexWriter(mock_db, max_rows=100, max_bytes=10)
+
+        await writer.add("big.py", "x" * 20, "h")
+
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_without_rows_is_noop(self, mock_db):
+        await FileIndexWriter(mock_db).flush()
+        mock_db.execute.assert_not_awaited()
+
+
+class TestDeleteIndexPaths:
+    """Tests for delete_index_paths."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_chunks(self, mock_db, monkeypatch):
+        monkeypatch.setattr("src.services.file_index_sync.DELETE_BATCH_SIZE", 2)
+        mock_db.execute.return_value = MagicMock(rowcount=2)
+
+        deleted = await delete_index_paths(mock_db, ["a", "b", "c"])
+
+        assert mock_db.execute.await_count == 2
+        assert deleted == 4
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_delete(self, mock_db):
+        assert await delete_index_paths(mock_db, []) == 0
+        mock_db.execute.assert_not_awaited()
@@ -112,8 +112,9 @@ class TestReindexWorkspaceFiles:
     @pytest.mark.asyncio
     async def test_marks_missing_files_as_deleted(self, mock_db, temp_workspace):
         """Files in file_index but not on filesystem are removed."""
-        # Mock that the update statement affects 2 rows
+        # file_index holds 2 files that are gone from disk; the delete affects 2 rows
         mock_result = MagicMock()
+        mock_result.all.return_value = [("gone/a.py", "hash-a"), ("gone/b.py", "hash-b")]
         mock_result.rowcount = 2
         mock_result.scalars = MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))
         mock_db.execute.return_value = mock_result
@@ -126,8 +127,10 @@ class TestReindexWorkspaceFiles:
         storage._reindex_service._extract_metadata = AsyncMock()
         counts = await storage.reindex_workspace_files(temp_workspace)
 
-        # files_removed should reflect the rowcount from the update
+        # files_removed should reflect the rowcount from the delete
         assert counts["files_removed"] == 2
+        delete_stmt = mock_db.execute.await_args_list[1].args[0]
+        assert sorted(delete_stmt.compile().params["path_1"]) == ["gone/a.py", "gone/b.py"]
 
     @pytest.mark.asyncio
     async def test_marks_orphaned_workflows_inactive(self, mock_db, temp_workspace):
@@ -137,14 +140,12 @@ class TestReindexWorkspaceFiles:
         The workflows_deactivated count includes data providers.
         data_providers_deactivated is kept for backward compatibility but is always 0.
         """
-        # First execute returns rowcount for files_removed
+        # First execute loads the stored hashes (none, so nothing is stale)
         # Subsequent calls return workflow deactivation count
         mock_results = [
-            MagicMock(rowcount=0, scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))),  # mark missing files
+            MagicMock(all=MagicMock(return_value=[])),  # stored file_index hashes
+            MagicMock(),  # one multi-row upsert for the 3 files
         ]
-        # Add results for file upserts
-        for _ in range(3):
-            mock_results.append(MagicMock())
 
         # Add results for orphaned endpoint workflows query
         mock_results.append(MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))))
@@ -224,7 +225,7 @@ class TestReindexWorkspaceFiles:
 
         # Mock: 0 files removed, 0 indexed, but 4 workflows deactivated (includes 1 data provider)
         mock_results = [
-            MagicMock(rowcount=0),  # mark missing files
+            MagicMock(all=MagicMock(return_value=[])),  # stored file_index hashes
             MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))),  # orphaned endpoints
             MagicMock(rowcount=4),  # workflows deactivated (includes data providers)
         ]
@@ -251,11 +252,9 @@ class TestReindexWorkspaceFiles:
         mock_workflow.id = uuid4()
 
         mock_results = [
-            MagicMock(rowcount=0),  # mark missing files
+            MagicMock(all=MagicMock(return_value=[])),  # stored file_index hashes
+            MagicMock(),  # one multi-row upsert for the 3 files
         ]
-        # Add results for file upserts
-        for _ in range(3):
-            mock_results.append(MagicMock())
 
         # Add result for orphaned endpoint workflows query - return our mock
         mock_results.append(MagicMock(
@@ -312,3 +311,29 @@ class TestReindexWorkspaceFiles:
 
         # Should have only indexed 2 files (skipped the one with error)
         assert counts["files_indexed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_files(self, mock_db, temp_workspace):
+        """Files whose hash matches file_index are not rewritten, but metadata is still extracted."""
+        import hashlib
+
+        utils_hash = hashlib.sha256((temp_workspace / "utils.py").read_bytes()).hexdigest()
+        mock_db.execute.return_value = MagicMock(
+            rowcount=0,
+            all=MagicMock(return_value=[("utils.py", utils_hash)]),
+            scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[]))),
+        )
+
+        clear_libcst_modules()
+        from src.services.file_storage import FileStorageService
+        storage = FileStorageService(mock_db)
+        mock_extract = AsyncMock()
+        storage._reindex_service._extract_metadata = mock_extract
+
+        counts = await storage.reindex_workspace_files(temp_workspace)
+
+        assert counts["files_indexed"] == 2
+        assert counts["files_removed"] == 0
+        assert mock_extract.call_count == 3
+        upsert = mock_db.execute.await_args_list[1].args[0]
+        assert "utils.py" not in upsert.compile().params.values()
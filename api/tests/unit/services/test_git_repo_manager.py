@@ -1,5 +1,9 @@
 """Tests for GitRepoManager — S3-backed persistent git working tree."""
 
+import hashlib
+import io
+import json
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,6 +22,7 @@ def mock_settings():
     settings.s3_secret_key = "bifrost123"
     settings.s3_region = "us-east-1"
     settings.redis_url = ""  # Disable Redis lock in unit tests
+    settings.git_worktree_cache_dir = ""  # Temp-dir checkout unless a test sets one
     return settings
 
 
@@ -244,3 +249,217 @@ class TestCheckout:
                     async with manager.checkout():
                         pass  # pragma: no cover
                 mock_up.assert_not_awaited()
+
+
+class FakeS3:
+    """In-memory stand-in for the aiobotocore S3 client, recording transfers."""
+
+    def __init__(self, objects: dict[str, bytes]):
+        self.objects = dict(objects)
+        self.gets: list[str] = []
+        self.puts: list[str] = []
+        self.deletes: list[str] = []
+        self.reads: list[int] = []
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.multipart_etags: dict[str, str] = {}
+
+    @staticmethod
+    def _etag(content: bytes) -> str:
+        return f'"{hashlib.md5(content).hexdigest()}"'
+
+    def get_paginator(self, name):
+        async def pages(**kwargs):
+            yield {"Contents": [
+                {"Key": key, "ETag": self.multipart_etags.get(key) or self._etag(content)}
+                for key, content in self.objects.items()
+                if key.startswith(kwargs["Prefix"])
+            ]}
+
+        paginator = MagicMock()
+        paginator.paginate = pages
+        return paginator
+
+    async def get_object(self, Bucket, Key):
+        self.gets.append(Key)
+        content = self.objects[Key]
+        stream = io.BytesIO(content)
+
+        async def read(amt=None):
+            self.reads.append(amt)
+            return stream.read(amt)
+
+        body = MagicMock()
+        body.read = read
+        return {"Body": body, "ETag": self._etag(content)}
+
+    async def put_object(self, Bucket, Key, Body):
+        self.puts.append(Key)
+        self.objects[Key] = Body
+        self.multipart_etags.pop(Key, None)
+        return {"ETag": self._etag(Body)}
+
+    async def create_multipart_upload(self, Bucket, Key):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": self._etag(Body)}
+
+    async def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        assert [p["PartNumber"] for p in MultipartUpload["Parts"]] == sorted(parts)
+        self.puts.append(Key)
+        self.objects[Key] = b"".join(parts[n] for n in sorted(parts))
+        digest = hashlib.md5(b"".join(hashlib.md5(parts[n]).digest() for n in sorted(parts)))
+        self.multipart_etags[Key] = f'"{digest.hexdigest()}-{len(parts)}"'
+        return {"ETag": self.multipart_etags[Key]}
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+
+    async def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.deletes.append(obj["Key"])
+            self.objects.pop(obj["Key"], None)
+
+
+class TestCachedCheckout:
+    """Tests for checkout against the persistent working-tree cache."""
+
+    @pytest.fixture
+    def s3(self):
+        return FakeS3({
+            "_repo/.git/HEAD": b"ref: refs/heads/main\n",
+            "_repo/workflows/a.py": b"a = 1\n",
+            "_repo/workflows/b.py": b"b = 1\n",
+        })
+
+    @pytest.fixture
+    def cached_manager(self, mock_settings, tmp_path, s3):
+        mock_settings.git_worktree_cache_dir = str(tmp_path / "cache")
+        mgr = GitRepoManager(settings=mock_settings)
+
+        @asynccontextmanager
+        async def client():
+            yield s3
+
+        mgr._s3_client = client
+        return mgr
+
+    @pytest.mark.asyncio
+    async def test_first_checkout_downloads_everything(self, cached_manager, s3, tmp_path):
+        async with cached_manager.checkout() as work_dir:
+            assert (work_dir / "workflows" / "a.py").read_bytes() == b"a = 1\n"
+
+        assert work_dir == tmp_path / "cache" / "repo"
+        assert work_dir.exists()  # kept for the next checkout
+        assert len(s3.gets) == 3
+        assert s3.puts == [] and s3.deletes == []
+        manifest = json.loads((tmp_path / "cache" / "manifest.json").read_text())
+        assert set(manifest["files"]) == {".git/HEAD", "workflows/a.py", "workflows/b.py"}
+
+    @pytest.mark.asyncio
+    async def test_second_checkout_transfers_only_changes(self, cached_manager, s3):
+        async with cached_manager.checkout():
+            pass
+        s3.gets.clear()
+        s3.objects["_repo/workflows/b.py"] = b"b = 2\n"  # written by the editor meanwhile
+        s3.objects["_repo/workflows/c.py"] = b"c = 1\n"
+        del s3.objects["_repo/workflows/a.py"]
+
+        async with cached_manager.checkout() as work_dir:
+            assert sorted(s3.gets) == ["_repo/workflows/b.py", "_repo/workflows/c.py"]
+            assert (work_dir / "workflows" / "b.py").read_bytes() == b"b = 2\n"
+            assert not (work_dir / "workflows" / "a.py").exists()
+
+            (work_dir / "workflows" / "c.py").write_bytes(b"c = 2\n")
+            (work_dir / "workflows" / "d.py").write_bytes(b"d = 1\n")
+            (work_dir / ".git" / "HEAD").unlink()
+
+        assert sorted(s3.puts) == ["_repo/workflows/c.py", "_repo/workflows/d.py"]
+        assert s3.deletes == ["_repo/.git/HEAD"]
+        assert s3.objects["_repo/workflows/c.py"] == b"c = 2\n"
+
+        s3.gets.clear()
+        async with cached_manager.checkout():
+            pass
+        assert s3.gets == []
+
+    @pytest.mark.asyncio
+    async def test_missing_manifest_reuses_files_matching_etag(self, cached_manager, s3, tmp_path):
+        async with cached_manager.checkout() as work_dir:
+            (work_dir / "workflows" / "a.py").write_bytes(b"local edit\n")
+        (tmp_path / "cache" / "manifest.json").unlink()
+        s3.gets.clear()
+        s3.puts.clear()
+
+        async with cached_manager.checkout():
+            pass
+
+        assert s3.gets == []
+        assert s3.puts == []
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_is_reverted_by_next_checkout(self, cached_manager, s3):
+        async with cached_manager.checkout():
+            pass
+        s3.gets.clear()
+
+        with pytest.raises(ValueError):
+            async with cached_manager.checkout() as work_dir:
+                (work_dir / "workflows" / "a.py").write_bytes(b"half-done\n")
+                (work_dir / "stray.txt").write_bytes(b"x")
+                raise ValueError("merge failed")
+        assert s3.puts == []
+
+        async with cached_manager.checkout() as work_dir:
+            assert (work_dir / "workflows" / "a.py").read_bytes() == b"a = 1\n"
+            assert not (work_dir / "stray.txt").exists()
+        assert s3.gets == ["_repo/workflows/a.py"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_sync(self, cached_manager, tmp_path):
+        @asynccontextmanager
+        async def broken():
+            raise RuntimeError("endpoint unreachable")
+            yield  # pragma: no cover
+
+        cached_manager._s3_client = broken
+        with patch.object(cached_manager, "sync_down", new_callable=AsyncMock) as down, \
+                patch.object(cached_manager, "sync_up", new_callable=AsyncMock) as up:
+            async with cached_manager.checkout() as work_dir:
+                pass
+
+        down.assert_awaited_once_with(work_dir)
+        up.assert_awaited_once_with(work_dir)
+        assert not (tmp_path / "cache" / "manifest.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_streamed_in_chunks(self, cached_manager, s3, monkeypatch):
+        monkeypatch.setattr("src.services.git_repo_manager.DOWNLOAD_CHUNK_SIZE", 4)
+
+        async with cached_manager.checkout() as work_dir:
+            assert (work_dir / "workflows" / "a.py").read_bytes() == b"a = 1\n"
+
+        assert set(s3.reads) == {4}
+        assert not list(work_dir.rglob("*.bifrost-tmp"))
+
+    @pytest.mark.asyncio
+    async def test_large_files_are_uploaded_in_parts(self, cached_manager, s3, monkeypatch):
+        monkeypatch.setattr("src.services.git_repo_manager.MULTIPART_PART_SIZE", 4)
+        async with cached_manager.checkout() as work_dir:
+            (work_dir / "big.bin").write_bytes(b"0123456789")
+            (work_dir / "small.txt").write_bytes(b"tiny")
+
+        assert s3.objects["_repo/big.bin"] == b"0123456789"
+        assert s3.objects["_repo/small.txt"] == b"tiny"
+        assert s3.uploads == {}
+        manifest = json.loads((work_dir.parent / "manifest.json").read_text())
+        assert manifest["files"]["big.bin"]["etag"].endswith("-3")
+
+        s3.gets.clear()
+        async with cached_manager.checkout():
+            pass
+        assert s3.gets == []
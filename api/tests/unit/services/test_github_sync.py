@@ -4,6 +4,10 @@ Unit tests for GitHub Sync Service.
 Tests the GitHubSyncService data models and exceptions.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
 from src.models.contracts.github import (
     OrphanInfo,
     PreflightIssue,
@@ -409,3 +413,40 @@ class TestMemoryUsageDuringFileScan:
             f"expected max {max_expected / 1024 / 1024:.1f}MB. "
             f"This simulates sync pull pattern - memory should not accumulate."
         )
+
+
+class TestUpdateFileIndex:
+    """Tests for _update_file_index writing only what changed in the tree."""
+
+    @pytest.mark.asyncio
+    async def test_writes_changed_files_and_removes_stale(self, tmp_path):
+        import hashlib
+
+        from src.services.github_sync import GitHubSyncService
+
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / "workflows").mkdir()
+        (tmp_path / "workflows" / "same.py").write_text("a = 1\n")
+        (tmp_path / "workflows" / "edited.py").write_text("b = 2\n")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+
+        stored = MagicMock()
+        stored.all.return_value = [
+            ("workflows/same.py", hashlib.sha256(b"a = 1\n").hexdigest()),
+            ("workflows/edited.py", hashlib.sha256(b"b = 1\n").hexdigest()),
+            ("workflows/deleted.py", "old"),
+        ]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[stored, MagicMock(), MagicMock(rowcount=1)])
+
+        service = GitHubSyncService.__new__(GitHubSyncService)
+        service.db = db
+        await service._update_file_index(tmp_path)
+
+        assert db.execute.await_count == 3
+        upsert = db.execute.await_args_list[1].args[0].compile().params
+        assert "workflows/edited.py" in upsert.values()
+        assert "workflows/same.py" not in upsert.values()
+        delete = db.execute.await_args_list[2].args[0].compile().params
+        assert list(delete.values()) == [["workflows/deleted.py"]]
@@ -26,12 +26,14 @@ async def test_reconciler_adds_missing_files(mock_db, mock_repo_storage):
 
     # DB has only one
     db_result = MagicMock()
-    db_result.all.return_value = [("workflows/a.py",)]
+    db_result.all.return_value = [("workflows/a.py", "hash-a")]
     mock_db.execute = AsyncMock(return_value=db_result)
 
     stats = await reconcile_file_index(mock_db, mock_repo_storage)
 
-    assert stats["added"] >= 1
+    assert stats["added"] == 1
+    assert stats["unchanged"] == 1
+    mock_repo_storage.read.assert_awaited_once_with("workflows/b.py")
 
 
 @pytest.mark.asyncio
@@ -45,16 +47,15 @@ async def test_reconciler_reverse_syncs_db_only_entries(mock_db, mock_repo_stora
 
     # DB has two (one only in DB)
     db_result = MagicMock()
-    db_result.all.return_value = [("workflows/a.py",), ("workflows/db_only.py",)]
+    db_result.all.return_value = [("workflows/a.py", "hash-a"), ("workflows/db_only.py", "hash-b")]
 
     # For the reverse-sync content read, return actual content
     content_result = MagicMock()
-    content_result.scalar_one_or_none.return_value = "print('db content')"
+    content_result.all.return_value = [("workflows/db_only.py", "print('db content')")]
 
     mock_db.execute = AsyncMock(side_effect=[
-        db_result,   # select FileIndex.path
-        db_result,   # select FileIndex.path (re-read in add loop - no files to add)
-        content_result,  # select FileIndex.content for reverse-sync
+        db_result,       # select FileIndex.path, content_hash
+        content_result,  # select FileIndex.path, content for reverse-sync
     ])
 
     stats = await reconcile_file_index(mock_db, mock_repo_storage)
@@ -70,17 +71,17 @@ async def test_reconciler_removes_orphaned_null_content(mock_db, mock_repo_stora
     mock_repo_storage.list.return_value = []
 
     db_result = MagicMock()
-    db_result.all.return_value = [("workflows/orphaned.py",)]
+    db_result.all.return_value = [("workflows/orphaned.py", None)]
 
     # content is None — orphaned row with no content
     content_result = MagicMock()
-    content_result.scalar_one_or_none.return_value = None
+    content_result.all.return_value = [("workflows/orphaned.py", None)]
 
-    delete_result = MagicMock()
+    delete_result = MagicMock(rowcount=1)
     mock_db.execute = AsyncMock(side_effect=[
-        db_result,       # select FileIndex.path
-        content_result,  # select FileIndex.content for reverse-sync (returns None)
-        delete_result,   # delete FileIndex where path = ...
+        db_result,       # select FileIndex.path, content_hash
+        content_result,  # select FileIndex.path, content for reverse-sync (content None)
+        delete_result,   # delete FileIndex where path in (...)
     ])
 
     stats = await reconcile_file_index(mock_db, mock_repo_storage)
@@ -97,14 +98,14 @@ async def test_reconciler_handles_empty_s3_with_db_content(mock_db, mock_repo_st
     mock_repo_storage.list.return_value = []
 
     db_result = MagicMock()
-    db_result.all.return_value = [("workflows/old.py",)]
+    db_result.all.return_value = [("workflows/old.py", "hash-old")]
 
     content_result = MagicMock()
-    content_result.scalar_one_or_none.return_value = "print('old code')"
+    content_result.all.return_value = [("workflows/old.py", "print('old code')")]
 
     mock_db.execute = AsyncMock(side_effect=[
-        db_result,       # select FileIndex.path
-        content_result,  # select FileIndex.content for reverse-sync
+        db_result,       # select FileIndex.path, content_hash
+        content_result,  # select FileIndex.path, content for reverse-sync
     ])
 
     stats = await reconcile_file_index(mock_db, mock_repo_storage)
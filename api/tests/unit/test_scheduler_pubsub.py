@@ -0,0 +1,49 @@
+"""Tests for the scheduler's on-demand pub/sub listener."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core import pubsub
+from src.scheduler.main import Scheduler
+
+
+@pytest.mark.asyncio
+async def test_sharded_scheduler_receives_spublished_messages():
+    """With pubsub_sharded, scheduler messages go out with SPUBLISH and are received with SSUBSCRIBE."""
+    settings = MagicMock(pubsub_sharded=True, redis_url="redis://localhost:6379")
+    mock_pubsub = MagicMock()
+    mock_pubsub.ssubscribe = AsyncMock()
+    mock_pubsub.subscribe = AsyncMock()
+    redis_instance = MagicMock()
+    redis_instance.pubsub.return_value = mock_pubsub
+    redis_instance.ping = AsyncMock()
+
+    with patch("src.scheduler.main.get_settings", return_value=settings):
+        scheduler = Scheduler()
+    scheduler._schedule_timer = MagicMock()
+
+    with patch("src.core.redis_reconnect.Redis.from_url", return_value=redis_instance), \
+            patch("src.core.redis_reconnect.ResilientPubSubListener.start", AsyncMock()):
+        await scheduler._start_pubsub_listener()
+        listener = scheduler._pubsub_listener
+        assert await listener._connect() is True
+
+    mock_pubsub.ssubscribe.assert_awaited()
+    mock_pubsub.subscribe.assert_not_called()
+    subscribed = {channel for call in mock_pubsub.ssubscribe.await_args_list for channel in call.args}
+
+    publisher = MagicMock(spublish=AsyncMock(), publish=AsyncMock())
+    fire_at = datetime(2026, 3, 20, 9, 0, tzinfo=timezone.utc)
+    with patch.object(pubsub.manager, "_redis", publisher), \
+            patch("src.core.pubsub.get_settings", return_value=settings):
+        await pubsub.publish_schedules_changed(fire_at)
+
+    publisher.publish.assert_not_called()
+    channel, payload = publisher.spublish.await_args.args
+    assert channel in subscribed
+
+    await listener._handle_message({"type": "smessage", "channel": channel.encode(), "data": payload})
+    scheduler._schedule_timer.wake.assert_called_once_with(fire_at)
+    await listener._cleanup()
@@ -17591,6 +17591,13 @@ export interface components {
              * @default 1800
              */
             timeout_seconds: number;
+            /**
+             * Variable Capture
+             * @description Variable capture mode for execution details
+             * @default full
+             * @enum {string}
+             */
+            variable_capture: "off" | "summary" | "full";
             /** @description Retry configuration */
             retry_policy?: components["schemas"]["RetryPolicy"] | null;
             /**
@@ -17826,6 +17833,11 @@ export interface components {
              * @description Execution mode: 'sync' for immediate response, 'async' for background execution
              */
             execution_mode?: ("sync" | "async") | null;
+            /**
+             * Variable Capture
+             * @description Variable capture mode: 'off', 'summary' (shallow, truncated values) or 'full'
+             */
+            variable_capture?: ("off" | "summary" | "full") | null;
             /**
              * Time Saved
              * @description Minutes saved per execution (for ROI reporting)
@@ -348,6 +348,7 @@ type WebSocketMessage =
 	| { type: "unsubscribed"; channel: string }
 	| { type: "pong" }
 	| { type: "execution_update"; executionId: string; [key: string]: unknown }
+	| { type: "queue_update"; epoch: number; depth: number }
 	| { type: "execution_log"; executionId: string; [key: string]: unknown }
 	| { type: "history_update"; [key: string]: unknown }
 	| { type: "notification_created"; notification: NotificationPayload }
@@ -498,6 +499,10 @@ class WebSocketService {
 	private poolMessageCallbacks = new Set<PoolMessageCallback>();
 	private connectionStatusCallbacks = new Set<(connected: boolean) => void>();
 
+	// Queue position at a known queue epoch, per queued execution.
+	// Positions are derived locally from "queue_update" epoch changes.
+	private queueTickets = new Map<string, { position: number; epoch: number }>();
+
 	// Track subscribed channels
 	private subscribedChannels = new Set<string>();
 	private pendingSubscriptions = new Set<string>();
@@ -702,6 +707,10 @@ class WebSocketService {
 				this.dispatchExecutionUpdate(message);
 				break;
 
+			case "queue_update":
+				this.dispatchQueueUpdate(message);
+				break;
+
 			case "execution_log":
 				this.dispatchExecutionLog(message);
 				break;
@@ -942,6 +951,29 @@ class WebSocketService {
 		const requiredMemoryMb = message["requiredMemoryMb"] as
 			| number
 			| undefined;
+		const queueEpoch = message["queueEpoch"] as number | undefined;
+
+		// Remember the queue ticket so later epoch changes can move it
+		if (
+			status === "Pending" &&
+			waitReason === "queued" &&
+			queuePosition !== undefined &&
+			queueEpoch !== undefined
+		) {
+			this.queueTickets.set(message.executionId, {
+				position: queuePosition,
+				epoch: queueEpoch,
+			});
+			if (
+				!this.subscribedChannels.has("queue") &&
+				!this.pendingSubscriptions.has("queue")
+			) {
+				this.pendingSubscriptions.add("queue");
+				void this.subscribe("queue");
+			}
+		} else if (status !== "Pending" || waitReason !== undefined) {
+			this.queueTickets.delete(message.executionId);
+		}
 
 		const update: ExecutionUpdate = {
 			executionId: message.executionId,
@@ -984,6 +1016,36 @@ class WebSocketService {
 		this.historyUpdateCallbacks.forEach((cb) => cb(historyUpdate));
 	}
 
+	private dispatchQueueUpdate(message: {
+		type: "queue_update";
+		epoch: number;
+		depth: number;
+	}) {
+		// Each removal from the queue bumps the epoch, so a ticket moves up
+		// by the number of removals since it was issued
+		const timestamp = new Date().toISOString();
+		this.queueTickets.forEach((ticket, executionId) => {
+			const queuePosition = Math.max(
+				1,
+				Math.min(
+					message.depth,
+					ticket.position - (message.epoch - ticket.epoch),
+				),
+			);
+			const update: ExecutionUpdate = {
+				executionId,
+				status: "Pending",
+				isComplete: false,
+				timestamp,
+				queuePosition,
+				waitReason: "queued",
+			};
+			this.executionUpdateCallbacks
+				.get(executionId)
+				?.forEach((cb) => cb(update));
+		});
+	}
+
 	private dispatchHistoryUpdate(
 		message: { type: "history_update" } & Record<string, unknown>,
 	) {